@@ -5,16 +5,23 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
-    from langchain_core.document_loaders.base import BaseBlobParser, BaseLoader
+    from langchain_core.document_loaders.base import (
+        BaseBlobParser,
+        BaseLoader,
+        FingerprintedLoader,
+    )
     from langchain_core.document_loaders.blob_loaders import Blob, BlobLoader, PathLike
     from langchain_core.document_loaders.langsmith import LangSmithLoader
+    from langchain_core.document_loaders.parallel import ParallelBlobPipeline
 
 __all__ = (
     "BaseBlobParser",
     "BaseLoader",
     "Blob",
     "BlobLoader",
+    "FingerprintedLoader",
     "LangSmithLoader",
+    "ParallelBlobPipeline",
     "PathLike",
 )
 
@@ -23,8 +30,10 @@ _dynamic_imports = {
     "BaseLoader": "base",
     "Blob": "blob_loaders",
     "BlobLoader": "blob_loaders",
+    "FingerprintedLoader": "base",
     "PathLike": "blob_loaders",
     "LangSmithLoader": "langsmith",
+    "ParallelBlobPipeline": "parallel",
 }
 
 
@@ -111,6 +111,48 @@ class BaseLoader(ABC):  # noqa: B024
             yield doc  # type: ignore[misc]
 
 
+class FingerprintedLoader(BaseLoader):
+    """Loader whose documents come from independently loadable sources.
+
+    Each source (e.g. a file) has a fingerprint that is cheap to compute without
+    loading it, such as a file's modification time and size, and that changes
+    whenever its content does.
+
+    When such a loader is passed to `index()` with a `source_id_key`, sources
+    whose fingerprint matches the one stored in the record manager are not
+    loaded at all; their existing records are just refreshed. Source ids must
+    therefore match the ids `source_id_key` assigns to their documents.
+    """
+
+    @abstractmethod
+    def lazy_fingerprints(self) -> Iterator[tuple[str, str]]:
+        """Lazily list the sources without loading them.
+
+        Yields:
+            `(source_id, fingerprint)` pairs.
+        """
+
+    @abstractmethod
+    def lazy_load_source(self, source_id: str) -> Iterator[Document]:
+        """Lazily load the documents of a single source.
+
+        Args:
+            source_id: A source id yielded by `lazy_fingerprints`.
+
+        Yields:
+            the documents.
+        """
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Load the documents of every source.
+
+        Yields:
+            the documents.
+        """
+        for source_id, _ in self.lazy_fingerprints():
+            yield from self.lazy_load_source(source_id)
+
+
 class BaseBlobParser(ABC):
     """Abstract interface for blob parsers.
 
@@ -0,0 +1,178 @@
+"""Concurrent blob loading and parsing."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Any, Literal
+
+from langchain_core.document_loaders.base import BaseLoader
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_text_splitters import TextSplitter
+
+    from langchain_core.document_loaders.base import BaseBlobParser
+    from langchain_core.document_loaders.blob_loaders import BlobLoader
+    from langchain_core.documents import Document
+    from langchain_core.documents.base import Blob
+
+
+def _parse(
+    parser: BaseBlobParser, text_splitter: TextSplitter | None, blob: Blob
+) -> list[Document]:
+    documents = list(parser.lazy_parse(blob))
+    if text_splitter is not None:
+        documents = text_splitter.split_documents(documents)
+    return documents
+
+
+# Set once per worker process so the parser is not pickled with every blob.
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(parser: BaseBlobParser, text_splitter: TextSplitter | None) -> None:
+    _worker_state["parser"] = parser
+    _worker_state["text_splitter"] = text_splitter
+
+
+def _parse_in_worker(blob: Blob) -> list[Document]:
+    return _parse(_worker_state["parser"], _worker_state["text_splitter"], blob)
+
+
+class ParallelBlobPipeline(BaseLoader):
+    """Load blobs from a `BlobLoader` and parse them concurrently.
+
+    Blobs are pulled lazily from `blob_loader` and parsed, and optionally split,
+    in a pool of worker processes (or threads). At most `max_pending` blobs are in
+    flight at any time, so memory stays flat however large the corpus is.
+
+    With `ordered=True` documents come out in the order of the blobs they were
+    parsed from, exactly as a sequential `blob_parser.lazy_parse` loop would
+    produce them. With `ordered=False` each blob's documents are yielded as soon
+    as it is parsed, which keeps the workers busy behind a slow blob.
+
+    The pipeline is a `BaseLoader`, so it can be handed straight to `index()`:
+
+    Example:
+        ```python
+        from langchain_core.document_loaders import ParallelBlobPipeline
+        from langchain_core.indexing import index
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        pipeline = ParallelBlobPipeline(
+            blob_loader,
+            parser,
+            text_splitter=RecursiveCharacterTextSplitter(chunk_size=1000),
+        )
+        index(pipeline, record_manager, vector_store, cleanup="incremental")
+        ```
+
+    In process mode `blob_parser`, `text_splitter` and the blobs must be
+    picklable; blobs backed by a path are read in the worker.
+    """
+
+    def __init__(
+        self,
+        blob_loader: BlobLoader,
+        blob_parser: BaseBlobParser,
+        *,
+        text_splitter: TextSplitter | None = None,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        ordered: bool = True,
+        executor: Literal["process", "thread"] = "process",
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            blob_loader: Source of the blobs to parse.
+            blob_parser: Parser applied to every blob.
+            text_splitter: If given, each blob's documents are split in the worker
+                that parsed them.
+            max_workers: Number of workers. Defaults to the number of CPUs.
+            max_pending: Maximum number of blobs submitted but not yet yielded.
+                Defaults to twice `max_workers`.
+            ordered: Whether to yield documents in blob order.
+            executor: Run workers in separate processes, for CPU-bound parsers,
+                or in threads, for parsers that release the GIL or wait on I/O.
+
+        Raises:
+            ValueError: If `max_workers` or `max_pending` is less than 1, or
+                `executor` is not `'process'` or `'thread'`.
+        """
+        if max_workers is not None and max_workers < 1:
+            msg = f"max_workers must be at least 1. Got {max_workers}."
+            raise ValueError(msg)
+        if max_pending is not None and max_pending < 1:
+            msg = f"max_pending must be at least 1. Got {max_pending}."
+            raise ValueError(msg)
+        if executor not in {"process", "thread"}:
+            msg = f"executor must be 'process' or 'thread'. Got {executor!r}."
+            raise ValueError(msg)
+        self.blob_loader = blob_loader
+        self.blob_parser = blob_parser
+        self.text_splitter = text_splitter
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.ordered = ordered
+        self.executor = executor
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Parse the blobs concurrently.
+
+        Yields:
+            the documents.
+        """
+        pool: Executor
+        if self.executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.blob_parser, self.text_splitter),
+            )
+        else:
+            pool = ContextThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            if self.ordered:
+                yield from self._ordered(pool)
+            else:
+                yield from self._unordered(pool)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, pool: Executor, blob: Blob) -> Future[list[Document]]:
+        if self.executor == "process":
+            return pool.submit(_parse_in_worker, blob)
+        return pool.submit(_parse, self.blob_parser, self.text_splitter, blob)
+
+    def _ordered(self, pool: Executor) -> Iterator[Document]:
+        pending: deque[Future[list[Document]]] = deque()
+        for blob in self.blob_loader.yield_blobs():
+            pending.append(self._submit(pool, blob))
+            if len(pending) >= self.max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def _unordered(self, pool: Executor) -> Iterator[Document]:
+        pending: set[Future[list[Document]]] = set()
+        for blob in self.blob_loader.yield_blobs():
+            pending.add(self._submit(pool, blob))
+            if len(pending) >= self.max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
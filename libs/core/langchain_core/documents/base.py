@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import codecs
 import contextlib
 import mimetypes
+import mmap
+import os
 from io import BufferedReader, BytesIO
 from pathlib import Path, PurePath
 from typing import TYPE_CHECKING, Any, Literal, cast
 
-from pydantic import ConfigDict, Field, model_validator
+from pydantic import ConfigDict, Field, PrivateAttr, model_validator
 
 from langchain_core.load.serializable import Serializable
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
+
+    from typing_extensions import Self
 
 PathLike = str | PurePath
 
@@ -46,7 +51,31 @@ class BaseMedia(Serializable):
     """Arbitrary metadata associated with the content."""
 
 
-class Blob(BaseMedia):
+class _MappedFile:
+    """Read-only memory map of a file, held open for the lifetime of a blob."""
+
+    __slots__ = ("_map", "view")
+
+    def __init__(self, path: PathLike) -> None:
+        with Path(path).open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped.
+                self._map: mmap.mmap | None = None
+                self.view = memoryview(b"")
+            else:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.view = memoryview(self._map)
+
+    def close(self) -> None:
+        self.view.release()
+        if self._map is not None:
+            # Views handed out by `Blob.as_memoryview` keep the map alive; it is
+            # unmapped once the last of them is released.
+            with contextlib.suppress(BufferError):
+                self._map.close()
+
+
+class Blob(BaseMedia):  # noqa: PLW1641  # pydantic hashes frozen models
     """Blob represents raw data by either reference or value.
 
     Provides an interface to materialize the blob in different representations, and
@@ -102,6 +131,20 @@ class Blob(BaseMedia):
         with blob.as_bytes_io() as f:
             print(f.read())
         ```
+
+    Example: Memory-map a large file
+
+        ```python
+        from langchain_core.documents import Blob
+
+        with Blob.from_path("path/to/dump.log", memory_map=True) as blob:
+            # Zero-copy slice of the mapped file
+            header = blob.as_memoryview()[:1024]
+
+            # Decoded text in bounded windows, without the full string in memory
+            for text in blob.iter_text(window_size=1 << 20):
+                print(len(text))
+        ```
     """
 
     data: bytes | str | None = None
@@ -115,6 +158,18 @@ class Blob(BaseMedia):
     """
     path: PathLike | None = None
     """Location where the original content was found."""
+    memory_map: bool = False
+    """Whether to read the file at `path` through a memory map.
+
+    The file is mapped once, on first read, and every later read of the blob is
+    served from that mapping instead of reading the file again. Call `close` (or
+    use the blob as a context manager) to release it early.
+
+    Without it, every read of a blob backed by a path reads the file again, so the
+    blob holds no copy of the data and always reflects the file's current content.
+    """
+
+    _mapped: _MappedFile | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -153,6 +208,8 @@ class Blob(BaseMedia):
             The data as a string.
         """
         if self.data is None and self.path:
+            if self.memory_map:
+                return str(self._mapping().view, self.encoding)
             return Path(self.path).read_text(encoding=self.encoding)
         if isinstance(self.data, bytes):
             return self.data.decode(self.encoding)
@@ -175,10 +232,66 @@ class Blob(BaseMedia):
         if isinstance(self.data, str):
             return self.data.encode(self.encoding)
         if self.data is None and self.path:
+            if self.memory_map:
+                return self._mapping().view.tobytes()
             return Path(self.path).read_bytes()
         msg = f"Unable to get bytes for blob {self}"
         raise ValueError(msg)
 
+    def as_memoryview(self) -> memoryview:
+        """Read data as a `memoryview`.
+
+        For `memory_map` blobs this is a view of the mapped file, so slicing it does
+        not copy or read anything until the slice is accessed.
+
+        Raises:
+            ValueError: If the blob cannot be represented as bytes.
+
+        Returns:
+            A read-only view of the data.
+        """
+        if self.data is None and self.path and self.memory_map:
+            return self._mapping().view[:]
+        return memoryview(self.as_bytes()).toreadonly()
+
+    def iter_text(self, window_size: int = 1 << 20) -> Iterator[str]:
+        """Lazily decode the data as text, a window at a time.
+
+        Only one window of decoded text is held at a time, so arbitrarily large
+        files can be streamed into e.g. a text splitter. Multi-byte characters
+        that straddle a window boundary are decoded whole.
+
+        Args:
+            window_size: Number of bytes (characters, for `str` data) per window.
+
+        Raises:
+            ValueError: If `window_size` is less than 1 or the blob cannot be
+                represented as a string.
+
+        Yields:
+            Consecutive pieces of the text.
+        """
+        if window_size < 1:
+            msg = f"window_size must be at least 1. Got {window_size}."
+            raise ValueError(msg)
+        if isinstance(self.data, str):
+            for start in range(0, len(self.data), window_size):
+                yield self.data[start : start + window_size]
+            return
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        if self.data is None and self.path and not self.memory_map:
+            with Path(self.path).open("rb") as f:
+                while window := f.read(window_size):
+                    if text := decoder.decode(window):
+                        yield text
+        else:
+            view = self.as_memoryview()
+            for start in range(0, len(view), window_size):
+                if text := decoder.decode(view[start : start + window_size]):
+                    yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
     @contextlib.contextmanager
     def as_bytes_io(self) -> Generator[BytesIO | BufferedReader, None, None]:
         """Read data as a byte stream.
@@ -198,6 +311,51 @@ class Blob(BaseMedia):
             msg = f"Unable to convert blob {self}"
             raise NotImplementedError(msg)
 
+    def _mapping(self) -> _MappedFile:
+        if self._mapped is None:
+            self._mapped = _MappedFile(cast("PathLike", self.path))
+        return self._mapped
+
+    def close(self) -> None:
+        """Release the memory map of a `memory_map` blob, if it is open.
+
+        The blob stays readable; it is mapped again on the next read.
+        """
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare blobs by value, ignoring whether their file is mapped."""
+        if not isinstance(other, Blob) or (
+            self._mapped is None and other._mapped is None
+        ):
+            return super().__eq__(other)
+        return self._unmapped() == other._unmapped()
+
+    def _unmapped(self) -> Blob:
+        """A copy of the blob that does not share its memory map."""
+        blob = self.model_copy()
+        blob._mapped = None  # noqa: SLF001
+        return blob
+
+    def __enter__(self) -> Self:
+        """Use the blob as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Release the memory map, if any."""
+        self.close()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Pickle the blob without its memory map."""
+        state = super().__getstate__()
+        state["__pydantic_private__"] = {
+            **(state.get("__pydantic_private__") or {}),
+            "_mapped": None,
+        }
+        return state
+
     @classmethod
     def from_path(
         cls,
@@ -207,6 +365,7 @@ class Blob(BaseMedia):
         mime_type: str | None = None,
         guess_type: bool = True,
         metadata: dict | None = None,
+        memory_map: bool = False,
     ) -> Blob:
         """Load the blob from a path like object.
 
@@ -217,6 +376,8 @@ class Blob(BaseMedia):
             guess_type: If `True`, the mimetype will be guessed from the file extension,
                         if a mime-type was not provided
             metadata: Metadata to associate with the blob
+            memory_map: Whether to read the file through a memory map, see
+                `Blob.memory_map`
 
         Returns:
             Blob instance
@@ -233,6 +394,7 @@ class Blob(BaseMedia):
             encoding=encoding,
             path=path,
             metadata=metadata if metadata is not None else {},
+            memory_map=memory_map,
         )
 
     @classmethod
@@ -1,9 +1,32 @@
 """**Embeddings** interface."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.runnables.config import run_in_executor
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _to_float32_matrix(vectors: Any) -> np.ndarray:
+    """Convert a sequence of embedding vectors to a 2-D `float32` array."""
+    # numpy is imported lazily to keep importing `Embeddings` cheap
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        msg = (
+            "Array embeddings require numpy to be installed. "
+            "Please install numpy with `pip install numpy`."
+        )
+        raise ImportError(msg) from e
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1 if len(matrix) else 0)
+    return matrix
+
 
 class Embeddings(ABC):
     """Interface for embedding models.
@@ -28,6 +51,12 @@ class Embeddings(ABC):
     In addition to the synchronous methods, this interface also provides asynchronous
     versions of the methods.
 
+    `embed_documents_array` / `aembed_documents_array` return the document
+    embeddings as a single 2-D `float32` NumPy array instead of nested lists of
+    Python floats. By default they convert the output of `embed_documents`;
+    implementations that already produce arrays should override them to skip the
+    round trip through Python lists.
+
     By default, the asynchronous methods are implemented using the synchronous methods;
     however, implementations may choose to override the asynchronous methods with
     an async native implementation for performance reasons.
@@ -76,3 +105,31 @@ class Embeddings(ABC):
             Embedding.
         """
         return await run_in_executor(None, self.embed_query, text)
+
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        """Embed search docs into a 2-D `float32` array.
+
+        Args:
+            texts: List of text to embed.
+
+        Returns:
+            Array of shape `(len(texts), dimensions)`.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        return _to_float32_matrix(self.embed_documents(texts))
+
+    async def aembed_documents_array(self, texts: list[str]) -> np.ndarray:
+        """Asynchronous Embed search docs into a 2-D `float32` array.
+
+        Args:
+            texts: List of text to embed.
+
+        Returns:
+            Array of shape `(len(texts), dimensions)`.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        return _to_float32_matrix(await self.aembed_documents(texts))
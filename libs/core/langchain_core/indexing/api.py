@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import time
 import uuid
 import warnings
+from collections import deque
 from collections.abc import (
     AsyncIterable,
     AsyncIterator,
@@ -14,19 +17,24 @@ from collections.abc import (
     Iterator,
     Sequence,
 )
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
 from itertools import islice
 from typing import (
     Any,
     Literal,
-    TypedDict,
     TypeVar,
     cast,
 )
 
-from langchain_core.document_loaders.base import BaseLoader
+from typing_extensions import NotRequired, TypedDict
+
+from langchain_core.document_loaders.base import BaseLoader, FingerprintedLoader
 from langchain_core.documents import Document
 from langchain_core.exceptions import LangChainException
 from langchain_core.indexing.base import DocumentIndex, RecordManager
+from langchain_core.runnables import run_in_executor
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langchain_core.vectorstores import VectorStore
 
 # Magic UUID to use as a namespace for hashing.
@@ -36,6 +44,7 @@ NAMESPACE_UUID = uuid.UUID(int=1984)
 
 
 T = TypeVar("T")
+_R = TypeVar("_R")
 
 
 def _hash_string_to_uuid(input_string: str) -> str:
@@ -257,9 +266,129 @@ def _delete(
         raise TypeError(msg)
 
 
+class _ChangedSources:
+    """Documents of the sources of a `FingerprintedLoader` that have changed.
+
+    Sources whose fingerprint matches the stored one and which still have
+    records are not loaded; their records are refreshed instead, so that cleanup
+    keeps them. Fingerprints of loaded sources are stored by `commit`, once the
+    run has indexed their documents.
+    """
+
+    def __init__(
+        self,
+        loader: FingerprintedLoader,
+        record_manager: RecordManager,
+        *,
+        batch_size: int,
+        time_at_least: float,
+    ) -> None:
+        self.loader = loader
+        self.record_manager = record_manager
+        self.batch_size = batch_size
+        self.time_at_least = time_at_least
+        self.num_skipped = 0
+        self.fingerprints: dict[str, str] = {}
+
+    def _unchanged(
+        self, sources: list[tuple[str, str]], stored: dict[str, str]
+    ) -> list[str]:
+        return [
+            source_id
+            for source_id, fingerprint in sources
+            if stored.get(source_id) == fingerprint
+        ]
+
+    def __iter__(self) -> Iterator[Document]:
+        record_manager = self.record_manager
+        for sources in _batch(self.batch_size, self.loader.lazy_fingerprints()):
+            stored = record_manager.get_source_fingerprints(
+                [source_id for source_id, _ in sources]
+            )
+            keys: list[str] = []
+            group_ids: list[str] = []
+            skipped: set[str] = set()
+            for source_id in self._unchanged(sources, stored):
+                source_keys = record_manager.list_keys(group_ids=[source_id])
+                if source_keys:
+                    keys.extend(source_keys)
+                    group_ids.extend([source_id] * len(source_keys))
+                    skipped.add(source_id)
+            if keys:
+                record_manager.update(
+                    keys, group_ids=group_ids, time_at_least=self.time_at_least
+                )
+                self.num_skipped += len(keys)
+            for source_id, fingerprint in sources:
+                if source_id not in skipped:
+                    self.fingerprints[source_id] = fingerprint
+                    yield from self.loader.lazy_load_source(source_id)
+
+    async def __aiter__(self) -> AsyncIterator[Document]:
+        record_manager = self.record_manager
+        fingerprints = self.loader.lazy_fingerprints()
+        while sources := await run_in_executor(
+            None, lambda: list(islice(fingerprints, self.batch_size))
+        ):
+            stored = await record_manager.aget_source_fingerprints(
+                [source_id for source_id, _ in sources]
+            )
+            keys: list[str] = []
+            group_ids: list[str] = []
+            skipped: set[str] = set()
+            for source_id in self._unchanged(sources, stored):
+                source_keys = await record_manager.alist_keys(group_ids=[source_id])
+                if source_keys:
+                    keys.extend(source_keys)
+                    group_ids.extend([source_id] * len(source_keys))
+                    skipped.add(source_id)
+            if keys:
+                await record_manager.aupdate(
+                    keys, group_ids=group_ids, time_at_least=self.time_at_least
+                )
+                self.num_skipped += len(keys)
+            for source_id, fingerprint in sources:
+                if source_id not in skipped:
+                    self.fingerprints[source_id] = fingerprint
+                    docs = await run_in_executor(
+                        None, list, self.loader.lazy_load_source(source_id)
+                    )
+                    for doc in docs:
+                        yield doc
+
+    def commit(self) -> None:
+        if self.fingerprints:
+            self.record_manager.update_source_fingerprints(self.fingerprints)
+
+    async def acommit(self) -> None:
+        if self.fingerprints:
+            await self.record_manager.aupdate_source_fingerprints(self.fingerprints)
+
+
 # PUBLIC API
 
 
+class IndexingTimings(TypedDict):
+    """Seconds spent in each stage of a pipelined indexing run.
+
+    Stage times are summed over batches. Stages overlap, so their sum can exceed
+    `total`.
+    """
+
+    hash: float
+    """Hashing documents and assigning source ids."""
+    exists: float
+    """Checking the record manager for existing documents."""
+    write: float
+    """Writing (and embedding) documents in the vector store."""
+    update: float
+    """Updating records in the record manager."""
+    cleanup: float
+    """Finding and deleting outdated documents."""
+    total: float
+    """Wall-clock time of the whole run."""
+
+
 class IndexingResult(TypedDict):
     """Return a detailed a breakdown of the result of the indexing operation."""
 
@@ -271,6 +400,8 @@ class IndexingResult(TypedDict):
     """Number of deleted documents."""
     num_skipped: int
     """Number of skipped documents because they were already up to date."""
+    timings: NotRequired[IndexingTimings]
+    """Per-stage timings, reported when `max_in_flight_batches` is set."""
 
 
 def index(
@@ -286,6 +417,7 @@ def index(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_in_flight_batches: int | None = None,
 ) -> IndexingResult:
     """Index data from the loader into the vector store.
 
@@ -323,6 +455,12 @@ def index(
 
     Args:
         docs_source: Data loader or iterable of documents to index.
+
+            With a `FingerprintedLoader` and a `source_id_key`, sources whose
+            fingerprint is unchanged since the last run are not loaded, split
+            or hashed; their records are only refreshed and counted as
+            skipped. Pass `force_update=True` to load every source, e.g. after
+            changing how documents are split.
         record_manager: Timestamped set to keep track of which documents were
             updated.
         vector_store: VectorStore or DocumentIndex to index the documents into.
@@ -370,6 +508,13 @@ def index(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in version 0.3.10"
+        max_in_flight_batches: Pipeline the run, with up to this many batches
+            being written to the vector store concurrently. Hashing runs in
+            worker threads ahead of the writes, and each batch's records are
+            still updated only after its vector store write returns, in batch
+            order. The vector store must support concurrent writes.
+            The result then includes per-stage `timings`.
+            Default is None, which indexes one batch at a time.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -378,6 +523,7 @@ def index(
     Raises:
         ValueError: If cleanup mode is not one of 'incremental', 'full' or None
         ValueError: If cleanup mode is incremental and source_id_key is None.
+        ValueError: If max_in_flight_batches is less than 1.
         ValueError: If vectorstore does not have
             "delete" and "add_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
@@ -403,6 +549,10 @@ def index(
         )
         raise ValueError(msg)
 
+    if max_in_flight_batches is not None and max_in_flight_batches < 1:
+        msg = f"max_in_flight_batches must be at least 1. Got {max_in_flight_batches}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -443,6 +593,40 @@ def index(
 
     # Mark when the update started.
     index_start_dt = record_manager.get_time()
+    changed_sources: _ChangedSources | None = None
+    if (
+        isinstance(docs_source, FingerprintedLoader)
+        and source_id_key is not None
+        and not force_update
+    ):
+        changed_sources = _ChangedSources(
+            docs_source,
+            record_manager,
+            batch_size=batch_size,
+            time_at_least=index_start_dt,
+        )
+        doc_iterator = iter(changed_sources)
+
+    if max_in_flight_batches is not None:
+        result = _index_pipelined(
+            doc_iterator,
+            record_manager,
+            destination,
+            index_start_dt=index_start_dt,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            max_in_flight_batches=max_in_flight_batches,
+        )
+        if changed_sources is not None:
+            changed_sources.commit()
+            result["num_skipped"] += changed_sources.num_skipped
+        return result
+
     num_added = 0
     num_skipped = 0
     num_updated = 0
@@ -562,6 +746,10 @@ def index(
                 record_manager.delete_keys(uids_to_delete)
                 num_deleted += len(uids_to_delete)
 
+    if changed_sources is not None:
+        changed_sources.commit()
+        num_skipped += changed_sources.num_skipped
+
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
     ):
@@ -627,6 +815,7 @@ async def aindex(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_in_flight_batches: int | None = None,
 ) -> IndexingResult:
     """Async index data from the loader into the vector store.
 
@@ -664,6 +853,12 @@ async def aindex(
 
     Args:
         docs_source: Data loader or iterable of documents to index.
+
+            With a `FingerprintedLoader` and a `source_id_key`, sources whose
+            fingerprint is unchanged since the last run are not loaded, split
+            or hashed; their records are only refreshed and counted as
+            skipped. Pass `force_update=True` to load every source, e.g. after
+            changing how documents are split.
         record_manager: Timestamped set to keep track of which documents were
             updated.
         vector_store: VectorStore or DocumentIndex to index the documents into.
@@ -711,6 +906,13 @@ async def aindex(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in version 0.3.10"
+        max_in_flight_batches: Pipeline the run, with up to this many batches
+            being written to the vector store concurrently. Hashing runs in
+            worker threads ahead of the writes, and each batch's records are
+            still updated only after its vector store write returns, in batch
+            order. The vector store must support concurrent writes.
+            The result then includes per-stage `timings`.
+            Default is None, which indexes one batch at a time.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -719,6 +921,7 @@ async def aindex(
     Raises:
         ValueError: If cleanup mode is not one of 'incremental', 'full' or None
         ValueError: If cleanup mode is incremental and source_id_key is None.
+        ValueError: If max_in_flight_batches is less than 1.
         ValueError: If vectorstore does not have
             "adelete" and "aadd_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
@@ -744,6 +947,10 @@ async def aindex(
         )
         raise ValueError(msg)
 
+    if max_in_flight_batches is not None and max_in_flight_batches < 1:
+        msg = f"max_in_flight_batches must be at least 1. Got {max_in_flight_batches}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -795,6 +1002,40 @@ async def aindex(
 
     # Mark when the update started.
     index_start_dt = await record_manager.aget_time()
+    changed_sources: _ChangedSources | None = None
+    if (
+        isinstance(docs_source, FingerprintedLoader)
+        and source_id_key is not None
+        and not force_update
+    ):
+        changed_sources = _ChangedSources(
+            docs_source,
+            record_manager,
+            batch_size=batch_size,
+            time_at_least=index_start_dt,
+        )
+        async_doc_iterator = aiter(changed_sources)
+
+    if max_in_flight_batches is not None:
+        result = await _aindex_pipelined(
+            async_doc_iterator,
+            record_manager,
+            destination,
+            index_start_dt=index_start_dt,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            max_in_flight_batches=max_in_flight_batches,
+        )
+        if changed_sources is not None:
+            await changed_sources.acommit()
+            result["num_skipped"] += changed_sources.num_skipped
+        return result
+
     num_added = 0
     num_skipped = 0
     num_updated = 0
@@ -915,6 +1156,10 @@ async def aindex(
                 await record_manager.adelete_keys(uids_to_delete)
                 num_deleted += len(uids_to_delete)
 
+    if changed_sources is not None:
+        await changed_sources.acommit()
+        num_skipped += changed_sources.num_skipped
+
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
     ):
@@ -936,3 +1181,469 @@ async def aindex(
         "num_skipped": num_skipped,
         "num_deleted": num_deleted,
     }
+
+
+# PIPELINED INDEXING
+#
+# With `max_in_flight_batches` set, batches flow through three stages:
+#
+# 1. hashing, in worker threads, read ahead of the main loop;
+# 2. `exists` on the main thread, then the vector store write in a worker thread,
+#    so that up to `max_in_flight_batches` writes overlap;
+# 3. a commit step on the main thread, strictly in batch order: the record
+#    manager is updated (and incremental cleanup runs) only after the batch's
+#    vector store write has returned.
+#
+# All record manager calls stay on the main thread. Because a batch's `exists`
+# check may run before earlier batches commit, the commit step reconciles it
+# against what those commits did in the meantime (see `_PipelineLedger`).
+
+
+@dataclass
+class _HashedBatch:
+    docs: list[Document]
+    source_ids: Sequence[str | None]
+    num_duplicates: int
+    seconds: float
+
+
+@dataclass
+class _PendingBatch:
+    hashed: _HashedBatch
+    exists: list[bool]
+    log_position: int
+
+
+def _hash_batch(
+    doc_batch: list[Document],
+    *,
+    key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
+    | Callable[[Document], str],
+    source_id_assigner: Callable[[Document], str | None],
+    require_source_ids: bool,
+) -> _HashedBatch:
+    start = time.perf_counter()
+    hashed_docs = list(
+        _deduplicate_in_order(
+            [_get_document_with_hash(doc, key_encoder=key_encoder) for doc in doc_batch]
+        )
+    )
+    source_ids = [source_id_assigner(doc) for doc in hashed_docs]
+    if require_source_ids:
+        for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
+            if source_id is None:
+                msg = (
+                    f"Source ids are required when cleanup mode is "
+                    f"incremental or scoped_full. "
+                    f"Document that starts with "
+                    f"content: {hashed_doc.page_content[:100]} "
+                    f"was not assigned as source id."
+                )
+                raise ValueError(msg)
+    return _HashedBatch(
+        docs=hashed_docs,
+        source_ids=source_ids,
+        num_duplicates=len(doc_batch) - len(hashed_docs),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _write(
+    destination: VectorStore | DocumentIndex,
+    docs: list[Document],
+    *,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> float:
+    """Write documents to the destination; return the seconds it took."""
+    start = time.perf_counter()
+    if isinstance(destination, VectorStore):
+        destination.add_documents(
+            docs,
+            ids=[cast("str", doc.id) for doc in docs],
+            batch_size=batch_size,
+            **(upsert_kwargs or {}),
+        )
+    else:
+        destination.upsert(docs, **(upsert_kwargs or {}))
+    return time.perf_counter() - start
+
+
+async def _awrite(
+    destination: VectorStore | DocumentIndex,
+    docs: list[Document],
+    *,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> float:
+    """Write documents to the destination; return the seconds it took."""
+    start = time.perf_counter()
+    if isinstance(destination, VectorStore):
+        await destination.aadd_documents(
+            docs,
+            ids=[cast("str", doc.id) for doc in docs],
+            batch_size=batch_size,
+            **(upsert_kwargs or {}),
+        )
+    else:
+        await destination.aupsert(docs, **(upsert_kwargs or {}))
+    return time.perf_counter() - start
+
+
+class _PipelineLedger:
+    """Record manager changes made by commits, for reconciling later batches.
+
+    A batch's `exists` result is a snapshot taken when it entered the pipeline.
+    By the time it commits, earlier batches may have added the same documents or
+    deleted them during incremental cleanup. Replaying the changes made since
+    the snapshot recovers what a sequential run would have seen at that point.
+    """
+
+    def __init__(self) -> None:
+        self._log: list[tuple[str, bool]] = []  # (uid, present after the change)
+        self._offset = 0
+
+    def position(self) -> int:
+        return self._offset + len(self._log)
+
+    def record(self, uids: Iterable[str], *, present: bool) -> None:
+        self._log.extend((uid, present) for uid in uids)
+
+    def trim(self, position: int) -> None:
+        """Forget changes before `position`, which no pending batch needs."""
+        del self._log[: position - self._offset]
+        self._offset = position
+
+    def reconcile(
+        self, batch: _PendingBatch, *, force_update: bool
+    ) -> tuple[list[Document], int, int, int]:
+        """Return documents to write again, and added/updated/skipped counts.
+
+        Documents that existed at the snapshot were not written unless
+        `force_update` is set. If a cleanup has deleted one since, it must be
+        written again before its record is refreshed.
+        """
+        changes = self._log[batch.log_position - self._offset :]
+        present_now = dict(changes)
+        deleted = {uid for uid, present in changes if not present}
+        rewrite = []
+        num_added = num_updated = num_skipped = 0
+        for doc, existed in zip(batch.hashed.docs, batch.exists, strict=False):
+            uid = cast("str", doc.id)
+            if existed and uid in deleted:
+                rewrite.append(doc)
+            if present_now.get(uid, existed):
+                if force_update:
+                    num_updated += 1
+                else:
+                    num_skipped += 1
+            else:
+                num_added += 1
+        return rewrite, num_added, num_updated, num_skipped
+
+
+def _new_timings() -> IndexingTimings:
+    return {
+        "hash": 0.0,
+        "exists": 0.0,
+        "write": 0.0,
+        "update": 0.0,
+        "cleanup": 0.0,
+        "total": 0.0,
+    }
+
+
+def _prefetch(
+    executor: Executor,
+    fn: Callable[[T], _R],
+    items: Iterable[T],
+    depth: int,
+) -> Iterator[_R]:
+    """Map `fn` over `items` in `executor`, keeping `depth` calls in flight."""
+    queue: deque[Future[_R]] = deque()
+    for item in items:
+        queue.append(executor.submit(fn, item))
+        if len(queue) > depth:
+            yield queue.popleft().result()
+    while queue:
+        yield queue.popleft().result()
+
+
+async def _aprefetch(
+    fn: Callable[[T], _R],
+    items: AsyncIterable[T],
+    depth: int,
+) -> AsyncIterator[_R]:
+    """Map `fn` over `items` in the default executor, keeping `depth` in flight."""
+    queue: deque[asyncio.Future[_R]] = deque()
+    try:
+        async for item in items:
+            queue.append(asyncio.ensure_future(run_in_executor(None, fn, item)))
+            if len(queue) > depth:
+                yield await queue.popleft()
+        while queue:
+            yield await queue.popleft()
+    finally:
+        for future in queue:
+            future.cancel()
+
+
+def _index_pipelined(
+    doc_iterator: Iterable[Document],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    index_start_dt: float,
+    batch_size: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup_batch_size: int,
+    force_update: bool,
+    key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
+    | Callable[[Document], str],
+    upsert_kwargs: dict[str, Any] | None,
+    max_in_flight_batches: int,
+) -> IndexingResult:
+    start = time.perf_counter()
+    timings = _new_timings()
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    scoped_full_cleanup_source_ids: set[str] = set()
+    ledger = _PipelineLedger()
+    pending: deque[tuple[_PendingBatch, Future[float] | None]] = deque()
+
+    def delete(group_ids: Sequence[str] | None) -> None:
+        t = time.perf_counter()
+        while uids_to_delete := record_manager.list_keys(
+            group_ids=group_ids, before=index_start_dt, limit=cleanup_batch_size
+        ):
+            # First delete from vector store, then from the record manager.
+            _delete(destination, uids_to_delete)
+            record_manager.delete_keys(uids_to_delete)
+            ledger.record(uids_to_delete, present=False)
+            result["num_deleted"] += len(uids_to_delete)
+        timings["cleanup"] += time.perf_counter() - t
+
+    def commit(batch: _PendingBatch, write: Future[float] | None) -> None:
+        if write is not None:
+            timings["write"] += write.result()
+        rewrite, num_added, num_updated, num_skipped = ledger.reconcile(
+            batch, force_update=force_update
+        )
+        if rewrite:
+            timings["write"] += _write(
+                destination,
+                rewrite,
+                batch_size=batch_size,
+                upsert_kwargs=upsert_kwargs,
+            )
+        result["num_added"] += num_added
+        result["num_updated"] += num_updated
+        result["num_skipped"] += num_skipped
+        uids = [cast("str", doc.id) for doc in batch.hashed.docs]
+        t = time.perf_counter()
+        record_manager.update(
+            uids, group_ids=batch.hashed.source_ids, time_at_least=index_start_dt
+        )
+        timings["update"] += time.perf_counter() - t
+        ledger.record(uids, present=True)
+        if cleanup == "incremental":
+            delete(cast("Sequence[str]", batch.hashed.source_ids))
+        ledger.trim(pending[0][0].log_position if pending else ledger.position())
+
+    def hash_batch(doc_batch: list[Document]) -> _HashedBatch:
+        return _hash_batch(
+            doc_batch,
+            key_encoder=key_encoder,
+            source_id_assigner=source_id_assigner,
+            require_source_ids=cleanup in {"incremental", "scoped_full"},
+        )
+
+    # Hashing read-ahead and vector store writes each get their own workers.
+    executor = ContextThreadPoolExecutor(max_workers=2 * max_in_flight_batches)
+    try:
+        for hashed in _prefetch(
+            executor,
+            hash_batch,
+            _batch(batch_size, doc_iterator),
+            max_in_flight_batches,
+        ):
+            timings["hash"] += hashed.seconds
+            result["num_skipped"] += hashed.num_duplicates
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.update(
+                    cast("Sequence[str]", hashed.source_ids)
+                )
+            log_position = ledger.position()
+            t = time.perf_counter()
+            exists = record_manager.exists([cast("str", doc.id) for doc in hashed.docs])
+            timings["exists"] += time.perf_counter() - t
+            docs_to_index = [
+                doc
+                for doc, doc_exists in zip(hashed.docs, exists, strict=False)
+                if force_update or not doc_exists
+            ]
+            write = (
+                executor.submit(
+                    _write,
+                    destination,
+                    docs_to_index,
+                    batch_size=batch_size,
+                    upsert_kwargs=upsert_kwargs,
+                )
+                if docs_to_index
+                else None
+            )
+            pending.append((_PendingBatch(hashed, exists, log_position), write))
+            while len(pending) >= max_in_flight_batches:
+                commit(*pending.popleft())
+        while pending:
+            commit(*pending.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if cleanup == "full" or (
+        cleanup == "scoped_full" and scoped_full_cleanup_source_ids
+    ):
+        delete(
+            list(scoped_full_cleanup_source_ids) if cleanup == "scoped_full" else None
+        )
+
+    timings["total"] = time.perf_counter() - start
+    result["timings"] = timings
+    return result
+
+
+async def _aindex_pipelined(
+    doc_iterator: AsyncIterator[Document],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    index_start_dt: float,
+    batch_size: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup_batch_size: int,
+    force_update: bool,
+    key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
+    | Callable[[Document], str],
+    upsert_kwargs: dict[str, Any] | None,
+    max_in_flight_batches: int,
+) -> IndexingResult:
+    start = time.perf_counter()
+    timings = _new_timings()
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    scoped_full_cleanup_source_ids: set[str] = set()
+    ledger = _PipelineLedger()
+    pending: deque[tuple[_PendingBatch, asyncio.Task[float] | None]] = deque()
+
+    async def delete(group_ids: Sequence[str] | None) -> None:
+        t = time.perf_counter()
+        while uids_to_delete := await record_manager.alist_keys(
+            group_ids=group_ids, before=index_start_dt, limit=cleanup_batch_size
+        ):
+            # First delete from vector store, then from the record manager.
+            await _adelete(destination, uids_to_delete)
+            await record_manager.adelete_keys(uids_to_delete)
+            ledger.record(uids_to_delete, present=False)
+            result["num_deleted"] += len(uids_to_delete)
+        timings["cleanup"] += time.perf_counter() - t
+
+    async def commit(batch: _PendingBatch, write: asyncio.Task[float] | None) -> None:
+        if write is not None:
+            timings["write"] += await write
+        rewrite, num_added, num_updated, num_skipped = ledger.reconcile(
+            batch, force_update=force_update
+        )
+        if rewrite:
+            timings["write"] += await _awrite(
+                destination,
+                rewrite,
+                batch_size=batch_size,
+                upsert_kwargs=upsert_kwargs,
+            )
+        result["num_added"] += num_added
+        result["num_updated"] += num_updated
+        result["num_skipped"] += num_skipped
+        uids = [cast("str", doc.id) for doc in batch.hashed.docs]
+        t = time.perf_counter()
+        await record_manager.aupdate(
+            uids, group_ids=batch.hashed.source_ids, time_at_least=index_start_dt
+        )
+        timings["update"] += time.perf_counter() - t
+        ledger.record(uids, present=True)
+        if cleanup == "incremental":
+            await delete(cast("Sequence[str]", batch.hashed.source_ids))
+        ledger.trim(pending[0][0].log_position if pending else ledger.position())
+
+    def hash_batch(doc_batch: list[Document]) -> _HashedBatch:
+        return _hash_batch(
+            doc_batch,
+            key_encoder=key_encoder,
+            source_id_assigner=source_id_assigner,
+            require_source_ids=cleanup in {"incremental", "scoped_full"},
+        )
+
+    try:
+        async for hashed in _aprefetch(
+            hash_batch, _abatch(batch_size, doc_iterator), max_in_flight_batches
+        ):
+            timings["hash"] += hashed.seconds
+            result["num_skipped"] += hashed.num_duplicates
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.update(
+                    cast("Sequence[str]", hashed.source_ids)
+                )
+            log_position = ledger.position()
+            t = time.perf_counter()
+            exists = await record_manager.aexists(
+                [cast("str", doc.id) for doc in hashed.docs]
+            )
+            timings["exists"] += time.perf_counter() - t
+            docs_to_index = [
+                doc
+                for doc, doc_exists in zip(hashed.docs, exists, strict=False)
+                if force_update or not doc_exists
+            ]
+            write = (
+                asyncio.create_task(
+                    _awrite(
+                        destination,
+                        docs_to_index,
+                        batch_size=batch_size,
+                        upsert_kwargs=upsert_kwargs,
+                    )
+                )
+                if docs_to_index
+                else None
+            )
+            pending.append((_PendingBatch(hashed, exists, log_position), write))
+            while len(pending) >= max_in_flight_batches:
+                await commit(*pending.popleft())
+        while pending:
+            await commit(*pending.popleft())
+    finally:
+        writes = [write for _, write in pending if write is not None]
+        for write in writes:
+            write.cancel()
+        await asyncio.gather(*writes, return_exceptions=True)
+
+    if cleanup == "full" or (
+        cleanup == "scoped_full" and scoped_full_cleanup_source_ids
+    ):
+        await delete(
+            list(scoped_full_cleanup_source_ids) if cleanup == "scoped_full" else None
+        )
+
+    timings["total"] = time.perf_counter() - start
+    result["timings"] = timings
+    return result
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import itertools
+import operator
 import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, TypedDict
@@ -14,7 +17,7 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import run_in_executor
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from langchain_core.documents import Document
 
@@ -231,12 +234,60 @@ class RecordManager(ABC):
             keys: A list of keys to delete.
         """
 
+    def get_source_fingerprints(self, source_ids: Sequence[str]) -> dict[str, str]:  # noqa: ARG002
+        """Get the stored fingerprints of the given sources.
+
+        Fingerprints let the indexing API skip loading sources that have not
+        changed since they were last indexed (see `FingerprintedLoader`).
+        The default implementation does not store fingerprints.
+
+        Args:
+            source_ids: Source ids to look up.
+
+        Returns:
+            A mapping from source id to fingerprint, for sources that have one.
+        """
+        return {}
+
+    async def aget_source_fingerprints(
+        self, source_ids: Sequence[str]
+    ) -> dict[str, str]:
+        """Asynchronously get the stored fingerprints of the given sources.
+
+        Args:
+            source_ids: Source ids to look up.
+
+        Returns:
+            A mapping from source id to fingerprint, for sources that have one.
+        """
+        return await run_in_executor(None, self.get_source_fingerprints, source_ids)
+
+    def update_source_fingerprints(self, fingerprints: dict[str, str]) -> None:  # noqa: B027
+        """Store fingerprints of sources whose documents have been indexed.
+
+        The default implementation discards them.
+
+        Args:
+            fingerprints: A mapping from source id to fingerprint.
+        """
+
+    async def aupdate_source_fingerprints(self, fingerprints: dict[str, str]) -> None:
+        """Asynchronously store fingerprints of indexed sources.
+
+        Args:
+            fingerprints: A mapping from source id to fingerprint.
+        """
+        await run_in_executor(None, self.update_source_fingerprints, fingerprints)
+
 
 class _Record(TypedDict):
     group_id: str | None
     updated_at: float
 
 
+_updated_at = operator.itemgetter(0)
+
+
 class InMemoryRecordManager(RecordManager):
     """An in-memory record manager for testing purposes."""
 
@@ -251,6 +302,15 @@ class InMemoryRecordManager(RecordManager):
         # of {'group_id': group_id, 'updated_at': timestamp}
         self.records: dict[str, _Record] = {}
         self.namespace = namespace
+        # Secondary indexes serving `list_keys` filters without a full scan.
+        # Keys by group id, in insertion order.
+        self._groups: dict[str | None, dict[str, None]] = {}
+        # (updated_at, key) entries, appended on every update. An entry is stale
+        # once its key is deleted or updated again; stale entries are skipped
+        # on read and dropped when they outnumber the live records.
+        self._times: list[tuple[float, str]] = []
+        self._times_sorted = True
+        self.fingerprints: dict[str, str] = {}
 
     def create_schema(self) -> None:
         """In-memory schema creation is simply ensuring the structure is initialized."""
@@ -296,12 +356,56 @@ class InMemoryRecordManager(RecordManager):
         if group_ids and len(keys) != len(group_ids):
             msg = "Length of keys must match length of group_ids"
             raise ValueError(msg)
+        if not keys:
+            return
+        update_time = self.get_time()
+        if time_at_least and time_at_least > update_time:
+            msg = "time_at_least must be in the past"
+            raise ValueError(msg)
+        if self._times and self._times[-1][0] > update_time:
+            self._times_sorted = False
         for index, key in enumerate(keys):
             group_id = group_ids[index] if group_ids else None
-            if time_at_least and time_at_least > self.get_time():
-                msg = "time_at_least must be in the past"
-                raise ValueError(msg)
-            self.records[key] = {"group_id": group_id, "updated_at": self.get_time()}
+            previous = self.records.get(key)
+            if previous is not None and previous["group_id"] != group_id:
+                self._discard_from_group(key, previous["group_id"])
+            self.records[key] = {"group_id": group_id, "updated_at": update_time}
+            self._groups.setdefault(group_id, {})[key] = None
+            self._times.append((update_time, key))
+        if len(self._times) > 2 * len(self.records) + 1024:
+            self._compact_times()
+
+    def _discard_from_group(self, key: str, group_id: str | None) -> None:
+        group = self._groups.get(group_id)
+        if group is not None:
+            group.pop(key, None)
+            if not group:
+                del self._groups[group_id]
+
+    def _compact_times(self) -> None:
+        self._times = sorted(
+            (record["updated_at"], key) for key, record in self.records.items()
+        )
+        self._times_sorted = True
+
+    def _keys_in_time_range(
+        self, before: float | None, after: float | None
+    ) -> Iterator[str]:
+        """Yield live keys with `after < updated_at < before` from the time index."""
+        if not self._times_sorted:
+            self._times.sort()
+            self._times_sorted = True
+        times = self._times
+        start = bisect.bisect_right(times, after, key=_updated_at) if after else 0
+        stop = (
+            bisect.bisect_left(times, before, key=_updated_at) if before else len(times)
+        )
+        records = self.records
+        for i in range(start, stop):
+            updated_at, key = times[i]
+            record = records.get(key)
+            if record is not None and record["updated_at"] == updated_at:
+                yield key
 
     async def aupdate(
         self,
@@ -372,18 +476,28 @@ class InMemoryRecordManager(RecordManager):
         Returns:
             A list of keys for the matching records.
         """
-        result = []
-        for key, data in self.records.items():
-            if before and data["updated_at"] >= before:
-                continue
-            if after and data["updated_at"] <= after:
-                continue
-            if group_ids and data["group_id"] not in group_ids:
-                continue
-            result.append(key)
+        candidates: Iterable[str]
+        if group_ids:
+            candidates = (
+                key
+                for group_id in dict.fromkeys(group_ids)
+                for key in self._groups.get(group_id, ())
+            )
+            if before or after:
+                candidates = (
+                    key
+                    for key in candidates
+                    if not (before and self.records[key]["updated_at"] >= before)
+                    and not (after and self.records[key]["updated_at"] <= after)
+                )
+        elif before or after:
+            # The same key can appear twice if it was re-added with an equal time.
+            candidates = dict.fromkeys(self._keys_in_time_range(before, after))
+        else:
+            candidates = self.records
         if limit:
-            return result[:limit]
-        return result
+            return list(itertools.islice(candidates, limit))
+        return list(candidates)
 
     async def alist_keys(
         self,
@@ -419,8 +533,9 @@ class InMemoryRecordManager(RecordManager):
             keys: A list of keys to delete.
         """
         for key in keys:
-            if key in self.records:
-                del self.records[key]
+            record = self.records.pop(key, None)
+            if record is not None:
+                self._discard_from_group(key, record["group_id"])
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Async delete specified records from the database.
@@ -430,6 +545,28 @@ class InMemoryRecordManager(RecordManager):
         """
         self.delete_keys(keys)
 
+    @override
+    def get_source_fingerprints(self, source_ids: Sequence[str]) -> dict[str, str]:
+        return {
+            source_id: self.fingerprints[source_id]
+            for source_id in source_ids
+            if source_id in self.fingerprints
+        }
+
+    @override
+    async def aget_source_fingerprints(
+        self, source_ids: Sequence[str]
+    ) -> dict[str, str]:
+        return self.get_source_fingerprints(source_ids)
+
+    @override
+    def update_source_fingerprints(self, fingerprints: dict[str, str]) -> None:
+        self.fingerprints.update(fingerprints)
+
+    @override
+    async def aupdate_source_fingerprints(self, fingerprints: dict[str, str]) -> None:
+        self.update_source_fingerprints(fingerprints)
+
 
 class UpsertResponse(TypedDict):
     """A generic response for upsert operations.
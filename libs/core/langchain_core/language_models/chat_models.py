@@ -55,11 +55,11 @@ from langchain_core.outputs import (
     ChatGeneration,
     ChatGenerationChunk,
     ChatResult,
+    ChunkAccumulator,
     Generation,
     LLMResult,
     RunInfo,
 )
-from langchain_core.outputs.chat_generation import merge_chat_generation_chunks
 from langchain_core.prompt_values import ChatPromptValue, PromptValue, StringPromptValue
 from langchain_core.rate_limiters import BaseRateLimiter
 from langchain_core.runnables import RunnableMap, RunnablePassthrough
@@ -188,9 +188,10 @@ def generate_from_stream(stream: Iterator[ChatGenerationChunk]) -> ChatResult:
         Chat result.
 
     """
-    generation = next(stream, None)
-    if generation:
-        generation += list(stream)
+    accumulator = ChunkAccumulator()
+    for chunk in stream:
+        accumulator.add(chunk)
+    generation: ChatGenerationChunk | None = accumulator.result()
     if generation is None:
         msg = "No generations found in stream."
         raise ValueError(msg)
@@ -505,7 +506,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 batch_size=1,
             )
 
-            chunks: list[ChatGenerationChunk] = []
+            accumulator = ChunkAccumulator()
 
             if self.rate_limiter:
                 self.rate_limiter.acquire(blocking=True)
@@ -536,7 +537,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     run_manager.on_llm_new_token(
                         cast("str", chunk.message.content), chunk=chunk
                     )
-                    chunks.append(chunk)
+                    accumulator.add(chunk)
                     yield cast("AIMessageChunk", chunk.message)
                     yielded = True
 
@@ -559,7 +560,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     yield msg_chunk
             except BaseException as e:
                 generations_with_error_metadata = _generate_response_from_error(e)
-                chat_generation_chunk = merge_chat_generation_chunks(chunks)
+                chat_generation_chunk = accumulator.result()
                 if chat_generation_chunk:
                     generations = [
                         [chat_generation_chunk],
@@ -573,7 +574,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 )
                 raise
 
-            generation = merge_chat_generation_chunks(chunks)
+            generation = accumulator.result()
             if generation is None:
                 err = ValueError("No generation chunks were returned")
                 run_manager.on_llm_error(err, response=LLMResult(generations=[]))
@@ -636,7 +637,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         if self.rate_limiter:
             await self.rate_limiter.aacquire(blocking=True)
 
-        chunks: list[ChatGenerationChunk] = []
+        accumulator = ChunkAccumulator()
 
         try:
             input_messages = _normalize_messages(messages)
@@ -668,7 +669,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 await run_manager.on_llm_new_token(
                     cast("str", chunk.message.content), chunk=chunk
                 )
-                chunks.append(chunk)
+                accumulator.add(chunk)
                 yield cast("AIMessageChunk", chunk.message)
                 yielded = True
 
@@ -690,7 +691,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 yield msg_chunk
         except BaseException as e:
             generations_with_error_metadata = _generate_response_from_error(e)
-            chat_generation_chunk = merge_chat_generation_chunks(chunks)
+            chat_generation_chunk = accumulator.result()
             if chat_generation_chunk:
                 generations = [[chat_generation_chunk], generations_with_error_metadata]
             else:
@@ -701,7 +702,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             )
             raise
 
-        generation = merge_chat_generation_chunks(chunks)
+        generation = accumulator.result()
         if not generation:
             err = ValueError("No generation chunks were returned")
             await run_manager.on_llm_error(err, response=LLMResult(generations=[]))
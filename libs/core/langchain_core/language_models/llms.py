@@ -48,7 +48,13 @@ from langchain_core.load import dumpd
 from langchain_core.messages import (
     convert_to_messages,
 )
-from langchain_core.outputs import Generation, GenerationChunk, LLMResult, RunInfo
+from langchain_core.outputs import (
+    ChunkAccumulator,
+    Generation,
+    GenerationChunk,
+    LLMResult,
+    RunInfo,
+)
 from langchain_core.prompt_values import ChatPromptValue, PromptValue, StringPromptValue
 from langchain_core.runnables import RunnableConfig, ensure_config, get_config_list
 from langchain_core.runnables.config import run_in_executor
@@ -533,25 +539,23 @@ class BaseLLM(BaseLanguageModel[str], ABC):
                 run_id=config.pop("run_id", None),
                 batch_size=1,
             )
-            generation: GenerationChunk | None = None
+            accumulator = ChunkAccumulator()
             try:
                 for chunk in self._stream(
                     prompt, stop=stop, run_manager=run_manager, **kwargs
                 ):
                     yield chunk.text
-                    if generation is None:
-                        generation = chunk
-                    else:
-                        generation += chunk
+                    accumulator.add(chunk)
             except BaseException as e:
                 run_manager.on_llm_error(
                     e,
                     response=LLMResult(
-                        generations=[[generation]] if generation else []
+                        generations=[[accumulator.result()]] if accumulator else []
                     ),
                 )
                 raise
 
+            generation: GenerationChunk | None = accumulator.result()
             if generation is None:
                 err = ValueError("No generation chunks were returned")
                 run_manager.on_llm_error(err, response=LLMResult(generations=[]))
@@ -603,7 +607,7 @@ class BaseLLM(BaseLanguageModel[str], ABC):
             run_id=config.pop("run_id", None),
             batch_size=1,
         )
-        generation: GenerationChunk | None = None
+        accumulator = ChunkAccumulator()
         try:
             async for chunk in self._astream(
                 prompt,
@@ -612,17 +616,17 @@ class BaseLLM(BaseLanguageModel[str], ABC):
                 **kwargs,
             ):
                 yield chunk.text
-                if generation is None:
-                    generation = chunk
-                else:
-                    generation += chunk
+                accumulator.add(chunk)
         except BaseException as e:
             await run_manager.on_llm_error(
                 e,
-                response=LLMResult(generations=[[generation]] if generation else []),
+                response=LLMResult(
+                    generations=[[accumulator.result()]] if accumulator else []
+                ),
             )
             raise
 
+        generation: GenerationChunk | None = accumulator.result()
         if generation is None:
             err = ValueError("No generation chunks were returned")
             await run_manager.on_llm_error(err, response=LLMResult(generations=[]))
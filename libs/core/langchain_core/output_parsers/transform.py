@@ -14,6 +14,7 @@ from langchain_core.output_parsers.base import BaseOutputParser, T
 from langchain_core.outputs import (
     ChatGeneration,
     ChatGenerationChunk,
+    ChunkAccumulator,
     Generation,
     GenerationChunk,
 )
@@ -125,7 +126,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     @override
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
-        acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        acc_gen = ChunkAccumulator()
         for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -137,9 +138,11 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+            if not acc_gen.add(chunk_gen):
+                # Parsing the same input again cannot give a new result
+                continue
 
-            parsed = self.parse_result([acc_gen], partial=True)
+            parsed = self.parse_result([acc_gen.result()], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield self._diff(prev_parsed, parsed)
@@ -152,7 +155,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         self, input: AsyncIterator[str | BaseMessage]
     ) -> AsyncIterator[T]:
         prev_parsed = None
-        acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        acc_gen = ChunkAccumulator()
         async for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -164,9 +167,11 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+            if not acc_gen.add(chunk_gen):
+                # Parsing the same input again cannot give a new result
+                continue
 
-            parsed = await self.aparse_result([acc_gen], partial=True)
+            parsed = await self.aparse_result([acc_gen.result()], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield await run_in_executor(None, self._diff, prev_parsed, parsed)
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
         ChatGenerationChunk,
     )
     from langchain_core.outputs.chat_result import ChatResult
+    from langchain_core.outputs.chunk_accumulator import ChunkAccumulator
     from langchain_core.outputs.generation import Generation, GenerationChunk
     from langchain_core.outputs.llm_result import LLMResult
     from langchain_core.outputs.run_info import RunInfo
@@ -38,6 +39,7 @@ __all__ = (
     "ChatGeneration",
     "ChatGenerationChunk",
     "ChatResult",
+    "ChunkAccumulator",
     "Generation",
     "GenerationChunk",
     "LLMResult",
@@ -48,6 +50,7 @@ _dynamic_imports = {
     "ChatGeneration": "chat_generation",
     "ChatGenerationChunk": "chat_generation",
     "ChatResult": "chat_result",
+    "ChunkAccumulator": "chunk_accumulator",
     "Generation": "generation",
     "GenerationChunk": "generation",
     "LLMResult": "llm_result",
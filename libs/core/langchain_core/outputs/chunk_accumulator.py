@@ -0,0 +1,314 @@
+"""Linear-time accumulation of streamed chunks."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from typing_extensions import Self
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.ai import UsageMetadata, add_usage
+from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
+from langchain_core.outputs.chat_generation import ChatGenerationChunk
+from langchain_core.outputs.generation import GenerationChunk
+from langchain_core.utils._merge import _DictBuilder, _ListBuilder, _StrBuilder
+from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
+
+
+class _ContentBuilder:
+    """Incremental equivalent of `merge_content(first, *others)`."""
+
+    __slots__ = ("blocks", "text")
+
+    def __init__(self, first: str | list[str | dict] | None) -> None:
+        self.text: _StrBuilder | None = None
+        self.blocks: _ListBuilder | None = None
+        if first is None or isinstance(first, str):
+            self.text = _StrBuilder(first or "")
+        else:
+            self.blocks = _ListBuilder(first)
+
+    def add(self, content: str | list[str | dict]) -> None:
+        if self.text is not None:
+            if isinstance(content, str):
+                self.text.append(content)
+            else:
+                self.blocks = _ListBuilder([self.text.build(), *content])
+                self.text = None
+            return
+        blocks = self.blocks
+        if blocks is None:  # pragma: no cover
+            return
+        if isinstance(content, list):
+            blocks.extend(content)
+        elif blocks.items and isinstance(blocks.items[-1], (str, _StrBuilder)):
+            last = blocks.items[-1]
+            if not isinstance(last, _StrBuilder):
+                last = blocks.items[-1] = _StrBuilder(last)
+            last.append(content)
+        elif content == "":
+            pass
+        elif blocks.items:
+            blocks.append(content)
+
+    def build(self) -> str | list[str | dict]:
+        if self.text is not None:
+            return self.text.build()
+        return self.blocks.build() if self.blocks is not None else ""
+
+
+class _AIMessageState:
+    """Incremental equivalent of `add_ai_message_chunks(first, *others)`."""
+
+    __slots__ = (
+        "additional_kwargs",
+        "any_id",
+        "cls",
+        "content",
+        "last",
+        "provider_id",
+        "response_metadata",
+        "run_id",
+        "tool_call_chunks",
+        "usage",
+        "usage_seen",
+    )
+
+    def __init__(self, first: AIMessageChunk) -> None:
+        self.cls = first.__class__
+        self.content = _ContentBuilder(first.content)
+        self.additional_kwargs = _DictBuilder(first.additional_kwargs)
+        self.response_metadata = _DictBuilder(first.response_metadata)
+        self.tool_call_chunks = _ListBuilder(first.tool_call_chunks)
+        self.usage: UsageMetadata | None = first.usage_metadata
+        self.usage_seen = bool(first.usage_metadata)
+        self.provider_id: str | None = None
+        self.run_id: str | None = None
+        self.any_id: str | None = None
+        self.last = False
+        self._track(first)
+
+    def _track(self, chunk: AIMessageChunk) -> None:
+        if id_ := chunk.id:
+            if not id_.startswith((LC_ID_PREFIX, LC_AUTO_PREFIX)):
+                self.provider_id = self.provider_id or id_
+            elif id_.startswith(LC_ID_PREFIX):
+                self.run_id = self.run_id or id_
+            self.any_id = self.any_id or id_
+        self.last = self.last or chunk.chunk_position == "last"
+
+    def add(self, chunk: AIMessageChunk) -> None:
+        self.content.add(chunk.content)
+        self.additional_kwargs.merge(chunk.additional_kwargs)
+        self.response_metadata.merge(chunk.response_metadata)
+        self.tool_call_chunks.extend(chunk.tool_call_chunks)
+        usage = chunk.usage_metadata
+        if usage is not None:
+            self.usage_seen = True
+        if usage is not None or not self.usage:
+            # add_usage(left, None) is `left` itself when `left` is non-empty.
+            self.usage = add_usage(self.usage, usage)
+        self._track(chunk)
+
+    def build(self) -> AIMessageChunk:
+        chunk_position: Literal["last"] | None = "last" if self.last else None
+        return self.cls(
+            content=self.content.build(),
+            additional_kwargs=self.additional_kwargs.build(),
+            tool_call_chunks=[
+                create_tool_call_chunk(
+                    name=rtc.get("name"),
+                    args=rtc.get("args"),
+                    index=rtc.get("index"),
+                    id=rtc.get("id"),
+                )
+                for rtc in self.tool_call_chunks.build()
+            ],
+            response_metadata=self.response_metadata.build(),
+            usage_metadata=self.usage if self.usage_seen else None,
+            id=self.provider_id or self.run_id or self.any_id,
+            chunk_position=chunk_position,
+        )
+
+
+def _is_plain_ai_chunk(message: Any) -> bool:
+    return (
+        isinstance(message, AIMessageChunk)
+        and type(message).__add__ is AIMessageChunk.__add__
+    )
+
+
+def _is_empty_ai_chunk(chunk: AIMessageChunk) -> bool:
+    """Whether adding `chunk` leaves the merged message unchanged."""
+    return (
+        chunk.content == ""
+        and not chunk.tool_call_chunks
+        and not chunk.additional_kwargs
+        and not chunk.response_metadata
+        and chunk.usage_metadata is None
+        and chunk.id is None
+        and chunk.chunk_position is None
+    )
+
+
+class ChunkAccumulator:
+    """Merge a stream of chunks in amortised constant time per chunk.
+
+    `acc.add(chunk)` for every chunk followed by `acc.result()` gives the same value
+    as `functools.reduce(operator.add, chunks)`, without re-merging everything
+    accumulated so far on each step. `AIMessageChunk`s (bare or wrapped in a
+    `ChatGenerationChunk`), `GenerationChunk`s and strings are grown in place;
+    text goes into string builders and indexed content blocks and tool call chunks
+    are found through per-index maps. The merged chunk is only materialised when
+    `result` is called.
+
+    Any other value, or a chunk that does not match the ones before it, is merged
+    eagerly with `+`, so the accumulator can stand in wherever a stream of chunks
+    was previously summed.
+
+    Example:
+        ```python
+        from langchain_core.outputs import ChunkAccumulator
+
+        acc = ChunkAccumulator()
+        for chunk in model.stream("hello"):
+            acc.add(chunk)
+        message = acc.result()
+        ```
+    """
+
+    __slots__ = ("_count", "_first", "_generation_info", "_mode", "_state")
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self._count = 0
+        self._mode: Literal["str", "text", "message", "generation", "any"] | None = None
+        self._first: Any = None
+        self._state: Any = None
+        self._generation_info: _DictBuilder | None = None
+
+    def __len__(self) -> int:
+        """Number of chunks merged since the accumulator was last (re)started."""
+        return self._count
+
+    def __iadd__(self, chunk: Any) -> Self:
+        """Add a chunk in place; `acc += chunk` is `acc.add(chunk)`."""
+        self.add(chunk)
+        return self
+
+    def replace(self, chunk: Any) -> None:
+        """Discard everything merged so far and restart from `chunk`."""
+        self._count = 1
+        self._first = chunk
+        self._state = None
+        self._generation_info = None
+        if type(chunk) is str:
+            self._mode = "str"
+        elif type(chunk) is GenerationChunk:
+            self._mode = "text"
+        elif type(chunk) is ChatGenerationChunk and _is_plain_ai_chunk(chunk.message):
+            self._mode = "generation"
+        elif _is_plain_ai_chunk(chunk):
+            self._mode = "message"
+        else:
+            self._mode = "any"
+
+    def add(self, chunk: Any) -> bool:
+        """Merge `chunk` into the accumulated value.
+
+        Args:
+            chunk: The next chunk of the stream.
+
+        Raises:
+            TypeError: If `chunk` cannot be added to the accumulated value. The
+                accumulated value is left unchanged for mismatched chunk types.
+
+        Returns:
+            Whether the accumulated value may have changed. It is `False` for
+                chunks that merge as a no-op, such as empty text, so callers can
+                skip re-reading `result`.
+        """
+        mode = self._mode
+        if mode is None or (mode == "any" and self._first is None):
+            count = self._count
+            self.replace(chunk)
+            self._count = count + 1
+            return True
+        changed = True
+        if mode == "str" and type(chunk) is str:
+            self._start().append(chunk)
+            changed = chunk != ""
+        elif mode == "text" and type(chunk) is GenerationChunk:
+            self._start().append(chunk.text)
+            self._merge_generation_info(chunk)
+            changed = chunk.text != "" or bool(chunk.generation_info)
+        elif (
+            mode == "generation"
+            and type(chunk) is ChatGenerationChunk
+            and isinstance(chunk.message, AIMessageChunk)
+        ):
+            self._start().add(chunk.message)
+            self._merge_generation_info(chunk)
+            changed = bool(chunk.generation_info) or not _is_empty_ai_chunk(
+                chunk.message
+            )
+        elif mode == "message" and isinstance(chunk, AIMessageChunk):
+            self._start().add(chunk)
+            changed = not _is_empty_ai_chunk(chunk)
+        else:
+            merged = self.result() + chunk
+            self._mode = "any"
+            self._first = merged
+            self._state = None
+            self._generation_info = None
+        self._count += 1
+        return changed
+
+    def result(self) -> Any:
+        """Materialise the merged value.
+
+        Returns:
+            The sum of all chunks added since the last `replace`, or `None` if no
+            chunks were added.
+        """
+        if self._state is None:
+            return self._first
+        if self._mode == "str":
+            return self._state.build()
+        if self._mode == "message":
+            return self._state.build()
+        generation_info = (
+            self._generation_info.build() or None
+            if self._generation_info is not None
+            else None
+        )
+        if self._mode == "text":
+            return GenerationChunk(
+                text=self._state.build(), generation_info=generation_info
+            )
+        return ChatGenerationChunk(
+            message=self._state.build(), generation_info=generation_info
+        )
+
+    def _start(self) -> Any:
+        """Switch from holding the first chunk to growing builders."""
+        if self._state is not None:
+            return self._state
+        first = self._first
+        if self._mode == "str":
+            self._state = _StrBuilder(first)
+        elif self._mode == "text":
+            self._state = _StrBuilder(first.text)
+            self._generation_info = _DictBuilder(first.generation_info or {})
+        elif self._mode == "generation":
+            self._state = _AIMessageState(first.message)
+            self._generation_info = _DictBuilder(first.generation_info or {})
+        else:
+            self._state = _AIMessageState(first)
+        return self._state
+
+    def _merge_generation_info(
+        self, chunk: GenerationChunk | ChatGenerationChunk
+    ) -> None:
+        if chunk.generation_info and self._generation_info is not None:
+            self._generation_info.merge(chunk.generation_info)
@@ -47,6 +47,7 @@ from langchain_core.load.serializable import (
     SerializedConstructor,
     SerializedNotImplemented,
 )
+from langchain_core.outputs.chunk_accumulator import ChunkAccumulator
 from langchain_core.runnables.config import (
     RunnableConfig,
     acall_func_with_variable_args,
@@ -1512,8 +1513,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
-        got_first_val = False
+        buffered = ChunkAccumulator()
 
         for ichunk in input:
             # The default implementation of transform is to buffer input and
@@ -1523,16 +1523,13 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            try:
+                buffered.add(ichunk)
+            except TypeError:
+                buffered.replace(ichunk)
+        final: Input = buffered.result()
 
-        if got_first_val:
+        if buffered:
             yield from self.stream(final, config, **kwargs)
 
     async def atransform(
@@ -1557,8 +1554,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
-        got_first_val = False
+        buffered = ChunkAccumulator()
 
         async for ichunk in input:
             # The default implementation of transform is to buffer input and
@@ -1568,16 +1564,13 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            try:
+                buffered.add(ichunk)
+            except TypeError:
+                buffered.replace(ichunk)
+        final: Input = buffered.result()
 
-        if got_first_val:
+        if buffered:
             async for output in self.astream(final, config, **kwargs):
                 yield output
 
@@ -2249,9 +2242,10 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = tee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = next(input_for_tracing, None)
+        final_input = ChunkAccumulator()
+        final_input.add(next(input_for_tracing, None))
         final_input_supported = True
-        final_output: Output | None = None
+        final_output = ChunkAccumulator()
         final_output_supported = True
 
         config = ensure_config(config)
@@ -2289,35 +2283,29 @@ class Runnable(ABC, Generic[Input, Output]):
                         chunk: Output = context.run(next, iterator)
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output.replace(chunk)
+                                final_output_supported = False
                         else:
-                            final_output = chunk
+                            final_output.replace(chunk)
                 except (StopIteration, GeneratorExit):
                     pass
                 for ichunk in input_for_tracing:
                     if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
+                        try:
+                            final_input.add(ichunk)
+                        except TypeError:
+                            final_input.replace(ichunk)
+                            final_input_supported = False
                     else:
-                        final_input = ichunk
+                        final_input.replace(ichunk)
         except BaseException as e:
-            run_manager.on_chain_error(e, inputs=final_input)
+            run_manager.on_chain_error(e, inputs=final_input.result())
             raise
         else:
-            run_manager.on_chain_end(final_output, inputs=final_input)
+            run_manager.on_chain_end(final_output.result(), inputs=final_input.result())
 
     async def _atransform_stream_with_config(
         self,
@@ -2346,9 +2334,10 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = atee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = await py_anext(input_for_tracing, None)
+        final_input = ChunkAccumulator()
+        final_input.add(await py_anext(input_for_tracing, None))
         final_input_supported = True
-        final_output: Output | None = None
+        final_output = ChunkAccumulator()
         final_output_supported = True
 
         config = ensure_config(config)
@@ -2389,35 +2378,31 @@ class Runnable(ABC, Generic[Input, Output]):
                         chunk = await coro_with_context(py_anext(iterator), context)
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output.replace(chunk)
+                                final_output_supported = False
                         else:
-                            final_output = chunk
+                            final_output.replace(chunk)
                 except StopAsyncIteration:
                     pass
                 async for ichunk in input_for_tracing:
                     if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
+                        try:
+                            final_input.add(ichunk)
+                        except TypeError:
+                            final_input.replace(ichunk)
+                            final_input_supported = False
                     else:
-                        final_input = ichunk
+                        final_input.replace(ichunk)
         except BaseException as e:
-            await run_manager.on_chain_error(e, inputs=final_input)
+            await run_manager.on_chain_error(e, inputs=final_input.result())
             raise
         else:
-            await run_manager.on_chain_end(final_output, inputs=final_input)
+            await run_manager.on_chain_end(
+                final_output.result(), inputs=final_input.result()
+            )
         finally:
             if iterator_ is not None and hasattr(iterator_, "aclose"):
                 await iterator_.aclose()
@@ -4661,7 +4646,7 @@ class RunnableLambda(Runnable[Input, Output]):
         **kwargs: Any,
     ) -> Output:
         if inspect.isgeneratorfunction(self.func):
-            output: Output | None = None
+            accumulator = ChunkAccumulator()
             for chunk in call_func_with_variable_args(
                 cast("Callable[[Input], Iterator[Output]]", self.func),
                 input_,
@@ -4669,13 +4654,11 @@ class RunnableLambda(Runnable[Input, Output]):
                 run_manager,
                 **kwargs,
             ):
-                if output is None:
-                    output = chunk
-                else:
-                    try:
-                        output = output + chunk  # type: ignore[operator]
-                    except TypeError:
-                        output = chunk
+                try:
+                    accumulator.add(chunk)
+                except TypeError:
+                    accumulator.replace(chunk)
+            output = accumulator.result()
         else:
             output = call_func_with_variable_args(
                 self.func, input_, config, run_manager, **kwargs
@@ -4716,7 +4699,7 @@ class RunnableLambda(Runnable[Input, Output]):
                     config: RunnableConfig,
                     **kwargs: Any,
                 ) -> Output:
-                    output: Output | None = None
+                    accumulator = ChunkAccumulator()
                     for chunk in call_func_with_variable_args(
                         cast("Callable[[Input], Iterator[Output]]", self.func),
                         value,
@@ -4724,14 +4707,11 @@ class RunnableLambda(Runnable[Input, Output]):
                         run_manager.get_sync(),
                         **kwargs,
                     ):
-                        if output is None:
-                            output = chunk
-                        else:
-                            try:
-                                output = output + chunk  # type: ignore[operator]
-                            except TypeError:
-                                output = chunk
-                    return cast("Output", output)
+                        try:
+                            accumulator.add(chunk)
+                        except TypeError:
+                            accumulator.replace(chunk)
+                    return cast("Output", accumulator.result())
 
             else:
 
@@ -4752,7 +4732,7 @@ class RunnableLambda(Runnable[Input, Output]):
             afunc = f
 
         if is_async_generator(afunc):
-            output: Output | None = None
+            accumulator = ChunkAccumulator()
             async with aclosing(
                 cast(
                     "AsyncGenerator[Any, Any]",
@@ -4769,13 +4749,11 @@ class RunnableLambda(Runnable[Input, Output]):
                     "AsyncIterator[Output]",
                     stream,
                 ):
-                    if output is None:
-                        output = chunk
-                    else:
-                        try:
-                            output = output + chunk  # type: ignore[operator]
-                        except TypeError:
-                            output = chunk
+                    try:
+                        accumulator.add(chunk)
+                    except TypeError:
+                        accumulator.replace(chunk)
+            output = accumulator.result()
         else:
             output = await acall_func_with_variable_args(
                 cast("Callable", afunc), value, config, run_manager, **kwargs
@@ -4861,35 +4839,29 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> Iterator[Output]:
-        final: Input
-        got_first_val = False
+        buffered = ChunkAccumulator()
         for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            try:
+                buffered.add(ichunk)
+            except TypeError:
+                buffered.replace(ichunk)
+        final: Input = buffered.result()
 
         if inspect.isgeneratorfunction(self.func):
-            output: Output | None = None
+            accumulator = ChunkAccumulator()
             for chunk in call_func_with_variable_args(
                 self.func, final, config, run_manager, **kwargs
             ):
                 yield chunk
-                if output is None:
-                    output = chunk
-                else:
-                    try:
-                        output = output + chunk
-                    except TypeError:
-                        output = chunk
+                try:
+                    accumulator.add(chunk)
+                except TypeError:
+                    accumulator.replace(chunk)
+            output = accumulator.result()
         else:
             output = call_func_with_variable_args(
                 self.func, final, config, run_manager, **kwargs
@@ -4953,21 +4925,17 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> AsyncIterator[Output]:
-        final: Input
-        got_first_val = False
+        buffered = ChunkAccumulator()
         async for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            try:
+                buffered.add(ichunk)
+            except TypeError:
+                buffered.replace(ichunk)
+        final: Input = buffered.result()
 
         if hasattr(self, "afunc"):
             afunc = self.afunc
@@ -4996,7 +4964,7 @@ class RunnableLambda(Runnable[Input, Output]):
             afunc = f
 
         if is_async_generator(afunc):
-            output: Output | None = None
+            accumulator = ChunkAccumulator()
             async for chunk in cast(
                 "AsyncIterator[Output]",
                 acall_func_with_variable_args(
@@ -5008,13 +4976,11 @@ class RunnableLambda(Runnable[Input, Output]):
                 ),
             ):
                 yield chunk
-                if output is None:
-                    output = chunk
-                else:
-                    try:
-                        output = output + chunk  # type: ignore[operator]
-                    except TypeError:
-                        output = chunk
+                try:
+                    accumulator.add(chunk)
+                except TypeError:
+                    accumulator.replace(chunk)
+            output = accumulator.result()
         else:
             output = await acall_func_with_variable_args(
                 cast("Callable", afunc),
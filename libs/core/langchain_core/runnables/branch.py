@@ -16,6 +16,7 @@ from typing import (
 from pydantic import BaseModel, ConfigDict
 from typing_extensions import override
 
+from langchain_core.outputs.chunk_accumulator import ChunkAccumulator
 from langchain_core.runnables.base import (
     Runnable,
     RunnableLike,
@@ -315,7 +316,7 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
             name=config.get("run_name") or self.get_name(),
             run_id=config.pop("run_id", None),
         )
-        final_output: Output | None = None
+        final_output = ChunkAccumulator()
         final_output_supported = True
 
         try:
@@ -341,14 +342,10 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
                     ):
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = None
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output_supported = False
                     break
             else:
                 for chunk in self.default.stream(
@@ -361,18 +358,16 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
                 ):
                     yield chunk
                     if final_output_supported:
-                        if final_output is None:
-                            final_output = chunk
-                        else:
-                            try:
-                                final_output = final_output + chunk  # type: ignore[operator]
-                            except TypeError:
-                                final_output = None
-                                final_output_supported = False
+                        try:
+                            final_output.add(chunk)
+                        except TypeError:
+                            final_output_supported = False
         except BaseException as e:
             run_manager.on_chain_error(e)
             raise
-        run_manager.on_chain_end(final_output)
+        run_manager.on_chain_end(
+            final_output.result() if final_output_supported else None
+        )
 
     @override
     async def astream(
@@ -399,7 +394,7 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
             name=config.get("run_name") or self.get_name(),
             run_id=config.pop("run_id", None),
         )
-        final_output: Output | None = None
+        final_output = ChunkAccumulator()
         final_output_supported = True
 
         try:
@@ -425,14 +420,10 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
                     ):
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = None
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output_supported = False
                     break
             else:
                 async for chunk in self.default.astream(
@@ -445,15 +436,13 @@ class RunnableBranch(RunnableSerializable[Input, Output]):
                 ):
                     yield chunk
                     if final_output_supported:
-                        if final_output is None:
-                            final_output = chunk
-                        else:
-                            try:
-                                final_output = final_output + chunk  # type: ignore[operator]
-                            except TypeError:
-                                final_output = None
-                                final_output_supported = False
+                        try:
+                            final_output.add(chunk)
+                        except TypeError:
+                            final_output_supported = False
         except BaseException as e:
             await run_manager.on_chain_error(e)
             raise
-        await run_manager.on_chain_end(final_output)
+        await run_manager.on_chain_end(
+            final_output.result() if final_output_supported else None
+        )
@@ -11,6 +11,7 @@ from pydantic import BaseModel, ConfigDict
 from typing_extensions import override
 
 from langchain_core.callbacks.manager import AsyncCallbackManager, CallbackManager
+from langchain_core.outputs.chunk_accumulator import ChunkAccumulator
 from langchain_core.runnables.base import Runnable, RunnableSerializable
 from langchain_core.runnables.config import (
     RunnableConfig,
@@ -511,18 +512,21 @@ class RunnableWithFallbacks(RunnableSerializable[Input, Output]):
             raise first_error
 
         yield chunk
-        output: Output | None = chunk
+        output = ChunkAccumulator()
+        output.add(chunk)
+        output_supported = True
         try:
             for chunk in stream:
                 yield chunk
-                try:
-                    output = output + chunk  # type: ignore[operator]
-                except TypeError:
-                    output = None
+                if output_supported:
+                    try:
+                        output.add(chunk)
+                    except TypeError:
+                        output_supported = False
         except BaseException as e:
             run_manager.on_chain_error(e)
             raise
-        run_manager.on_chain_end(output)
+        run_manager.on_chain_end(output.result() if output_supported else None)
 
     @override
     async def astream(
@@ -575,18 +579,21 @@ class RunnableWithFallbacks(RunnableSerializable[Input, Output]):
             raise first_error
 
         yield chunk
-        output: Output | None = chunk
+        output = ChunkAccumulator()
+        output.add(chunk)
+        output_supported = True
         try:
             async for chunk in stream:
                 yield chunk
-                try:
-                    output = output + chunk  # type: ignore[operator]
-                except TypeError:
-                    output = None
+                if output_supported:
+                    try:
+                        output.add(chunk)
+                    except TypeError:
+                        output_supported = False
         except BaseException as e:
             await run_manager.on_chain_error(e)
             raise
-        await run_manager.on_chain_end(output)
+        await run_manager.on_chain_end(output.result() if output_supported else None)
 
     def __getattr__(self, name: str) -> Any:
         """Get an attribute from the wrapped Runnable and its fallbacks.
@@ -15,6 +15,7 @@ from typing import (
 from pydantic import BaseModel, RootModel
 from typing_extensions import override
 
+from langchain_core.outputs.chunk_accumulator import ChunkAccumulator
 from langchain_core.runnables.base import (
     Other,
     Runnable,
@@ -260,22 +261,18 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
             for chunk in self._transform_stream_with_config(input, identity, config):
                 yield chunk
         else:
-            final: Other
-            got_first_chunk = False
+            buffered = ChunkAccumulator()
 
             for chunk in self._transform_stream_with_config(input, identity, config):
                 yield chunk
 
-                if not got_first_chunk:
-                    final = chunk
-                    got_first_chunk = True
-                else:
-                    try:
-                        final = final + chunk  # type: ignore[operator]
-                    except TypeError:
-                        final = chunk
+                try:
+                    buffered.add(chunk)
+                except TypeError:
+                    buffered.replace(chunk)
 
-            if got_first_chunk:
+            if buffered:
+                final: Other = buffered.result()
                 call_func_with_variable_args(
                     self.func, final, ensure_config(config), **kwargs
                 )
@@ -293,7 +290,7 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
             ):
                 yield chunk
         else:
-            got_first_chunk = False
+            buffered = ChunkAccumulator()
 
             async for chunk in self._atransform_stream_with_config(
                 input, identity, config
@@ -305,16 +302,13 @@ class RunnablePassthrough(RunnableSerializable[Other, Other]):
                 # chunk.
                 # If the input is not addable, then we'll assume that we can
                 # only operate on the last chunk.
-                if not got_first_chunk:
-                    final = chunk
-                    got_first_chunk = True
-                else:
-                    try:
-                        final = final + chunk  # type: ignore[operator]
-                    except TypeError:
-                        final = chunk
-
-            if got_first_chunk:
+                try:
+                    buffered.add(chunk)
+                except TypeError:
+                    buffered.replace(chunk)
+
+            if buffered:
+                final: Other = buffered.result()
                 config = ensure_config(config)
                 if self.afunc is not None:
                     await acall_func_with_variable_args(
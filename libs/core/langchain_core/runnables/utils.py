@@ -525,10 +525,14 @@ def add(addables: Iterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    from langchain_core.outputs.chunk_accumulator import (  # noqa: PLC0415
+        ChunkAccumulator,
+    )
+
+    accumulator = ChunkAccumulator()
     for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        accumulator.add(chunk)
+    return accumulator.result()
 
 
 async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
@@ -540,10 +544,14 @@ async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    from langchain_core.outputs.chunk_accumulator import (  # noqa: PLC0415
+        ChunkAccumulator,
+    )
+
+    accumulator = ChunkAccumulator()
     async for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        accumulator.add(chunk)
+    return accumulator.result()
 
 
 class ConfigurableField(NamedTuple):
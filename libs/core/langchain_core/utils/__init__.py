@@ -20,7 +20,7 @@ if TYPE_CHECKING:
         get_colored_text,
         print_text,
     )
-    from langchain_core.utils.iter import batch_iterate
+    from langchain_core.utils.iter import batch_iterate, bounded_map
     from langchain_core.utils.pydantic import pre_init
     from langchain_core.utils.strings import (
         comma_list,
@@ -45,6 +45,7 @@ __all__ = (
     "StrictFormatter",
     "abatch_iterate",
     "batch_iterate",
+    "bounded_map",
     "build_extra_kwargs",
     "check_package_version",
     "comma_list",
@@ -82,6 +83,7 @@ _dynamic_imports = {
     "get_colored_text": "input",
     "print_text": "input",
     "batch_iterate": "iter",
+    "bounded_map": "iter",
     "pre_init": "pydantic",
     "comma_list": "strings",
     "sanitize_for_postgres": "strings",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 
 
@@ -192,3 +193,177 @@ def merge_obj(left: Any, right: Any) -> Any:
         f"list, or else be two equal objects."
     )
     raise ValueError(msg)
+
+
+_PLAIN_STR_KEYS = frozenset(("index", "id", "output_version", "model_provider"))
+
+
+class _StrBuilder:
+    """Growable string; `join` is only paid once per materialisation."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, value: str) -> None:
+        self.parts = [value]
+
+    def append(self, value: str) -> None:
+        self.parts.append(value)
+
+    def build(self) -> str:
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0]
+
+
+def _build(value: Any) -> Any:
+    if isinstance(value, (_StrBuilder, _DictBuilder, _ListBuilder)):
+        return value.build()
+    return value
+
+
+def _kind(value: Any) -> type:
+    if isinstance(value, _StrBuilder):
+        return str
+    if isinstance(value, _DictBuilder):
+        return dict
+    if isinstance(value, _ListBuilder):
+        return list
+    return type(value)
+
+
+class _DictBuilder:
+    """Incremental equivalent of `merge_dicts(left, *others)`.
+
+    Strings, nested dicts and lists are grown in place instead of being copied on
+    every merge, so merging `n` small dicts costs `O(n)` rather than `O(n**2)`.
+    Values are only wrapped in a builder the first time they are merged into.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, left: dict[str, Any]) -> None:
+        self.values = left.copy()
+
+    def merge(self, right: dict[str, Any]) -> None:
+        merged = self.values
+        for right_k, right_v in right.items():
+            if right_k not in merged or (
+                right_v is not None and merged[right_k] is None
+            ):
+                merged[right_k] = right_v
+                continue
+            if right_v is None:
+                continue
+            left_v = merged[right_k]
+            kind = _kind(left_v)
+            if kind is not type(right_v):
+                msg = (
+                    f'additional_kwargs["{right_k}"] already exists in this message,'
+                    " but with a different type."
+                )
+                raise TypeError(msg)
+            if kind is str:
+                if right_k in _PLAIN_STR_KEYS:
+                    # Compared against their full value, so kept as plain strings.
+                    if (right_k == "index" and left_v.startswith("lc_")) or (
+                        right_k != "index" and left_v == right_v
+                    ):
+                        continue
+                    merged[right_k] = left_v + right_v
+                else:
+                    if not isinstance(left_v, _StrBuilder):
+                        left_v = merged[right_k] = _StrBuilder(left_v)
+                    left_v.append(right_v)
+            elif kind is dict:
+                if not isinstance(left_v, _DictBuilder):
+                    left_v = merged[right_k] = _DictBuilder(left_v)
+                left_v.merge(right_v)
+            elif kind is list:
+                if not isinstance(left_v, _ListBuilder):
+                    left_v = merged[right_k] = _ListBuilder(left_v)
+                left_v.extend(right_v)
+            elif left_v == right_v:
+                continue
+            elif isinstance(left_v, int):
+                merged[right_k] = left_v + right_v
+            else:
+                msg = (
+                    f"Additional kwargs key {right_k} already exists in left dict and "
+                    f"value has unsupported type {type(left_v)}."
+                )
+                raise TypeError(msg)
+
+    def build(self) -> dict[str, Any]:
+        return {k: _build(v) for k, v in self.values.items()}
+
+
+class _ListBuilder:
+    """Incremental equivalent of `merge_lists(left, *others)`.
+
+    Elements carrying an `index` are located through a dict instead of a linear
+    scan, and merged elements are kept as `_DictBuilder`s until `build`.
+    """
+
+    __slots__ = ("items", "positions")
+
+    def __init__(self, left: list) -> None:
+        self.items: list[Any] = list(left)
+        self.positions: dict[Any, int] = {}
+        for i, item in enumerate(self.items):
+            self._register(item, i)
+
+    def _register(self, item: Any, position: int) -> None:
+        if isinstance(item, dict) and "index" in item:
+            # Unhashable indexes can never match an int or "lc_" index.
+            with contextlib.suppress(TypeError):
+                self.positions.setdefault(item["index"], position)
+
+    def append(self, item: Any) -> None:
+        self._register(item, len(self.items))
+        self.items.append(item)
+
+    def extend(self, other: list) -> None:
+        for e in other:
+            if not (
+                isinstance(e, dict)
+                and "index" in e
+                and (
+                    isinstance(e["index"], int)
+                    or (isinstance(e["index"], str) and e["index"].startswith("lc_"))
+                )
+            ):
+                self.append(e)
+                continue
+            position = self.positions.get(e["index"])
+            if position is None:
+                self.append(e)
+                continue
+            target = self.items[position]
+            left_type = (
+                _build(target.values.get("type"))
+                if isinstance(target, _DictBuilder)
+                else target.get("type")
+            )
+            if left_type and (e.get("type") == "non_standard" and "value" in e):
+                if left_type != "non_standard":
+                    # standard + non_standard
+                    new_e: dict[str, Any] = {
+                        "extras": {k: v for k, v in e["value"].items() if k != "type"}
+                    }
+                else:
+                    # non_standard + non_standard
+                    new_e = {
+                        "value": {k: v for k, v in e["value"].items() if k != "type"}
+                    }
+                    if "index" in e:
+                        new_e["index"] = e["index"]
+            else:
+                new_e = (
+                    {k: v for k, v in e.items() if k != "type"} if "type" in e else e
+                )
+            if not isinstance(target, _DictBuilder):
+                target = self.items[position] = _DictBuilder(target)
+            target.merge(new_e)
+
+    def build(self) -> list:
+        return [_build(item) for item in self.items]
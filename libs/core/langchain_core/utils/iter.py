@@ -1,8 +1,10 @@
 """Utilities for working with iterators."""
 
 from collections import deque
-from collections.abc import Generator, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
+from contextvars import copy_context
 from itertools import islice
 from types import TracebackType
 from typing import (
@@ -14,6 +16,7 @@ from typing import (
 )
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class NoLock:
@@ -219,3 +222,60 @@ def batch_iterate(size: int | None, iterable: Iterable[T]) -> Iterator[list[T]]:
         if not chunk:
             return
         yield chunk
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    *,
+    max_in_flight: int,
+    executor: Executor | None = None,
+) -> Iterator[R]:
+    """Lazily map `func` over `iterable` in worker threads, preserving order.
+
+    At most `max_in_flight` calls are submitted but not yet consumed, so the
+    input is read (and results are held) only a bounded number of items ahead of
+    the consumer. While the consumer processes one result, the following calls
+    keep running in the background, which overlaps e.g. embedding the next batch
+    with writing the current one.
+
+    Args:
+        func: The function to apply to each item.
+        iterable: The items to map over. Consumed lazily.
+        max_in_flight: Maximum number of pending calls. Must be at least 1.
+        executor: Executor to submit calls to. If `None`, a thread pool with
+            `max_in_flight` workers is created and shut down when the iterator
+            is exhausted or closed.
+
+    Yields:
+        The results of `func`, in input order.
+
+    Raises:
+        ValueError: If `max_in_flight` is less than 1.
+    """
+    if max_in_flight < 1:
+        msg = f"max_in_flight must be at least 1, got {max_in_flight}."
+        raise ValueError(msg)
+    return _bounded_map(func, iterable, max_in_flight, executor)
+
+
+def _bounded_map(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    max_in_flight: int,
+    executor: Executor | None,
+) -> Iterator[R]:
+    pool = executor or ThreadPoolExecutor(max_workers=max_in_flight)
+    pending: deque[Future[R]] = deque()
+    try:
+        for item in iterable:
+            pending.append(pool.submit(copy_context().run, func, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
@@ -5,20 +5,30 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
-    from langchain_core.vectorstores.base import VST, VectorStore, VectorStoreRetriever
+    from langchain_core.vectorstores.base import (
+        VST,
+        IngestProgress,
+        VectorStore,
+        VectorStoreRetriever,
+        ingest_progress,
+    )
     from langchain_core.vectorstores.in_memory import InMemoryVectorStore
 
 __all__ = (
     "VST",
     "InMemoryVectorStore",
+    "IngestProgress",
     "VectorStore",
     "VectorStoreRetriever",
+    "ingest_progress",
 )
 
 _dynamic_imports = {
     "VectorStore": "base",
     "VST": "base",
     "VectorStoreRetriever": "base",
+    "IngestProgress": "base",
+    "ingest_progress": "base",
     "InMemoryVectorStore": "in_memory",
 }
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import math
+import time
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Callable
@@ -17,6 +18,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    TypedDict,
     TypeVar,
 )
 
@@ -41,6 +43,39 @@ logger = logging.getLogger(__name__)
 VST = TypeVar("VST", bound="VectorStore")
 
 
+class IngestProgress(TypedDict):
+    """Progress of a batched ingest, as passed to a `progress_callback`."""
+
+    batches: int
+    """Number of batches upserted so far."""
+    texts: int
+    """Number of texts upserted so far."""
+    elapsed: float
+    """Seconds since the ingest started."""
+    texts_per_second: float
+    """Average ingest throughput so far."""
+
+
+def ingest_progress(batches: int, texts: int, start: float) -> IngestProgress:
+    """Build the `IngestProgress` of an ingest.
+
+    Args:
+        batches: Number of batches upserted so far.
+        texts: Number of texts upserted so far.
+        start: `time.perf_counter()` value taken when the ingest started.
+
+    Returns:
+        The progress, with the elapsed time measured now.
+    """
+    elapsed = time.perf_counter() - start
+    return {
+        "batches": batches,
+        "texts": texts,
+        "elapsed": elapsed,
+        "texts_per_second": texts / elapsed if elapsed else 0.0,
+    }
+
+
 class VectorStore(ABC):
     """Interface for vector store."""
 
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
 )
 
 from typing_extensions import override
@@ -16,8 +17,15 @@ from typing_extensions import override
 from langchain_core.documents import Document
 from langchain_core.load import dumpd, load
 from langchain_core.vectorstores import VectorStore
+from langchain_core.vectorstores.utils import (
+    _BM25Index,
+    _cosine_top_k,
+    _fuse_scores,
+    _IVFIndex,
+    _QuantizedVectors,
+    maximal_marginal_relevance,
+)
 from langchain_core.vectorstores.utils import _cosine_similarity as cosine_similarity
-from langchain_core.vectorstores.utils import maximal_marginal_relevance
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -32,10 +40,30 @@ except ImportError:
     _HAS_NUMPY = False
 
 
+# Constructor arguments accepted by `from_texts`, which otherwise forwards its
+# keyword arguments to `add_texts`.
+_INIT_KWARGS = (
+    "precision",
+    "rescore_multiplier",
+    "index",
+    "n_lists",
+    "nprobe",
+    "keyword_index",
+    "tokenizer",
+)
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".ivf.json")
+
+
 class InMemoryVectorStore(VectorStore):
     """In-memory vector store implementation.
 
     Uses a dictionary, and computes cosine similarity for search using numpy.
+    By default the records in `store` hold the embeddings as returned by
+    `Embeddings.embed_documents`. Quantized or indexed stores embed with
+    `Embeddings.embed_documents_array` and keep the vectors in a separate matrix.
 
     Setup:
         Install `langchain-core`.
@@ -47,6 +75,13 @@ class InMemoryVectorStore(VectorStore):
     Key init args — indexing params:
         embedding_function: Embeddings
             Embedding function to use.
+        precision: Literal["float32", "float16", "int8", "binary"]
+            Storage precision of the vectors. See `__init__`.
+        index: Literal["flat", "ivf"]
+            Exact (`'flat'`) or approximate (`'ivf'`) search. See `__init__`.
+        keyword_index: bool
+            Also maintain a BM25 keyword index, enabling `keyword_search` and
+            `hybrid_search`.
 
     Instantiate:
         ```python
@@ -158,16 +193,74 @@ class InMemoryVectorStore(VectorStore):
         ```
     """
 
-    def __init__(self, embedding: Embeddings) -> None:
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        precision: Literal["float32", "float16", "int8", "binary"] = "float32",
+        rescore_multiplier: int = 4,
+        index: Literal["flat", "ivf"] = "flat",
+        n_lists: int | None = None,
+        nprobe: int = 8,
+        keyword_index: bool = False,
+        tokenizer: Callable[[str], list[str]] | None = None,
+    ) -> None:
         """Initialize with the given embedding function.
 
         Args:
             embedding: embedding function to use.
+            precision: Storage precision of the vectors.
+
+                - `'float32'`: vectors are kept in `store` as is and searched
+                    exactly.
+                - `'float16'`: half precision (2x smaller than float32).
+                - `'int8'`: scalar quantization with one scale per vector (4x
+                    smaller).
+                - `'binary'`: one sign bit per dimension (32x smaller). Search
+                    prefilters by Hamming distance and rescores the closest
+                    candidates with the float query vector.
+
+                With any precision other than `'float32'`, or with an `'ivf'`
+                index, vectors live in a contiguous matrix instead of `store`, and
+                `get_vectors_by_ids` returns their dequantized values.
+            rescore_multiplier: For `'binary'` precision, the number of Hamming
+                candidates rescored per requested result.
+            index: Search strategy.
+
+                - `'flat'`: exact brute-force search over every vector.
+                - `'ivf'`: approximate IVF-Flat search. Vectors are partitioned
+                    into `n_lists` clusters by k-means, and a query only scans
+                    the `nprobe` clusters closest to it. The clustering is
+                    trained on the first search once 1024 vectors are stored and
+                    retrained as the store grows; until then search is exact.
+                    Searches with a `filter` are always exact over the
+                    documents that pass it.
+            n_lists: For `'ivf'`, the number of clusters. Defaults to the
+                square root of the number of vectors at training time.
+            nprobe: For `'ivf'`, the number of clusters scanned per query.
+                Higher values improve recall at the cost of speed. Can be
+                overridden per search by passing `nprobe` as a keyword argument.
+            keyword_index: Whether to also index document texts in a BM25
+                inverted index, for `keyword_search_with_score` and
+                `hybrid_search_with_score`.
+            tokenizer: Function splitting text into keyword index terms. The
+                default lowercases, splits on non-word characters, and indexes
+                Chinese, Japanese and Korean text as character unigrams and
+                bigrams. Pass e.g. `jieba.lcut_for_search` for word-level
+                Chinese segmentation.
         """
         # TODO: would be nice to change to
         # dict[str, Document] at some point (will be a breaking change)
         self.store: dict[str, dict[str, Any]] = {}
         self.embedding = embedding
+        self.precision = precision
+        self._vectors = (
+            _QuantizedVectors(precision, rescore_multiplier)
+            if precision != "float32" or index != "flat"
+            else None
+        )
+        self._index = _IVFIndex(n_lists, nprobe) if index == "ivf" else None
+        self._keywords = _BM25Index(tokenizer) if keyword_index else None
 
     @property
     @override
@@ -179,6 +272,10 @@ class InMemoryVectorStore(VectorStore):
         if ids:
             for _id in ids:
                 self.store.pop(_id, None)
+            if self._vectors is not None:
+                self._vectors.delete(ids)
+            if self._keywords is not None:
+                self._keywords.delete(ids)
 
     @override
     async def adelete(self, ids: Sequence[str] | None = None, **kwargs: Any) -> None:
@@ -192,45 +289,34 @@ class InMemoryVectorStore(VectorStore):
         **kwargs: Any,
     ) -> list[str]:
         texts = [doc.page_content for doc in documents]
-        vectors = self.embedding.embed_documents(texts)
-
-        if ids and len(ids) != len(texts):
-            msg = (
-                f"ids must be the same length as texts. "
-                f"Got {len(ids)} ids and {len(texts)} texts."
-            )
-            raise ValueError(msg)
-
-        id_iterator: Iterator[str | None] = (
-            iter(ids) if ids else iter(doc.id for doc in documents)
+        vectors = (
+            self.embedding.embed_documents_array(texts)
+            if self._vectors is not None
+            else self.embedding.embed_documents(texts)
         )
 
-        ids_ = []
-
-        for doc, vector in zip(documents, vectors, strict=False):
-            doc_id = next(id_iterator)
-            doc_id_ = doc_id or str(uuid.uuid4())
-            ids_.append(doc_id_)
-            self.store[doc_id_] = {
-                "id": doc_id_,
-                "vector": vector,
-                "text": doc.page_content,
-                "metadata": doc.metadata,
-            }
-
-        return ids_
+        return self._add_vectors(documents, vectors, ids)
 
     @override
     async def aadd_documents(
         self, documents: list[Document], ids: list[str] | None = None, **kwargs: Any
     ) -> list[str]:
         texts = [doc.page_content for doc in documents]
-        vectors = await self.embedding.aembed_documents(texts)
+        vectors = (
+            await self.embedding.aembed_documents_array(texts)
+            if self._vectors is not None
+            else await self.embedding.aembed_documents(texts)
+        )
+
+        return self._add_vectors(documents, vectors, ids)
 
-        if ids and len(ids) != len(texts):
+    def _add_vectors(
+        self, documents: list[Document], vectors: Any, ids: list[str] | None
+    ) -> list[str]:
+        if ids and len(ids) != len(documents):
             msg = (
                 f"ids must be the same length as texts. "
-                f"Got {len(ids)} ids and {len(texts)} texts."
+                f"Got {len(ids)} ids and {len(documents)} texts."
             )
             raise ValueError(msg)
 
@@ -238,18 +324,31 @@ class InMemoryVectorStore(VectorStore):
             iter(ids) if ids else iter(doc.id for doc in documents)
         )
         ids_: list[str] = []
+        records: list[dict[str, Any]] = []
 
         for doc, vector in zip(documents, vectors, strict=False):
             doc_id = next(id_iterator)
             doc_id_ = doc_id or str(uuid.uuid4())
             ids_.append(doc_id_)
-            self.store[doc_id_] = {
+            record = {
                 "id": doc_id_,
-                "vector": vector,
                 "text": doc.page_content,
                 "metadata": doc.metadata,
             }
-
+            if self._vectors is None:
+                record["vector"] = vector
+            records.append(record)
+
+        # Store the vectors first: if they are rejected (e.g. for a dimension
+        # mismatch), no record is left without a vector row.
+        if self._vectors is not None:
+            rows = self._vectors.add(ids_, vectors[: len(ids_)])
+            if self._index is not None:
+                self._index.assign(self._vectors, rows)
+        for record in records:
+            self.store[record["id"]] = record
+        if self._keywords is not None:
+            self._keywords.add(ids_, [doc.page_content for doc in documents])
         return ids_
 
     @override
@@ -288,12 +387,40 @@ class InMemoryVectorStore(VectorStore):
         """
         return self.get_by_ids(ids)
 
+    def get_vectors_by_ids(self, ids: Sequence[str], /) -> dict[str, list[float]]:
+        """Get the stored embedding vectors for the given ids.
+
+        Ids that are not found are omitted from the result.
+
+        Args:
+            ids: The ids of the documents to get vectors for.
+
+        Returns:
+            Mapping from document id to its stored embedding vector.
+        """
+        if self._vectors is not None:
+            found = [doc_id for doc_id in ids if doc_id in self._vectors]
+            return dict(zip(found, self._vectors.get(found).tolist(), strict=True))
+        return {
+            doc_id: self.store[doc_id]["vector"]
+            for doc_id in ids
+            if doc_id in self.store
+        }
+
     def _similarity_search_with_score_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
         filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        nprobe: int | None = None,
     ) -> list[tuple[Document, float, list[float]]]:
+        if self._vectors is not None and filter is None:
+            if self._index is not None:
+                rows, scores = self._index.search(self._vectors, embedding, k, nprobe)
+            else:
+                rows, scores = self._vectors.search(embedding, k)
+            return self._vector_results(rows, scores)
+
         # get all docs with fixed order in list
         docs = list(self.store.values())
 
@@ -311,10 +438,21 @@ class InMemoryVectorStore(VectorStore):
         if not docs:
             return []
 
-        similarity = cosine_similarity([embedding], [doc["vector"] for doc in docs])[0]
+        if self._vectors is not None:
+            # Skip records added to `store` directly, which have no vector row.
+            rows = np.fromiter(
+                (
+                    self._vectors.row(doc["id"])
+                    for doc in docs
+                    if doc["id"] in self._vectors
+                ),
+                dtype=np.intp,
+            )
+            return self._vector_results(*self._vectors.search(embedding, k, rows))
 
-        # get the indices ordered by similarity score
-        top_k_idx = similarity.argsort()[::-1][:k]
+        top_k_idx, similarity = _cosine_top_k(
+            embedding, [doc["vector"] for doc in docs], k
+        )
 
         return [
             (
@@ -323,20 +461,40 @@ class InMemoryVectorStore(VectorStore):
                     page_content=doc_dict["text"],
                     metadata=doc_dict["metadata"],
                 ),
-                float(similarity[idx].item()),
+                float(score),
                 doc_dict["vector"],
             )
-            for idx in top_k_idx
+            for idx, score in zip(top_k_idx[0], similarity[0], strict=True)
             # Assign using walrus operator to avoid multiple lookups
             if (doc_dict := docs[idx])
         ]
 
+    def _vector_results(
+        self, rows: Any, scores: Any
+    ) -> list[tuple[Document, float, Any]]:
+        vectors = self._vectors
+        assert vectors is not None  # noqa: S101
+        ids = [vectors.ids[row] for row in rows]
+        results = []
+        for doc_id, score, vector in zip(ids, scores, vectors.get(ids), strict=True):
+            doc_dict = self.store.get(doc_id)
+            if doc_dict is None:
+                # Removed from `store` directly rather than through `delete`.
+                continue
+            doc = Document(
+                id=doc_id,
+                page_content=doc_dict["text"],
+                metadata=doc_dict["metadata"],
+            )
+            results.append((doc, float(score), vector))
+        return results
+
     def similarity_search_with_score_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
         filter: Callable[[Document], bool] | None = None,  # noqa: A002
-        **_kwargs: Any,
+        **kwargs: Any,
     ) -> list[tuple[Document, float]]:
         """Search for the most similar documents to the given embedding.
 
@@ -344,6 +502,8 @@ class InMemoryVectorStore(VectorStore):
             embedding: The embedding to search for.
             k: The number of documents to return.
             filter: A function to filter the documents.
+            **kwargs: `nprobe` overrides the number of clusters scanned by an
+                `'ivf'` index for this search.
 
         Returns:
             A list of tuples of Document objects and their similarity scores.
@@ -351,7 +511,7 @@ class InMemoryVectorStore(VectorStore):
         return [
             (doc, similarity)
             for doc, similarity, _ in self._similarity_search_with_score_by_vector(
-                embedding=embedding, k=k, filter=filter
+                embedding=embedding, k=k, filter=filter, nprobe=kwargs.get("nprobe")
             )
         ]
 
@@ -415,6 +575,223 @@ class InMemoryVectorStore(VectorStore):
             for doc, _ in await self.asimilarity_search_with_score(query, k, **kwargs)
         ]
 
+    def _require_keywords(self) -> _BM25Index:
+        if self._keywords is None:
+            msg = (
+                "Keyword search requires a keyword index. Create the store with "
+                "`InMemoryVectorStore(..., keyword_index=True)`."
+            )
+            raise ValueError(msg)
+        return self._keywords
+
+    def _allowed_ids(
+        self,
+        filter: Callable[[Document], bool] | None,  # noqa: A002
+    ) -> set[str] | None:
+        if filter is None:
+            return None
+        return {
+            doc_id
+            for doc_id, doc in self.store.items()
+            if filter(
+                Document(id=doc_id, page_content=doc["text"], metadata=doc["metadata"])
+            )
+        }
+
+    def _to_document(self, doc_id: str) -> Document:
+        doc = self.store[doc_id]
+        return Document(id=doc_id, page_content=doc["text"], metadata=doc["metadata"])
+
+    def keyword_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        **_kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """Search documents by BM25 keyword relevance to the query.
+
+        Requires the store to be created with `keyword_index=True`. Documents
+        sharing no term with the query are not returned.
+
+        Args:
+            query: Input text.
+            k: Number of documents to return.
+            filter: A function to filter the documents.
+
+        Returns:
+            A list of tuples of Document objects and their BM25 scores.
+        """
+        keywords = self._require_keywords()
+        hits = keywords.top(keywords.scores(query), k, self._allowed_ids(filter))
+        return [(self._to_document(doc_id), score) for doc_id, score in hits]
+
+    def _hybrid_search_with_score(
+        self,
+        query: str,
+        embedding: list[float],
+        k: int,
+        *,
+        fusion: Literal["rrf", "weighted"],
+        alpha: float,
+        fetch_k: int,
+        rrf_c: int,
+        filter: Callable[[Document], bool] | None,  # noqa: A002
+        nprobe: int | None,
+    ) -> list[tuple[Document, float]]:
+        keywords = self._require_keywords()
+        allowed = self._allowed_ids(filter)
+        dense_hits = self._similarity_search_with_score_by_vector(
+            embedding,
+            k=fetch_k,
+            filter=None if allowed is None else (lambda doc: doc.id in allowed),
+            nprobe=nprobe,
+        )
+        dense = {doc.id: score for doc, score, _ in dense_hits}
+        keyword_scores = keywords.scores(query)
+        sparse = dict(keywords.top(keyword_scores, fetch_k, allowed))
+        if fusion == "weighted":
+            # Both signals need a score for every candidate before normalizing.
+            missing = [doc_id for doc_id in sparse if doc_id not in dense]
+            if missing:
+                vectors = self.get_vectors_by_ids(missing)
+                similarity = cosine_similarity(
+                    [embedding], [vectors[doc_id] for doc_id in missing]
+                )[0]
+                dense.update(zip(missing, map(float, similarity), strict=True))
+            for doc_id in dense:
+                if doc_id not in sparse:
+                    sparse[doc_id] = keywords.score_of(keyword_scores, doc_id)
+        fused = _fuse_scores(
+            dense,  # type: ignore[arg-type]
+            sparse,
+            fusion=fusion,
+            alpha=alpha,
+            rrf_c=rrf_c,
+        )
+        return [(self._to_document(doc_id), score) for doc_id, score in fused[:k]]
+
+    def hybrid_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        *,
+        fusion: Literal["rrf", "weighted"] = "rrf",
+        alpha: float = 0.5,
+        fetch_k: int = 20,
+        rrf_c: int = 60,
+        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """Search by combined vector similarity and BM25 keyword relevance.
+
+        Requires the store to be created with `keyword_index=True`. The top
+        `fetch_k` documents of each ranking are fused into one list.
+
+        Args:
+            query: Input text.
+            k: Number of documents to return.
+            fusion: How to combine the rankings.
+
+                - `'rrf'`: Reciprocal Rank Fusion, summing
+                    `weight / (rrf_c + rank)` over both rankings.
+                - `'weighted'`: min-max normalize the cosine and BM25 scores of
+                    the candidates and sum them.
+            alpha: Weight of the vector ranking; the keyword ranking is weighted
+                `1 - alpha`.
+            fetch_k: Number of candidates taken from each ranking.
+            rrf_c: Rank offset for `'rrf'` fusion.
+            filter: A function to filter the documents.
+            **kwargs: `nprobe` overrides the number of clusters scanned by an
+                `'ivf'` index for this search.
+
+        Returns:
+            A list of tuples of Document objects and their fused scores.
+        """
+        embedding = self.embedding.embed_query(query)
+        return self._hybrid_search_with_score(
+            query,
+            embedding,
+            k,
+            fusion=fusion,
+            alpha=alpha,
+            fetch_k=fetch_k,
+            rrf_c=rrf_c,
+            filter=filter,
+            nprobe=kwargs.get("nprobe"),
+        )
+
+    async def ahybrid_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        *,
+        fusion: Literal["rrf", "weighted"] = "rrf",
+        alpha: float = 0.5,
+        fetch_k: int = 20,
+        rrf_c: int = 60,
+        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """Async version of `hybrid_search_with_score`.
+
+        Args:
+            query: Input text.
+            k: Number of documents to return.
+            fusion: How to combine the rankings, `'rrf'` or `'weighted'`.
+            alpha: Weight of the vector ranking.
+            fetch_k: Number of candidates taken from each ranking.
+            rrf_c: Rank offset for `'rrf'` fusion.
+            filter: A function to filter the documents.
+            **kwargs: `nprobe` overrides the number of clusters scanned by an
+                `'ivf'` index for this search.
+
+        Returns:
+            A list of tuples of Document objects and their fused scores.
+        """
+        embedding = await self.embedding.aembed_query(query)
+        return self._hybrid_search_with_score(
+            query,
+            embedding,
+            k,
+            fusion=fusion,
+            alpha=alpha,
+            fetch_k=fetch_k,
+            rrf_c=rrf_c,
+            filter=filter,
+            nprobe=kwargs.get("nprobe"),
+        )
+
+    def hybrid_search(self, query: str, k: int = 4, **kwargs: Any) -> list[Document]:
+        """Return the documents of `hybrid_search_with_score`.
+
+        Args:
+            query: Input text.
+            k: Number of documents to return.
+            **kwargs: Arguments to pass to `hybrid_search_with_score`.
+
+        Returns:
+            List of documents.
+        """
+        return [doc for doc, _ in self.hybrid_search_with_score(query, k, **kwargs)]
+
+    async def ahybrid_search(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        """Async version of `hybrid_search`.
+
+        Args:
+            query: Input text.
+            k: Number of documents to return.
+            **kwargs: Arguments to pass to `ahybrid_search_with_score`.
+
+        Returns:
+            List of documents.
+        """
+        return [
+            doc for doc, _ in await self.ahybrid_search_with_score(query, k, **kwargs)
+        ]
+
     @override
     def max_marginal_relevance_search_by_vector(
         self,
@@ -430,6 +807,7 @@ class InMemoryVectorStore(VectorStore):
             embedding=embedding,
             k=fetch_k,
             filter=filter,
+            nprobe=kwargs.get("nprobe"),
         )
 
         if not _HAS_NUMPY:
@@ -494,6 +872,7 @@ class InMemoryVectorStore(VectorStore):
     ) -> InMemoryVectorStore:
         store = cls(
             embedding=embedding,
+            **{key: kwargs.pop(key) for key in _INIT_KWARGS if key in kwargs},
         )
         store.add_texts(texts=texts, metadatas=metadatas, **kwargs)
         return store
@@ -509,6 +888,7 @@ class InMemoryVectorStore(VectorStore):
     ) -> InMemoryVectorStore:
         store = cls(
             embedding=embedding,
+            **{key: kwargs.pop(key) for key in _INIT_KWARGS if key in kwargs},
         )
         await store.aadd_texts(texts=texts, metadatas=metadatas, **kwargs)
         return store
@@ -531,16 +911,42 @@ class InMemoryVectorStore(VectorStore):
         with path_.open("r", encoding="utf-8") as f:
             store = load(json.load(f))
         vectorstore = cls(embedding=embedding, **kwargs)
+        if vectorstore._vectors is not None:
+            vectors = [doc.pop("vector") for doc in store.values()]
+            vectorstore._vectors.add(list(store), vectors)
+            index_path = _index_path(path_)
+            if vectorstore._index is not None and index_path.exists():
+                with index_path.open("r", encoding="utf-8") as f:
+                    centroids = json.load(f)["centroids"]
+                if centroids is not None:
+                    vectorstore._index.set_centroids(vectorstore._vectors, centroids)
+        if vectorstore._keywords is not None:
+            vectorstore._keywords.add(
+                list(store), [doc["text"] for doc in store.values()]
+            )
         vectorstore.store = store
         return vectorstore
 
     def dump(self, path: str) -> None:
         """Dump the vector store to a file.
 
+        With an `'ivf'` index, the trained clustering is written next to it to
+        `<path>.ivf.json`, so that `load` restores it instead of retraining.
+
         Args:
             path: The path to dump the vector store to.
         """
         path_: Path = Path(path)
         path_.parent.mkdir(exist_ok=True, parents=True)
         with path_.open("w", encoding="utf-8") as f:
-            json.dump(dumpd(self.store), f, indent=2)
+            store = self.store
+            if self._vectors is not None:
+                vectors = self.get_vectors_by_ids(list(store))
+                store = {
+                    doc_id: {**doc, "vector": vectors[doc_id]}
+                    for doc_id, doc in store.items()
+                }
+            json.dump(dumpd(store), f, indent=2)
+        if self._index is not None:
+            with _index_path(path_).open("w", encoding="utf-8") as f:
+                json.dump(self._index.state(), f)
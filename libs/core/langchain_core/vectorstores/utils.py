@@ -7,8 +7,12 @@ as they can change without notice.
 from __future__ import annotations
 
 import logging
+import math
+import re
 import warnings
-from typing import TYPE_CHECKING
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 
 try:
     import numpy as np
@@ -25,17 +29,44 @@ except ImportError:
     _HAS_SIMSIMD = False
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     Matrix = list[list[float]] | list[np.ndarray] | np.ndarray
 
+_PRECISIONS = ("float32", "float16", "int8", "binary")
+# Rows dequantized and scored at a time, bounding the temporary float32 copies.
+_SCORE_CHUNK_SIZE = 16384
+
+if _HAS_NUMPY:
+    # Number of set bits in every possible byte, for Hamming distances.
+    _POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+        axis=1, dtype=np.uint8
+    )
+
 logger = logging.getLogger(__name__)
 
 
-def _cosine_similarity(x: Matrix, y: Matrix) -> np.ndarray:
+def _cosine_similarity(
+    x: Matrix,
+    y: Matrix,
+    *,
+    dtype: Any = None,
+    normalized: bool = False,
+    trusted: bool = False,
+) -> np.ndarray:
     """Row-wise cosine similarity between two equal-width matrices.
 
+    Array inputs of the requested `dtype` are used without copying.
+
     Args:
         x: A matrix of shape (n, m).
         y: A matrix of shape (k, m).
+        dtype: dtype to compute in, e.g. `np.float32` to halve memory use and
+            use single-precision BLAS. Defaults to the dtype of the inputs.
+        normalized: Whether the rows of `x` and `y` already have unit norm, in
+            which case the similarity is their dot product.
+        trusted: Whether the inputs are known to be finite with no zero rows.
+            Skips the NaN / Inf checks on the inputs and on the result.
 
     Returns:
         A matrix of shape (n, k) where each element (i, j) is the cosine similarity
@@ -55,50 +86,178 @@ def _cosine_similarity(x: Matrix, y: Matrix) -> np.ndarray:
     if len(x) == 0 or len(y) == 0:
         return np.array([[]])
 
-    x = np.array(x)
-    y = np.array(y)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+
+    if not trusted:
+        _warn_non_finite(x, y)
+
+    if x.shape[1] != y.shape[1]:
+        msg = (
+            f"Number of columns in X and Y must be the same. X has shape {x.shape} "
+            f"and Y has shape {y.shape}."
+        )
+        raise ValueError(msg)
+    if _HAS_SIMSIMD and not normalized:
+        x = np.asarray(x, dtype=np.float32)
+        y = np.asarray(y, dtype=np.float32)
+        return 1 - np.array(simd.cdist(x, y, metric="cosine"))
+
+    logger.debug(
+        "Unable to import simsimd, defaulting to NumPy implementation. If you want "
+        "to use simsimd please install with `pip install simsimd`."
+    )
+    similarity = x @ y.T
+    if not np.issubdtype(similarity.dtype, np.floating):
+        similarity = similarity.astype(np.float64)
+    if not normalized:
+        # Scale in place rather than dividing by an (n, k) outer product of norms.
+        # Ignore divide by zero errors run time warnings as those are handled below.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity /= np.linalg.norm(x, axis=1)[:, None]
+            similarity /= np.linalg.norm(y, axis=1)
+    if not trusted:
+        invalid = ~np.isfinite(similarity)
+        if invalid.any():
+            if np.isnan(similarity).all():
+                msg = "NaN values found, please remove the NaN values and try again"
+                raise ValueError(msg) from None
+            similarity[invalid] = 0.0
+    return similarity
+
 
+def _warn_non_finite(*arrays: np.ndarray) -> None:
+    """Warn if any of `arrays` contains NaN or Inf, scanning each array once."""
+    if all(np.isfinite(a).all() for a in arrays):
+        return
     # Check for NaN
-    if np.any(np.isnan(x)) or np.any(np.isnan(y)):
+    if any(np.isnan(a).any() for a in arrays):
         warnings.warn(
             "NaN found in input arrays, unexpected return might follow",
             category=RuntimeWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
-
     # Check for Inf
-    if np.any(np.isinf(x)) or np.any(np.isinf(y)):
+    if any(np.isinf(a).any() for a in arrays):
         warnings.warn(
             "Inf found in input arrays, unexpected return might follow",
             category=RuntimeWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
 
-    if x.shape[1] != y.shape[1]:
+
+def _cosine_top_k(
+    x: Matrix,
+    y: Matrix,
+    k: int,
+    *,
+    dtype: Any = np.float32 if _HAS_NUMPY else None,
+    normalized: bool = False,
+    chunk_size: int = 16384,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the `k` rows of `y` most cosine-similar to each row of `x`.
+
+    `y` is converted and scored `chunk_size` rows at a time, keeping only the
+    running top `k` per query, so memory stays bounded by the chunk size rather
+    than growing with `len(y)`. Zero vectors have a similarity of 0.
+
+    Args:
+        x: A vector of shape (m,) or matrix of shape (n, m).
+        y: A matrix of shape (N, m).
+        k: Number of rows of `y` to select per row of `x`.
+        dtype: dtype to compute in.
+        normalized: Whether the rows of `x` and `y` already have unit norm.
+        chunk_size: Number of rows of `y` scored at once.
+
+    Returns:
+        The indices into `y` and the similarities of the selected rows, each of
+        shape (n, min(k, N)), best first.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    if not _HAS_NUMPY:
         msg = (
-            f"Number of columns in X and Y must be the same. X has shape {x.shape} "
-            f"and Y has shape {y.shape}."
-        )
-        raise ValueError(msg)
-    if not _HAS_SIMSIMD:
-        logger.debug(
-            "Unable to import simsimd, defaulting to NumPy implementation. If you want "
-            "to use simsimd please install with `pip install simsimd`."
+            "cosine_similarity requires numpy to be installed. "
+            "Please install numpy with `pip install numpy`."
         )
-        x_norm = np.linalg.norm(x, axis=1)
-        y_norm = np.linalg.norm(y, axis=1)
-        # Ignore divide by zero errors run time warnings as those are handled below.
-        with np.errstate(divide="ignore", invalid="ignore"):
-            similarity = np.dot(x, y.T) / np.outer(x_norm, y_norm)
-        if np.isnan(similarity).all():
-            msg = "NaN values found, please remove the NaN values and try again"
-            raise ValueError(msg) from None
-        similarity[np.isnan(similarity) | np.isinf(similarity)] = 0.0
-        return similarity
+        raise ImportError(msg)
+    x = np.asarray(x, dtype=dtype).reshape(-1, np.shape(x)[-1])
+    if not normalized:
+        x = _normalize_rows(x)
+    k = min(k, len(y))
+    best_idx = np.empty((len(x), 0), dtype=np.intp)
+    if k <= 0:
+        return best_idx, np.empty((len(x), 0), dtype=x.dtype)
+    best_scores = np.empty((len(x), 0), dtype=x.dtype)
+    for start in range(0, len(y), chunk_size):
+        chunk = np.asarray(y[start : start + chunk_size], dtype=dtype)
+        scores = x @ chunk.T
+        if not normalized:
+            norms = np.linalg.norm(chunk, axis=1)
+            norms[norms == 0] = 1
+            scores /= norms
+        chunk_idx = np.broadcast_to(np.arange(start, start + len(chunk)), scores.shape)
+        scores = np.concatenate([best_scores, scores], axis=1)
+        idx = np.concatenate([best_idx, chunk_idx], axis=1)
+        if scores.shape[1] > k:
+            part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, part, axis=1)
+            idx = np.take_along_axis(idx, part, axis=1)
+        best_idx, best_scores = idx, scores
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(best_idx, order, axis=1),
+        np.take_along_axis(best_scores, order, axis=1),
+    )
+
+
+def _normalize_rows(x: np.ndarray) -> np.ndarray:
+    """Scale each row of a 2-D array to unit L2 norm; all-zero rows stay zero."""
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = x / norms
+    normalized[~np.isfinite(normalized)] = 0.0
+    return normalized
 
-    x = np.array(x, dtype=np.float32)
-    y = np.array(y, dtype=np.float32)
-    return 1 - np.array(simd.cdist(x, y, metric="cosine"))
+
+def _mmr_select(
+    similarity_to_query: np.ndarray,
+    candidates: np.ndarray,
+    lambda_mult: float,
+    k: int,
+) -> np.ndarray:
+    """Run incremental MMR over a batch of queries.
+
+    Args:
+        similarity_to_query: Array of shape (m, n), similarity of each of the n
+            candidates to each of the m queries.
+        candidates: Array of shape (m, n, d) of unit-normalized candidate vectors.
+        lambda_mult: The lambda parameter for MMR.
+        k: The number of candidates to select per query, at most n.
+
+    Returns:
+        Array of shape (m, k) with the selected candidate indices in MMR order.
+    """
+    m, n = similarity_to_query.shape
+    rows = np.arange(m)
+    selected = np.empty((m, k), dtype=np.intp)
+    chosen = np.zeros((m, n), dtype=bool)
+    # Running max similarity of every candidate to the already-selected set;
+    # each pick only adds one new column, so an iteration costs O(n * d).
+    max_similarity = np.full((m, n), -np.inf)
+    pick = np.argmax(similarity_to_query, axis=1)
+    for step in range(k):
+        selected[:, step] = pick
+        chosen[rows, pick] = True
+        if step == k - 1:
+            break
+        new_column = np.matmul(candidates, candidates[rows, pick][:, :, None])[..., 0]
+        np.maximum(max_similarity, new_column, out=max_similarity)
+        scores = lambda_mult * similarity_to_query - (1 - lambda_mult) * max_similarity
+        scores[chosen] = -np.inf
+        pick = np.argmax(scores, axis=1)
+    return selected
 
 
 def maximal_marginal_relevance(
@@ -109,6 +268,10 @@ def maximal_marginal_relevance(
 ) -> list[int]:
     """Calculate maximal marginal relevance.
 
+    Candidates are normalized once and the similarity of every candidate to the
+    selected set is maintained as a running maximum, so selecting k of n
+    candidates costs O(k * n * d).
+
     Args:
         query_embedding: The query embedding.
         embedding_list: A list of embeddings.
@@ -130,26 +293,618 @@ def maximal_marginal_relevance(
 
     if min(k, len(embedding_list)) <= 0:
         return []
-    if query_embedding.ndim == 1:
-        query_embedding = np.expand_dims(query_embedding, axis=0)
-    similarity_to_query = _cosine_similarity(query_embedding, embedding_list)[0]
-    most_similar = int(np.argmax(similarity_to_query))
-    idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = _cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
+    query = np.asarray(query_embedding, dtype=float).reshape(1, -1)
+    return batch_maximal_marginal_relevance(
+        query, [embedding_list], lambda_mult=lambda_mult, k=k
+    )[0]
+
+
+def batch_maximal_marginal_relevance(
+    query_embeddings: Matrix,
+    embedding_lists: list,
+    lambda_mult: float = 0.5,
+    k: int = 4,
+) -> list[list[int]]:
+    """Calculate maximal marginal relevance for several queries at once.
+
+    Args:
+        query_embeddings: A matrix of shape (m, d) with one row per query.
+        embedding_lists: A sequence of m candidate matrices, one per query. If all
+            of them have the same number of candidates they are scored together in
+            a single vectorized pass.
+        lambda_mult: The lambda parameter for MMR. Default is 0.5.
+        k: The number of embeddings to return per query. Default is 4.
+
+    Returns:
+        For each query, a list of indices into its candidates, in MMR order.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If the number of queries and candidate sets differ, or if a
+            query embedding has no direction (all zeros or NaN).
+    """
+    if not _HAS_NUMPY:
+        msg = (
+            "maximal_marginal_relevance requires numpy to be installed. "
+            "Please install numpy with `pip install numpy`."
+        )
+        raise ImportError(msg)
+
+    if len(query_embeddings) != len(embedding_lists):
+        msg = (
+            f"Got {len(query_embeddings)} query embeddings but "
+            f"{len(embedding_lists)} candidate sets."
+        )
+        raise ValueError(msg)
+    if len(query_embeddings) == 0:
+        return []
+    queries = _normalize_rows(np.asarray(query_embeddings, dtype=float))
+    if not queries.any(axis=1).all():
+        msg = "NaN values found, please remove the NaN values and try again"
+        raise ValueError(msg)
+
+    sizes = {len(candidates) for candidates in embedding_lists}
+    if len(sizes) > 1:
+        return [
+            batch_maximal_marginal_relevance(
+                queries[i : i + 1], [candidates], lambda_mult=lambda_mult, k=k
+            )[0]
+            for i, candidates in enumerate(embedding_lists)
+        ]
+    n = sizes.pop()
+    if min(k, n) <= 0:
+        return [[] for _ in embedding_lists]
+    candidates = _normalize_rows(
+        np.asarray(
+            [np.asarray(c, dtype=float) for c in embedding_lists], dtype=float
+        ).reshape(len(embedding_lists), n, -1)
+    )
+    similarity_to_query = np.matmul(candidates, queries[:, :, None])[..., 0]
+    return _mmr_select(similarity_to_query, candidates, lambda_mult, min(k, n)).tolist()
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` highest scores, best first."""
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+class _QuantizedVectors:
+    """Contiguous vector storage at a configurable precision.
+
+    Rows are stored as:
+
+    * `float32` / `float16`: the vectors themselves,
+    * `int8`: symmetric scalar quantization with one scale per vector
+      (`vector ~= codes * scale`),
+    * `binary`: one sign bit per dimension, packed 8 per byte.
+
+    Cosine scores are computed against the dequantized vectors, whose norms are
+    precomputed. Binary search ranks all rows by Hamming distance to the query's
+    sign bits, then rescores the `k * rescore_multiplier` nearest with the float
+    query against the `±1` document vectors.
+
+    Each row also carries an integer label (`-1` until set), which an index such
+    as `_IVFIndex` uses to record the row's inverted list.
+
+    Deleting a row moves the last row into its place, so storage stays dense.
+    """
+
+    def __init__(self, precision: str, rescore_multiplier: int = 4) -> None:
+        if not _HAS_NUMPY:
+            msg = (
+                "Quantized vector storage requires numpy to be installed. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        if precision not in _PRECISIONS:
+            msg = f"precision must be one of {_PRECISIONS}, got {precision!r}."
+            raise ValueError(msg)
+        self.precision = precision
+        self.rescore_multiplier = rescore_multiplier
+        self.ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._dim = 0
+        self._codes: np.ndarray | None = None
+        self._scales = np.empty(0, dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self.labels = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def row(self, doc_id: str) -> int:
+        return self._rows[doc_id]
+
+    def _encode(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the codes and per-row scales for float32 `vectors`."""
+        scales = np.ones(len(vectors), dtype=np.float32)
+        if self.precision == "float32":
+            return vectors, scales
+        if self.precision == "float16":
+            return vectors.astype(np.float16), scales
+        if self.precision == "int8":
+            max_abs = np.abs(vectors).max(axis=1)
+            scales = np.where(max_abs > 0, max_abs / 127, 1).astype(np.float32)
+            codes = np.rint(vectors / scales[:, None]).clip(-127, 127)
+            return codes.astype(np.int8), scales
+        return np.packbits(vectors > 0, axis=1), scales
+
+    def decode(self, rows: np.ndarray | slice) -> np.ndarray:
+        assert self._codes is not None  # noqa: S101
+        codes = self._codes[rows]
+        if self.precision == "binary":
+            bits = np.unpackbits(codes, axis=1, count=self._dim)
+            return bits.astype(np.float32) * 2 - 1
+        if self.precision != "int8":
+            # Unscaled, so float32 rows are returned without a copy.
+            return codes.astype(np.float32, copy=False)
+        return codes.astype(np.float32) * self._scales[rows, None]
+
+    def _dots(self, rows: np.ndarray | None, query: np.ndarray) -> np.ndarray:
+        """Dot products of `query` with the dequantized `rows`, chunk by chunk.
+
+        `rows=None` scores every row, slicing the storage without copying it.
+        """
+        n = len(self.ids) if rows is None else len(rows)
+        dots = np.empty(n, dtype=np.float32)
+        for start in range(0, n, _SCORE_CHUNK_SIZE):
+            stop = min(start + _SCORE_CHUNK_SIZE, n)
+            chunk = slice(start, stop) if rows is None else rows[start:stop]
+            dots[start:stop] = self.decode(chunk) @ query
+        return dots
+
+    def _reserve(self, size: int, row_width: int, dtype: np.dtype) -> None:
+        if self._codes is not None and len(self._codes) >= size:
+            return
+        capacity = max(size, 2 * len(self._scales), 16)
+        codes = np.zeros((capacity, row_width), dtype=dtype)
+        scales = np.ones(capacity, dtype=np.float32)
+        norms = np.zeros(capacity, dtype=np.float32)
+        labels = np.full(capacity, -1, dtype=np.int32)
+        n = len(self.ids)
+        if self._codes is not None:
+            codes[:n] = self._codes[:n]
+            scales[:n] = self._scales[:n]
+            norms[:n] = self._norms[:n]
+            labels[:n] = self.labels[:n]
+        self._codes, self._scales, self._norms = codes, scales, norms
+        self.labels = labels
+
+    def add(self, ids: Sequence[str], vectors: Matrix) -> np.ndarray:
+        """Insert or overwrite the vectors for `ids`; return the rows written."""
+        if not len(ids):
+            return np.empty(0, dtype=np.intp)
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1)
+        if not self._dim:
+            self._dim = matrix.shape[1]
+        elif matrix.shape[1] != self._dim:
+            msg = f"Expected vectors of dimension {self._dim}, got {matrix.shape[1]}."
+            raise ValueError(msg)
+        codes, scales = self._encode(matrix)
+        # Later duplicates win, like repeated dict assignment.
+        positions: dict[str, int] = {doc_id: i for i, doc_id in enumerate(ids)}
+        new_ids = [doc_id for doc_id in positions if doc_id not in self._rows]
+        self._reserve(len(self.ids) + len(new_ids), codes.shape[1], codes.dtype)
+        for doc_id in new_ids:
+            self._rows[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+        rows = np.fromiter((self._rows[d] for d in positions), dtype=np.intp)
+        src = np.fromiter(positions.values(), dtype=np.intp)
+        assert self._codes is not None  # noqa: S101
+        self._codes[rows] = codes[src]
+        self._scales[rows] = scales[src]
+        self._norms[rows] = np.linalg.norm(self.decode(rows), axis=1)
+        self.labels[rows] = -1
+        return rows
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Remove `ids`, ignoring unknown ones."""
+        assert self._codes is not None or not self._rows  # noqa: S101
+        for doc_id in ids:
+            row = self._rows.pop(doc_id, None)
+            if row is None:
                 continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
+            last = len(self.ids) - 1
+            last_id = self.ids.pop()
+            if row != last:
+                self.ids[row] = last_id
+                self._rows[last_id] = row
+                self._codes[row] = self._codes[last]  # type: ignore[index]
+                self._scales[row] = self._scales[last]
+                self._norms[row] = self._norms[last]
+                self.labels[row] = self.labels[last]
+
+    def get(self, ids: Sequence[str]) -> np.ndarray:
+        """Return the dequantized vectors for `ids`, which must all be present."""
+        if not self._dim:
+            return np.empty((0, 0), dtype=np.float32)
+        rows = np.fromiter((self._rows[d] for d in ids), dtype=np.intp)
+        return self.decode(rows)
+
+    def search(
+        self, query: Matrix, k: int, rows: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the `k` rows most cosine-similar to `query`.
+
+        Args:
+            query: The query vector.
+            k: Number of rows to return.
+            rows: Restrict the search to these rows. Defaults to all rows.
+
+        Returns:
+            The selected rows, best first, and their cosine similarities.
+        """
+        n = len(self.ids) if rows is None else len(rows)
+        if k <= 0 or not n:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        assert self._codes is not None  # noqa: S101
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        q_norm = float(np.linalg.norm(q))
+        if self.precision == "binary":
+            q_bits = np.packbits(q > 0)
+            codes = self._codes[:n] if rows is None else self._codes[rows]
+            distances = _POPCOUNT[np.bitwise_xor(codes, q_bits)].sum(
+                axis=1, dtype=np.int32
             )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
-        idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
-    return idxs
+            n_candidates = min(n, k * self.rescore_multiplier)
+            if n_candidates < n:
+                nearest = np.argpartition(distances, n_candidates - 1)[:n_candidates]
+                rows = nearest if rows is None else rows[nearest]
+        dots = self._dots(rows, q)
+        norms = self._norms[:n] if rows is None else self._norms[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = dots / (norms * q_norm)
+        scores[~np.isfinite(scores)] = 0.0
+        best = _top_k(scores, k)
+        return (best if rows is None else rows[best]), scores[best]
+
+
+def _nearest_centroids(
+    vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 4096
+) -> np.ndarray:
+    """Label each row of `vectors` with its most cosine-similar centroid."""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        labels[start : start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+    return labels
+
+
+def _spherical_kmeans(
+    vectors: np.ndarray, n_clusters: int, n_iter: int = 20, seed: int = 0
+) -> np.ndarray:
+    """Cluster unit-normalized `vectors` by cosine similarity.
+
+    Returns:
+        The unit-normalized centroids, one row per cluster.
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)]
+    for _ in range(n_iter):
+        labels = _nearest_centroids(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, vectors)
+        counts = np.bincount(labels, minlength=n_clusters)
+        # Reseed empty clusters from random points rather than dropping them.
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        previous, centroids = centroids, _normalize_rows(sums)
+        if np.allclose(previous, centroids, atol=1e-6):
+            break
+    return centroids
+
+
+class _IVFIndex:
+    """Inverted-file (IVF-Flat) approximate index over `_QuantizedVectors`.
+
+    A spherical k-means coarse quantizer partitions the stored vectors into
+    `n_lists` inverted lists, recorded in the storage's row labels. A query is
+    compared to the centroids, and only the rows of the `nprobe` closest lists
+    are scored, so raising `nprobe` trades speed for recall.
+
+    The quantizer is trained lazily on the first search once enough vectors are
+    stored, and retrained when the store has grown `_RETRAIN_GROWTH` times since
+    the last training. Vectors added in between are assigned to their nearest
+    existing centroid; deletes need no index maintenance.
+    """
+
+    _MIN_TRAIN_SIZE = 1024
+    _RETRAIN_GROWTH = 4
+    _MAX_TRAIN_POINTS_PER_LIST = 256
+
+    def __init__(self, n_lists: int | None = None, nprobe: int = 8) -> None:
+        if n_lists is not None and n_lists < 1:
+            msg = f"n_lists must be a positive integer, got {n_lists}."
+            raise ValueError(msg)
+        if nprobe < 1:
+            msg = f"nprobe must be a positive integer, got {nprobe}."
+            raise ValueError(msg)
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.centroids: np.ndarray | None = None
+        self.trained_size = 0
+
+    def _needs_training(self, size: int) -> bool:
+        if self.centroids is None:
+            return size >= max(self._MIN_TRAIN_SIZE, self.n_lists or 0)
+        return size >= self._RETRAIN_GROWTH * self.trained_size
+
+    def train(self, vectors: _QuantizedVectors) -> None:
+        """Fit the coarse quantizer to the stored vectors and relabel every row."""
+        size = len(vectors)
+        n_lists = min(self.n_lists or max(1, int(np.sqrt(size))), size)
+        rng = np.random.default_rng(0)
+        n_sample = min(size, n_lists * self._MAX_TRAIN_POINTS_PER_LIST)
+        sample = np.sort(rng.choice(size, n_sample, replace=False))
+        self.centroids = _spherical_kmeans(
+            _normalize_rows(vectors.decode(sample)), n_lists
+        )
+        self.trained_size = size
+        self.assign(vectors, np.arange(size))
+
+    def assign(self, vectors: _QuantizedVectors, rows: np.ndarray) -> None:
+        """Label `rows` with their nearest centroid, if the index is trained."""
+        if self.centroids is None or not len(rows):
+            return
+        vectors.labels[rows] = _nearest_centroids(vectors.decode(rows), self.centroids)
+
+    def set_centroids(self, vectors: _QuantizedVectors, centroids: Matrix) -> None:
+        """Restore a previously trained quantizer and relabel every row."""
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.trained_size = len(vectors)
+        self.assign(vectors, np.arange(len(vectors)))
+
+    def search(
+        self,
+        vectors: _QuantizedVectors,
+        query: Matrix,
+        k: int,
+        nprobe: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Approximately find the `k` rows most cosine-similar to `query`.
+
+        Args:
+            vectors: The storage the index was built over.
+            query: The query vector.
+            k: Number of rows to return.
+            nprobe: Number of inverted lists to scan. Defaults to `self.nprobe`.
+
+        Returns:
+            The selected rows, best first, and their cosine similarities.
+        """
+        if self._needs_training(len(vectors)):
+            self.train(vectors)
+        if self.centroids is None:
+            return vectors.search(query, k)
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        probes = _top_k(self.centroids @ q, nprobe)
+        rows = np.flatnonzero(np.isin(vectors.labels[: len(vectors)], probes))
+        return vectors.search(query, k, rows)
+
+    def state(self) -> dict[str, Any]:
+        """Return the trained quantizer in a JSON-serializable form."""
+        if self.centroids is None:
+            return {"centroids": None}
+        return {"centroids": self.centroids.tolist()}
+
+
+# Han, kana and Hangul; scripts written without spaces between words.
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_TOKEN_RE = re.compile(f"[{_CJK}]+|(?:(?![{_CJK}])[^\\W_])+")
+_CJK_RE = re.compile(f"[{_CJK}]")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split `text` into lowercase keyword tokens.
+
+    Runs of letters and digits are tokens. Runs of CJK characters, which are
+    not separated by spaces, are indexed as character unigrams and bigrams, so
+    that multi-character words match without a dictionary-based segmenter.
+    """
+    tokens: list[str] = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        token = match.group()
+        if _CJK_RE.match(token):
+            tokens.extend(token)
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+class _BM25Index:
+    """Okapi BM25 inverted index.
+
+    Each document occupies a slot. For every term, the postings are two compact
+    arrays holding the slots containing the term and the term's frequency in
+    them, so that a query term is scored with a few vectorized operations over
+    its postings.
+
+    Deleted documents leave their postings behind until more than half of the
+    slots are dead, at which point the postings are compacted.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Callable[[str], list[str]] | None = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        if not _HAS_NUMPY:
+            msg = (
+                "The keyword index requires numpy to be installed. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        self.tokenizer = tokenizer or _tokenize
+        self.k1 = k1
+        self.b = b
+        self.ids: list[str | None] = []
+        self._slots: dict[str, int] = {}
+        self._dead: list[int] = []
+        self._doc_terms: list[tuple[str, ...]] = []
+        self._doc_len = array("f")
+        self._total_len = 0.0
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._df: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, ids: Sequence[str], texts: Sequence[str]) -> None:
+        """Index `texts` under `ids`, replacing documents with the same ids."""
+        for doc_id, text in zip(ids, texts, strict=True):
+            if doc_id in self._slots:
+                self.delete([doc_id])
+            tokens = self.tokenizer(text)
+            counts = Counter(tokens)
+            slot = len(self.ids)
+            self.ids.append(doc_id)
+            self._slots[doc_id] = slot
+            self._doc_terms.append(tuple(counts))
+            self._doc_len.append(len(tokens))
+            self._total_len += len(tokens)
+            self._df.update(counts.keys())
+            for term, tf in counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("i"), array("f"))
+                postings[0].append(slot)
+                postings[1].append(tf)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Remove `ids`, ignoring unknown ones."""
+        for doc_id in ids:
+            slot = self._slots.pop(doc_id, None)
+            if slot is None:
+                continue
+            self.ids[slot] = None
+            self._dead.append(slot)
+            self._df.subtract(self._doc_terms[slot])
+            self._doc_terms[slot] = ()
+            self._total_len -= self._doc_len[slot]
+        if len(self._dead) > max(len(self._slots), 1024):
+            self._compact()
+
+    def _compact(self) -> None:
+        alive = np.fromiter((i is not None for i in self.ids), dtype=bool)
+        new_slot = np.cumsum(alive, dtype=np.int32) - 1
+        for term in list(self._postings):
+            slots, tfs = (
+                np.frombuffer(a, dtype=a.typecode) for a in self._postings[term]
+            )
+            keep = alive[slots]
+            if not keep.any():
+                del self._postings[term]
+                self._df.pop(term, None)
+                continue
+            self._postings[term] = (
+                array("i", new_slot[slots[keep]].tobytes()),
+                array("f", tfs[keep].tobytes()),
+            )
+        self.ids = [doc_id for doc_id in self.ids if doc_id is not None]
+        self._dead = []
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(self.ids)}
+        self._doc_terms = [
+            t for t, keep in zip(self._doc_terms, alive, strict=True) if keep
+        ]
+        self._doc_len = array(
+            "f", np.frombuffer(self._doc_len, dtype=np.float32)[alive].tobytes()
+        )
+
+    def scores(self, query: str) -> np.ndarray:
+        """Return the BM25 score of every slot for `query`; dead slots score 0."""
+        scores = np.zeros(len(self.ids))
+        n_docs = len(self._slots)
+        if not n_docs:
+            return scores
+        doc_len = np.frombuffer(self._doc_len, dtype=np.float32)
+        avg_len = self._total_len / n_docs or 1.0
+        for term, query_tf in Counter(self.tokenizer(query)).items():
+            df = self._df.get(term, 0)
+            if df <= 0:
+                continue
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            slots = np.frombuffer(self._postings[term][0], dtype=np.int32)
+            tfs = np.frombuffer(self._postings[term][1], dtype=np.float32)
+            norm = self.k1 * (1 - self.b + self.b * doc_len[slots] / avg_len)
+            weights = (query_tf * idf) * tfs * (self.k1 + 1) / (tfs + norm)
+            scores += np.bincount(slots, weights=weights, minlength=len(scores))
+        scores[self._dead] = 0
+        return scores
+
+    def score_of(self, scores: np.ndarray, doc_id: str) -> float:
+        """Look up the score of `doc_id` in the output of `scores`."""
+        slot = self._slots.get(doc_id)
+        return 0.0 if slot is None else float(scores[slot])
+
+    def top(
+        self, scores: np.ndarray, k: int, allowed: Iterable[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """Return the `k` best-scoring ids with a positive score, best first.
+
+        Args:
+            scores: Output of `scores`.
+            k: Number of ids to return.
+            allowed: Restrict the results to these ids. Defaults to all ids.
+        """
+        if allowed is not None:
+            slots = np.fromiter(
+                (self._slots[doc_id] for doc_id in allowed if doc_id in self._slots),
+                dtype=np.intp,
+            )
+            masked = np.zeros_like(scores)
+            masked[slots] = scores[slots]
+            scores = masked
+        return [
+            (self.ids[slot], float(scores[slot]))  # type: ignore[misc]
+            for slot in _top_k(scores, k)
+            if scores[slot] > 0
+        ]
+
+
+def _fuse_scores(
+    dense: dict[str, float],
+    sparse: dict[str, float],
+    *,
+    fusion: str,
+    alpha: float,
+    rrf_c: int,
+) -> list[tuple[str, float]]:
+    """Fuse two rankings of document ids into one, best first.
+
+    Args:
+        dense: Dense (vector) scores by id, in rank order.
+        sparse: Sparse (keyword) scores by id, in rank order.
+        fusion: `'rrf'` sums `weight / (rrf_c + rank)` over both rankings, with
+            weights `alpha` and `1 - alpha`. `'weighted'` min-max normalizes
+            each score set and sums them with the same weights; it expects
+            both dicts to score the same ids.
+        alpha: Weight of the dense ranking, between 0 and 1.
+        rrf_c: Rank offset for `'rrf'`.
+
+    Returns:
+        `(id, fused score)` pairs sorted by descending score.
+    """
+    fused: dict[str, float] = dict.fromkeys([*dense, *sparse], 0.0)
+    for scores, weight in ((dense, alpha), (sparse, 1 - alpha)):
+        if not scores:
+            continue
+        if fusion == "rrf":
+            for rank, doc_id in enumerate(scores, start=1):
+                fused[doc_id] += weight / (rrf_c + rank)
+        else:
+            low, high = min(scores.values()), max(scores.values())
+            span = high - low or 1.0
+            for doc_id, score in scores.items():
+                fused[doc_id] += weight * (score - low) / span
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
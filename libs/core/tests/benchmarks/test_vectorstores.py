@@ -0,0 +1,175 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore[import-untyped]
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores.utils import (
+    _cosine_similarity,
+    _cosine_top_k,
+    batch_maximal_marginal_relevance,
+    maximal_marginal_relevance,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def mmr_candidates() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    return rng.normal(size=(8, 1024)), rng.normal(size=(1000, 1024))
+
+
+@pytest.mark.benchmark
+def test_mmr_fetch_k_1000_k_50(
+    benchmark: BenchmarkFixture, mmr_candidates: tuple[np.ndarray, np.ndarray]
+) -> None:
+    queries, candidates = mmr_candidates
+
+    @benchmark  # type: ignore[misc]
+    def mmr() -> None:
+        maximal_marginal_relevance(queries[0], candidates, k=50)
+
+
+@pytest.mark.benchmark
+def test_batch_mmr_fetch_k_1000_k_50(
+    benchmark: BenchmarkFixture, mmr_candidates: tuple[np.ndarray, np.ndarray]
+) -> None:
+    queries, candidates = mmr_candidates
+
+    @benchmark  # type: ignore[misc]
+    def batch_mmr() -> None:
+        batch_maximal_marginal_relevance(queries, [candidates] * len(queries), k=50)
+
+
+def _clustered_texts_and_vectors(
+    n: int, dim: int, n_clusters: int
+) -> tuple[list[str], np.ndarray]:
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(n_clusters, dim))
+    labels = rng.integers(n_clusters, size=n)
+    vectors = centers[labels] + 0.3 * rng.normal(size=(n, dim))
+    return [f"doc {i}" for i in range(n)], vectors.astype(np.float32)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("precision", ["float32", "float16", "int8", "binary"])
+@pytest.mark.parametrize("dataset", ["clustered", "fake"])
+def test_inmemory_search_precision(
+    benchmark: BenchmarkFixture, precision: str, dataset: str
+) -> None:
+    """Search latency per storage precision, with recall@10 vs exact float32."""
+    dim, k = 384, 10
+    if dataset == "clustered":
+        texts, vectors = _clustered_texts_and_vectors(10_000, dim, n_clusters=50)
+        queries = vectors[:: len(vectors) // 20] + np.float32(0.1)
+    else:
+        texts = [f"doc {i}" for i in range(10_000)]
+        fake = DeterministicFakeEmbedding(size=dim)
+        vectors = fake.embed_documents_array(texts)
+        queries = fake.embed_documents_array([f"query {i}" for i in range(20)])
+    embedding = DeterministicFakeEmbedding(size=dim)
+
+    def _store(precision: str) -> InMemoryVectorStore:
+        store = InMemoryVectorStore(embedding, precision=precision)  # type: ignore[arg-type]
+        # Bypass embedding so the clustered vectors can be stored as is.
+        store._add_vectors([Document(page_content=t) for t in texts], vectors, texts)
+        return store
+
+    exact, store = _store("float32"), _store(precision)
+    hits = 0
+    for query in queries:
+        expected = exact.similarity_search_by_vector(query.tolist(), k=k)
+        got = store.similarity_search_by_vector(query.tolist(), k=k)
+        hits += len({d.id for d in expected} & {d.id for d in got})
+    benchmark.extra_info["recall@10"] = hits / (k * len(queries))
+
+    query = queries[0].tolist()
+
+    @benchmark  # type: ignore[misc]
+    def search() -> None:
+        store.similarity_search_with_score_by_vector(query, k=k)
+
+
+@pytest.fixture(scope="module")
+def ivf_stores() -> tuple[InMemoryVectorStore, InMemoryVectorStore, np.ndarray]:
+    texts, vectors = _clustered_texts_and_vectors(50_000, 128, n_clusters=200)
+    embedding = DeterministicFakeEmbedding(size=128)
+    documents = [Document(page_content=t) for t in texts]
+    exact = InMemoryVectorStore(embedding, index="flat", precision="float32")
+    exact._add_vectors(documents, vectors, texts)
+    ivf = InMemoryVectorStore(embedding, index="ivf")
+    ivf._add_vectors(documents, vectors, texts)
+    queries = vectors[:: len(vectors) // 50] + np.float32(0.1)
+    # Train outside of the timed section.
+    ivf.similarity_search_by_vector(queries[0].tolist(), k=1)
+    return exact, ivf, queries
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("nprobe", [0, 1, 4, 16, 64])
+def test_inmemory_ivf_recall_vs_qps(
+    benchmark: BenchmarkFixture,
+    ivf_stores: tuple[InMemoryVectorStore, InMemoryVectorStore, np.ndarray],
+    nprobe: int,
+) -> None:
+    """Search latency of an IVF index by `nprobe`, with recall@10 vs exact.
+
+    `nprobe=0` benchmarks exact search on a flat index as the baseline.
+    """
+    exact, ivf, queries = ivf_stores
+    store = ivf if nprobe else exact
+    k = 10
+    hits = 0
+    for query in queries:
+        expected = exact.similarity_search_by_vector(query.tolist(), k=k)
+        got = store.similarity_search_by_vector(query.tolist(), k=k, nprobe=nprobe)
+        hits += len({d.id for d in expected} & {d.id for d in got})
+    benchmark.extra_info["recall@10"] = hits / (k * len(queries))
+
+    query_lists = [query.tolist() for query in queries]
+
+    @benchmark  # type: ignore[misc]
+    def search() -> None:
+        for query in query_lists:
+            store.similarity_search_by_vector(query, k=k, nprobe=nprobe)
+
+
+@pytest.fixture(scope="module")
+def similarity_candidates() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    return (
+        rng.normal(size=(4, 1024)).astype(np.float32),
+        rng.normal(size=(100_000, 1024)).astype(np.float32),
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"dtype": np.float32}, {"dtype": np.float32, "trusted": True}],
+    ids=["default", "float32", "float32-trusted"],
+)
+def test_cosine_similarity_100k_top_10(
+    benchmark: BenchmarkFixture,
+    similarity_candidates: tuple[np.ndarray, np.ndarray],
+    options: dict,
+) -> None:
+    queries, candidates = similarity_candidates
+
+    @benchmark  # type: ignore[misc]
+    def full_then_sort() -> None:
+        similarity = _cosine_similarity(queries, candidates, **options)
+        np.argsort(-similarity, axis=1)[:, :10]
+
+
+@pytest.mark.benchmark
+def test_cosine_top_k_100k_top_10(
+    benchmark: BenchmarkFixture,
+    similarity_candidates: tuple[np.ndarray, np.ndarray],
+) -> None:
+    queries, candidates = similarity_candidates
+
+    @benchmark  # type: ignore[misc]
+    def chunked_top_k() -> None:
+        _cosine_top_k(queries, candidates, 10)
@@ -0,0 +1,121 @@
+import time
+from collections.abc import Iterable, Iterator
+
+import pytest
+from typing_extensions import override
+
+from langchain_core.document_loaders import (
+    BaseBlobParser,
+    BlobLoader,
+    ParallelBlobPipeline,
+)
+from langchain_core.documents import Document
+from langchain_core.documents.base import Blob
+
+
+class LineParser(BaseBlobParser):
+    """Yields one document per line; slower for blobs with fewer lines."""
+
+    @override
+    def lazy_parse(self, blob: Blob) -> Iterator[Document]:
+        lines = blob.as_string().splitlines()
+        time.sleep(0.01 / len(lines))
+        for i, line in enumerate(lines):
+            yield Document(page_content=line, metadata={"source": blob.source, "i": i})
+
+
+class FailingParser(BaseBlobParser):
+    @override
+    def lazy_parse(self, blob: Blob) -> Iterator[Document]:
+        if blob.source == "2":
+            msg = "bad blob"
+            raise ValueError(msg)
+        yield Document(page_content=blob.as_string())
+
+
+class CountingBlobLoader(BlobLoader):
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.yielded = 0
+
+    @override
+    def yield_blobs(self) -> Iterable[Blob]:
+        for i in range(self.n):
+            self.yielded += 1
+            text = "\n".join(f"{i}-{j}" for j in range(i % 4 + 1))
+            yield Blob.from_data(text, path=str(i))
+
+
+def _sequential(n: int) -> list[Document]:
+    parser = LineParser()
+    return [
+        doc
+        for blob in CountingBlobLoader(n).yield_blobs()
+        for doc in parser.lazy_parse(blob)
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_ordered_matches_sequential(executor: str) -> None:
+    pipeline = ParallelBlobPipeline(
+        CountingBlobLoader(20),
+        LineParser(),
+        max_workers=3,
+        executor=executor,  # type: ignore[arg-type]
+    )
+    assert pipeline.load() == _sequential(20)
+
+
+def test_unordered_yields_every_document() -> None:
+    pipeline = ParallelBlobPipeline(
+        CountingBlobLoader(20),
+        LineParser(),
+        max_workers=4,
+        ordered=False,
+        executor="thread",
+    )
+
+    def key(doc: Document) -> tuple[str, int]:
+        return doc.metadata["source"], doc.metadata["i"]
+
+    assert sorted(pipeline.load(), key=key) == sorted(_sequential(20), key=key)
+
+
+def test_blobs_are_pulled_lazily() -> None:
+    loader = CountingBlobLoader(100)
+    pipeline = ParallelBlobPipeline(
+        loader, LineParser(), max_workers=2, max_pending=3, executor="thread"
+    )
+    docs = pipeline.lazy_load()
+    next(docs)
+    assert loader.yielded == 3
+    docs.close()
+
+
+def test_text_splitter_runs_in_workers() -> None:
+    text_splitters = pytest.importorskip("langchain_text_splitters")
+    splitter = text_splitters.CharacterTextSplitter(
+        separator="-", chunk_size=1, chunk_overlap=0
+    )
+    pipeline = ParallelBlobPipeline(
+        CountingBlobLoader(5),
+        LineParser(),
+        text_splitter=splitter,
+        executor="thread",
+    )
+    assert pipeline.load() == splitter.split_documents(_sequential(5))
+
+
+def test_parser_errors_propagate() -> None:
+    pipeline = ParallelBlobPipeline(
+        CountingBlobLoader(5), FailingParser(), max_workers=2, executor="thread"
+    )
+    with pytest.raises(ValueError, match="bad blob"):
+        pipeline.load()
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        ParallelBlobPipeline(CountingBlobLoader(1), LineParser(), max_workers=0)
+    with pytest.raises(ValueError, match="max_pending"):
+        ParallelBlobPipeline(CountingBlobLoader(1), LineParser(), max_pending=0)
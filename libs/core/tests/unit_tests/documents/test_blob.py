@@ -0,0 +1,95 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from langchain_core.documents.base import Blob
+
+TEXT = "héllo wörld\n" * 50 + "ünïcödé ✓"
+
+
+@pytest.fixture
+def text_file(tmp_path: Path) -> Path:
+    path = tmp_path / "file.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+def test_memory_map_reads_match_plain_reads(text_file: Path) -> None:
+    plain = Blob.from_path(text_file)
+    with Blob.from_path(text_file, memory_map=True) as mapped:
+        assert mapped.as_bytes() == plain.as_bytes()
+        assert mapped.as_string() == plain.as_string() == TEXT
+        with mapped.as_bytes_io() as f:
+            assert f.read() == plain.as_bytes()
+
+
+def test_memory_map_is_opened_once(text_file: Path) -> None:
+    blob = Blob.from_path(text_file, memory_map=True)
+    blob.as_bytes()
+    mapping = blob._mapped
+    assert mapping is not None
+    blob.as_string()
+    assert blob.as_memoryview()[:5].tobytes() == TEXT.encode()[:5]
+    assert blob._mapped is mapping
+
+    blob.close()
+    assert blob._mapped is None
+    assert blob.as_string() == TEXT
+
+
+def test_memoryview_outlives_close(text_file: Path) -> None:
+    blob = Blob.from_path(text_file, memory_map=True)
+    view = blob.as_memoryview()
+    blob.close()
+    assert view.tobytes() == TEXT.encode()
+    assert view.readonly
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+@pytest.mark.parametrize("window_size", [1, 2, 7, 4096])
+def test_iter_text_from_path(
+    text_file: Path, *, memory_map: bool, window_size: int
+) -> None:
+    blob = Blob.from_path(text_file, memory_map=memory_map)
+    pieces = list(blob.iter_text(window_size=window_size))
+    assert "".join(pieces) == TEXT
+    assert all(pieces)
+    assert max(len(piece) for piece in pieces) <= window_size
+
+
+@pytest.mark.parametrize("data", [TEXT, TEXT.encode()])
+def test_iter_text_from_data(data: str | bytes) -> None:
+    assert "".join(Blob.from_data(data).iter_text(window_size=5)) == TEXT
+
+
+def test_iter_text_rejects_empty_window() -> None:
+    with pytest.raises(ValueError, match="window_size"):
+        next(Blob.from_data("x").iter_text(window_size=0))
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.txt"
+    path.touch()
+    blob = Blob.from_path(path, memory_map=True)
+    assert blob.as_bytes() == b""
+    assert list(blob.iter_text()) == []
+
+
+def test_pickle_drops_memory_map(text_file: Path) -> None:
+    blob = Blob.from_path(text_file, memory_map=True)
+    blob.as_bytes()
+    restored = pickle.loads(pickle.dumps(blob))
+    assert restored._mapped is None
+    assert restored.as_string() == TEXT
+    assert blob._mapped is not None
+
+
+def test_memory_map_is_ignored_by_equality(text_file: Path) -> None:
+    blob = Blob.from_path(text_file, memory_map=True)
+    other = Blob.from_path(text_file, memory_map=True)
+    blob.as_bytes()
+    assert blob == other
+    assert other == blob
+    assert blob._mapped is not None
+    assert blob != Blob.from_path(text_file, memory_map=True, encoding="latin-1")
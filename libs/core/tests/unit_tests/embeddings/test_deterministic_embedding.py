@@ -1,3 +1,5 @@
+import pytest
+
 from langchain_core.embeddings import DeterministicFakeEmbedding
 
 
@@ -18,3 +20,19 @@ def test_deterministic_fake_embeddings() -> None:
             "Goodbye world!",
         ]
     )
+
+
+async def test_embed_documents_array() -> None:
+    np = pytest.importorskip("numpy")
+    fake = DeterministicFakeEmbedding(size=10)
+    texts = ["Hello world!", "Goodbye world!"]
+    expected = fake.embed_documents(texts)
+
+    output = fake.embed_documents_array(texts)
+    assert output.dtype == np.float32
+    assert output.shape == (2, 10)
+    np.testing.assert_allclose(output, expected, rtol=1e-6)
+
+    output = await fake.aembed_documents_array(texts)
+    np.testing.assert_allclose(output, expected, rtol=1e-6)
+    assert fake.embed_documents_array([]).shape == (0, 0)
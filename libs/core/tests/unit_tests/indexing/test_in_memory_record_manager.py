@@ -277,3 +277,38 @@ async def test_adelete_keys(amanager: InMemoryRecordManager) -> None:
     # Check if the deleted keys are no longer in the database
     remaining_keys = await amanager.alist_keys()
     assert remaining_keys == ["key3"]
+
+
+def test_list_keys_indexes(manager: InMemoryRecordManager) -> None:
+    """Group and time indexes follow updates, regroupings and deletes."""
+    with patch.object(manager, "get_time", return_value=20.0):
+        manager.update(["key1", "key2", "key3"], group_ids=["g1", "g1", "g2"])
+    # Out-of-order time and a group change for an existing key.
+    with patch.object(manager, "get_time", return_value=10.0):
+        manager.update(["key2", "key4"], group_ids=["g2", None])
+
+    assert manager.list_keys(group_ids=["g1"]) == ["key1"]
+    assert sorted(manager.list_keys(group_ids=["g2", "g2"])) == ["key2", "key3"]
+    assert manager.list_keys(group_ids=["g2"], before=15.0) == ["key2"]
+    assert sorted(manager.list_keys(before=15.0)) == ["key2", "key4"]
+    assert sorted(manager.list_keys(after=15.0)) == ["key1", "key3"]
+    assert len(manager.list_keys(after=5.0, limit=3)) == 3
+
+    manager.delete_keys(["key2", "key3"])
+    assert manager.list_keys(group_ids=["g2"]) == []
+    assert manager.list_keys(before=15.0) == ["key4"]
+
+    # Re-adding a deleted key at the same time is listed once.
+    with patch.object(manager, "get_time", return_value=10.0):
+        manager.update(["key4"])
+    assert manager.list_keys(before=15.0) == ["key4"]
+
+
+def test_list_keys_after_many_updates(manager: InMemoryRecordManager) -> None:
+    """Stale time-index entries are compacted away."""
+    for i in range(3000):
+        with patch.object(manager, "get_time", return_value=float(i)):
+            manager.update(["key1", "key2"])
+    assert len(manager._times) < 3000
+    assert sorted(manager.list_keys(after=2998.5)) == ["key1", "key2"]
+    assert manager.list_keys(before=2998.5) == []
@@ -1,7 +1,9 @@
+import itertools
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import (
     Any,
+    Literal,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,7 +11,7 @@ import pytest
 import pytest_asyncio
 from pytest_mock import MockerFixture
 
-from langchain_core.document_loaders.base import BaseLoader
+from langchain_core.document_loaders.base import BaseLoader, FingerprintedLoader
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
 from langchain_core.indexing import InMemoryRecordManager, aindex, index
@@ -2940,3 +2942,251 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _pipeline_runs() -> list[list[Document]]:
+    """Successive loader contents, including moves, edits and shared sources."""
+
+    def doc(text: str, source: str) -> Document:
+        return Document(page_content=text, metadata={"source": source})
+
+    return [
+        [doc("a1", "a"), doc("a2", "a"), doc("b1", "b"), doc("c1", "c")],
+        # "a3" cleans up source "a" before the unchanged "a1" commits.
+        [doc("a3", "a"), doc("a1", "a"), doc("b2", "b"), doc("b2", "b")],
+        [doc("c1", "c"), doc("a3", "a"), doc("c1", "c"), doc("d1", "d")],
+    ]
+
+
+def _run_pipeline_scenario(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    max_in_flight_batches: int | None,
+    *,
+    force_update: bool = False,
+) -> tuple[list[dict[str, int]], set[str], set[str]]:
+    clock = itertools.count(1)
+    record_manager = InMemoryRecordManager(namespace="hello")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+    results = []
+    with patch.object(record_manager, "get_time", lambda: float(next(clock))):
+        for docs in _pipeline_runs():
+            result = index(
+                docs,
+                record_manager,
+                vector_store,
+                batch_size=1,
+                cleanup=cleanup,
+                source_id_key="source",
+                force_update=force_update,
+                key_encoder="sha256",
+                max_in_flight_batches=max_in_flight_batches,
+            )
+            result.pop("timings", None)
+            results.append(dict(result))
+    texts = {doc["text"] for doc in vector_store.store.values()}
+    return results, texts, set(record_manager.list_keys())
+
+
+@pytest.mark.parametrize("cleanup", ["incremental", "full", "scoped_full", None])
+@pytest.mark.parametrize("force_update", [False, True])
+@pytest.mark.parametrize("max_in_flight_batches", [1, 3])
+def test_pipelined_index_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    *,
+    force_update: bool,
+    max_in_flight_batches: int,
+) -> None:
+    """Pipelined runs end in the same state, with the same counts."""
+    assert _run_pipeline_scenario(
+        cleanup, max_in_flight_batches, force_update=force_update
+    ) == _run_pipeline_scenario(cleanup, None, force_update=force_update)
+
+
+def test_pipelined_index_reports_timings(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    docs = [Document(page_content=str(i)) for i in range(10)]
+    result = index(
+        docs,
+        record_manager,
+        vector_store,
+        batch_size=3,
+        key_encoder="sha256",
+        max_in_flight_batches=2,
+    )
+    assert result["num_added"] == 10
+    timings = result["timings"]
+    assert set(timings) == {"hash", "exists", "write", "update", "cleanup", "total"}
+    assert all(value >= 0 for value in timings.values())
+
+    with pytest.raises(ValueError, match="max_in_flight_batches"):
+        index(docs, record_manager, vector_store, max_in_flight_batches=0)
+
+
+def test_pipelined_index_propagates_write_errors(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    docs = [Document(page_content=str(i)) for i in range(10)]
+    with (
+        patch.object(vector_store, "add_documents", side_effect=RuntimeError("boom")),
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=2,
+            key_encoder="sha256",
+            max_in_flight_batches=3,
+        )
+    # No record is written for a batch whose vector store write failed.
+    assert record_manager.list_keys() == []
+
+
+async def _arun_pipeline_scenario(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    max_in_flight_batches: int | None,
+) -> tuple[list[dict[str, int]], set[str], set[str]]:
+    clock = itertools.count(1)
+    record_manager = InMemoryRecordManager(namespace="hello")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+    results = []
+    with patch.object(record_manager, "get_time", lambda: float(next(clock))):
+        for docs in _pipeline_runs():
+            result = await aindex(
+                docs,
+                record_manager,
+                vector_store,
+                batch_size=1,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_in_flight_batches=max_in_flight_batches,
+            )
+            assert ("timings" in result) == (max_in_flight_batches is not None)
+            result.pop("timings", None)
+            results.append(dict(result))
+    texts = {doc["text"] for doc in vector_store.store.values()}
+    return results, texts, set(record_manager.list_keys())
+
+
+@pytest.mark.parametrize("cleanup", ["incremental", "full"])
+async def test_apipelined_index_matches_sequential(
+    cleanup: Literal["incremental", "full"],
+) -> None:
+    assert await _arun_pipeline_scenario(cleanup, 3) == await _arun_pipeline_scenario(
+        cleanup, None
+    )
+
+
+class ToyFingerprintedLoader(FingerprintedLoader):
+    """Loader over in-memory sources that records which sources it loads."""
+
+    def __init__(self, sources: dict[str, list[str]]) -> None:
+        self.sources = sources
+        self.loaded: list[str] = []
+
+    def lazy_fingerprints(self) -> Iterator[tuple[str, str]]:
+        for source_id, texts in self.sources.items():
+            yield source_id, "|".join(texts)
+
+    def lazy_load_source(self, source_id: str) -> Iterator[Document]:
+        self.loaded.append(source_id)
+        for text in self.sources[source_id]:
+            yield Document(page_content=text, metadata={"source": source_id})
+
+
+@pytest.mark.parametrize("max_in_flight_batches", [None, 2])
+@pytest.mark.parametrize("cleanup", ["incremental", "full"])
+def test_index_skips_unchanged_sources(
+    record_manager: InMemoryRecordManager,
+    vector_store: InMemoryVectorStore,
+    cleanup: Literal["incremental", "full"],
+    max_in_flight_batches: int | None,
+) -> None:
+    loader = ToyFingerprintedLoader({"a": ["a1", "a2"], "b": ["b1"], "c": ["c1"]})
+    clock = itertools.count(1)
+
+    def run(**kwargs: Any) -> dict[str, Any]:
+        result = dict(
+            index(
+                loader,
+                record_manager,
+                vector_store,
+                batch_size=2,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_in_flight_batches=max_in_flight_batches,
+                **kwargs,
+            )
+        )
+        result.pop("timings", None)
+        return result
+
+    with patch.object(record_manager, "get_time", lambda: float(next(clock))):
+        assert run() == {
+            "num_added": 4,
+            "num_deleted": 0,
+            "num_skipped": 0,
+            "num_updated": 0,
+        }
+        assert loader.loaded == ["a", "b", "c"]
+
+        # Only the changed source is loaded; unchanged ones survive cleanup.
+        loader.loaded.clear()
+        loader.sources["b"] = ["b2"]
+        assert run() == {
+            "num_added": 1,
+            "num_deleted": 1,
+            "num_skipped": 3,
+            "num_updated": 0,
+        }
+        assert loader.loaded == ["b"]
+
+        # A source whose records are gone is loaded despite its fingerprint.
+        loader.loaded.clear()
+        record_manager.delete_keys(record_manager.list_keys(group_ids=["c"]))
+        assert run()["num_added"] == 1
+        assert loader.loaded == ["c"]
+
+        loader.loaded.clear()
+        assert run(force_update=True)["num_updated"] == 4
+        assert loader.loaded == ["a", "b", "c"]
+
+    texts = {doc["text"] for doc in vector_store.store.values()}
+    assert texts == {"a1", "a2", "b2", "c1"}
+
+
+async def test_aindex_skips_unchanged_sources(
+    arecord_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    loader = ToyFingerprintedLoader({"a": ["a1", "a2"], "b": ["b1"]})
+    clock = itertools.count(1)
+    with patch.object(arecord_manager, "get_time", lambda: float(next(clock))):
+        first = await aindex(
+            loader,
+            arecord_manager,
+            vector_store,
+            cleanup="incremental",
+            source_id_key="source",
+            key_encoder="sha256",
+        )
+        assert first["num_added"] == 3
+        loader.loaded.clear()
+        loader.sources["a"] = ["a3"]
+        assert await aindex(
+            loader,
+            arecord_manager,
+            vector_store,
+            cleanup="incremental",
+            source_id_key="source",
+            key_encoder="sha256",
+        ) == {
+            "num_added": 1,
+            "num_deleted": 2,
+            "num_skipped": 1,
+            "num_updated": 0,
+        }
+    assert loader.loaded == ["a"]
+    assert arecord_manager.fingerprints == {"a": "a3", "b": "b1"}
@@ -10,6 +10,7 @@ def test_all() -> None:
         "DocumentIndex",
         "index",
         "IndexingResult",
+        "IndexingTimings",
         "InMemoryRecordManager",
         "RecordManager",
         "UpsertResponse",
@@ -0,0 +1,193 @@
+import functools
+import operator
+from typing import Any
+
+import pytest
+
+from langchain_core.messages import AIMessageChunk, HumanMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import (
+    ChatGenerationChunk,
+    ChunkAccumulator,
+    GenerationChunk,
+)
+
+
+def _accumulate(chunks: list[Any]) -> Any:
+    acc = ChunkAccumulator()
+    for chunk in chunks:
+        acc.add(chunk)
+    assert len(acc) == len(chunks)
+    return acc.result()
+
+
+def _text_chunks() -> list[AIMessageChunk]:
+    return [
+        AIMessageChunk(content="Hello", id="lc_run-1"),
+        AIMessageChunk(
+            content=" wor",
+            id="provider-id",
+            additional_kwargs={"function_call": {"name": "f", "arguments": None}},
+        ),
+        AIMessageChunk(
+            content="ld",
+            additional_kwargs={"function_call": {"arguments": '{"a"'}},
+            response_metadata={"model_name": "m", "seq": 1},
+        ),
+        AIMessageChunk(
+            content="!",
+            additional_kwargs={"function_call": {"arguments": ": 1}"}},
+            response_metadata={"seq": 2, "finish_reason": "stop"},
+            usage_metadata={"input_tokens": 3, "output_tokens": 4, "total_tokens": 7},
+            chunk_position="last",
+        ),
+    ]
+
+
+def _block_chunks() -> list[AIMessageChunk]:
+    return [
+        AIMessageChunk(content=[], id="lc_abc"),
+        AIMessageChunk(
+            content=[{"type": "thinking", "thinking": "hm", "index": 0}],
+            usage_metadata={"input_tokens": 1, "output_tokens": 0, "total_tokens": 1},
+        ),
+        AIMessageChunk(content=[{"type": "thinking", "thinking": "m.", "index": 0}]),
+        AIMessageChunk(
+            content=[{"type": "text", "text": "An", "index": 1}],
+            tool_call_chunks=[tool_call_chunk(name="add", args="", id="t1", index=2)],
+        ),
+        AIMessageChunk(
+            content=[{"type": "text", "text": "swer", "index": 1}],
+            tool_call_chunks=[tool_call_chunk(args='{"x": ', index=2)],
+        ),
+        AIMessageChunk(
+            content=[{"type": "text", "text": ".", "index": 1}, "tail"],
+            tool_call_chunks=[tool_call_chunk(args="1}", index=2)],
+            usage_metadata={"input_tokens": 0, "output_tokens": 5, "total_tokens": 5},
+        ),
+        AIMessageChunk(content=" end"),
+        AIMessageChunk(content=""),
+    ]
+
+
+@pytest.mark.parametrize("chunks", [_text_chunks(), _block_chunks()])
+def test_messages_match_add(chunks: list[AIMessageChunk]) -> None:
+    expected = chunks[0] + chunks[1:]
+    assert _accumulate(chunks) == expected
+    assert _accumulate(chunks) == functools.reduce(operator.add, chunks)
+
+
+def test_generation_chunks_match_add() -> None:
+    chunks = [
+        ChatGenerationChunk(message=message, generation_info=info)
+        for message, info in zip(
+            _block_chunks(),
+            [None, {"a": "x"}, None, {"a": "y", "n": 1}, {}, None, None, {"n": 2}],
+            strict=True,
+        )
+    ]
+    expected = chunks[0] + chunks[1:]
+    result = _accumulate(chunks)
+    assert result == expected
+    assert result.generation_info == {"a": "xy", "n": 3}
+    assert result.message.tool_call_chunks == [
+        tool_call_chunk(name="add", args='{"x": 1}', id="t1", index=2)
+    ]
+    assert result.message.usage_metadata == {
+        "input_tokens": 1,
+        "output_tokens": 5,
+        "total_tokens": 6,
+    }
+
+
+def test_string_content_becomes_list() -> None:
+    chunks = [
+        AIMessageChunk(content="a"),
+        AIMessageChunk(content="b"),
+        AIMessageChunk(content=[{"type": "text", "text": "c", "index": 0}]),
+        AIMessageChunk(content=[{"type": "text", "text": "d", "index": 0}]),
+    ]
+    assert _accumulate(chunks) == chunks[0] + chunks[1:]
+
+
+def test_inputs_are_not_mutated() -> None:
+    chunks = _block_chunks()
+    snapshot = [chunk.model_copy(deep=True) for chunk in chunks]
+    acc = ChunkAccumulator()
+    for chunk in chunks:
+        acc.add(chunk)
+        acc.result()
+    assert chunks == snapshot
+
+
+def test_text_generation_chunks() -> None:
+    chunks = [
+        GenerationChunk(text="foo", generation_info={"k": [1]}),
+        GenerationChunk(text="bar"),
+        GenerationChunk(text="baz", generation_info={"k": [2]}),
+    ]
+    assert _accumulate(chunks) == functools.reduce(operator.add, chunks)
+
+
+def test_strings_and_generic_values() -> None:
+    assert _accumulate(["a", "b", "c"]) == "abc"
+    assert _accumulate([[1], [2], [3]]) == [1, 2, 3]
+    assert _accumulate([None, "a", "b"]) == "ab"
+    assert ChunkAccumulator().result() is None
+
+
+def test_single_chunk_is_returned_as_is() -> None:
+    chunk = AIMessageChunk(content="x")
+    acc = ChunkAccumulator()
+    acc += chunk
+    assert acc.result() is chunk
+
+
+def test_mixed_message_types_fall_back_to_add() -> None:
+    chunks = [
+        AIMessageChunk(content="a"),
+        AIMessageChunk(content="b"),
+        HumanMessageChunk(content="c"),
+    ]
+    assert _accumulate(chunks) == functools.reduce(operator.add, chunks)
+
+
+def test_incompatible_chunk_raises_and_keeps_value() -> None:
+    acc = ChunkAccumulator()
+    acc.add("a")
+    acc.add("b")
+    with pytest.raises(TypeError):
+        acc.add(1)
+    assert acc.result() == "ab"
+    acc.replace(1)
+    acc.add(2)
+    assert acc.result() == 3
+    assert len(acc) == 2
+
+
+def test_mismatched_kwargs_raise() -> None:
+    acc = ChunkAccumulator()
+    acc.add(AIMessageChunk(content="", additional_kwargs={"a": "x"}))
+    with pytest.raises(TypeError, match="different type"):
+        acc.add(AIMessageChunk(content="", additional_kwargs={"a": 1}))
+
+
+def test_add_reports_empty_chunks() -> None:
+    acc = ChunkAccumulator()
+    assert acc.add(AIMessageChunk(content=""))
+    assert not acc.add(AIMessageChunk(content=""))
+    assert acc.add(AIMessageChunk(content="a"))
+    assert acc.add(AIMessageChunk(content="", response_metadata={"seq": 1}))
+    assert acc.add(AIMessageChunk(content="", chunk_position="last"))
+    before = acc.result()
+    assert not acc.add(AIMessageChunk(content=""))
+    assert acc.result() == before
+
+    acc = ChunkAccumulator()
+    assert acc.add(GenerationChunk(text="a"))
+    assert not acc.add(GenerationChunk(text=""))
+    assert acc.add(GenerationChunk(text="", generation_info={"k": 1}))
+
+    acc = ChunkAccumulator()
+    assert acc.add("a")
+    assert not acc.add("")
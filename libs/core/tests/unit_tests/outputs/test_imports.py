@@ -4,6 +4,7 @@ EXPECTED_ALL = [
     "ChatGeneration",
     "ChatGenerationChunk",
     "ChatResult",
+    "ChunkAccumulator",
     "Generation",
     "GenerationChunk",
     "LLMResult",
@@ -8,6 +8,7 @@ EXPECTED_ALL = [
     "get_bolded_text",
     "abatch_iterate",
     "batch_iterate",
+    "bounded_map",
     "get_color_mapping",
     "get_colored_text",
     "get_pydantic_field_names",
@@ -1,6 +1,8 @@
+from collections.abc import Iterator
+
 import pytest
 
-from langchain_core.utils.iter import batch_iterate
+from langchain_core.utils.iter import batch_iterate, bounded_map
 
 
 @pytest.mark.parametrize(
@@ -17,3 +19,30 @@ def test_batch_iterate(
 ) -> None:
     """Test batching function."""
     assert list(batch_iterate(input_size, input_iterable)) == expected_output
+
+
+def test_bounded_map_preserves_order_and_bounds_reads() -> None:
+    consumed: list[int] = []
+
+    def source() -> Iterator[int]:
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    results = bounded_map(lambda x: x * 2, source(), max_in_flight=3)
+    assert next(results) == 0
+    assert len(consumed) == 3
+    assert list(results) == [2 * i for i in range(1, 10)]
+
+
+def test_bounded_map_propagates_errors() -> None:
+    def fail(x: int) -> int:
+        if x == 2:
+            msg = "boom"
+            raise ValueError(msg)
+        return x
+
+    with pytest.raises(ValueError, match="boom"):
+        list(bounded_map(fail, range(5), max_in_flight=2))
+    with pytest.raises(ValueError, match="max_in_flight"):
+        bounded_map(fail, range(5), max_in_flight=0)
@@ -16,6 +16,12 @@ class TestInMemoryStandard(VectorStoreIntegrationTests):
         return InMemoryVectorStore(embedding=self.get_embeddings())
 
 
+class TestInMemoryInt8Standard(VectorStoreIntegrationTests):
+    @pytest.fixture
+    def vectorstore(self) -> InMemoryVectorStore:
+        return InMemoryVectorStore(embedding=self.get_embeddings(), precision="int8")
+
+
 async def test_inmemory_similarity_search() -> None:
     """Test end to end similarity search."""
     store = await InMemoryVectorStore.afrom_texts(
@@ -206,6 +212,60 @@ async def test_inmemory_get_by_ids() -> None:
     ]
 
 
+def test_inmemory_get_vectors_by_ids() -> None:
+    """Test get vectors by ids."""
+    embedding = DeterministicFakeEmbedding(size=3)
+    store = InMemoryVectorStore(embedding=embedding)
+    store.add_documents(
+        [Document(page_content="foo", id="1"), Document(page_content="bar", id="2")]
+    )
+
+    output = store.get_vectors_by_ids(["2", "5"])
+    assert output == {"2": embedding.embed_query("bar")}
+
+
+def test_inmemory_search_sees_direct_store_changes() -> None:
+    """Records edited through `store` are searched as they are."""
+    embedding = DeterministicFakeEmbedding(size=3)
+    store = InMemoryVectorStore(embedding=embedding)
+    store.add_documents(
+        [Document(page_content="foo", id="1"), Document(page_content="bar", id="2")]
+    )
+
+    store.store["1"] = {
+        "id": "1",
+        "text": "baz",
+        "vector": embedding.embed_query("baz"),
+        "metadata": {},
+    }
+    assert store.similarity_search("baz", k=1) == [Document(page_content="baz", id="1")]
+
+    del store.store["2"]
+    store.add_documents([Document(page_content="qux", id="3")])
+    assert sorted(doc.id for doc in store.similarity_search("bar", k=3)) == [
+        "1",
+        "3",
+    ]
+
+    store.store = {}
+    assert store.similarity_search("bar", k=1) == []
+
+
+def test_inmemory_quantized_search_skips_removed_records() -> None:
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"],
+        DeterministicFakeEmbedding(size=8),
+        ids=["1", "2", "3"],
+        precision="int8",
+    )
+    del store.store["2"]
+    store.store["4"] = {"id": "4", "text": "qux", "metadata": {}}
+
+    assert {doc.id for doc in store.similarity_search("bar", k=4)} == {"1", "3"}
+    output = store.similarity_search("bar", k=4, filter=lambda _: True)
+    assert {doc.id for doc in output} == {"1", "3"}
+
+
 async def test_inmemory_call_embeddings_async() -> None:
     embeddings_mock = Mock(
         wraps=DeterministicFakeEmbedding(size=3),
@@ -220,3 +280,180 @@ async def test_inmemory_call_embeddings_async() -> None:
     # Ensure the async embedding function is called
     assert embeddings_mock.aembed_documents.await_count == 1
     assert embeddings_mock.aembed_query.await_count == 1
+
+
+@pytest.mark.parametrize("precision", ["float16", "int8", "binary"])
+def test_inmemory_quantized_search(precision: str) -> None:
+    texts = [f"text {i}" for i in range(50)]
+    embedding = DeterministicFakeEmbedding(size=64)
+    exact = InMemoryVectorStore.from_texts(texts, embedding)
+    store = InMemoryVectorStore.from_texts(texts, embedding, precision=precision)
+    assert all("vector" not in doc for doc in store.store.values())
+
+    for text in texts[:10]:
+        output = store.similarity_search_with_score(text, k=1)
+        assert output[0][0].page_content == text
+        if precision != "binary":
+            assert output[0][1] == pytest.approx(1.0, abs=0.01)
+
+    if precision != "binary":
+        expected = exact.similarity_search_with_score("text 3", k=5)
+        output = store.similarity_search_with_score("text 3", k=5)
+        assert [doc.page_content for doc, _ in output] == [
+            doc.page_content for doc, _ in expected
+        ]
+        assert [score for _, score in output] == pytest.approx(
+            [score for _, score in expected], abs=0.02
+        )
+
+    output = store.similarity_search(
+        "text 3", k=3, filter=lambda doc: doc.page_content != "text 3"
+    )
+    assert len(output) == 3
+    assert "text 3" not in [doc.page_content for doc in output]
+
+    mmr = store.max_marginal_relevance_search("text 3", k=3, fetch_k=10)
+    assert mmr[0].page_content == "text 3"
+
+
+@pytest.mark.parametrize("precision", ["float16", "int8", "binary"])
+def test_inmemory_quantized_delete_upsert(precision: str) -> None:
+    store = InMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=16), precision=precision
+    )
+    store.add_texts(["foo", "bar", "baz"], ids=["1", "2", "3"])
+    store.delete(["1"])
+    assert store.similarity_search("foo", k=3)[0].page_content != "foo"
+    assert sorted(store.get_vectors_by_ids(["1", "2", "3"])) == ["2", "3"]
+
+    store.add_texts(["foo"], ids=["2"])
+    output = store.similarity_search("foo", k=1)
+    assert output[0].id == "2"
+    assert output[0].page_content == "foo"
+    assert len(store.similarity_search("foo", k=10)) == 2
+
+
+def test_inmemory_quantized_add_rejects_dimension_mismatch() -> None:
+    store = InMemoryVectorStore(DeterministicFakeEmbedding(size=4), precision="int8")
+    store.add_documents([Document(page_content="foo", id="1")])
+    store.embedding = DeterministicFakeEmbedding(size=3)
+
+    with pytest.raises(ValueError, match="dimension"):
+        store.add_documents([Document(page_content="bar", id="2")])
+    assert list(store.store) == ["1"]
+    assert store.get_by_ids(["2"]) == []
+
+
+def test_inmemory_quantized_dump_load(tmp_path: Path) -> None:
+    embedding = DeterministicFakeEmbedding(size=16)
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"], embedding, precision="int8"
+    )
+    output = store.similarity_search_with_score("foo", k=3)
+
+    test_file = str(tmp_path / "test_load_dump.json")
+    store.dump(test_file)
+
+    loaded = InMemoryVectorStore.load(test_file, embedding, precision="int8")
+    reloaded = loaded.similarity_search_with_score("foo", k=3)
+    assert [doc for doc, _ in reloaded] == [doc for doc, _ in output]
+    assert [score for _, score in reloaded] == pytest.approx(
+        [score for _, score in output], abs=1e-3
+    )
+    exact = InMemoryVectorStore.load(test_file, embedding)
+    assert exact.similarity_search("foo", k=1)[0].page_content == "foo"
+
+
+def test_inmemory_ivf_search(tmp_path: Path) -> None:
+    texts = [f"text {i}" for i in range(1500)]
+    embedding = DeterministicFakeEmbedding(size=16)
+    exact = InMemoryVectorStore.from_texts(texts, embedding, ids=texts)
+    store = InMemoryVectorStore.from_texts(
+        texts, embedding, ids=texts, index="ivf", n_lists=16, nprobe=4
+    )
+
+    # Searching trains the index; probing every list is exact.
+    output = store.similarity_search("text 7", k=5)
+    assert output[0].page_content == "text 7"
+    assert store._index is not None
+    assert store._index.centroids is not None
+    expected = exact.similarity_search("text 7", k=5)
+    assert store.similarity_search("text 7", k=5, nprobe=16) == expected
+
+    # Vectors added after training are assigned to a list and found.
+    store.add_texts(["new text"], ids=["new"])
+    assert store.similarity_search("new text", k=1)[0].id == "new"
+    store.delete(["new"])
+    assert store.similarity_search("new text", k=1)[0].id != "new"
+
+    # Filtered searches are exact over the documents that pass the filter.
+    output = store.similarity_search(
+        "text 7", k=2, filter=lambda doc: doc.page_content.endswith("9")
+    )
+    assert output == exact.similarity_search(
+        "text 7", k=2, filter=lambda doc: doc.page_content.endswith("9")
+    )
+
+    test_file = str(tmp_path / "test_load_dump.json")
+    store.dump(test_file)
+    loaded = InMemoryVectorStore.load(
+        test_file, embedding, index="ivf", n_lists=16, nprobe=4
+    )
+    assert loaded._index is not None
+    assert loaded._index.centroids is not None
+    assert loaded.similarity_search("text 3", k=5) == store.similarity_search(
+        "text 3", k=5
+    )
+
+
+async def test_inmemory_hybrid_search() -> None:
+    texts = [
+        "苹果手机评测",
+        "banana bread recipe",
+        "香蕉面包的做法",
+        "apple pie recipe",
+    ]
+    store = InMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=16), keyword_index=True
+    )
+    store.add_texts(texts, ids=["1", "2", "3", "4"])
+
+    output = store.keyword_search_with_score("香蕉面包", k=4)
+    assert [doc.id for doc, _ in output] == ["3"]
+
+    output = store.hybrid_search_with_score("recipe", k=4)
+    assert {doc.id for doc, _ in output[:2]} == {"2", "4"}
+    scores = [score for _, score in output]
+    assert scores == sorted(scores, reverse=True)
+
+    # An exact text match ranks first for both signals.
+    for fusion in ("rrf", "weighted"):
+        assert store.hybrid_search("apple pie recipe", k=1, fusion=fusion)[0].id == "4"
+    assert (await store.ahybrid_search("banana bread recipe", k=1))[0].id == "2"
+
+    output = store.hybrid_search(
+        "recipe", k=4, filter=lambda doc: doc.id != "4", fusion="weighted"
+    )
+    assert "4" not in [doc.id for doc in output]
+
+    store.delete(["3"])
+    assert store.keyword_search_with_score("香蕉面包", k=4) == []
+
+
+def test_inmemory_hybrid_search_requires_keyword_index() -> None:
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=4))
+    with pytest.raises(ValueError, match="keyword_index=True"):
+        store.hybrid_search("foo")
+
+
+def test_inmemory_keyword_index_dump_load(tmp_path: Path) -> None:
+    embedding = DeterministicFakeEmbedding(size=4)
+    store = InMemoryVectorStore.from_texts(
+        ["foo bar", "baz"], embedding, keyword_index=True
+    )
+    test_file = str(tmp_path / "test_load_dump.json")
+    store.dump(test_file)
+    loaded = InMemoryVectorStore.load(test_file, embedding, keyword_index=True)
+    assert loaded.keyword_search_with_score("bar") == store.keyword_search_with_score(
+        "bar"
+    )
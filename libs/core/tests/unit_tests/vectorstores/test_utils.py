@@ -1,13 +1,22 @@
 """Tests for langchain_core.vectorstores.utils module."""
 
 import math
+import warnings
 
 import pytest
 
 pytest.importorskip("numpy")
 import numpy as np
 
-from langchain_core.vectorstores.utils import _cosine_similarity
+from langchain_core.vectorstores.utils import (
+    _BM25Index,
+    _cosine_similarity,
+    _cosine_top_k,
+    _fuse_scores,
+    _tokenize,
+    batch_maximal_marginal_relevance,
+    maximal_marginal_relevance,
+)
 
 
 class TestCosineSimilarity:
@@ -162,3 +171,201 @@ class TestCosineSimilarity:
             ]
         )
         np.testing.assert_array_almost_equal(result, expected)
+
+
+class TestCosineSimilarityOptions:
+    """Tests for the dtype / normalized / trusted options and top-k selection."""
+
+    def test_float32(self) -> None:
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(3, 16)), rng.normal(size=(20, 16))
+        result = _cosine_similarity(x, y, dtype=np.float32)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, _cosine_similarity(x, y), atol=1e-6)
+
+    def test_normalized(self) -> None:
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(3, 16)), rng.normal(size=(20, 16))
+        x_unit = x / np.linalg.norm(x, axis=1, keepdims=True)
+        y_unit = y / np.linalg.norm(y, axis=1, keepdims=True)
+        np.testing.assert_allclose(
+            _cosine_similarity(x_unit, y_unit, normalized=True, trusted=True),
+            _cosine_similarity(x, y),
+        )
+
+    def test_trusted_skips_checks(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = _cosine_similarity([[np.nan, 1.0]], [[1.0, 0.0]], trusted=True)
+        assert np.isnan(result).all()
+        with pytest.warns(RuntimeWarning, match="NaN found"):
+            _cosine_similarity([[np.nan, 1.0], [1.0, 0.0]], [[1.0, 0.0]])
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_top_k_matches_full_sort(self, chunk_size: int) -> None:
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(4, 8)), rng.normal(size=(50, 8))
+        y[3] = 0.0
+        idx, scores = _cosine_top_k(x, y, 5, chunk_size=chunk_size)
+        full = _cosine_similarity(x, y)
+        np.testing.assert_array_equal(idx, np.argsort(-full, axis=1)[:, :5])
+        np.testing.assert_allclose(
+            scores, np.take_along_axis(full, idx, axis=1), atol=1e-6
+        )
+
+    def test_top_k_edge_cases(self) -> None:
+        idx, scores = _cosine_top_k([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0]], 10)
+        assert idx.tolist() == [[0, 1]]
+        assert scores.shape == (1, 2)
+        idx, _ = _cosine_top_k([1.0, 0.0], [[1.0, 0.0]], 0)
+        assert idx.shape == (1, 0)
+
+
+def _reference_mmr(
+    query: np.ndarray, embeddings: np.ndarray, lambda_mult: float, k: int
+) -> list[int]:
+    """Direct O(k^2 * n) MMR used as the ground truth."""
+    similarity_to_query = _cosine_similarity([query], embeddings)[0]
+    idxs = [int(np.argmax(similarity_to_query))]
+    while len(idxs) < min(k, len(embeddings)):
+        similarity_to_selected = _cosine_similarity(embeddings, embeddings[idxs])
+        scores = [
+            -np.inf
+            if i in idxs
+            else lambda_mult * similarity_to_query[i]
+            - (1 - lambda_mult) * max(similarity_to_selected[i])
+            for i in range(len(embeddings))
+        ]
+        idxs.append(int(np.argmax(scores)))
+    return idxs
+
+
+class TestMaximalMarginalRelevance:
+    """Tests for the incremental MMR implementation."""
+
+    @pytest.mark.parametrize("lambda_mult", [0.0, 0.3, 0.5, 1.0])
+    def test_matches_reference(self, lambda_mult: float) -> None:
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(40, 8))
+        query = rng.normal(size=8)
+        assert maximal_marginal_relevance(
+            query, list(embeddings), lambda_mult=lambda_mult, k=10
+        ) == _reference_mmr(query, embeddings, lambda_mult, 10)
+
+    def test_k_larger_than_candidates(self) -> None:
+        embeddings = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+        result = maximal_marginal_relevance(np.array([1.0, 0.1]), embeddings, k=10)
+        assert sorted(result) == [0, 1, 2]
+        assert result[0] == 0
+
+    def test_empty(self) -> None:
+        assert maximal_marginal_relevance(np.array([1.0, 0.0]), [], k=4) == []
+        assert maximal_marginal_relevance(np.array([1.0, 0.0]), [[1, 0]], k=0) == []
+
+    def test_zero_candidate_vector(self) -> None:
+        embeddings = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+        result = maximal_marginal_relevance(np.array([1.0, 0.0]), embeddings, k=3)
+        assert result[0] == 1
+        assert sorted(result) == [0, 1, 2]
+
+    def test_batch_matches_single(self) -> None:
+        rng = np.random.default_rng(1)
+        queries = rng.normal(size=(3, 6))
+        candidates = [rng.normal(size=(20, 6)) for _ in range(3)]
+        expected = [
+            maximal_marginal_relevance(q, list(c), k=5)
+            for q, c in zip(queries, candidates, strict=True)
+        ]
+        assert batch_maximal_marginal_relevance(queries, candidates, k=5) == expected
+        # Ragged candidate sets fall back to per-query selection.
+        ragged = [candidates[0], candidates[1][:7], candidates[2][:2]]
+        assert batch_maximal_marginal_relevance(queries, ragged, k=5) == [
+            maximal_marginal_relevance(q, list(c), k=5)
+            for q, c in zip(queries, ragged, strict=True)
+        ]
+
+    def test_batch_length_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="candidate sets"):
+            batch_maximal_marginal_relevance([[1.0, 0.0]], [], k=1)
+
+
+def test_tokenize_cjk() -> None:
+    assert _tokenize("Hello, World! 检索系统") == [
+        "hello",
+        "world",
+        "检",
+        "索",
+        "系",
+        "统",
+        "检索",
+        "索系",
+        "系统",
+    ]
+    assert _tokenize("RAG检索") == ["rag", "检", "索", "检索"]
+
+
+class TestBM25Index:
+    """Tests for the BM25 keyword index."""
+
+    def test_matches_reference(self) -> None:
+        corpus = ["the cat sat", "the dog sat on the cat", "a bird", "cat cat cat"]
+        index = _BM25Index()
+        index.add([str(i) for i in range(len(corpus))], corpus)
+
+        docs = [text.split() for text in corpus]
+        avg_len = sum(map(len, docs)) / len(docs)
+        expected = []
+        for doc in docs:
+            score = 0.0
+            for term in ["cat", "sat"]:
+                df = sum(term in d for d in docs)
+                idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                tf = doc.count(term)
+                score += (
+                    idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * len(doc) / avg_len))
+                )
+            expected.append(score)
+        assert index.scores("cat sat") == pytest.approx(expected)
+
+    def test_delete_and_upsert(self) -> None:
+        index = _BM25Index()
+        index.add(["a", "b"], ["red apple", "green apple"])
+        index.add(["a"], ["blue sky"])
+        assert [doc_id for doc_id, _ in index.top(index.scores("apple"), 5)] == ["b"]
+        assert index.top(index.scores("sky"), 5)[0][0] == "a"
+
+        index.delete(["a", "missing"])
+        assert index.top(index.scores("sky"), 5) == []
+        assert len(index) == 1
+
+    def test_compaction(self) -> None:
+        index = _BM25Index()
+        ids = [str(i) for i in range(3000)]
+        index.add(ids, [f"doc {i} word{i % 7}" for i in range(3000)])
+        index.delete(ids[:2500])
+        assert len(index.ids) == 500
+        hits = index.top(index.scores("word3"), 1000)
+        assert {doc_id for doc_id, _ in hits} == {
+            str(i) for i in range(2500, 3000) if i % 7 == 3
+        }
+
+    def test_top_allowed(self) -> None:
+        index = _BM25Index()
+        index.add(["a", "b", "c"], ["x y", "x", "z"])
+        assert [doc_id for doc_id, _ in index.top(index.scores("x"), 3)] == ["b", "a"]
+        assert index.top(index.scores("x"), 3, allowed={"a", "c"})[0][0] == "a"
+
+
+def test_fuse_scores() -> None:
+    dense = {"a": 0.9, "b": 0.8}
+    sparse = {"c": 5.0, "a": 1.0}
+    fused = _fuse_scores(dense, sparse, fusion="rrf", alpha=0.5, rrf_c=60)
+    assert [doc_id for doc_id, _ in fused] == ["a", "c", "b"]
+    assert fused[0][1] == pytest.approx(0.5 / 61 + 0.5 / 62)
+
+    dense = {"a": 0.9, "b": 0.8, "c": 0.1}
+    sparse = {"a": 1.0, "b": 0.0, "c": 5.0}
+    fused = _fuse_scores(dense, sparse, fusion="weighted", alpha=0.7, rrf_c=60)
+    assert dict(fused) == pytest.approx(
+        {"a": 0.7 + 0.3 * 0.2, "b": 0.7 * 0.875, "c": 0.3}
+    )
@@ -6,6 +6,7 @@ the relevant methods.
 
 from __future__ import annotations
 
+import time
 import uuid
 from typing import TYPE_CHECKING, Any
 
@@ -14,7 +15,7 @@ from typing_extensions import override
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings, FakeEmbeddings
-from langchain_core.vectorstores import VectorStore
+from langchain_core.vectorstores import VectorStore, ingest_progress
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
@@ -292,3 +293,11 @@ async def test_default_afrom_documents(vs_class: type[VectorStore]) -> None:
     store = await vs_class.afrom_documents([original_document], embeddings, ids=["6"])
     assert original_document.id == "7"  # original document should not be modified
     assert await store.aget_by_ids(["6"]) == [Document(id="6", page_content="baz")]
+
+
+def test_ingest_progress() -> None:
+    progress = ingest_progress(3, 30, time.perf_counter() - 2.0)
+    assert progress["batches"] == 3
+    assert progress["texts"] == 30
+    assert progress["elapsed"] >= 2.0
+    assert progress["texts_per_second"] == pytest.approx(30 / progress["elapsed"])
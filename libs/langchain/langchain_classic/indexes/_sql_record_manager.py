@@ -16,6 +16,7 @@ allow it to work with a variety of SQL as a backend.
 
 import contextlib
 import decimal
+import time
 import uuid
 from collections.abc import AsyncGenerator, Generator, Sequence
 from typing import Any
@@ -30,6 +31,7 @@ from sqlalchemy import (
     and_,
     create_engine,
     delete,
+    event,
     select,
     text,
 )
@@ -39,7 +41,8 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
 )
-from sqlalchemy.orm import Query, Session, declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.sql import Select
 
 try:
     from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -49,6 +52,21 @@ except ImportError:
 
 Base = declarative_base()
 
+# Maximum number of bound parameters in one `IN (...)` list. Larger key lists are
+# split into several statements; SQLite builds before 3.32 allow 999 parameters.
+_MAX_IN_PARAMS = 500
+
+
+def _chunks(items: Sequence[str], size: int = _MAX_IN_PARAMS) -> list[Sequence[str]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _set_sqlite_bulk_pragmas(dbapi_connection: Any, _: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 class UpsertionRecord(Base):  # type: ignore[valid-type,misc]
     """Table used to keep track of when a key was last updated."""
@@ -79,9 +97,30 @@ class UpsertionRecord(Base):  # type: ignore[valid-type,misc]
     __table_args__ = (
         UniqueConstraint("key", "namespace", name="uix_key_namespace"),
         Index("ix_key_namespace", "key", "namespace"),
+        # Serve `list_keys` filters on group ids and/or time within a namespace.
+        Index(
+            "ix_namespace_group_id_updated_at", "namespace", "group_id", "updated_at"
+        ),
+        Index("ix_namespace_updated_at", "namespace", "updated_at"),
     )
 
 
+class SourceFingerprintRecord(Base):  # type: ignore[valid-type,misc]
+    """Table storing the fingerprint of each indexed source."""
+
+    __tablename__ = "source_fingerprint_record"
+
+    namespace = Column(String, primary_key=True, nullable=False)
+    source_id = Column(String, primary_key=True, nullable=False)
+    fingerprint = Column(String, nullable=False)
+
+
+def _create_indexes(connection: Any) -> None:
+    """Create indexes added after a table was created, which `create_all` skips."""
+    for index in UpsertionRecord.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
 class SQLRecordManager(RecordManager):
     """A SQL Alchemy based implementation of the record manager."""
 
@@ -93,6 +132,7 @@ class SQLRecordManager(RecordManager):
         db_url: None | str | URL = None,
         engine_kwargs: dict[str, Any] | None = None,
         async_mode: bool = False,
+        bulk_mode: bool = False,
     ) -> None:
         """Initialize the SQLRecordManager.
 
@@ -112,6 +152,10 @@ class SQLRecordManager(RecordManager):
                 Driver should support async operations.
                 It only applies if db_url is provided.
                 Default is False.
+            bulk_mode: For SQLite, put every connection in WAL journal mode with
+                `synchronous=NORMAL`, so that frequent small commits during
+                large indexing runs are not each flushed to disk. Default is
+                False.
 
         Raises:
             ValueError: If both db_url and engine are provided or neither.
@@ -148,6 +192,11 @@ class SQLRecordManager(RecordManager):
         self.engine = _engine
         self.dialect = _engine.dialect.name
         self.session_factory = _session_factory
+        if bulk_mode and self.dialect == "sqlite":
+            sync_engine = (
+                _engine.sync_engine if isinstance(_engine, AsyncEngine) else _engine
+            )
+            event.listen(sync_engine, "connect", _set_sqlite_bulk_pragmas)
 
     def create_schema(self) -> None:
         """Create the database schema."""
@@ -156,6 +205,8 @@ class SQLRecordManager(RecordManager):
             raise AssertionError(msg)  # noqa: TRY004
 
         Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            _create_indexes(connection)
 
     async def acreate_schema(self) -> None:
         """Create the database schema."""
@@ -165,6 +216,7 @@ class SQLRecordManager(RecordManager):
 
         async with self.engine.begin() as session:
             await session.run_sync(Base.metadata.create_all)
+            await session.run_sync(_create_indexes)
 
     @contextlib.contextmanager
     def _make_session(self) -> Generator[Session, None, None]:
@@ -193,8 +245,11 @@ class SQLRecordManager(RecordManager):
         """Get the current server time as a timestamp.
 
         Please note it's critical that time is obtained from the server since
-        we want a monotonic clock.
+        we want a monotonic clock. SQLite runs in this process and reads the same
+        clock, so no query is made for it.
         """
+        if self.dialect == "sqlite":
+            return time.time()
         with self._make_session() as session:
             # * SQLite specific implementation, can be changed based on dialect.
             # * For SQLite, unlike unixepoch it will work with older versions of SQLite.
@@ -225,8 +280,11 @@ class SQLRecordManager(RecordManager):
         """Get the current server time as a timestamp.
 
         Please note it's critical that time is obtained from the server since
-        we want a monotonic clock.
+        we want a monotonic clock. SQLite runs in this process and reads the same
+        clock, so no query is made for it.
         """
+        if self.dialect == "sqlite":
+            return time.time()
         async with self._amake_session() as session:
             # * SQLite specific implementation, can be changed based on dialect.
             # * For SQLite, unlike unixepoch it will work with older versions of SQLite.
@@ -305,7 +363,7 @@ class SQLRecordManager(RecordManager):
                 # This code needs to be generalized a bit to work with more dialects.
                 sqlite_insert_stmt: SqliteInsertType = sqlite_insert(
                     UpsertionRecord,
-                ).values(records_to_upsert)
+                )
                 stmt = sqlite_insert_stmt.on_conflict_do_update(
                     [UpsertionRecord.key, UpsertionRecord.namespace],
                     set_={
@@ -319,9 +377,7 @@ class SQLRecordManager(RecordManager):
 
                 # Note: uses postgresql insert to make on_conflict_do_update work.
                 # This code needs to be generalized a bit to work with more dialects.
-                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord).values(
-                    records_to_upsert,
-                )
+                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord)
                 stmt = pg_insert_stmt.on_conflict_do_update(  # type: ignore[assignment]
                     constraint="uix_key_namespace",  # Name of constraint
                     set_={
@@ -333,7 +389,10 @@ class SQLRecordManager(RecordManager):
                 msg = f"Unsupported dialect {self.dialect}"
                 raise NotImplementedError(msg)
 
-            session.execute(stmt)
+            # Bind the records as parameter sets (executemany) rather than one
+            # multi-row VALUES clause, so batch size is not capped by the
+            # dialect's bound-parameter limit and the statement is compiled once.
+            session.execute(stmt, records_to_upsert)
             session.commit()
 
     async def aupdate(
@@ -387,7 +446,7 @@ class SQLRecordManager(RecordManager):
                 # This code needs to be generalized a bit to work with more dialects.
                 sqlite_insert_stmt: SqliteInsertType = sqlite_insert(
                     UpsertionRecord,
-                ).values(records_to_upsert)
+                )
                 stmt = sqlite_insert_stmt.on_conflict_do_update(
                     [UpsertionRecord.key, UpsertionRecord.namespace],
                     set_={
@@ -401,9 +460,7 @@ class SQLRecordManager(RecordManager):
 
                 # Note: uses SQLite insert to make on_conflict_do_update work.
                 # This code needs to be generalized a bit to work with more dialects.
-                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord).values(
-                    records_to_upsert,
-                )
+                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord)
                 stmt = pg_insert_stmt.on_conflict_do_update(  # type: ignore[assignment]
                     constraint="uix_key_namespace",  # Name of constraint
                     set_={
@@ -415,43 +472,61 @@ class SQLRecordManager(RecordManager):
                 msg = f"Unsupported dialect {self.dialect}"
                 raise NotImplementedError(msg)
 
-            await session.execute(stmt)
+            # Executemany; see `update`.
+            await session.execute(stmt, records_to_upsert)
             await session.commit()
 
     def exists(self, keys: Sequence[str]) -> list[bool]:
         """Check if the given keys exist in the SQLite database."""
+        found_keys: set[str] = set()
         session: Session
         with self._make_session() as session:
-            filtered_query: Query = session.query(UpsertionRecord.key).filter(
-                and_(
-                    UpsertionRecord.key.in_(keys),
-                    UpsertionRecord.namespace == self.namespace,
-                ),
-            )
-            records = filtered_query.all()
-        found_keys = {r.key for r in records}
+            for chunk in _chunks(keys):
+                query = select(UpsertionRecord.key).where(
+                    and_(
+                        UpsertionRecord.key.in_(chunk),
+                        UpsertionRecord.namespace == self.namespace,
+                    ),
+                )
+                found_keys.update(session.execute(query).scalars())
         return [k in found_keys for k in keys]
 
     async def aexists(self, keys: Sequence[str]) -> list[bool]:
         """Check if the given keys exist in the SQLite database."""
+        found_keys: set[str] = set()
         async with self._amake_session() as session:
-            records = (
-                (
-                    await session.execute(
-                        select(UpsertionRecord.key).where(
-                            and_(
-                                UpsertionRecord.key.in_(keys),
-                                UpsertionRecord.namespace == self.namespace,
-                            ),
-                        ),
-                    )
+            for chunk in _chunks(keys):
+                query = select(UpsertionRecord.key).where(
+                    and_(
+                        UpsertionRecord.key.in_(chunk),
+                        UpsertionRecord.namespace == self.namespace,
+                    ),
                 )
-                .scalars()
-                .all()
-            )
-        found_keys = set(records)
+                found_keys.update((await session.execute(query)).scalars())
         return [k in found_keys for k in keys]
 
+    def _list_keys_queries(
+        self,
+        *,
+        before: float | None,
+        after: float | None,
+        group_ids: Sequence[str] | None,
+    ) -> list[Select]:
+        """Build key-only queries, one per chunk of `group_ids`."""
+        query = select(UpsertionRecord.key).where(
+            UpsertionRecord.namespace == self.namespace,
+        )
+        if after:
+            query = query.where(UpsertionRecord.updated_at > after)
+        if before:
+            query = query.where(UpsertionRecord.updated_at < before)
+        if not group_ids:
+            return [query]
+        return [
+            query.where(UpsertionRecord.group_id.in_(chunk))
+            for chunk in _chunks(group_ids)
+        ]
+
     def list_keys(
         self,
         *,
@@ -461,23 +536,18 @@ class SQLRecordManager(RecordManager):
         limit: int | None = None,
     ) -> list[str]:
         """List records in the SQLite database based on the provided date range."""
+        keys: list[str] = []
         session: Session
         with self._make_session() as session:
-            query: Query = session.query(UpsertionRecord).filter(
-                UpsertionRecord.namespace == self.namespace,
-            )
-
-            if after:
-                query = query.filter(UpsertionRecord.updated_at > after)
-            if before:
-                query = query.filter(UpsertionRecord.updated_at < before)
-            if group_ids:
-                query = query.filter(UpsertionRecord.group_id.in_(group_ids))
-
-            if limit:
-                query = query.limit(limit)
-            records = query.all()
-        return [r.key for r in records]
+            for query in self._list_keys_queries(
+                before=before, after=after, group_ids=group_ids
+            ):
+                if limit:
+                    query = query.limit(limit - len(keys))  # noqa: PLW2901
+                keys.extend(session.execute(query).scalars())
+                if limit and len(keys) >= limit:
+                    break
+        return keys
 
     async def alist_keys(
         self,
@@ -488,49 +558,129 @@ class SQLRecordManager(RecordManager):
         limit: int | None = None,
     ) -> list[str]:
         """List records in the SQLite database based on the provided date range."""
-        session: AsyncSession
+        keys: list[str] = []
         async with self._amake_session() as session:
-            query: Query = select(UpsertionRecord.key).filter(  # type: ignore[assignment]
-                UpsertionRecord.namespace == self.namespace,
+            for query in self._list_keys_queries(
+                before=before, after=after, group_ids=group_ids
+            ):
+                if limit:
+                    query = query.limit(limit - len(keys))  # noqa: PLW2901
+                keys.extend((await session.execute(query)).scalars())
+                if limit and len(keys) >= limit:
+                    break
+        return keys
+
+    def _fingerprint_upsert(self) -> Any:
+        """Build an upsert into the source fingerprint table for the dialect."""
+        if self.dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            sqlite_insert_stmt = sqlite_insert(SourceFingerprintRecord)
+            return sqlite_insert_stmt.on_conflict_do_update(
+                [SourceFingerprintRecord.namespace, SourceFingerprintRecord.source_id],
+                set_={"fingerprint": sqlite_insert_stmt.excluded.fingerprint},
+            )
+        if self.dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            pg_insert_stmt = pg_insert(SourceFingerprintRecord)
+            return pg_insert_stmt.on_conflict_do_update(
+                index_elements=[
+                    SourceFingerprintRecord.namespace,
+                    SourceFingerprintRecord.source_id,
+                ],
+                set_={"fingerprint": pg_insert_stmt.excluded.fingerprint},
             )
+        msg = f"Unsupported dialect {self.dialect}"
+        raise NotImplementedError(msg)
+
+    def _fingerprint_rows(self, fingerprints: dict[str, str]) -> list[dict[str, str]]:
+        return [
+            {
+                "namespace": self.namespace,
+                "source_id": source_id,
+                "fingerprint": fingerprint,
+            }
+            for source_id, fingerprint in fingerprints.items()
+        ]
 
-            # mypy does not recognize .all() or .filter()
-            if after:
-                query = query.filter(UpsertionRecord.updated_at > after)
-            if before:
-                query = query.filter(UpsertionRecord.updated_at < before)
-            if group_ids:
-                query = query.filter(UpsertionRecord.group_id.in_(group_ids))
+    def _fingerprint_query(self, source_ids: Sequence[str]) -> Select:
+        return select(
+            SourceFingerprintRecord.source_id, SourceFingerprintRecord.fingerprint
+        ).where(
+            and_(
+                SourceFingerprintRecord.namespace == self.namespace,
+                SourceFingerprintRecord.source_id.in_(source_ids),
+            ),
+        )
+
+    def get_source_fingerprints(self, source_ids: Sequence[str]) -> dict[str, str]:
+        """Get stored source fingerprints from the SQLite database."""
+        fingerprints: dict[str, str] = {}
+        session: Session
+        with self._make_session() as session:
+            for chunk in _chunks(source_ids):
+                fingerprints.update(
+                    session.execute(self._fingerprint_query(chunk)).all()
+                )
+        return fingerprints
 
-            if limit:
-                query = query.limit(limit)
-            records = (await session.execute(query)).scalars().all()
-        return list(records)
+    async def aget_source_fingerprints(
+        self, source_ids: Sequence[str]
+    ) -> dict[str, str]:
+        """Get stored source fingerprints from the SQLite database."""
+        fingerprints: dict[str, str] = {}
+        async with self._amake_session() as session:
+            for chunk in _chunks(source_ids):
+                result = await session.execute(self._fingerprint_query(chunk))
+                fingerprints.update(result.all())
+        return fingerprints
+
+    def update_source_fingerprints(self, fingerprints: dict[str, str]) -> None:
+        """Upsert source fingerprints into the SQLite database."""
+        if not fingerprints:
+            return
+        with self._make_session() as session:
+            session.execute(
+                self._fingerprint_upsert(), self._fingerprint_rows(fingerprints)
+            )
+            session.commit()
+
+    async def aupdate_source_fingerprints(self, fingerprints: dict[str, str]) -> None:
+        """Upsert source fingerprints into the SQLite database."""
+        if not fingerprints:
+            return
+        async with self._amake_session() as session:
+            await session.execute(
+                self._fingerprint_upsert(), self._fingerprint_rows(fingerprints)
+            )
+            await session.commit()
 
     def delete_keys(self, keys: Sequence[str]) -> None:
         """Delete records from the SQLite database."""
         session: Session
         with self._make_session() as session:
-            filtered_query: Query = session.query(UpsertionRecord).filter(
-                and_(
-                    UpsertionRecord.key.in_(keys),
-                    UpsertionRecord.namespace == self.namespace,
-                ),
-            )
-
-            filtered_query.delete()
+            for chunk in _chunks(keys):
+                session.execute(
+                    delete(UpsertionRecord).where(
+                        and_(
+                            UpsertionRecord.key.in_(chunk),
+                            UpsertionRecord.namespace == self.namespace,
+                        ),
+                    ),
+                )
             session.commit()
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Delete records from the SQLite database."""
         async with self._amake_session() as session:
-            await session.execute(
-                delete(UpsertionRecord).where(
-                    and_(
-                        UpsertionRecord.key.in_(keys),
-                        UpsertionRecord.namespace == self.namespace,
+            for chunk in _chunks(keys):
+                await session.execute(
+                    delete(UpsertionRecord).where(
+                        and_(
+                            UpsertionRecord.key.in_(chunk),
+                            UpsertionRecord.namespace == self.namespace,
+                        ),
                     ),
-                ),
-            )
-
+                )
             await session.commit()
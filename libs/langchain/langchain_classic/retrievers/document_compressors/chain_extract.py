@@ -8,14 +8,20 @@ from typing import Any, cast
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.output_parsers import BaseOutputParser, StrOutputParser
+from langchain_core.output_parsers import (
+    BaseOutputParser,
+    JsonOutputParser,
+    StrOutputParser,
+)
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import RunnableConfig
 from pydantic import ConfigDict
 from typing_extensions import override
 
 from langchain_classic.chains.llm import LLMChain
 from langchain_classic.retrievers.document_compressors.chain_extract_prompt import (
+    packed_prompt_template,
     prompt_template,
 )
 
@@ -48,11 +54,33 @@ def _get_default_chain_prompt() -> PromptTemplate:
     )
 
 
+def _get_packed_chain_prompt() -> PromptTemplate:
+    template = packed_prompt_template.format(
+        no_output_str=NoOutputParser().no_output_str
+    )
+    return PromptTemplate(
+        template=template,
+        input_variables=["question", "contexts"],
+    )
+
+
+def format_packed_contexts(docs: Sequence[Document]) -> str:
+    """Format documents as the numbered contexts of a packed extraction prompt."""
+    return "\n".join(
+        f">>> [{i}]\n{doc.page_content}\n>>>" for i, doc in enumerate(docs, 1)
+    )
+
+
 class LLMChainExtractor(BaseDocumentCompressor):
     """LLM Chain Extractor.
 
     Document compressor that uses an LLM chain to extract
     the relevant parts of documents.
+
+    Documents are sent to the LLM as one batch, with at most `max_concurrency`
+    calls in flight. If `packed_chain` is set, documents no longer than
+    `pack_max_chars` are additionally packed `pack_size` at a time into a single
+    extraction prompt whose JSON answer is split back into per-document outputs.
     """
 
     llm_chain: Runnable
@@ -61,10 +89,92 @@ class LLMChainExtractor(BaseDocumentCompressor):
     get_input: Callable[[str, Document], dict] = default_get_input
     """Callable for constructing the chain input from the query and a Document."""
 
+    max_concurrency: int | None = None
+    """Maximum number of LLM calls to run concurrently. `None` means no limit."""
+
+    packed_chain: Runnable | None = None
+    """Chain extracting from several documents at once. It receives
+    `{"question": ..., "contexts": ...}` (see `format_packed_contexts`) and must
+    return a dict mapping each context number, as a string, to its extracted text.
+    Packing is disabled if `None`."""
+
+    pack_size: int = 4
+    """Maximum number of documents packed into one `packed_chain` call."""
+
+    pack_max_chars: int = 1000
+    """Only documents with at most this many characters are packed."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    def _parse_output(self, output_: Any) -> str:
+        if isinstance(self.llm_chain, LLMChain):
+            output = output_[self.llm_chain.output_key]
+            if self.llm_chain.prompt.output_parser is not None:
+                output = self.llm_chain.prompt.output_parser.parse(output)
+            return cast("str", output)
+        return cast("str", output_)
+
+    def _plan(self, documents: Sequence[Document]) -> tuple[list[int], list[list[int]]]:
+        """Split document indexes into single calls and packed groups."""
+        if self.packed_chain is None or self.pack_size <= 1:
+            return list(range(len(documents))), []
+        singles: list[int] = []
+        packable: list[int] = []
+        for i, doc in enumerate(documents):
+            if len(doc.page_content) <= self.pack_max_chars:
+                packable.append(i)
+            else:
+                singles.append(i)
+        groups = [
+            packable[i : i + self.pack_size]
+            for i in range(0, len(packable), self.pack_size)
+        ]
+        # A lone short document gains nothing from packing.
+        if groups and len(groups[-1]) == 1:
+            singles.extend(groups.pop())
+        return singles, groups
+
+    def _packed_inputs(
+        self, documents: Sequence[Document], query: str, groups: list[list[int]]
+    ) -> list[dict[str, Any]]:
+        return [
+            {
+                "question": query,
+                "contexts": format_packed_contexts([documents[i] for i in group]),
+            }
+            for group in groups
+        ]
+
+    @staticmethod
+    def _unpack(
+        outputs: list[Any], groups: list[list[int]], extracted: dict[int, str]
+    ) -> list[int]:
+        """Demultiplex packed outputs; return indexes of documents to retry."""
+        no_output = NoOutputParser()
+        retry: list[int] = []
+        for group, output in zip(groups, outputs, strict=False):
+            if not isinstance(output, dict):
+                retry.extend(group)
+                continue
+            for n, i in enumerate(group, 1):
+                value = output.get(str(n))
+                if value is None:
+                    retry.append(i)
+                else:
+                    extracted[i] = no_output.parse(str(value))
+        return retry
+
+    def _assemble(
+        self, documents: Sequence[Document], extracted: dict[int, str]
+    ) -> list[Document]:
+        return [
+            Document(page_content=extracted[i], metadata=doc.metadata)
+            for i, doc in enumerate(documents)
+            if extracted.get(i)
+        ]
+
     def compress_documents(
         self,
         documents: Sequence[Document],
@@ -72,22 +182,26 @@ class LLMChainExtractor(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Compress page content of raw documents."""
-        compressed_docs = []
-        for doc in documents:
-            _input = self.get_input(query, doc)
-            output_ = self.llm_chain.invoke(_input, config={"callbacks": callbacks})
-            if isinstance(self.llm_chain, LLMChain):
-                output = output_[self.llm_chain.output_key]
-                if self.llm_chain.prompt.output_parser is not None:
-                    output = self.llm_chain.prompt.output_parser.parse(output)
-            else:
-                output = output_
-            if len(output) == 0:
-                continue
-            compressed_docs.append(
-                Document(page_content=cast("str", output), metadata=doc.metadata),
+        config = RunnableConfig(
+            callbacks=callbacks, max_concurrency=self.max_concurrency
+        )
+        singles, groups = self._plan(documents)
+        extracted: dict[int, str] = {}
+        if groups and self.packed_chain is not None:
+            outputs = self.packed_chain.batch(
+                self._packed_inputs(documents, query, groups),
+                config=config,
+                return_exceptions=True,
+            )
+            singles += self._unpack(outputs, groups, extracted)
+        if singles:
+            outputs = self.llm_chain.batch(
+                [self.get_input(query, documents[i]) for i in singles],
+                config=config,
             )
-        return compressed_docs
+            for i, output_ in zip(singles, outputs, strict=False):
+                extracted[i] = self._parse_output(output_)
+        return self._assemble(documents, extracted)
 
     async def acompress_documents(
         self,
@@ -96,16 +210,26 @@ class LLMChainExtractor(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Compress page content of raw documents asynchronously."""
-        inputs = [self.get_input(query, doc) for doc in documents]
-        outputs = await self.llm_chain.abatch(inputs, {"callbacks": callbacks})
-        compressed_docs = []
-        for i, doc in enumerate(documents):
-            if len(outputs[i]) == 0:
-                continue
-            compressed_docs.append(
-                Document(page_content=outputs[i], metadata=doc.metadata),
+        config = RunnableConfig(
+            callbacks=callbacks, max_concurrency=self.max_concurrency
+        )
+        singles, groups = self._plan(documents)
+        extracted: dict[int, str] = {}
+        if groups and self.packed_chain is not None:
+            outputs = await self.packed_chain.abatch(
+                self._packed_inputs(documents, query, groups),
+                config=config,
+                return_exceptions=True,
             )
-        return compressed_docs
+            singles += self._unpack(outputs, groups, extracted)
+        if singles:
+            outputs = await self.llm_chain.abatch(
+                [self.get_input(query, documents[i]) for i in singles],
+                config=config,
+            )
+            for i, output_ in zip(singles, outputs, strict=False):
+                extracted[i] = self._parse_output(output_)
+        return self._assemble(documents, extracted)
 
     @classmethod
     def from_llm(
@@ -114,8 +238,25 @@ class LLMChainExtractor(BaseDocumentCompressor):
         prompt: PromptTemplate | None = None,
         get_input: Callable[[str, Document], str] | None = None,
         llm_chain_kwargs: dict | None = None,  # noqa: ARG003
+        *,
+        pack_size: int = 1,
+        **kwargs: Any,
     ) -> LLMChainExtractor:
-        """Initialize from LLM."""
+        """Initialize from LLM.
+
+        Args:
+            llm: The language model to use for extraction.
+            prompt: The prompt to use for single-document extraction.
+            get_input: Callable for constructing the chain input.
+            llm_chain_kwargs: Unused.
+            pack_size: If greater than 1, also build a `packed_chain` that extracts
+                from up to this many short documents per LLM call.
+            kwargs: Additional arguments to pass to the constructor, e.g.
+                `max_concurrency` or `pack_max_chars`.
+
+        Returns:
+            A LLMChainExtractor that uses the given language model.
+        """
         _prompt = prompt if prompt is not None else _get_default_chain_prompt()
         _get_input = get_input if get_input is not None else default_get_input
         if _prompt.output_parser is not None:
@@ -123,4 +264,9 @@ class LLMChainExtractor(BaseDocumentCompressor):
         else:
             parser = StrOutputParser()
         llm_chain = _prompt | llm | parser
-        return cls(llm_chain=llm_chain, get_input=_get_input)
+        if pack_size > 1:
+            kwargs["packed_chain"] = (
+                _get_packed_chain_prompt() | llm | JsonOutputParser()
+            )
+            kwargs["pack_size"] = pack_size
+        return cls(llm_chain=llm_chain, get_input=_get_input, **kwargs)
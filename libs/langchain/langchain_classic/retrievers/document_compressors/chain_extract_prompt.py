@@ -8,3 +8,14 @@ Remember, *DO NOT* edit the extracted parts of the context.
 {{context}}
 >>>
 Extracted relevant parts:"""  # noqa: E501
+
+packed_prompt_template = """Given the following question and numbered contexts, extract from each context any part *AS IS* that is relevant to answer the question. If none of a context is relevant use {no_output_str} for that context.
+
+Remember, *DO NOT* edit the extracted parts of the contexts.
+
+Respond with a single JSON object that maps every context number (as a string) to the extracted parts of that context, and nothing else.
+
+> Question: {{question}}
+> Contexts:
+{{contexts}}
+JSON:"""  # noqa: E501
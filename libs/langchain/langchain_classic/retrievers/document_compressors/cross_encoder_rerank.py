@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import operator
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
+from typing import Any
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
-from pydantic import ConfigDict
+from langchain_core.runnables import run_in_executor
+from pydantic import ConfigDict, PrivateAttr
 from typing_extensions import override
 
 from langchain_classic.retrievers.document_compressors.cross_encoder import (
@@ -13,20 +19,103 @@ from langchain_classic.retrievers.document_compressors.cross_encoder import (
 )
 
 
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class CrossEncoderReranker(BaseDocumentCompressor):
-    """Document compressor that uses CrossEncoder for reranking."""
+    """Document compressor that uses CrossEncoder for reranking.
+
+    Optionally:
+
+    * scores pairs in micro-batches of `batch_size`,
+    * caches pair scores keyed by query hash and document id (`cache_size`),
+    * runs a cheap `prefilter` compressor (e.g. an `EmbeddingsFilter` with
+      `k=M`) to prune the candidate set before the cross-encoder runs.
+    """
 
     model: BaseCrossEncoder
     """CrossEncoder model to use for scoring similarity
       between the query and documents."""
     top_n: int = 3
     """Number of documents to return."""
+    batch_size: int | None = None
+    """Maximum number of pairs passed to a single `model.score` call.
+    If `None`, all pairs are scored in one call."""
+    cache_size: int = 0
+    """Maximum number of (query, document) scores to keep in an LRU cache.
+    Documents are identified by `Document.id` or, failing that, a hash of their
+    content. `0` disables caching."""
+    prefilter: BaseDocumentCompressor | None = None
+    """Cheap first-stage compressor applied before cross-encoder scoring, e.g.
+    `EmbeddingsFilter(embeddings=..., k=50)`. Only its surviving documents are
+    scored by `model`."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
 
+    _cache: OrderedDict[tuple[str, str], float] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _cache_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @staticmethod
+    def _doc_key(doc: Document) -> str:
+        return doc.id or _hash_text(doc.page_content)
+
+    def _score(self, query: str, documents: Sequence[Document]) -> list[float]:
+        """Score documents against the query, consulting the pair cache."""
+        if self.cache_size <= 0:
+            return self._score_pairs([(query, doc.page_content) for doc in documents])
+
+        query_key = _hash_text(query)
+        keys = [(query_key, self._doc_key(doc)) for doc in documents]
+        scores: list[float | None] = [None] * len(documents)
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    scores[i] = self._cache[key]
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            fresh = self._score_pairs(
+                [(query, documents[i].page_content) for i in missing]
+            )
+            with self._cache_lock:
+                for i, score in zip(missing, fresh, strict=False):
+                    scores[i] = score
+                    self._cache[keys[i]] = score
+                    self._cache.move_to_end(keys[i])
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return scores  # type: ignore[return-value]
+
+    def _score_pairs(self, text_pairs: list[tuple[str, str]]) -> list[float]:
+        if not text_pairs:
+            return []
+        if not self.batch_size or len(text_pairs) <= self.batch_size:
+            return list(self.model.score(text_pairs))
+        scores: list[float] = []
+        for i in range(0, len(text_pairs), self.batch_size):
+            scores.extend(self.model.score(text_pairs[i : i + self.batch_size]))
+        return scores
+
+    def _select(
+        self, documents: Sequence[Document], scores: Sequence[float]
+    ) -> list[Document]:
+        docs_with_scores = zip(documents, scores, strict=False)
+        result = heapq.nlargest(
+            self.top_n, docs_with_scores, key=operator.itemgetter(1)
+        )
+        return [doc for doc, _ in result]
+
+    def clear_cache(self) -> None:
+        """Drop all cached pair scores."""
+        with self._cache_lock:
+            self._cache.clear()
+
     @override
     def compress_documents(
         self,
@@ -44,7 +133,33 @@ class CrossEncoderReranker(BaseDocumentCompressor):
         Returns:
             A sequence of compressed documents.
         """
-        scores = self.model.score([(query, doc.page_content) for doc in documents])
-        docs_with_scores = list(zip(documents, scores, strict=False))
-        result = sorted(docs_with_scores, key=operator.itemgetter(1), reverse=True)
-        return [doc for doc, _ in result[: self.top_n]]
+        if self.prefilter is not None and len(documents) > self.top_n:
+            documents = self.prefilter.compress_documents(
+                documents, query, callbacks=callbacks
+            )
+        scores = self._score(query, documents)
+        return self._select(documents, scores)
+
+    @override
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Rerank documents using CrossEncoder.
+
+        Args:
+            documents: A sequence of documents to compress.
+            query: The query to use for compressing the documents.
+            callbacks: Callbacks to run during the compression process.
+
+        Returns:
+            A sequence of compressed documents.
+        """
+        if self.prefilter is not None and len(documents) > self.top_n:
+            documents = await self.prefilter.acompress_documents(
+                documents, query, callbacks=callbacks
+            )
+        scores = await run_in_executor(None, self._score, query, documents)
+        return self._select(documents, scores)
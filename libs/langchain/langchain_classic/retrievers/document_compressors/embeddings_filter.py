@@ -1,29 +1,59 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
+from typing import Any
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 from langchain_core.embeddings import Embeddings
+from langchain_core.runnables import run_in_executor
 from langchain_core.utils import pre_init
-from pydantic import ConfigDict, Field
+from langchain_core.vectorstores import VectorStore
+from pydantic import ConfigDict, Field, PrivateAttr
 from typing_extensions import override
 
 
 def _get_similarity_function() -> Callable:
+    from langchain_core.vectorstores.utils import _cosine_similarity
+
+    return _cosine_similarity
+
+
+def _import_numpy() -> Any:
     try:
-        from langchain_community.utils.math import cosine_similarity
+        import numpy as np
     except ImportError as e:
-        msg = (
-            "To use please install langchain-community "
-            "with `pip install langchain-community`."
-        )
+        msg = "Could not import numpy, please install with `pip install numpy`."
         raise ImportError(msg) from e
-    return cosine_similarity
+    return np
+
+
+class _DocumentWithState(Document):
+    """Wrapper for a document that includes arbitrary state."""
+
+    state: dict = Field(default_factory=dict)
+    """State associated with the document."""
+
+
+def _content_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 class EmbeddingsFilter(BaseDocumentCompressor):
     """Embeddings Filter.
 
     Document compressor that uses embeddings to drop documents unrelated to the query.
+
+    Document vectors are resolved without re-embedding whenever possible, in order:
+
+    1. a vector already attached to the document as `state["embedded_doc"]`
+       (e.g. by an upstream `EmbeddingsRedundantFilter`),
+    2. the vector stored in `vectorstore` under `Document.id`,
+    3. the filter's own LRU cache of document embeddings (see `cache_size`).
+
+    Only the remaining documents are passed to `embeddings.embed_documents_array`.
+    Filtering itself is a single matrix product against the query vector.
     """
 
     embeddings: Embeddings
@@ -39,52 +69,94 @@ class EmbeddingsFilter(BaseDocumentCompressor):
     """Threshold for determining when two documents are similar enough
     to be considered redundant. Defaults to `None`, must be specified if `k` is set
     to None."""
+    vectorstore: VectorStore | None = None
+    """Vector store the documents were retrieved from. Must implement
+    `get_vectors_by_ids` (e.g. `InMemoryVectorStore` or `Chroma`). Stored vectors
+    are reused for documents with a matching `id`."""
+    cache_size: int = 0
+    """Maximum number of document embeddings, keyed by content hash, to keep in
+    an LRU cache for documents whose vectors are not otherwise available.
+    `0` disables caching."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _cache: OrderedDict[str, Any] = PrivateAttr(default_factory=OrderedDict)
+    _cache_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
     @pre_init
     def validate_params(cls, values: dict) -> dict:
         """Validate similarity parameters."""
         if values["k"] is None and values["similarity_threshold"] is None:
             msg = "Must specify one of `k` or `similarity_threshold`."
             raise ValueError(msg)
+        vectorstore = values.get("vectorstore")
+        if vectorstore is not None and not hasattr(vectorstore, "get_vectors_by_ids"):
+            msg = (
+                f"{type(vectorstore).__name__} does not implement "
+                "`get_vectors_by_ids`, so its vectors cannot be reused."
+            )
+            raise ValueError(msg)
         return values
 
-    @override
-    def compress_documents(
+    def _known_vectors(
+        self, documents: Sequence[Document]
+    ) -> tuple[list[Any], list[int]]:
+        """Resolve vectors available without embedding; return them and the misses."""
+        vectors: list[Any] = [
+            getattr(doc, "state", {}).get("embedded_doc") for doc in documents
+        ]
+        if self.vectorstore is not None:
+            ids = [
+                doc.id
+                for doc, vector in zip(documents, vectors, strict=False)
+                if vector is None and doc.id is not None
+            ]
+            if ids:
+                stored = self.vectorstore.get_vectors_by_ids(ids)  # type: ignore[attr-defined]
+                for i, doc in enumerate(documents):
+                    if vectors[i] is None and doc.id is not None:
+                        vectors[i] = stored.get(doc.id)
+        if self.cache_size > 0:
+            with self._cache_lock:
+                for i, doc in enumerate(documents):
+                    if vectors[i] is None:
+                        key = _content_key(doc.page_content)
+                        if key in self._cache:
+                            self._cache.move_to_end(key)
+                            vectors[i] = self._cache[key]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        return vectors, missing
+
+    def _store_embedded(
         self,
         documents: Sequence[Document],
-        query: str,
-        callbacks: Callbacks | None = None,
-    ) -> Sequence[Document]:
-        """Filter documents based on similarity of their embeddings to the query."""
-        try:
-            from langchain_community.document_transformers.embeddings_redundant_filter import (  # noqa: E501
-                _get_embeddings_from_stateful_docs,
-                get_stateful_documents,
-            )
-        except ImportError as e:
-            msg = (
-                "To use please install langchain-community "
-                "with `pip install langchain-community`."
-            )
-            raise ImportError(msg) from e
-
-        try:
-            import numpy as np
-        except ImportError as e:
-            msg = "Could not import numpy, please install with `pip install numpy`."
-            raise ImportError(msg) from e
-        stateful_documents = get_stateful_documents(documents)
-        embedded_documents = _get_embeddings_from_stateful_docs(
-            self.embeddings,
-            stateful_documents,
-        )
-        embedded_query = self.embeddings.embed_query(query)
-        similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
-        included_idxs: np.ndarray = np.arange(len(embedded_documents))
+        vectors: list[Any],
+        missing: list[int],
+        embedded: Any,
+    ) -> None:
+        for i, vector in zip(missing, embedded, strict=False):
+            vectors[i] = vector
+        if self.cache_size <= 0 or not missing:
+            return
+        with self._cache_lock:
+            for i, vector in zip(missing, embedded, strict=False):
+                key = _content_key(documents[i].page_content)
+                self._cache[key] = vector
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _filter(
+        self,
+        documents: Sequence[Document],
+        vectors: list[Any],
+        embedded_query: list[float],
+    ) -> list[Document]:
+        np = _import_numpy()
+        similarity = self.similarity_fn([embedded_query], np.asarray(vectors))[0]
+        included_idxs: np.ndarray = np.arange(len(vectors))
         if self.k is not None:
             included_idxs = np.argsort(similarity)[::-1][: self.k]
         if self.similarity_threshold is not None:
@@ -92,9 +164,45 @@ class EmbeddingsFilter(BaseDocumentCompressor):
                 similarity[included_idxs] > self.similarity_threshold,
             )
             included_idxs = included_idxs[similar_enough]
+        results: list[Document] = []
         for i in included_idxs:
-            stateful_documents[i].state["query_similarity_score"] = similarity[i]
-        return [stateful_documents[i] for i in included_idxs]
+            doc = documents[i]
+            state = {
+                **getattr(doc, "state", {}),
+                "embedded_doc": vectors[i],
+                "query_similarity_score": similarity[i],
+            }
+            if hasattr(doc, "state"):
+                results.append(doc.model_copy(update={"state": state}))
+            else:
+                results.append(
+                    _DocumentWithState(
+                        id=doc.id,
+                        page_content=doc.page_content,
+                        metadata=doc.metadata,
+                        state=state,
+                    )
+                )
+        return results
+
+    @override
+    def compress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Filter documents based on similarity of their embeddings to the query."""
+        if not documents:
+            return []
+        vectors, missing = self._known_vectors(documents)
+        if missing:
+            embedded = self.embeddings.embed_documents_array(
+                [documents[i].page_content for i in missing]
+            )
+            self._store_embedded(documents, vectors, missing, embedded)
+        embedded_query = self.embeddings.embed_query(query)
+        return self._filter(documents, vectors, embedded_query)
 
     @override
     async def acompress_documents(
@@ -104,38 +212,18 @@ class EmbeddingsFilter(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Filter documents based on similarity of their embeddings to the query."""
-        try:
-            from langchain_community.document_transformers.embeddings_redundant_filter import (  # noqa: E501
-                _aget_embeddings_from_stateful_docs,
-                get_stateful_documents,
+        if not documents:
+            return []
+        if self.vectorstore is not None:
+            vectors, missing = await run_in_executor(
+                None, self._known_vectors, documents
             )
-        except ImportError as e:
-            msg = (
-                "To use please install langchain-community "
-                "with `pip install langchain-community`."
+        else:
+            vectors, missing = self._known_vectors(documents)
+        if missing:
+            embedded = await self.embeddings.aembed_documents_array(
+                [documents[i].page_content for i in missing]
             )
-            raise ImportError(msg) from e
-
-        try:
-            import numpy as np
-        except ImportError as e:
-            msg = "Could not import numpy, please install with `pip install numpy`."
-            raise ImportError(msg) from e
-        stateful_documents = get_stateful_documents(documents)
-        embedded_documents = await _aget_embeddings_from_stateful_docs(
-            self.embeddings,
-            stateful_documents,
-        )
+            self._store_embedded(documents, vectors, missing, embedded)
         embedded_query = await self.embeddings.aembed_query(query)
-        similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
-        included_idxs: np.ndarray = np.arange(len(embedded_documents))
-        if self.k is not None:
-            included_idxs = np.argsort(similarity)[::-1][: self.k]
-        if self.similarity_threshold is not None:
-            similar_enough = np.where(
-                similarity[included_idxs] > self.similarity_threshold,
-            )
-            included_idxs = included_idxs[similar_enough]
-        for i in included_idxs:
-            stateful_documents[i].state["query_similarity_score"] = similarity[i]
-        return [stateful_documents[i] for i in included_idxs]
+        return self._filter(documents, vectors, embedded_query)
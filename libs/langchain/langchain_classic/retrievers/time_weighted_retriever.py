@@ -1,5 +1,8 @@
 import datetime
-from copy import deepcopy
+import functools
+import logging
+from collections.abc import Sequence
+from importlib import util
 from typing import Any
 
 from langchain_core.callbacks import (
@@ -9,15 +12,99 @@ from langchain_core.callbacks import (
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 from typing_extensions import override
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _check_numpy() -> bool:
+    if bool(util.find_spec("numpy")):
+        return True
+    logger.warning(
+        "NumPy not found in the current Python environment. "
+        "TimeWeightedVectorStoreRetriever will rescore memories in pure Python, "
+        "which is slow for large memory streams. Install NumPy with "
+        "`pip install numpy` for vectorized rescoring.",
+    )
+    return False
+
 
 def _get_hours_passed(time: datetime.datetime, ref_time: datetime.datetime) -> float:
     """Get the hours passed between two datetimes."""
     return (time - ref_time).total_seconds() / 3600
 
 
+def _to_timestamp(value: Any) -> float:
+    """Convert a date metadata value to a POSIX timestamp; NaN if missing."""
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float("nan")
+
+
+def _copy_document(document: Document) -> Document:
+    """Copy a document with its own top-level metadata dict."""
+    return document.model_copy(update={"metadata": dict(document.metadata)})
+
+
+class _MemoryColumns:
+    """Columnar mirror of the memory stream used for vectorized rescoring.
+
+    Row `i` describes `memory_stream[i]`: access/creation timestamps (NaN when
+    missing), the sum of its `other_score_keys` and its vector store id.
+    """
+
+    def __init__(self, other_score_keys: Sequence[str]) -> None:
+        import numpy as np
+
+        self.other_score_keys = tuple(other_score_keys)
+        self.size = 0
+        self.last_accessed_at = np.empty(0, dtype=np.float64)
+        self.created_at = np.empty(0, dtype=np.float64)
+        self.static_score = np.empty(0, dtype=np.float64)
+        self.ids: list[str | None] = []
+
+    def _reserve(self, n: int) -> None:
+        import numpy as np
+
+        capacity = len(self.last_accessed_at)
+        if self.size + n <= capacity:
+            return
+        new_capacity = max(self.size + n, 2 * capacity, 64)
+        for name in ("last_accessed_at", "created_at", "static_score"):
+            grown = np.empty(new_capacity, dtype=np.float64)
+            grown[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, grown)
+
+    def extend(
+        self,
+        documents: Sequence[Document],
+        ids: Sequence[str | None] | None = None,
+    ) -> None:
+        n = len(documents)
+        self._reserve(n)
+        start, end = self.size, self.size + n
+        self.last_accessed_at[start:end] = [
+            _to_timestamp(doc.metadata.get("last_accessed_at")) for doc in documents
+        ]
+        self.created_at[start:end] = [
+            _to_timestamp(doc.metadata.get("created_at")) for doc in documents
+        ]
+        self.static_score[start:end] = [
+            sum(
+                doc.metadata[key]
+                for key in self.other_score_keys
+                if key in doc.metadata
+            )
+            for doc in documents
+        ]
+        self.ids.extend(ids if ids is not None else [None] * n)
+        self.size = end
+
+
 class TimeWeightedVectorStoreRetriever(BaseRetriever):
     """Time Weighted Vector Store Retriever.
 
@@ -32,7 +119,11 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
 
     # TODO: abstract as a queue
     memory_stream: list[Document] = Field(default_factory=list)
-    """The memory_stream of documents to search through."""
+    """The memory_stream of documents to search through.
+
+    When NumPy is installed, access times and `other_score_keys` are mirrored into
+    a columnar index as documents are appended, so metadata should only be changed
+    through the retriever."""
 
     decay_rate: float = Field(default=0.01)
     """The exponential decay factor used as (1.0-decay_rate)**(hrs_passed)."""
@@ -49,10 +140,32 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
     None assigns no salience to documents not fetched from the vector store.
     """
 
+    access_flush_size: int | None = None
+    """Write pending `last_accessed_at` updates back to the vectorstore once this
+    many memories have been accessed. `None` only writes them back on an explicit
+    `flush_access_times` call."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _columns: _MemoryColumns | None = PrivateAttr(default=None)
+    _pending_access: set[int] = PrivateAttr(default_factory=set)
+
+    def _get_columns(self) -> _MemoryColumns:
+        """Return the columnar index, catching up with the memory stream."""
+        columns = self._columns
+        if (
+            columns is None
+            or columns.size > len(self.memory_stream)
+            or columns.other_score_keys != tuple(self.other_score_keys)
+        ):
+            columns = _MemoryColumns(self.other_score_keys)
+            self._columns = columns
+        if columns.size < len(self.memory_stream):
+            columns.extend(self.memory_stream[columns.size :])
+        return columns
+
     def _document_get_date(self, field: str, document: Document) -> datetime.datetime:
         """Return the value of the date field of a document."""
         if field in document.metadata:
@@ -115,6 +228,54 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
     def _get_rescored_docs(
         self,
         docs_and_scores: dict[Any, tuple[Document, float | None]],
+    ) -> list[Document]:
+        if not docs_and_scores:
+            return []
+        if not _check_numpy():
+            return self._get_rescored_docs_python(docs_and_scores)
+        import numpy as np
+
+        current_time = datetime.datetime.now()
+        now = current_time.timestamp()
+        columns = self._get_columns()
+        idxs = np.fromiter(docs_and_scores, dtype=np.int64, count=len(docs_and_scores))
+        relevance = np.fromiter(
+            (
+                0.0 if relevance is None else relevance
+                for _, relevance in docs_and_scores.values()
+            ),
+            dtype=np.float64,
+            count=len(docs_and_scores),
+        )
+        last_accessed = columns.last_accessed_at[idxs]
+        hours_passed = np.where(
+            np.isnan(last_accessed), 0.0, (now - last_accessed) / 3600
+        )
+        scores = (
+            (1.0 - self.decay_rate) ** hours_passed
+            + columns.static_score[idxs]
+            + relevance
+        )
+        if self.k < len(scores):
+            top = np.argpartition(-scores, self.k - 1)[: self.k]
+        else:
+            top = np.arange(len(scores))
+        # Highest score first; ties keep candidate order like a stable sort.
+        top = top[np.lexsort((top, -scores[top]))]
+        selected = idxs[top]
+        # Ensure frequently accessed memories aren't forgotten
+        columns.last_accessed_at[selected] = now
+        result = []
+        for buffer_idx in selected.tolist():
+            buffered_doc = self.memory_stream[buffer_idx]
+            buffered_doc.metadata["last_accessed_at"] = current_time
+            result.append(buffered_doc)
+        self._record_access(selected.tolist())
+        return result
+
+    def _get_rescored_docs_python(
+        self,
+        docs_and_scores: dict[Any, tuple[Document, float | None]],
     ) -> list[Document]:
         current_time = datetime.datetime.now()
         rescored_docs = [
@@ -125,12 +286,58 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         result = []
         # Ensure frequently accessed memories aren't forgotten
         for doc, _ in rescored_docs[: self.k]:
-            # TODO: Update vector store doc once `update` method is exposed.
             buffered_doc = self.memory_stream[doc.metadata["buffer_idx"]]
             buffered_doc.metadata["last_accessed_at"] = current_time
             result.append(buffered_doc)
+        self._record_access([doc.metadata["buffer_idx"] for doc in result])
         return result
 
+    def _record_access(self, buffer_idxs: list[int]) -> None:
+        self._pending_access.update(buffer_idxs)
+        if (
+            self.access_flush_size is not None
+            and len(self._pending_access) >= self.access_flush_size
+        ):
+            self.flush_access_times()
+
+    def _pending_updates(self) -> tuple[list[Document], list[str]]:
+        pending, self._pending_access = self._pending_access, set()
+        ids = self._columns.ids if self._columns is not None else []
+        docs: list[Document] = []
+        doc_ids: list[str] = []
+        for buffer_idx in sorted(pending):
+            doc_id = ids[buffer_idx] if buffer_idx < len(ids) else None
+            if doc_id is not None:
+                docs.append(self.memory_stream[buffer_idx])
+                doc_ids.append(doc_id)
+        return docs, doc_ids
+
+    def flush_access_times(self) -> list[str]:
+        """Write pending `last_accessed_at` updates back to the vectorstore.
+
+        Accessed memories are upserted in one `add_documents` call under the ids
+        the vectorstore assigned when they were added. Memories that were not added
+        through this retriever have no known id and are skipped.
+
+        Returns:
+            The ids of the upserted documents.
+        """
+        docs, ids = self._pending_updates()
+        if not docs:
+            return []
+        return self.vectorstore.add_documents(docs, ids=ids)
+
+    async def aflush_access_times(self) -> list[str]:
+        """Write pending `last_accessed_at` updates back to the vectorstore.
+
+        Returns:
+            The ids of the upserted documents.
+        """
+        docs, ids = self._pending_updates()
+        if not docs:
+            return []
+        return await self.vectorstore.aadd_documents(docs, ids=ids)
+
     @override
     def _get_relevant_documents(
         self,
@@ -161,21 +368,63 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         docs_and_scores.update(await self.aget_salient_docs(query))
         return self._get_rescored_docs(docs_and_scores)
 
-    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
-        """Add documents to vectorstore."""
-        current_time = kwargs.get("current_time")
+    def _prepare_documents(
+        self, documents: list[Document], current_time: datetime.datetime | None
+    ) -> list[Document]:
         if current_time is None:
             current_time = datetime.datetime.now()
         # Avoid mutating input documents
-        dup_docs = [deepcopy(d) for d in documents]
+        dup_docs = [_copy_document(d) for d in documents]
         for i, doc in enumerate(dup_docs):
             if "last_accessed_at" not in doc.metadata:
                 doc.metadata["last_accessed_at"] = current_time
             if "created_at" not in doc.metadata:
                 doc.metadata["created_at"] = current_time
             doc.metadata["buffer_idx"] = len(self.memory_stream) + i
+        return dup_docs
+
+    def _reserve_memories(self, dup_docs: list[Document]) -> int:
+        """Append `dup_docs` to the memory stream; return the first index used.
+
+        This happens before the vectorstore call so that concurrent adds get
+        distinct `buffer_idx` values.
+        """
+        start = len(self.memory_stream)
         self.memory_stream.extend(dup_docs)
-        return self.vectorstore.add_documents(dup_docs, **kwargs)
+        if _check_numpy():
+            self._get_columns()
+        return start
+
+    def _set_memory_ids(self, start: int, ids: list[str]) -> None:
+        columns = self._columns
+        end = start + len(ids)
+        if columns is not None and columns.size >= end:
+            columns.ids[start:end] = ids
+
+    def _release_memories(self, start: int, n: int) -> None:
+        """Undo `_reserve_memories` after the vectorstore call failed."""
+        # Memories reserved since by other calls keep their `buffer_idx`, so
+        # ours can only be removed while they are still at the end.
+        if len(self.memory_stream) != start + n:
+            return
+        del self.memory_stream[start:]
+        columns = self._columns
+        if columns is not None and columns.size > start:
+            columns.size = start
+            del columns.ids[start:]
+
+    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
+        """Add documents to vectorstore."""
+        dup_docs = self._prepare_documents(documents, kwargs.get("current_time"))
+        start = self._reserve_memories(dup_docs)
+        try:
+            ids = self.vectorstore.add_documents(dup_docs, **kwargs)
+        except BaseException:
+            self._release_memories(start, len(dup_docs))
+            raise
+        if len(ids) == len(dup_docs):
+            self._set_memory_ids(start, ids)
+        return ids
 
     async def aadd_documents(
         self,
@@ -183,16 +432,13 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         **kwargs: Any,
     ) -> list[str]:
         """Add documents to vectorstore."""
-        current_time = kwargs.get("current_time")
-        if current_time is None:
-            current_time = datetime.datetime.now()
-        # Avoid mutating input documents
-        dup_docs = [deepcopy(d) for d in documents]
-        for i, doc in enumerate(dup_docs):
-            if "last_accessed_at" not in doc.metadata:
-                doc.metadata["last_accessed_at"] = current_time
-            if "created_at" not in doc.metadata:
-                doc.metadata["created_at"] = current_time
-            doc.metadata["buffer_idx"] = len(self.memory_stream) + i
-        self.memory_stream.extend(dup_docs)
-        return await self.vectorstore.aadd_documents(dup_docs, **kwargs)
+        dup_docs = self._prepare_documents(documents, kwargs.get("current_time"))
+        start = self._reserve_memories(dup_docs)
+        try:
+            ids = await self.vectorstore.aadd_documents(dup_docs, **kwargs)
+        except BaseException:
+            self._release_memories(start, len(dup_docs))
+            raise
+        if len(ids) == len(dup_docs):
+            self._set_memory_ids(start, ids)
+        return ids
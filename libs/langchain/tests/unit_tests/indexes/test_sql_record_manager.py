@@ -0,0 +1,63 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from langchain_classic.indexes._sql_record_manager import (
+    _MAX_IN_PARAMS,
+    SQLRecordManager,
+)
+
+
+def test_bulk_batches_exceed_parameter_limit() -> None:
+    manager = SQLRecordManager("kittens", db_url="sqlite:///:memory:")
+    manager.create_schema()
+    n = 3 * _MAX_IN_PARAMS + 7
+    keys = [f"key{i}" for i in range(n)]
+    groups = [f"group{i}" for i in range(n)]
+    manager.update(keys, group_ids=groups)
+
+    assert manager.exists([*keys, "missing"]) == [True] * n + [False]
+    assert sorted(manager.list_keys(group_ids=groups)) == sorted(keys)
+    assert len(manager.list_keys(group_ids=groups, limit=_MAX_IN_PARAMS + 3)) == (
+        _MAX_IN_PARAMS + 3
+    )
+
+    manager.delete_keys(keys[1:])
+    assert manager.list_keys() == ["key0"]
+
+
+def test_list_keys_filters() -> None:
+    manager = SQLRecordManager("kittens", db_url="sqlite:///:memory:")
+    manager.create_schema()
+    with patch.object(manager, "get_time", return_value=10.0):
+        manager.update(["a", "b"], group_ids=["g1", "g2"])
+    with patch.object(manager, "get_time", return_value=20.0):
+        manager.update(["c"], group_ids=["g1"])
+
+    assert sorted(manager.list_keys(group_ids=["g1"])) == ["a", "c"]
+    assert manager.list_keys(group_ids=["g1"], before=15.0) == ["a"]
+    assert manager.list_keys(after=15.0) == ["c"]
+
+
+def test_bulk_mode_uses_wal(tmp_path: Path) -> None:
+    manager = SQLRecordManager(
+        "kittens", db_url=f"sqlite:///{tmp_path / 'records.db'}", bulk_mode=True
+    )
+    manager.create_schema()
+    manager.update(["a"])
+    with manager.engine.connect() as connection:  # type: ignore[union-attr]
+        mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert mode == "wal"
+    assert manager.exists(["a"]) == [True]
+
+
+def test_source_fingerprints() -> None:
+    manager = SQLRecordManager("kittens", db_url="sqlite:///:memory:")
+    manager.create_schema()
+    other = SQLRecordManager("puppies", engine=manager.engine)
+    assert manager.get_source_fingerprints(["a"]) == {}
+
+    manager.update_source_fingerprints({"a": "1", "b": "2"})
+    manager.update_source_fingerprints({"a": "3"})
+    other.update_source_fingerprints({"a": "4"})
+    assert manager.get_source_fingerprints(["a", "b", "c"]) == {"a": "3", "b": "2"}
+    assert other.get_source_fingerprints(["a", "b"]) == {"a": "4"}
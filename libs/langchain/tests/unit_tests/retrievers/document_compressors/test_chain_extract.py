@@ -86,3 +86,68 @@ async def test_llm_chain_extractor_async() -> None:
         ),
     ]
     assert output == expected
+
+
+def test_llm_chain_extractor_packed() -> None:
+    documents = [
+        Document(page_content="The sky is blue.", metadata={"a": 1}),
+        Document(
+            page_content="Candlepin bowling balls are smaller.", metadata={"b": 2}
+        ),
+        Document(page_content="The moon is round.", metadata={"c": 3}),
+        Document(
+            page_content="Candlepin bowling is popular in New England. " * 3,
+            metadata={"d": 4},
+        ),
+    ]
+    llm = FakeListChatModel(
+        responses=[
+            '{"1": "NO_OUTPUT", "2": "Candlepin bowling balls are smaller.", '
+            '"3": "NO_OUTPUT"}',
+            "Candlepin bowling is popular in New England.",
+        ],
+    )
+    doc_compressor = LLMChainExtractor.from_llm(
+        llm, pack_size=3, pack_max_chars=50, max_concurrency=1
+    )
+    output = doc_compressor.compress_documents(
+        documents,
+        "Tell me about Candlepin bowling.",
+    )
+    assert output == [
+        Document(
+            page_content="Candlepin bowling balls are smaller.",
+            metadata={"b": 2},
+        ),
+        Document(
+            page_content="Candlepin bowling is popular in New England.",
+            metadata={"d": 4},
+        ),
+    ]
+
+
+async def test_llm_chain_extractor_packed_fallback_async() -> None:
+    documents = [
+        Document(page_content="The sky is blue.", metadata={"a": 1}),
+        Document(
+            page_content="Candlepin bowling balls are smaller.", metadata={"b": 2}
+        ),
+    ]
+    llm = FakeListChatModel(
+        responses=[
+            "not json",
+            "NO_OUTPUT",
+            "Candlepin bowling balls are smaller.",
+        ],
+    )
+    doc_compressor = LLMChainExtractor.from_llm(llm, pack_size=2, max_concurrency=1)
+    output = await doc_compressor.acompress_documents(
+        documents,
+        "Tell me about Candlepin bowling.",
+    )
+    assert output == [
+        Document(
+            page_content="Candlepin bowling balls are smaller.",
+            metadata={"b": 2},
+        ),
+    ]
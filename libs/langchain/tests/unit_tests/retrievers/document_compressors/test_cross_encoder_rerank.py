@@ -0,0 +1,87 @@
+from collections.abc import Sequence
+
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor, Document
+from typing_extensions import override
+
+from langchain_classic.retrievers.document_compressors import CrossEncoderReranker
+from langchain_classic.retrievers.document_compressors.cross_encoder import (
+    BaseCrossEncoder,
+)
+
+
+class FakeCrossEncoder(BaseCrossEncoder):
+    """Scores a pair by the length of the document text."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def score(self, text_pairs: list[tuple[str, str]]) -> list[float]:
+        self.calls.append(len(text_pairs))
+        return [float(len(doc)) for _, doc in text_pairs]
+
+
+class KeepShortest(BaseDocumentCompressor):
+    """Prefilter that keeps the `k` shortest documents."""
+
+    k: int
+
+    @override
+    def compress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        return sorted(documents, key=lambda d: len(d.page_content))[: self.k]
+
+
+def _docs(n: int) -> list[Document]:
+    return [Document(page_content="x" * (i + 1), id=str(i)) for i in range(n)]
+
+
+def test_cross_encoder_reranker_top_n() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=3)
+    output = reranker.compress_documents(_docs(10), "q")
+    assert [doc.id for doc in output] == ["9", "8", "7"]
+    assert model.calls == [10]
+
+
+def test_cross_encoder_reranker_batches() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=2, batch_size=4)
+    output = reranker.compress_documents(_docs(10), "q")
+    assert [doc.id for doc in output] == ["9", "8"]
+    assert model.calls == [4, 4, 2]
+
+
+def test_cross_encoder_reranker_cache() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=2, cache_size=8)
+    docs = _docs(6)
+    reranker.compress_documents(docs, "q")
+    reranker.compress_documents(docs, "q")
+    assert model.calls == [6]
+    reranker.compress_documents(_docs(8), "q")
+    assert model.calls == [6, 2]
+    reranker.compress_documents(docs, "other")
+    assert model.calls == [6, 2, 6]
+
+
+def test_cross_encoder_reranker_prefilter() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=2, prefilter=KeepShortest(k=5))
+    output = reranker.compress_documents(_docs(20), "q")
+    assert [doc.id for doc in output] == ["4", "3"]
+    assert model.calls == [5]
+
+
+async def test_cross_encoder_reranker_async() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(
+        model=model, top_n=2, prefilter=KeepShortest(k=5), batch_size=2
+    )
+    output = await reranker.acompress_documents(_docs(20), "q")
+    assert [doc.id for doc in output] == ["4", "3"]
+    assert model.calls == [2, 2, 1]
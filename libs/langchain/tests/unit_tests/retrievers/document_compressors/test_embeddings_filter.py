@@ -0,0 +1,90 @@
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+from typing_extensions import override
+
+from langchain_classic.retrievers.document_compressors import EmbeddingsFilter
+
+pytest.importorskip("numpy")
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    embedded: list[str] = []
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+def _documents() -> list[Document]:
+    return [
+        Document(page_content=text, id=str(i))
+        for i, text in enumerate(["foo", "bar", "baz", "qux"])
+    ]
+
+
+def test_embeddings_filter_embeds_documents() -> None:
+    embeddings = CountingEmbedding(size=8, embedded=[])
+    doc_filter = EmbeddingsFilter(embeddings=embeddings, k=2)
+    output = doc_filter.compress_documents(_documents(), "foo")
+    assert len(output) == 2
+    assert output[0].page_content == "foo"
+    assert output[0].state["query_similarity_score"] == pytest.approx(1.0)
+    assert embeddings.embedded == ["foo", "bar", "baz", "qux"]
+
+
+def test_embeddings_filter_reuses_vectorstore_vectors() -> None:
+    embeddings = CountingEmbedding(size=8, embedded=[])
+    vectorstore = InMemoryVectorStore(embedding=embeddings)
+    vectorstore.add_documents(_documents()[:3])
+    embeddings.embedded.clear()
+
+    doc_filter = EmbeddingsFilter(
+        embeddings=embeddings,
+        k=None,
+        similarity_threshold=0.99,
+        vectorstore=vectorstore,
+    )
+    output = doc_filter.compress_documents(_documents(), "qux")
+    assert [doc.page_content for doc in output] == ["qux"]
+    assert embeddings.embedded == ["qux"]
+
+
+def test_embeddings_filter_cache() -> None:
+    embeddings = CountingEmbedding(size=8, embedded=[])
+    doc_filter = EmbeddingsFilter(embeddings=embeddings, k=2, cache_size=3)
+    doc_filter.compress_documents(_documents(), "foo")
+    doc_filter.compress_documents(_documents(), "bar")
+    assert embeddings.embedded == ["foo", "bar", "baz", "qux", "foo"]
+
+
+def test_embeddings_filter_reuses_state_vectors() -> None:
+    embeddings = CountingEmbedding(size=8, embedded=[])
+    doc_filter = EmbeddingsFilter(embeddings=embeddings, k=4)
+    first = doc_filter.compress_documents(_documents(), "foo")
+    embeddings.embedded.clear()
+    second = doc_filter.compress_documents(first, "bar")
+    assert embeddings.embedded == []
+    assert second[0].page_content == "bar"
+
+
+def test_embeddings_filter_requires_vector_lookup() -> None:
+    with pytest.raises(ValueError, match="get_vectors_by_ids"):
+        EmbeddingsFilter(
+            embeddings=DeterministicFakeEmbedding(size=8),
+            vectorstore=object(),  # type: ignore[arg-type]
+        )
+
+
+async def test_embeddings_filter_async() -> None:
+    embeddings = CountingEmbedding(size=8, embedded=[])
+    vectorstore = InMemoryVectorStore(embedding=embeddings)
+    await vectorstore.aadd_documents(_documents())
+    embeddings.embedded.clear()
+
+    doc_filter = EmbeddingsFilter(embeddings=embeddings, k=1, vectorstore=vectorstore)
+    output = await doc_filter.acompress_documents(_documents(), "baz")
+    assert [doc.page_content for doc in output] == ["baz"]
+    assert embeddings.embedded == []
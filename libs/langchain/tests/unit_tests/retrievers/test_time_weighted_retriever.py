@@ -1,5 +1,6 @@
 """Tests for the time-weighted retriever class."""
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import Any
@@ -201,3 +202,126 @@ async def test_aadd_documents(
         time_weighted_retriever.memory_stream[-1].page_content
         == documents[0].page_content
     )
+
+
+async def test_concurrent_aadd_documents_get_distinct_buffer_idx() -> None:
+    class SlowVectorStore(MockVectorStore):
+        @override
+        async def aadd_documents(
+            self, documents: list[Document], **kwargs: Any
+        ) -> list[str]:
+            await asyncio.sleep(0)
+            return [doc.page_content for doc in documents]
+
+    retriever = TimeWeightedVectorStoreRetriever(vectorstore=SlowVectorStore())
+    await asyncio.gather(
+        retriever.aadd_documents([Document(page_content="a")]),
+        retriever.aadd_documents([Document(page_content="b")]),
+    )
+    assert [
+        (doc.page_content, doc.metadata["buffer_idx"])
+        for doc in retriever.memory_stream
+    ] == [("a", 0), ("b", 1)]
+
+
+def test_failed_add_documents_is_rolled_back(
+    time_weighted_retriever: TimeWeightedVectorStoreRetriever,
+) -> None:
+    class FailingVectorStore(MockVectorStore):
+        @override
+        def add_texts(
+            self,
+            texts: Iterable[str],
+            metadatas: list[dict] | None = None,
+            **kwargs: Any,
+        ) -> list[str]:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+    time_weighted_retriever.vectorstore = FailingVectorStore()
+    with pytest.raises(RuntimeError, match="boom"):
+        time_weighted_retriever.add_documents([Document(page_content="a")])
+    assert len(time_weighted_retriever.memory_stream) == 4
+
+    time_weighted_retriever.vectorstore = MockVectorStore()
+    time_weighted_retriever.add_documents([Document(page_content="b")])
+    assert time_weighted_retriever.memory_stream[-1].metadata["buffer_idx"] == 4
+
+
+def test_rescored_docs_match_python_scoring() -> None:
+    now = datetime.now()
+    memories = [
+        Document(
+            page_content=str(i),
+            metadata={
+                "buffer_idx": i,
+                "last_accessed_at": now - timedelta(hours=i * 7 % 13),
+                "importance": (i % 5) / 10,
+            },
+        )
+        for i in range(50)
+    ]
+    retriever = TimeWeightedVectorStoreRetriever(
+        vectorstore=MockVectorStore(),
+        memory_stream=memories,
+        other_score_keys=["importance"],
+        decay_rate=0.1,
+        k=5,
+    )
+    docs_and_scores = {
+        doc.metadata["buffer_idx"]: (doc, (i % 3) / 10 if i % 4 else None)
+        for i, doc in enumerate(memories)
+    }
+    expected = sorted(
+        memories,
+        key=lambda doc: retriever._get_combined_score(
+            doc, docs_and_scores[doc.metadata["buffer_idx"]][1], now
+        ),
+        reverse=True,
+    )[:5]
+    result = retriever._get_rescored_docs(docs_and_scores)
+    assert [doc.page_content for doc in result] == [
+        doc.page_content for doc in expected
+    ]
+
+
+def test_flush_access_times() -> None:
+    class RecordingVectorStore(MockVectorStore):
+        upserts: list[list[str]] = []
+
+        @override
+        def add_texts(
+            self,
+            texts: Iterable[str],
+            metadatas: list[dict] | None = None,
+            **kwargs: Any,
+        ) -> list[str]:
+            if "ids" in kwargs:
+                self.upserts.append(kwargs["ids"])
+                return kwargs["ids"]
+            return [f"id-{text}" for text in texts]
+
+        @override
+        def _similarity_search_with_relevance_scores(
+            self,
+            query: str,
+            k: int = 4,
+            **kwargs: Any,
+        ) -> list[tuple[Document, float]]:
+            return []
+
+    vectorstore = RecordingVectorStore()
+    retriever = TimeWeightedVectorStoreRetriever(
+        vectorstore=vectorstore, k=2, access_flush_size=2
+    )
+    old = datetime(2023, 4, 14, 12, 0)
+    documents = [
+        Document(page_content=str(i), metadata={"last_accessed_at": old})
+        for i in range(3)
+    ]
+    assert retriever.add_documents(documents) == ["id-0", "id-1", "id-2"]
+    assert "buffer_idx" not in documents[0].metadata
+
+    retriever.invoke("query")
+    assert vectorstore.upserts == [["id-1", "id-2"]]
+    assert retriever.flush_access_times() == []
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import base64
 import logging
+import time
 import uuid
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -23,7 +25,12 @@ from chromadb.api import CreateCollectionConfiguration
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.utils import xor_args
-from langchain_core.vectorstores import VectorStore
+from langchain_core.utils.iter import batch_iterate, bounded_map
+from langchain_core.vectorstores import IngestProgress, VectorStore, ingest_progress
+from langchain_core.vectorstores.utils import (
+    batch_maximal_marginal_relevance,
+    maximal_marginal_relevance,
+)
 
 if TYPE_CHECKING:
     from chromadb.api.types import Where, WhereDocument
@@ -32,35 +39,40 @@ logger = logging.getLogger()
 DEFAULT_K = 4  # Number of Documents to return.
 
 
-def _results_to_docs(results: Any) -> list[Document]:
-    return [doc for doc, _ in _results_to_docs_and_scores(results)]
+def _results_to_docs(results: Any, query_index: int = 0) -> list[Document]:
+    return [doc for doc, _ in _results_to_docs_and_scores(results, query_index)]
 
 
-def _results_to_docs_and_scores(results: Any) -> list[tuple[Document, float]]:
+def _results_to_docs_and_scores(
+    results: Any, query_index: int = 0
+) -> list[tuple[Document, float]]:
     return [
-        # TODO: Chroma can do batch querying,
-        # we shouldn't hard code to the 1st result
         (
             Document(page_content=result[0], metadata=result[1] or {}, id=result[2]),
             result[3],
         )
         for result in zip(
-            results["documents"][0],
-            results["metadatas"][0],
-            results["ids"][0],
-            results["distances"][0],
+            results["documents"][query_index],
+            results["metadatas"][query_index],
+            results["ids"][query_index],
+            results["distances"][query_index],
             strict=False,
         )
     ]
 
 
-def _results_to_docs_and_vectors(results: Any) -> list[tuple[Document, np.ndarray]]:
+def _results_to_docs_and_vectors(
+    results: Any, query_index: int = 0
+) -> list[tuple[Document, np.ndarray]]:
+    # Chroma returns each query's embeddings as one 2-D array, so the rows below
+    # are views into it rather than copies.
+    vectors = np.asarray(results["embeddings"][query_index])
     return [
         (Document(page_content=result[0], metadata=result[1] or {}), result[2])
         for result in zip(
-            results["documents"][0],
-            results["metadatas"][0],
-            results["embeddings"][0],
+            results["documents"][query_index],
+            results["metadatas"][query_index],
+            vectors,
             strict=False,
         )
     ]
@@ -99,53 +111,6 @@ def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:  # type: ignore[valid
     return similarity
 
 
-def maximal_marginal_relevance(
-    query_embedding: np.ndarray,
-    embedding_list: list,
-    lambda_mult: float = 0.5,
-    k: int = 4,
-) -> list[int]:
-    """Calculate maximal marginal relevance.
-
-    Args:
-        query_embedding: Query embedding.
-        embedding_list: List of embeddings to select from.
-        lambda_mult: Number between 0 and 1 that determines the degree
-                of diversity among the results with 0 corresponding
-                to maximum diversity and 1 to minimum diversity.
-                Defaults to 0.5.
-        k: Number of Documents to return. Defaults to 4.
-
-    Returns:
-        List of indices of embeddings selected by maximal marginal relevance.
-    """
-    if min(k, len(embedding_list)) <= 0:
-        return []
-    if query_embedding.ndim == 1:
-        query_embedding = np.expand_dims(query_embedding, axis=0)
-    similarity_to_query = cosine_similarity(query_embedding, embedding_list)[0]
-    most_similar = int(np.argmax(similarity_to_query))
-    idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
-                continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
-            )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
-        idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
-    return idxs
-
-
 class Chroma(VectorStore):
     """Chroma vector store integration.
 
@@ -593,15 +558,33 @@ class Chroma(VectorStore):
         texts: Iterable[str],
         metadatas: list[dict] | None = None,
         ids: list[str] | None = None,
+        *,
+        batch_size: int | None = None,
+        max_in_flight: int = 2,
+        progress_callback: Callable[[IngestProgress], None] | None = None,
         **kwargs: Any,
     ) -> list[str]:
         """Run more texts through the embeddings and add to the vectorstore.
 
+        By default all texts are embedded with a single call and then upserted.
+        When `batch_size` is set, the input is streamed instead: texts (and
+        `metadatas`/`ids`, which may then be any iterables) are read lazily in
+        batches, up to `max_in_flight` batches are embedded concurrently in
+        worker threads, and each batch is upserted as soon as its embeddings are
+        ready, overlapping with the embedding of the following batches. At most
+        `max_in_flight` batches of vectors are held in memory at a time.
+
         Args:
             texts: Texts to add to the vectorstore.
             metadatas: Optional list of metadatas.
                     When querying, you can filter on this metadata.
             ids: Optional list of IDs. (Items without IDs will be assigned UUIDs)
+            batch_size: Number of texts per embedding call and upsert in
+                streaming mode. If `None`, texts are added in one batch.
+            max_in_flight: Maximum number of batches being embedded while the
+                current one is upserted. Only used when `batch_size` is set.
+            progress_callback: Called with an `IngestProgress` after each
+                upserted batch. Only used when `batch_size` is set.
             kwargs: Additional keyword arguments.
 
         Returns:
@@ -610,6 +593,15 @@ class Chroma(VectorStore):
         Raises:
             ValueError: When metadata is incorrect.
         """
+        if batch_size is not None:
+            return self._stream_add_texts(
+                texts,
+                metadatas,
+                ids,
+                batch_size=batch_size,
+                max_in_flight=max_in_flight,
+                progress_callback=progress_callback,
+            )
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in texts]
         else:
@@ -618,62 +610,130 @@ class Chroma(VectorStore):
         embeddings = None
         texts = list(texts)
         if self._embedding_function is not None:
-            embeddings = self._embedding_function.embed_documents(texts)
-        if metadatas:
-            # fill metadatas with empty dicts if somebody
-            # did not specify metadata for all texts
-            length_diff = len(texts) - len(metadatas)
-            if length_diff:
-                metadatas = metadatas + [{}] * length_diff
-            empty_ids = []
-            non_empty_ids = []
-            for idx, m in enumerate(metadatas):
-                if m:
-                    non_empty_ids.append(idx)
-                else:
-                    empty_ids.append(idx)
-            if non_empty_ids:
-                metadatas = [metadatas[idx] for idx in non_empty_ids]
-                texts_with_metadatas = [texts[idx] for idx in non_empty_ids]
-                embeddings_with_metadatas = (
-                    [embeddings[idx] for idx in non_empty_ids]
-                    if embeddings is not None and len(embeddings) > 0
-                    else None
+            embeddings = self._embedding_function.embed_documents_array(texts)
+        self._upsert_texts(texts, embeddings, metadatas, ids)
+        return ids
+
+    def _stream_add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Iterable[dict] | None,
+        ids: Iterable[str | None] | None,
+        *,
+        batch_size: int,
+        max_in_flight: int,
+        progress_callback: Callable[[IngestProgress], None] | None,
+    ) -> list[str]:
+        metadata_iter = iter(metadatas) if metadatas is not None else None
+        ids_iter = iter(ids) if ids is not None else None
+
+        def read_batches() -> Iterator[tuple[list[str], list[dict], list[str]]]:
+            for batch_texts in batch_iterate(batch_size, texts):
+                batch_metadatas = (
+                    list(islice(metadata_iter, len(batch_texts)))
+                    if metadata_iter is not None
+                    else []
                 )
-                ids_with_metadata = [ids[idx] for idx in non_empty_ids]
-                try:
-                    self._collection.upsert(
-                        metadatas=metadatas,  # type: ignore[arg-type]
-                        embeddings=embeddings_with_metadatas,  # type: ignore[arg-type]
-                        documents=texts_with_metadatas,
-                        ids=ids_with_metadata,
-                    )
-                except ValueError as e:
-                    if "Expected metadata value to be" in str(e):
-                        msg = (
-                            "Try filtering complex metadata from the document using "
-                            "langchain_community.vectorstores.utils.filter_complex_metadata."
-                        )
-                        raise ValueError(e.args[0] + "\n\n" + msg) from e
-                    raise e
-            if empty_ids:
-                texts_without_metadatas = [texts[j] for j in empty_ids]
-                embeddings_without_metadatas = (
-                    [embeddings[j] for j in empty_ids] if embeddings else None
+                batch_ids = (
+                    list(islice(ids_iter, len(batch_texts)))
+                    if ids_iter is not None
+                    else []
                 )
-                ids_without_metadatas = [ids[j] for j in empty_ids]
-                self._collection.upsert(
-                    embeddings=embeddings_without_metadatas,  # type: ignore[arg-type]
-                    documents=texts_without_metadatas,
-                    ids=ids_without_metadatas,
+                batch_ids += [None] * (len(batch_texts) - len(batch_ids))
+                yield (
+                    batch_texts,
+                    batch_metadatas,
+                    [
+                        id_ if id_ is not None else str(uuid.uuid4())
+                        for id_ in batch_ids
+                    ],
                 )
-        else:
+
+        def embed(
+            batch: tuple[list[str], list[dict], list[str]],
+        ) -> tuple[list[str], list[dict], list[str], np.ndarray | None]:
+            batch_texts, batch_metadatas, batch_ids = batch
+            embeddings = (
+                self._embedding_function.embed_documents_array(batch_texts)
+                if self._embedding_function is not None
+                else None
+            )
+            return batch_texts, batch_metadatas, batch_ids, embeddings
+
+        added: list[str] = []
+        start = time.perf_counter()
+        for batches, (batch_texts, batch_metadatas, batch_ids, embeddings) in enumerate(
+            bounded_map(embed, read_batches(), max_in_flight=max_in_flight), start=1
+        ):
+            self._upsert_texts(batch_texts, embeddings, batch_metadatas, batch_ids)
+            added.extend(batch_ids)
+            if progress_callback is not None:
+                progress_callback(ingest_progress(batches, len(added), start))
+        return added
+
+    def _upsert_texts(
+        self,
+        texts: list[str],
+        embeddings: np.ndarray | None,
+        metadatas: list[dict] | None,
+        ids: list[str],
+    ) -> None:
+        if not metadatas:
             self._collection.upsert(
                 embeddings=embeddings,  # type: ignore[arg-type]
                 documents=texts,
                 ids=ids,
             )
-        return ids
+            return
+        # fill metadatas with empty dicts if somebody
+        # did not specify metadata for all texts
+        length_diff = len(texts) - len(metadatas)
+        if length_diff:
+            metadatas = metadatas + [{}] * length_diff
+        empty_ids = []
+        non_empty_ids = []
+        for idx, m in enumerate(metadatas):
+            if m:
+                non_empty_ids.append(idx)
+            else:
+                empty_ids.append(idx)
+        if non_empty_ids:
+            metadatas = [metadatas[idx] for idx in non_empty_ids]
+            texts_with_metadatas = [texts[idx] for idx in non_empty_ids]
+            embeddings_with_metadatas = (
+                embeddings[non_empty_ids]
+                if embeddings is not None and len(embeddings) > 0
+                else None
+            )
+            ids_with_metadata = [ids[idx] for idx in non_empty_ids]
+            try:
+                self._collection.upsert(
+                    metadatas=metadatas,  # type: ignore[arg-type]
+                    embeddings=embeddings_with_metadatas,  # type: ignore[arg-type]
+                    documents=texts_with_metadatas,
+                    ids=ids_with_metadata,
+                )
+            except ValueError as e:
+                if "Expected metadata value to be" in str(e):
+                    msg = (
+                        "Try filtering complex metadata from the document using "
+                        "langchain_community.vectorstores.utils.filter_complex_metadata."
+                    )
+                    raise ValueError(e.args[0] + "\n\n" + msg) from e
+                raise e
+        if empty_ids:
+            texts_without_metadatas = [texts[j] for j in empty_ids]
+            embeddings_without_metadatas = (
+                embeddings[empty_ids]
+                if embeddings is not None and len(embeddings) > 0
+                else None
+            )
+            ids_without_metadatas = [ids[j] for j in empty_ids]
+            self._collection.upsert(
+                embeddings=embeddings_without_metadatas,  # type: ignore[arg-type]
+                documents=texts_without_metadatas,
+                ids=ids_without_metadatas,
+            )
 
     def similarity_search(
         self,
@@ -849,6 +909,196 @@ class Chroma(VectorStore):
 
         return _results_to_docs_and_vectors(results)
 
+    def _query_by_texts(
+        self,
+        queries: Sequence[str],
+        n_results: int,
+        where: dict[str, str] | None = None,
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> chromadb.QueryResult:
+        """Query the collection once for all `queries`, embedding them if needed."""
+        if self._embedding_function is None:
+            return self.__query_collection(  # type: ignore[return-value]
+                query_texts=list(queries),
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+                **kwargs,
+            )
+        query_embeddings = [
+            self._embedding_function.embed_query(query) for query in queries
+        ]
+        return self.__query_collection(  # type: ignore[return-value]
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=where,
+            where_document=where_document,
+            **kwargs,
+        )
+
+    def batch_similarity_search(
+        self,
+        queries: Sequence[str],
+        k: int = DEFAULT_K,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Run similarity search for several queries in one Chroma query.
+
+        Args:
+            queries: Query texts to search for.
+            k: Number of results to return per query. Defaults to 4.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each query, the list of documents most similar to it.
+        """
+        return [
+            [doc for doc, _ in docs_and_scores]
+            for docs_and_scores in self.batch_similarity_search_with_score(
+                queries, k, filter=filter, where_document=where_document, **kwargs
+            )
+        ]
+
+    def batch_similarity_search_with_score(
+        self,
+        queries: Sequence[str],
+        k: int = DEFAULT_K,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[tuple[Document, float]]]:
+        """Run similarity search with distance for several queries in one query.
+
+        Args:
+            queries: Query texts to search for.
+            k: Number of results to return per query. Defaults to 4.
+            filter: Filter by metadata.
+            where_document: dict used to filter by document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each query, the list of documents most similar to it and the
+            distance in float for each. Lower score represents more similarity.
+        """
+        if not queries:
+            return []
+        results = self._query_by_texts(
+            queries, k, where=filter, where_document=where_document, **kwargs
+        )
+        return [_results_to_docs_and_scores(results, i) for i in range(len(queries))]
+
+    def batch_similarity_search_by_vector(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = DEFAULT_K,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return docs most similar to each of several embedding vectors.
+
+        All embeddings are sent in a single Chroma query.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of Documents to return per embedding. Defaults to 4.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each embedding, the list of Documents most similar to it.
+        """
+        return [
+            [doc for doc, _ in docs_and_scores]
+            for docs_and_scores in (
+                self.batch_similarity_search_by_vector_with_relevance_scores(
+                    embeddings,
+                    k,
+                    filter=filter,
+                    where_document=where_document,
+                    **kwargs,
+                )
+            )
+        ]
+
+    def batch_similarity_search_by_vector_with_relevance_scores(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = DEFAULT_K,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[tuple[Document, float]]]:
+        """Return docs and scores most similar to each of several embedding vectors.
+
+        All embeddings are sent in a single Chroma query.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of Documents to return per embedding. Defaults to 4.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the documents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each embedding, the list of documents most similar to it and the
+            distance in float for each. Lower score represents more similarity.
+        """
+        if not embeddings:
+            return []
+        results = self.__query_collection(
+            query_embeddings=list(embeddings),
+            n_results=k,
+            where=filter,
+            where_document=where_document,
+            **kwargs,
+        )
+        return [_results_to_docs_and_scores(results, i) for i in range(len(embeddings))]
+
+    def batch_similarity_search_with_vectors(
+        self,
+        queries: Sequence[str],
+        k: int = DEFAULT_K,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[tuple[Document, np.ndarray]]]:
+        """Run similarity search with vectors for several queries in one query.
+
+        Args:
+            queries: Query texts to search for.
+            k: Number of results to return per query. Defaults to 4.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each query, the list of documents most similar to it and their
+            embedding vectors as rows of a NumPy array.
+        """
+        if not queries:
+            return []
+        results = self._query_by_texts(
+            queries,
+            k,
+            where=filter,
+            where_document=where_document,
+            include=["documents", "metadatas", "embeddings"],
+            **kwargs,
+        )
+        return [_results_to_docs_and_vectors(results, i) for i in range(len(queries))]
+
     def _select_relevance_score_fn(self) -> Callable[[float], float]:
         """Select the relevance score function based on collections distance metric.
 
@@ -1020,7 +1270,7 @@ class Chroma(VectorStore):
 
         candidates = _results_to_docs(results)
 
-        return [r for i, r in enumerate(candidates) if i in mmr_selected]
+        return [candidates[i] for i in mmr_selected]
 
     def max_marginal_relevance_search(
         self,
@@ -1072,6 +1322,108 @@ class Chroma(VectorStore):
             where_document=where_document,
         )
 
+    def batch_max_marginal_relevance_search_by_vector(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = DEFAULT_K,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return docs selected by maximal marginal relevance for several embeddings.
+
+        Candidates for all embeddings are fetched in a single Chroma query and
+        reranked together with a batched MMR pass.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of Documents to return per embedding. Defaults to 4.
+            fetch_k: Number of Documents to fetch per embedding to pass to MMR
+                algorithm. Defaults to 20.
+            lambda_mult: Number between 0 and 1 that determines the degree
+                of diversity among the results with 0 corresponding
+                to maximum diversity and 1 to minimum diversity.
+                Defaults to 0.5.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each embedding, the Documents selected by maximal marginal relevance.
+        """
+        if not embeddings:
+            return []
+        results = self.__query_collection(
+            query_embeddings=list(embeddings),
+            n_results=fetch_k,
+            where=filter,
+            where_document=where_document,
+            include=["metadatas", "documents", "distances", "embeddings"],
+            **kwargs,
+        )
+        mmr_selected = batch_maximal_marginal_relevance(
+            np.asarray(embeddings, dtype=np.float32),
+            [np.asarray(vectors) for vectors in results["embeddings"]],  # type: ignore[union-attr]
+            k=k,
+            lambda_mult=lambda_mult,
+        )
+        output = []
+        for i, selected in enumerate(mmr_selected):
+            candidates = _results_to_docs(results, i)
+            output.append([candidates[j] for j in selected])
+        return output
+
+    def batch_max_marginal_relevance_search(
+        self,
+        queries: Sequence[str],
+        k: int = DEFAULT_K,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: dict[str, str] | None = None,  # noqa: A002
+        where_document: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return docs selected by maximal marginal relevance for several queries.
+
+        Args:
+            queries: Texts to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            fetch_k: Number of Documents to fetch per query to pass to MMR algorithm.
+            lambda_mult: Number between 0 and 1 that determines the degree
+                        of diversity among the results with 0 corresponding
+                        to maximum diversity and 1 to minimum diversity.
+                        Defaults to 0.5.
+            filter: Filter by metadata.
+            where_document: dict used to filter by the document contents.
+                    E.g. {"$contains": "hello"}.
+            kwargs: Additional keyword arguments to pass to Chroma collection query.
+
+        Returns:
+            For each query, the Documents selected by maximal marginal relevance.
+
+        Raises:
+            ValueError: If the embedding function is not provided.
+        """
+        if self._embedding_function is None:
+            msg = "For MMR search, you must specify an embedding function on creation."
+            raise ValueError(
+                msg,
+            )
+
+        embeddings = [self._embedding_function.embed_query(query) for query in queries]
+        return self.batch_max_marginal_relevance_search_by_vector(
+            embeddings,
+            k,
+            fetch_k,
+            lambda_mult=lambda_mult,
+            filter=filter,
+            where_document=where_document,
+            **kwargs,
+        )
+
     def delete_collection(self) -> None:
         """Delete the collection."""
         self._client.delete_collection(self._collection.name)
@@ -1161,6 +1513,20 @@ class Chroma(VectorStore):
             )
         ]
 
+    def get_vectors_by_ids(self, ids: Sequence[str], /) -> dict[str, np.ndarray]:
+        """Get the stored embedding vectors for the given IDs.
+
+        IDs that are not found are omitted from the result.
+
+        Args:
+            ids: List of ids to retrieve.
+
+        Returns:
+            Mapping from document ID to its stored embedding vector.
+        """
+        results = self.get(ids=list(ids), include=["embeddings"])
+        return dict(zip(results["ids"], results["embeddings"], strict=False))
+
     def update_document(self, document_id: str, document: Document) -> None:
         """Update a document in the collection.
 
@@ -1187,7 +1553,7 @@ class Chroma(VectorStore):
             raise ValueError(
                 msg,
             )
-        embeddings = self._embedding_function.embed_documents(text)
+        embeddings = self._embedding_function.embed_documents_array(text)
 
         if hasattr(
             self._client,
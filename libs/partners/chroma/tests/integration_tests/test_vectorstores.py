@@ -8,6 +8,7 @@ from typing import (
 )
 
 import chromadb
+import numpy as np
 import pytest  # type: ignore[import-not-found]
 import requests
 from chromadb.api.client import SharedSystemClient
@@ -197,6 +198,23 @@ def test_chroma_with_metadatas_with_vectors() -> None:
     assert (output[0][1] == vec_1).all()
 
 
+def test_chroma_get_vectors_by_ids() -> None:
+    """Test that stored vectors can be fetched by id."""
+    texts = ["foo", "bar", "baz"]
+    ids = [f"id_{i}" for i in range(len(texts))]
+    embeddings = ConsistentFakeEmbeddings()
+    docsearch = Chroma.from_texts(
+        collection_name="test_collection",
+        texts=texts,
+        embedding=embeddings,
+        ids=ids,
+    )
+    output = docsearch.get_vectors_by_ids(["id_1", "missing"])
+    docsearch.delete_collection()
+    assert list(output) == ["id_1"]
+    assert (output["id_1"] == embeddings.embed_query("bar")).all()
+
+
 def test_chroma_with_metadatas_with_scores_using_vector() -> None:
     """Test end to end construction and scored search, using embedding vector."""
     texts = ["foo", "bar", "baz"]
@@ -383,6 +401,49 @@ def test_chroma_mmr() -> None:
     assert output[0].id is not None
 
 
+def test_chroma_batch_similarity_search() -> None:
+    """Test that several queries are answered by one collection query."""
+    texts = ["foo", "bar", "baz"]
+    embeddings = ConsistentFakeEmbeddings()
+    docsearch = Chroma.from_texts(
+        collection_name="test_collection",
+        texts=texts,
+        embedding=embeddings,
+    )
+    output = docsearch.batch_similarity_search_with_score(["foo", "baz"], k=2)
+    single = [docsearch.similarity_search_with_score(q, k=2) for q in ["foo", "baz"]]
+    vectors = docsearch.batch_similarity_search_with_vectors(["bar"], k=1)
+    by_vector = docsearch.batch_similarity_search_by_vector(
+        [embeddings.embed_query("bar")], k=1
+    )
+    docsearch.delete_collection()
+    assert output == single
+    assert output[1][0][0].page_content == "baz"
+    assert vectors[0][0][0].page_content == "bar"
+    assert isinstance(vectors[0][0][1], np.ndarray)
+    assert (vectors[0][0][1] == embeddings.embed_query("bar")).all()
+    assert by_vector[0][0].page_content == "bar"
+
+
+def test_chroma_batch_mmr() -> None:
+    """Test batched MMR matches per-query MMR."""
+    texts = ["foo", "foo", "fou", "baz", "bar"]
+    docsearch = Chroma.from_texts(
+        collection_name="test_collection",
+        texts=texts,
+        embedding=ConsistentFakeEmbeddings(),
+    )
+    queries = ["foo", "bar"]
+    output = docsearch.batch_max_marginal_relevance_search(queries, k=3, fetch_k=5)
+    single = [
+        docsearch.max_marginal_relevance_search(q, k=3, fetch_k=5) for q in queries
+    ]
+    docsearch.delete_collection()
+    assert output == single
+    assert len(output) == 2
+    assert all(len(docs) == 3 for docs in output)
+
+
 def test_chroma_mmr_by_vector() -> None:
     """Test end to end construction and search."""
     texts = ["foo", "bar", "baz"]
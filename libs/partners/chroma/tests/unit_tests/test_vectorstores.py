@@ -28,3 +28,29 @@ def test_similarity_search() -> None:
     output = docsearch.similarity_search("foo", k=1)
     docsearch.delete_collection()
     assert len(output) == 1
+
+
+def test_add_texts_streaming() -> None:
+    """Test streaming ingest from generators in bounded batches."""
+    docsearch = Chroma(
+        collection_name="test_collection", embedding_function=FakeEmbeddings(size=10)
+    )
+    progress = []
+    texts = (f"text {i}" for i in range(7))
+    metadatas = ({"page": str(i)} if i % 2 else {} for i in range(7))
+    ids = docsearch.add_texts(
+        texts,
+        metadatas=metadatas,  # type: ignore[arg-type]
+        batch_size=3,
+        max_in_flight=2,
+        progress_callback=progress.append,
+    )
+    stored = docsearch.get(ids=ids)
+    docsearch.delete_collection()
+    assert len(ids) == 7
+    assert len(set(ids)) == 7
+    assert sorted(stored["documents"]) == sorted(f"text {i}" for i in range(7))
+    assert [p["texts"] for p in progress] == [3, 6, 7]
+    assert progress[-1]["batches"] == 3
+    page_by_text = dict(zip(stored["documents"], stored["metadatas"], strict=True))
+    assert page_by_text["text 3"] == {"page": "3"}
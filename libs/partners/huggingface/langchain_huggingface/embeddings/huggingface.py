@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.embeddings import Embeddings
 from pydantic import BaseModel, ConfigDict, Field
@@ -12,6 +12,9 @@ from langchain_huggingface.utils.import_utils import (
     is_optimum_intel_version,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 DEFAULT_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
 
 _MIN_OPTIMUM_VERSION = "1.22"
@@ -119,6 +122,10 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
             List of embeddings, one for each text.
 
         """
+        return self._encode(texts, encode_kwargs).tolist()  # type: ignore[return-type]
+
+    def _encode(self, texts: list[str], encode_kwargs: dict[str, Any]) -> Any:
+        """Run the SentenceTransformer model and return its array or tensor output."""
         import sentence_transformers  # type: ignore[import]
 
         texts = [x.replace("\n", " ") for x in texts]
@@ -140,7 +147,7 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
             )
             raise TypeError(msg)
 
-        return embeddings.tolist()  # type: ignore[return-type]
+        return embeddings
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Compute doc embeddings using a HuggingFace transformer model.
@@ -154,6 +161,26 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
         """
         return self._embed(texts, self.encode_kwargs)
 
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        """Compute doc embeddings as a 2-D `float32` array.
+
+        The model output is returned as is (moved to CPU and cast to `float32` if
+        needed), without converting it to Python lists.
+
+        Args:
+            texts: The list of texts to embed.
+
+        Returns:
+            Array of shape `(len(texts), dimensions)`.
+
+        """
+        import numpy as np
+
+        embeddings = self._encode(texts, self.encode_kwargs)
+        if hasattr(embeddings, "cpu"):
+            embeddings = embeddings.cpu().numpy()
+        return np.asarray(embeddings, dtype=np.float32)
+
     def embed_query(self, text: str) -> list[float]:
         """Compute query embeddings using a HuggingFace transformer model.
 
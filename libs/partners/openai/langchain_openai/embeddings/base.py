@@ -2,22 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
+import sys
 import warnings
+from array import array
 from collections.abc import Iterable, Mapping, Sequence
-from typing import Any, Literal, cast
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import openai
 import tiktoken
 from langchain_core.embeddings import Embeddings
 from langchain_core.runnables.config import run_in_executor
 from langchain_core.utils import from_env, get_pydantic_field_names, secret_from_env
+from langchain_core.utils.iter import bounded_map
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def _check_numpy() -> bool:
+    return bool(find_spec("numpy"))
+
+
+def _decode_base64_embedding(data: str) -> Any:
+    """Decode a base64 encoded little-endian float32 embedding.
+
+    Returns a NumPy `float32` array if NumPy is installed, otherwise a list.
+    """
+    raw = base64.b64decode(data)
+    if _check_numpy():
+        import numpy as np
+
+        return np.frombuffer(raw, dtype="<f4")
+    values = array("f", raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+def _embeddings_from_response(response: Any, *, decode_base64: bool) -> list[Any]:
+    """Extract the embeddings from an embeddings API response.
+
+    Reads the embeddings straight off the response object instead of dumping the
+    whole response to Python dicts first.
+    """
+    if isinstance(response, dict):
+        embeddings = [r["embedding"] for r in response["data"]]
+    else:
+        embeddings = [r.embedding for r in response.data]
+    if decode_base64:
+        return [
+            _decode_base64_embedding(e) if isinstance(e, str) else e for e in embeddings
+        ]
+    return embeddings
+
+
+def _to_list(embedding: Any) -> list[float]:
+    return embedding if isinstance(embedding, list) else embedding.tolist()
+
+
+def _to_float32_matrix(embeddings: list[Any]) -> np.ndarray:
+    if not _check_numpy():
+        msg = "Could not import numpy, please install with `pip install numpy`."
+        raise ImportError(msg)
+    import numpy as np
+
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
 def _process_batched_chunked_embeddings(
     num_texts: int,
     tokens: list[list[int] | str],
@@ -60,6 +123,7 @@ def _process_batched_chunked_embeddings(
         # else we need to weighted average
         # should be same as
         # average = np.average(_result, axis=0, weights=num_tokens_in_batch[i])
+        _result = [_to_list(embedding) for embedding in _result]
         total_weight = sum(num_tokens_in_batch[i])
         average = [
             sum(
@@ -251,6 +315,16 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
     check_embedding_ctx_length: bool = True
     """Whether to check the token length of inputs and automatically split inputs
         longer than embedding_ctx_length."""
+    encoding_format: Literal["float", "base64"] | None = None
+    """Format to request embeddings in.
+
+    With `'base64'`, each embedding is returned as a base64 string of float32
+    values and decoded directly into a NumPy `float32` array (or a list, if NumPy
+    is not installed) instead of being parsed from a JSON list of floats.
+    """
+    max_concurrency: int = 1
+    """Maximum number of embedding requests to send concurrently when a call is
+    split into several chunks. Sync calls use a thread pool."""
 
     model_config = ConfigDict(
         extra="forbid", populate_by_name=True, protected_namespaces=()
@@ -351,8 +425,61 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         params: dict = {"model": self.model, **self.model_kwargs}
         if self.dimensions is not None:
             params["dimensions"] = self.dimensions
+        if self.encoding_format is not None:
+            params["encoding_format"] = self.encoding_format
         return params
 
+    def _embed_chunks(
+        self,
+        inputs: Sequence[Any],
+        starts: Iterable[int],
+        chunk_size: int,
+        client_kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Embed `inputs[i : i + chunk_size]` for each `i` in `starts`, in order.
+
+        Up to `max_concurrency` requests are in flight at a time.
+        """
+        decode_base64 = client_kwargs.get("encoding_format") == "base64"
+
+        def embed_chunk(i: int) -> list[Any]:
+            response = self.client.create(
+                input=inputs[i : i + chunk_size], **client_kwargs
+            )
+            return _embeddings_from_response(response, decode_base64=decode_base64)
+
+        if self.max_concurrency > 1:
+            chunks = bounded_map(
+                embed_chunk, starts, max_in_flight=self.max_concurrency
+            )
+        else:
+            chunks = map(embed_chunk, starts)
+        return [embedding for chunk in chunks for embedding in chunk]
+
+    async def _aembed_chunks(
+        self,
+        inputs: Sequence[Any],
+        starts: Iterable[int],
+        chunk_size: int,
+        client_kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Async version of `_embed_chunks`."""
+        decode_base64 = client_kwargs.get("encoding_format") == "base64"
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_chunk(i: int) -> list[Any]:
+            async with semaphore:
+                response = await self.async_client.create(
+                    input=inputs[i : i + chunk_size], **client_kwargs
+                )
+            return _embeddings_from_response(response, decode_base64=decode_base64)
+
+        if self.max_concurrency > 1:
+            chunks = await asyncio.gather(*(embed_chunk(i) for i in starts))
+        else:
+            chunks = [await embed_chunk(i) for i in starts]
+        return [embedding for chunk in chunks for embedding in chunk]
+
     def _tokenize(
         self, texts: list[str], chunk_size: int
     ) -> tuple[Iterable[int], list[list[int] | str], list[int]]:
@@ -394,20 +521,18 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
             tokenizer = AutoTokenizer.from_pretrained(
                 pretrained_model_name_or_path=model_name
             )
-            for i, text in enumerate(texts):
-                # Tokenize the text using HuggingFace transformers
-                tokenized: list[int] = tokenizer.encode(text, add_special_tokens=False)
-
+            # Tokenize all texts in one call, which fast tokenizers parallelize
+            tokenized_texts: list[list[int]] = tokenizer(
+                texts, add_special_tokens=False
+            )["input_ids"]
+            token_chunks: list[list[int]] = []
+            for i, tokenized in enumerate(tokenized_texts):
                 # Split tokens into chunks respecting the embedding_ctx_length
                 for j in range(0, len(tokenized), self.embedding_ctx_length):
-                    token_chunk: list[int] = tokenized[
-                        j : j + self.embedding_ctx_length
-                    ]
-
-                    # Convert token IDs back to a string
-                    chunk_text: str = tokenizer.decode(token_chunk)
-                    tokens.append(chunk_text)
+                    token_chunks.append(tokenized[j : j + self.embedding_ctx_length])
                     indices.append(i)
+            # Convert token IDs back to strings
+            tokens.extend(tokenizer.batch_decode(token_chunks))
         else:
             try:
                 encoding = tiktoken.encoding_for_model(model_name)
@@ -421,18 +546,19 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
                 }.items()
                 if v is not None
             }
-            for i, text in enumerate(texts):
-                if self.model.endswith("001"):
-                    # See: https://github.com/openai/openai-python/
-                    #      issues/418#issuecomment-1525939500
-                    # replace newlines, which can negatively affect performance.
-                    text = text.replace("\n", " ")
-
-                if encoder_kwargs:
-                    token = encoding.encode(text, **encoder_kwargs)
-                else:
-                    token = encoding.encode_ordinary(text)
-
+            if self.model.endswith("001"):
+                # See: https://github.com/openai/openai-python/
+                #      issues/418#issuecomment-1525939500
+                # replace newlines, which can negatively affect performance.
+                texts = [text.replace("\n", " ") for text in texts]
+
+            # tiktoken encodes batches on a thread pool, outside of the GIL
+            if encoder_kwargs:
+                encoded = encoding.encode_batch(texts, **encoder_kwargs)
+            else:
+                encoded = encoding.encode_ordinary_batch(texts)
+
+            for i, token in enumerate(encoded):
                 # Split tokens into chunks respecting the embedding_ctx_length
                 for j in range(0, len(token), self.embedding_ctx_length):
                     tokens.append(token[j : j + self.embedding_ctx_length])
@@ -475,28 +601,32 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         """
         _chunk_size = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
-        _iter, tokens, indices = self._tokenize(texts, _chunk_size)
-        batched_embeddings: list[list[float]] = []
-        for i in _iter:
-            response = self.client.create(
-                input=tokens[i : i + _chunk_size], **client_kwargs
-            )
-            if not isinstance(response, dict):
-                response = response.model_dump()
-            batched_embeddings.extend(r["embedding"] for r in response["data"])
+        return [
+            _to_list(e) for e in self._len_safe_rows(texts, _chunk_size, client_kwargs)
+        ]
+
+    def _len_safe_rows(
+        self, texts: list[str], chunk_size: int, client_kwargs: dict[str, Any]
+    ) -> list[Any]:
+        """Length-safe embeddings, as lists or `float32` arrays (see `_to_list`)."""
+        _iter, tokens, indices = self._tokenize(texts, chunk_size)
+        batched_embeddings = self._embed_chunks(
+            tokens, _iter, chunk_size, client_kwargs
+        )
 
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
         )
-        _cached_empty_embedding: list[float] | None = None
+        _cached_empty_embedding: Any = None
 
-        def empty_embedding() -> list[float]:
+        def empty_embedding() -> Any:
             nonlocal _cached_empty_embedding
             if _cached_empty_embedding is None:
                 average_embedded = self.client.create(input="", **client_kwargs)
-                if not isinstance(average_embedded, dict):
-                    average_embedded = average_embedded.model_dump()
-                _cached_empty_embedding = average_embedded["data"][0]["embedding"]
+                _cached_empty_embedding = _embeddings_from_response(
+                    average_embedded,
+                    decode_base64=client_kwargs.get("encoding_format") == "base64",
+                )[0]
             return _cached_empty_embedding
 
         return [e if e is not None else empty_embedding() for e in embeddings]
@@ -527,37 +657,63 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         """
         _chunk_size = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
+        return [
+            _to_list(e)
+            for e in await self._alen_safe_rows(texts, _chunk_size, client_kwargs)
+        ]
+
+    async def _alen_safe_rows(
+        self, texts: list[str], chunk_size: int, client_kwargs: dict[str, Any]
+    ) -> list[Any]:
+        """Async version of `_len_safe_rows`."""
         _iter, tokens, indices = await run_in_executor(
-            None, self._tokenize, texts, _chunk_size
+            None, self._tokenize, texts, chunk_size
+        )
+        batched_embeddings = await self._aembed_chunks(
+            tokens, range(0, len(tokens), chunk_size), chunk_size, client_kwargs
         )
-        batched_embeddings: list[list[float]] = []
-        for i in range(0, len(tokens), _chunk_size):
-            response = await self.async_client.create(
-                input=tokens[i : i + _chunk_size], **client_kwargs
-            )
-
-            if not isinstance(response, dict):
-                response = response.model_dump()
-            batched_embeddings.extend(r["embedding"] for r in response["data"])
 
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
         )
-        _cached_empty_embedding: list[float] | None = None
+        _cached_empty_embedding: Any = None
 
-        async def empty_embedding() -> list[float]:
+        async def empty_embedding() -> Any:
             nonlocal _cached_empty_embedding
             if _cached_empty_embedding is None:
                 average_embedded = await self.async_client.create(
                     input="", **client_kwargs
                 )
-                if not isinstance(average_embedded, dict):
-                    average_embedded = average_embedded.model_dump()
-                _cached_empty_embedding = average_embedded["data"][0]["embedding"]
+                _cached_empty_embedding = _embeddings_from_response(
+                    average_embedded,
+                    decode_base64=client_kwargs.get("encoding_format") == "base64",
+                )[0]
             return _cached_empty_embedding
 
         return [e if e is not None else await empty_embedding() for e in embeddings]
 
+    def _embed_rows(
+        self, texts: list[str], chunk_size: int | None, kwargs: dict[str, Any]
+    ) -> list[Any]:
+        chunk_size_ = chunk_size or self.chunk_size
+        client_kwargs = {**self._invocation_params, **kwargs}
+        if not self.check_embedding_ctx_length:
+            return self._embed_chunks(
+                texts, range(0, len(texts), chunk_size_), chunk_size_, client_kwargs
+            )
+        return self._len_safe_rows(texts, chunk_size_, client_kwargs)
+
+    async def _aembed_rows(
+        self, texts: list[str], chunk_size: int | None, kwargs: dict[str, Any]
+    ) -> list[Any]:
+        chunk_size_ = chunk_size or self.chunk_size
+        client_kwargs = {**self._invocation_params, **kwargs}
+        if not self.check_embedding_ctx_length:
+            return await self._aembed_chunks(
+                texts, range(0, len(texts), chunk_size_), chunk_size_, client_kwargs
+            )
+        return await self._alen_safe_rows(texts, chunk_size_, client_kwargs)
+
     def embed_documents(
         self, texts: list[str], chunk_size: int | None = None, **kwargs: Any
     ) -> list[list[float]]:
@@ -572,25 +728,15 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         Returns:
             List of embeddings, one for each text.
         """
-        chunk_size_ = chunk_size or self.chunk_size
-        client_kwargs = {**self._invocation_params, **kwargs}
-        if not self.check_embedding_ctx_length:
-            embeddings: list[list[float]] = []
-            for i in range(0, len(texts), chunk_size_):
-                response = self.client.create(
-                    input=texts[i : i + chunk_size_], **client_kwargs
-                )
-                if not isinstance(response, dict):
-                    response = response.model_dump()
-                embeddings.extend(r["embedding"] for r in response["data"])
-            return embeddings
-
-        # NOTE: to keep things simple, we assume the list may contain texts longer
-        #       than the maximum context and use length-safe embedding function.
-        engine = cast(str, self.deployment)
-        return self._get_len_safe_embeddings(
-            texts, engine=engine, chunk_size=chunk_size, **kwargs
-        )
+        if self.check_embedding_ctx_length:
+            # NOTE: to keep things simple, we assume the list may contain texts
+            #       longer than the maximum context and use length-safe embedding
+            #       function.
+            engine = cast(str, self.deployment)
+            return self._get_len_safe_embeddings(
+                texts, engine=engine, chunk_size=chunk_size, **kwargs
+            )
+        return [_to_list(e) for e in self._embed_rows(texts, chunk_size, kwargs)]
 
     async def aembed_documents(
         self, texts: list[str], chunk_size: int | None = None, **kwargs: Any
@@ -606,25 +752,52 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         Returns:
             List of embeddings, one for each text.
         """
-        chunk_size_ = chunk_size or self.chunk_size
-        client_kwargs = {**self._invocation_params, **kwargs}
-        if not self.check_embedding_ctx_length:
-            embeddings: list[list[float]] = []
-            for i in range(0, len(texts), chunk_size_):
-                response = await self.async_client.create(
-                    input=texts[i : i + chunk_size_], **client_kwargs
-                )
-                if not isinstance(response, dict):
-                    response = response.model_dump()
-                embeddings.extend(r["embedding"] for r in response["data"])
-            return embeddings
-
-        # NOTE: to keep things simple, we assume the list may contain texts longer
-        #       than the maximum context and use length-safe embedding function.
-        engine = cast(str, self.deployment)
-        return await self._aget_len_safe_embeddings(
-            texts, engine=engine, chunk_size=chunk_size, **kwargs
-        )
+        if self.check_embedding_ctx_length:
+            # NOTE: to keep things simple, we assume the list may contain texts
+            #       longer than the maximum context and use length-safe embedding
+            #       function.
+            engine = cast(str, self.deployment)
+            return await self._aget_len_safe_embeddings(
+                texts, engine=engine, chunk_size=chunk_size, **kwargs
+            )
+        rows = await self._aembed_rows(texts, chunk_size, kwargs)
+        return [_to_list(e) for e in rows]
+
+    def embed_documents_array(
+        self, texts: list[str], chunk_size: int | None = None, **kwargs: Any
+    ) -> np.ndarray:
+        """Call out to OpenAI's embedding endpoint, returning a `float32` array.
+
+        With `encoding_format="base64"` the decoded embeddings are stacked
+        directly, without creating Python floats.
+
+        Args:
+            texts: The list of texts to embed.
+            chunk_size: The chunk size of embeddings. If `None`, will use the chunk size
+                specified by the class.
+            kwargs: Additional keyword arguments to pass to the embedding API.
+
+        Returns:
+            Array of shape `(len(texts), dimensions)`.
+        """
+        return _to_float32_matrix(self._embed_rows(texts, chunk_size, kwargs))
+
+    async def aembed_documents_array(
+        self, texts: list[str], chunk_size: int | None = None, **kwargs: Any
+    ) -> np.ndarray:
+        """Call out to OpenAI's embedding endpoint async, returning a `float32` array.
+
+        Args:
+            texts: The list of texts to embed.
+            chunk_size: The chunk size of embeddings. If `None`, will use the chunk size
+                specified by the class.
+            kwargs: Additional keyword arguments to pass to the embedding API.
+
+        Returns:
+            Array of shape `(len(texts), dimensions)`.
+        """
+        rows = await self._aembed_rows(texts, chunk_size, kwargs)
+        return _to_float32_matrix(rows)
 
     def embed_query(self, text: str, **kwargs: Any) -> list[float]:
         """Call out to OpenAI's embedding endpoint for embedding query text.
@@ -0,0 +1,100 @@
+"""Benchmarks for `OpenAIEmbeddings` against a local stub embeddings server."""
+
+import base64
+import json
+import threading
+import time
+from collections.abc import Iterator
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_openai import OpenAIEmbeddings
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import (  # type: ignore[import-untyped]
+        BenchmarkFixture,
+    )
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+_DIMENSIONS = 1536
+_LATENCY = 0.02
+_VECTOR = np.random.default_rng(0).random(_DIMENSIONS, dtype=np.float32)
+_FLOAT_EMBEDDING = _VECTOR.tolist()
+_BASE64_EMBEDDING = base64.b64encode(_VECTOR.tobytes()).decode()
+
+
+@lru_cache
+def _response_body(n: int, model: str, encoding_format: str | None) -> bytes:
+    embedding = _BASE64_EMBEDDING if encoding_format == "base64" else _FLOAT_EMBEDDING
+    return json.dumps(
+        {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": embedding}
+                for i in range(n)
+            ],
+            "model": model,
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+    ).encode()
+
+
+class _StubEmbeddingsHandler(BaseHTTPRequestHandler):
+    """Answers every `/embeddings` request after a fixed latency.
+
+    Response bodies are cached so the stub spends as little CPU as possible in
+    the benchmarked process.
+    """
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        payload = _response_body(
+            len(body["input"]), body["model"], body.get("encoding_format")
+        )
+        time.sleep(_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubEmbeddingsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("encoding_format", [None, "base64"])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_embed_documents(
+    benchmark: "BenchmarkFixture",
+    stub_server_url: str,
+    encoding_format: str | None,
+    max_concurrency: int,
+) -> None:
+    embeddings = OpenAIEmbeddings(
+        api_key="stub",  # type: ignore[arg-type]
+        base_url=stub_server_url,
+        chunk_size=100,
+        check_embedding_ctx_length=False,
+        encoding_format=encoding_format,  # type: ignore[arg-type]
+        max_concurrency=max_concurrency,
+    )
+    texts = [f"document {i}" for i in range(800)]
+
+    @benchmark  # type: ignore[misc]
+    def embed() -> None:
+        embeddings.embed_documents(texts)
@@ -1,7 +1,13 @@
+import asyncio
+import base64
 import os
+import struct
+import time
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+import tiktoken
 
 from langchain_openai import OpenAIEmbeddings
 
@@ -96,3 +102,127 @@ async def test_embed_with_kwargs_async() -> None:
         mock_create.assert_any_call(input=texts, **client_kwargs)
 
     assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+
+
+def _byte_encoding() -> tiktoken.Encoding:
+    """A tiny byte-level encoding that does not need to be downloaded."""
+    return tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+def test_tokenize_batches_and_splits_long_texts() -> None:
+    embeddings = OpenAIEmbeddings(embedding_ctx_length=3)
+    with patch("tiktoken.encoding_for_model", return_value=_byte_encoding()):
+        _iter, tokens, indices = embeddings._tokenize(["abcdefg", "", "hi"], 2)
+
+    assert tokens == [[97, 98, 99], [100, 101, 102], [103], [104, 105]]
+    assert indices == [0, 0, 0, 2]
+    assert list(_iter) == [0, 2]
+
+
+def test_embed_documents_base64() -> None:
+    embeddings = OpenAIEmbeddings(
+        check_embedding_ctx_length=False, encoding_format="base64"
+    )
+    vectors = [[0.5, -1.0], [0.25, 2.0]]
+    data = [
+        {"embedding": base64.b64encode(struct.pack("<2f", *v)).decode()}
+        for v in vectors
+    ]
+    with patch.object(embeddings.client, "create") as mock_create:
+        mock_create.return_value = {"data": data}
+        result = embeddings.embed_documents(["a", "b"])
+        mock_create.assert_called_once_with(
+            input=["a", "b"], encoding_format="base64", model=embeddings.model
+        )
+
+    assert result == vectors
+    assert all(isinstance(v, float) for v in result[0])
+
+
+async def test_embed_documents_uses_len_safe_embeddings() -> None:
+    class CustomEmbeddings(OpenAIEmbeddings):
+        def _get_len_safe_embeddings(
+            self, texts: list[str], *, engine: str, **kwargs: Any
+        ) -> list[list[float]]:
+            return [[float(len(text))] for text in texts]
+
+        async def _aget_len_safe_embeddings(
+            self, texts: list[str], *, engine: str, **kwargs: Any
+        ) -> list[list[float]]:
+            return [[-float(len(text))] for text in texts]
+
+    embeddings = CustomEmbeddings()
+    assert embeddings.embed_documents(["a", "bb"]) == [[1.0], [2.0]]
+    assert await embeddings.aembed_documents(["a", "bb"]) == [[-1.0], [-2.0]]
+
+
+def test_embed_documents_concurrent_chunks_keep_order() -> None:
+    embeddings = OpenAIEmbeddings(
+        chunk_size=2, check_embedding_ctx_length=False, max_concurrency=3
+    )
+    texts = [f"text{i}" for i in range(7)]
+    finished = []
+
+    def create(input: list[str], **_: Any) -> dict:  # noqa: A002
+        # Earlier chunks take longer, so later ones complete first.
+        chunk = int(input[0][4:]) // 2
+        time.sleep(0.05 * (3 - chunk))
+        finished.append(chunk)
+        return {"data": [{"embedding": [float(t[4:])]} for t in input]}
+
+    with patch.object(embeddings.client, "create", side_effect=create) as mock:
+        result = embeddings.embed_documents(texts)
+
+    assert mock.call_count == 4
+    # The first three chunks run together; the fourth waits for a free slot.
+    assert finished == [2, 1, 0, 3]
+    assert result == [[float(i)] for i in range(7)]
+
+
+async def test_aembed_documents_concurrent_chunks_keep_order() -> None:
+    embeddings = OpenAIEmbeddings(
+        chunk_size=3, check_embedding_ctx_length=False, max_concurrency=2
+    )
+    texts = [f"text{i}" for i in range(7)]
+    finished = []
+
+    async def create(input: list[str], **_: Any) -> dict:  # noqa: A002
+        chunk = int(input[0][4:]) // 3
+        await asyncio.sleep(0.05 * (2 - chunk))
+        finished.append(chunk)
+        return {"data": [{"embedding": [float(t[4:])]} for t in input]}
+
+    with patch.object(embeddings.async_client, "create", side_effect=create):
+        result = await embeddings.aembed_documents(texts)
+
+    assert finished == [1, 2, 0]
+    assert result == [[float(i)] for i in range(7)]
+
+
+async def test_embed_documents_array_base64() -> None:
+    np = pytest.importorskip("numpy")
+    embeddings = OpenAIEmbeddings(
+        check_embedding_ctx_length=False, encoding_format="base64", chunk_size=1
+    )
+    vectors = np.array([[0.5, -1.0], [0.25, 2.0]], dtype=np.float32)
+
+    def response(input: list[str], **_: Any) -> dict:  # noqa: A002
+        row = vectors[int(input[0])]
+        return {"data": [{"embedding": base64.b64encode(row.tobytes()).decode()}]}
+
+    async def aresponse(input: list[str], **kwargs: Any) -> dict:  # noqa: A002
+        return response(input, **kwargs)
+
+    with patch.object(embeddings.client, "create", side_effect=response):
+        result = embeddings.embed_documents_array(["0", "1"])
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, vectors)
+
+    with patch.object(embeddings.async_client, "create", side_effect=aresponse):
+        result = await embeddings.aembed_documents_array(["1", "0"])
+    np.testing.assert_array_equal(result, vectors[::-1])
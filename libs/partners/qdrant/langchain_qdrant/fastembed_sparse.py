@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from langchain_qdrant.sparse_embeddings import SparseEmbeddings, SparseVector
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+
+
+def _to_sparse_vector(result: Any) -> SparseVector:
+    # The arrays come straight from the model, so skip re-validating them.
+    return SparseVector.model_construct(
+        indices=result.indices.tolist(), values=result.values.tolist()
+    )
 
 
 class FastEmbedSparse(SparseEmbeddings):
@@ -71,10 +79,36 @@ class FastEmbedSparse(SparseEmbeddings):
         results = self._model.embed(
             texts, batch_size=self._batch_size, parallel=self._parallel
         )
-        return [
-            SparseVector(indices=result.indices.tolist(), values=result.values.tolist())
-            for result in results
-        ]
+        return [_to_sparse_vector(result) for result in results]
+
+    def iter_embed_documents(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 64,
+        *,
+        parallel: int | None = None,
+    ) -> Iterator[list[SparseVector]]:
+        """Lazily embed search docs, yielding one list per `batch_size` texts.
+
+        All texts go through a single FastEmbed `embed` stream, so with
+        data-parallel encoding the worker pool is started once rather than per
+        batch.
+
+        Args:
+            texts: Texts to embed. Consumed lazily.
+            batch_size: Number of vectors per yielded list.
+            parallel: Overrides the `parallel` option given at construction.
+
+        Yields:
+            Lists of at most `batch_size` sparse vectors, in input order.
+        """
+        results = self._model.embed(
+            texts,
+            batch_size=self._batch_size,
+            parallel=self._parallel if parallel is None else parallel,
+        )
+        while batch := list(islice(results, batch_size)):
+            yield [_to_sparse_vector(result) for result in batch]
 
     def embed_query(self, text: str) -> SparseVector:
         result = next(self._model.query_embed(text))
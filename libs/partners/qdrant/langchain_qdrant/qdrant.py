@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import time
 import uuid
 from collections.abc import Callable
 from enum import Enum
-from itertools import islice
+from itertools import chain, islice, tee
 from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
@@ -13,7 +14,8 @@ from typing import (
 import numpy as np
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from langchain_core.vectorstores import VectorStore
+from langchain_core.utils.iter import bounded_map
+from langchain_core.vectorstores import IngestProgress, VectorStore, ingest_progress
 from qdrant_client import QdrantClient, models
 
 from langchain_qdrant._utils import maximal_marginal_relevance
@@ -21,13 +23,21 @@ from langchain_qdrant._utils import maximal_marginal_relevance
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable, Sequence
 
-    from langchain_qdrant.sparse_embeddings import SparseEmbeddings
+    from langchain_qdrant.sparse_embeddings import SparseEmbeddings, SparseVector
 
 
 class QdrantVectorStoreError(Exception):
     """`QdrantVectorStore` related exceptions."""
 
 
+def _to_qdrant_sparse_vector(vector: SparseVector) -> models.SparseVector:
+    # `vector` was already validated as a `SparseVector`, so skip re-validating
+    # every element.
+    return models.SparseVector.model_construct(
+        indices=vector.indices, values=vector.values
+    )
+
+
 class RetrievalMode(str, Enum):
     """Modes for retrieving vectors from Qdrant."""
 
@@ -500,22 +510,55 @@ class QdrantVectorStore(VectorStore):
         metadatas: list[dict] | None = None,
         ids: Sequence[str | int] | None = None,
         batch_size: int = 64,
+        *,
+        max_in_flight: int | None = None,
+        progress_callback: Callable[[IngestProgress], None] | None = None,
         **kwargs: Any,
     ) -> list[str | int]:
         """Add texts with embeddings to the vectorstore.
 
+        Texts are consumed lazily in batches of `batch_size`. By default each
+        batch is embedded and then upserted before the next one is read. With
+        `max_in_flight`, up to that many batches are embedded concurrently in
+        worker threads while the current batch is upserted, so embedding and
+        writing overlap and at most `max_in_flight` batches of vectors are held
+        in memory at a time.
+
+        Args:
+            texts: Texts to add to the vectorstore.
+            metadatas: Optional metadata for each text.
+            ids: Optional ids for each text. Random UUIDs are used otherwise.
+            batch_size: Number of texts per embedding call and upsert.
+            max_in_flight: Maximum number of batches being embedded while the
+                current one is upserted. If `None`, batches are processed
+                serially.
+            progress_callback: Called with an `IngestProgress` after each
+                upserted batch.
+            **kwargs: Additional keyword arguments passed to `client.upsert`.
+
         Returns:
             List of ids from adding the texts into the vectorstore.
 
         """
-        added_ids = []
-        for batch_ids, points in self._generate_batches(
-            texts, metadatas, ids, batch_size
-        ):
+        batches = self._read_batches(texts, metadatas, ids, batch_size)
+        if self.retrieval_mode != RetrievalMode.DENSE:
+            batches = self._with_sparse_vectors(batches, batch_size)
+        if max_in_flight is None:
+            points_batches = map(self._build_points, batches)
+        else:
+            points_batches = bounded_map(
+                self._build_points, batches, max_in_flight=max_in_flight
+            )
+
+        added_ids: list[str | int] = []
+        start = time.perf_counter()
+        for n_batches, (batch_ids, points) in enumerate(points_batches, start=1):
             self.client.upsert(
                 collection_name=self.collection_name, points=points, **kwargs
             )
             added_ids.extend(batch_ids)
+            if progress_callback is not None:
+                progress_callback(ingest_progress(n_batches, len(added_ids), start))
 
         return added_ids
 
@@ -1051,33 +1094,82 @@ class QdrantVectorStore(VectorStore):
         ids: Sequence[str | int] | None = None,
         batch_size: int = 64,
     ) -> Generator[tuple[list[str | int], list[models.PointStruct]], Any, None]:
+        batches = self._read_batches(texts, metadatas, ids, batch_size)
+        if self.retrieval_mode != RetrievalMode.DENSE:
+            batches = self._with_sparse_vectors(batches, batch_size)
+        for batch in batches:
+            yield self._build_points(batch)
+
+    @staticmethod
+    def _read_batches(
+        texts: Iterable[str],
+        metadatas: Iterable[dict] | None,
+        ids: Iterable[str | int] | None,
+        batch_size: int,
+    ) -> Generator[tuple[list[str | int], list[str], list[dict] | None], Any, None]:
         texts_iterator = iter(texts)
         metadatas_iterator = iter(metadatas or [])
-        ids_iterator = iter(ids or [uuid.uuid4().hex for _ in iter(texts)])
+        # Random ids are generated for an empty `ids` as well as for `None`.
+        ids_iterator = iter(ids) if ids else None
 
         while batch_texts := list(islice(texts_iterator, batch_size)):
             batch_metadatas = list(islice(metadatas_iterator, batch_size)) or None
-            batch_ids = list(islice(ids_iterator, batch_size))
-            points = [
-                models.PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload=payload,
-                )
-                for point_id, vector, payload in zip(
-                    batch_ids,
-                    self._build_vectors(batch_texts),
-                    self._build_payloads(
-                        batch_texts,
-                        batch_metadatas,
-                        self.content_payload_key,
-                        self.metadata_payload_key,
-                    ),
-                    strict=False,
-                )
-            ]
+            if ids_iterator is None:
+                batch_ids: list[str | int] = [uuid.uuid4().hex for _ in batch_texts]
+            else:
+                batch_ids = list(islice(ids_iterator, batch_size))
+            yield batch_ids, batch_texts, batch_metadatas
 
-            yield batch_ids, points
+    def _with_sparse_vectors(
+        self,
+        batches: Iterable[tuple[list[str | int], list[str], list[dict] | None]],
+        batch_size: int,
+    ) -> Generator[
+        tuple[list[str | int], list[str], list[dict] | None, list[SparseVector]],
+        Any,
+        None,
+    ]:
+        """Attach sparse vectors to `batches`, encoding them in one stream.
+
+        The texts of all batches are fed to a single
+        `sparse_embeddings.iter_embed_documents` call, whose output batches line
+        up with `batches` since both are cut every `batch_size` texts.
+        """
+        batches, texts_source = tee(batches)
+        sparse_batches = self.sparse_embeddings.iter_embed_documents(
+            chain.from_iterable(batch[1] for batch in texts_source),
+            batch_size=batch_size,
+        )
+        for batch, sparse_vectors in zip(batches, sparse_batches, strict=True):
+            yield (*batch, sparse_vectors)
+
+    def _build_points(
+        self,
+        batch: tuple[list[str | int], list[str], list[dict] | None]
+        | tuple[list[str | int], list[str], list[dict] | None, list[SparseVector]],
+    ) -> tuple[list[str | int], list[models.PointStruct]]:
+        batch_ids, batch_texts, batch_metadatas, *sparse_vectors = batch
+        points = [
+            models.PointStruct(
+                id=point_id,
+                vector=vector,
+                payload=payload,
+            )
+            for point_id, vector, payload in zip(
+                batch_ids,
+                self._build_vectors(
+                    batch_texts, sparse_vectors[0] if sparse_vectors else None
+                ),
+                self._build_payloads(
+                    batch_texts,
+                    batch_metadatas,
+                    self.content_payload_key,
+                    self.metadata_payload_key,
+                ),
+                strict=False,
+            )
+        ]
+        return batch_ids, points
 
     @staticmethod
     def _build_payloads(
@@ -1107,6 +1199,7 @@ class QdrantVectorStore(VectorStore):
     def _build_vectors(
         self,
         texts: Iterable[str],
+        sparse_vectors: list[SparseVector] | None = None,
     ) -> list[models.VectorStruct]:
         if self.retrieval_mode == RetrievalMode.DENSE:
             embeddings = self._require_embeddings("DENSE mode")
@@ -1119,22 +1212,24 @@ class QdrantVectorStore(VectorStore):
             ]
 
         if self.retrieval_mode == RetrievalMode.SPARSE:
-            batch_sparse_embeddings = self.sparse_embeddings.embed_documents(
-                list(texts)
+            batch_sparse_embeddings = (
+                sparse_vectors
+                if sparse_vectors is not None
+                else self.sparse_embeddings.embed_documents(list(texts))
             )
             return [
-                {
-                    self.sparse_vector_name: models.SparseVector(
-                        values=vector.values, indices=vector.indices
-                    )
-                }
+                {self.sparse_vector_name: _to_qdrant_sparse_vector(vector)}
                 for vector in batch_sparse_embeddings
             ]
 
         if self.retrieval_mode == RetrievalMode.HYBRID:
             embeddings = self._require_embeddings("HYBRID mode")
             dense_embeddings = embeddings.embed_documents(list(texts))
-            sparse_embeddings = self.sparse_embeddings.embed_documents(list(texts))
+            sparse_embeddings = (
+                sparse_vectors
+                if sparse_vectors is not None
+                else self.sparse_embeddings.embed_documents(list(texts))
+            )
 
             if len(dense_embeddings) != len(sparse_embeddings):
                 msg = "Mismatched length between dense and sparse embeddings."
@@ -1143,9 +1238,7 @@ class QdrantVectorStore(VectorStore):
             return [
                 {
                     self.vector_name: dense_vector,
-                    self.sparse_vector_name: models.SparseVector(
-                        values=sparse_vector.values, indices=sparse_vector.indices
-                    ),
+                    self.sparse_vector_name: _to_qdrant_sparse_vector(sparse_vector),
                 }
                 for dense_vector, sparse_vector in zip(
                     dense_embeddings, sparse_embeddings, strict=False
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
 from langchain_core.runnables.config import run_in_executor
 from pydantic import BaseModel, Field
@@ -24,6 +26,18 @@ class SparseEmbeddings(ABC):
     def embed_query(self, text: str) -> SparseVector:
         """Embed query text."""
 
+    def iter_embed_documents(
+        self, texts: Iterable[str], batch_size: int = 64
+    ) -> Iterator[list[SparseVector]]:
+        """Lazily embed search docs, yielding one list per `batch_size` texts.
+
+        `texts` is consumed as the batches are requested, so arbitrarily long
+        streams can be embedded without holding all vectors in memory.
+        """
+        texts_iterator = iter(texts)
+        while batch := list(islice(texts_iterator, batch_size)):
+            yield self.embed_documents(batch)
+
     async def aembed_documents(self, texts: list[str]) -> list[SparseVector]:
         """Asynchronous Embed search docs."""
         return await run_in_executor(None, self.embed_documents, texts)
@@ -35,3 +35,22 @@ def test_attention_embeddings(model_name: str) -> None:
     for result in output:
         assert len(result.indices) == len(result.values)
         assert len(result.indices) > 0
+
+
+@pytest.mark.parametrize("parallel", [None, 2])
+def test_iter_embed_documents(parallel: int | None) -> None:
+    model = FastEmbedSparse(model_name="Qdrant/bm25")
+    texts = [f"document number {i} about topic {i % 3}" for i in range(10)]
+
+    batches = list(
+        model.iter_embed_documents(iter(texts), batch_size=4, parallel=parallel)
+    )
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    expected = model.embed_documents(texts)
+    for result, reference in zip(
+        [vector for batch in batches for vector in batch], expected, strict=True
+    ):
+        assert result.indices == reference.indices
+        assert isinstance(result.values, list)
+        assert np.allclose(result.values, reference.values)
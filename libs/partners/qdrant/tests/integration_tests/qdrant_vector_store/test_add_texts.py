@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import uuid
+from typing import TYPE_CHECKING
 
 import pytest
 from langchain_core.documents import Document
 from qdrant_client import QdrantClient, models
 
-from langchain_qdrant import QdrantVectorStore, RetrievalMode
+from langchain_qdrant import QdrantVectorStore, RetrievalMode, SparseVector
 from tests.integration_tests.common import (
     ConsistentFakeEmbeddings,
     ConsistentFakeSparseEmbeddings,
@@ -14,6 +15,9 @@ from tests.integration_tests.common import (
 )
 from tests.integration_tests.fixtures import qdrant_locations, retrieval_modes
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 @pytest.mark.parametrize("location", qdrant_locations())
 @pytest.mark.parametrize("vector_name", ["", "my-vector"])
@@ -76,6 +80,10 @@ def test_qdrant_add_texts_returns_all_ids(
     assert len(set(ids)) == 3
     assert len(docsearch.get_by_ids(ids)) == 3
 
+    ids = docsearch.add_texts(["qux", "quux"], ids=[])
+    assert len(ids) == 2
+    assert len(docsearch.get_by_ids(ids)) == 2
+
 
 @pytest.mark.parametrize("location", qdrant_locations())
 @pytest.mark.parametrize("vector_name", ["", "my-vector"])
@@ -141,3 +149,82 @@ def test_qdrant_add_texts_stores_ids(
     stored_ids = [point.id for point in vec_store.client.scroll(collection_name)[0]]
     assert set(ids) == set(stored_ids)
     assert len(vec_store.get_by_ids(ids)) == 3
+
+
+@pytest.mark.parametrize("location", qdrant_locations())
+@pytest.mark.parametrize("retrieval_mode", retrieval_modes())
+@pytest.mark.parametrize("max_in_flight", [None, 1, 3])
+def test_qdrant_add_texts_streams_generator(
+    location: str,
+    retrieval_mode: RetrievalMode,
+    max_in_flight: int | None,
+) -> None:
+    """Test Qdrant.add_texts consumes a generator and reports progress."""
+    docsearch = QdrantVectorStore.from_texts(
+        ["foobar"],
+        ConsistentFakeEmbeddings(),
+        location=location,
+        retrieval_mode=retrieval_mode,
+        sparse_embedding=ConsistentFakeSparseEmbeddings(),
+    )
+    progress = []
+
+    ids = docsearch.add_texts(
+        (f"text {i}" for i in range(7)),
+        metadatas=[{"page": i} for i in range(7)],
+        batch_size=3,
+        max_in_flight=max_in_flight,
+        progress_callback=progress.append,
+    )
+
+    assert len(set(ids)) == 7
+    docs = docsearch.get_by_ids(ids)
+    assert sorted(doc.metadata["page"] for doc in docs) == list(range(7))
+    assert [p["texts"] for p in progress] == [3, 6, 7]
+    assert progress[-1]["batches"] == 3
+
+
+class StreamingFakeSparseEmbeddings(ConsistentFakeSparseEmbeddings):
+    """Records the batch sizes of each `iter_embed_documents` stream."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.streams: list[list[int]] = []
+
+    def iter_embed_documents(
+        self, texts: Iterable[str], batch_size: int = 64
+    ) -> Iterator[list[SparseVector]]:
+        sizes: list[int] = []
+        self.streams.append(sizes)
+        for batch in super().iter_embed_documents(texts, batch_size):
+            sizes.append(len(batch))
+            yield batch
+
+
+@pytest.mark.parametrize("location", qdrant_locations())
+@pytest.mark.parametrize(
+    "retrieval_mode", retrieval_modes(dense=False, sparse=True, hybrid=True)
+)
+@pytest.mark.parametrize("max_in_flight", [None, 2])
+def test_qdrant_add_texts_streams_sparse_vectors(
+    location: str,
+    retrieval_mode: RetrievalMode,
+    max_in_flight: int | None,
+) -> None:
+    """Test Qdrant.add_texts encodes sparse vectors in a single stream."""
+    sparse_embedding = StreamingFakeSparseEmbeddings()
+    docsearch = QdrantVectorStore.from_texts(
+        ["foobar"],
+        ConsistentFakeEmbeddings(),
+        location=location,
+        retrieval_mode=retrieval_mode,
+        sparse_embedding=sparse_embedding,
+    )
+    sparse_embedding.streams.clear()
+
+    texts = [f"text {i}" for i in range(7)]
+    docsearch.add_texts(iter(texts), batch_size=3, max_in_flight=max_in_flight)
+
+    assert sparse_embedding.streams == [[3, 3, 1]]
+    output = docsearch.similarity_search("text 4", k=1)
+    assert output[0].page_content == "text 4"
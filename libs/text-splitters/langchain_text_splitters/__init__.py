@@ -7,6 +7,7 @@
 
 from langchain_text_splitters.base import (
     Language,
+    TextChunk,
     TextSplitter,
     Tokenizer,
     TokenTextSplitter,
@@ -61,6 +62,7 @@ __all__ = [
     "RecursiveJsonSplitter",
     "SentenceTransformersTokenTextSplitter",
     "SpacyTextSplitter",
+    "TextChunk",
     "TextSplitter",
     "TokenTextSplitter",
     "Tokenizer",
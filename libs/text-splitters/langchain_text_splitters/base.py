@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
+import operator
+import os
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Literal,
     TypeVar,
 )
@@ -18,8 +24,9 @@ from langchain_core.documents import BaseDocumentTransformer, Document
 from typing_extensions import Self, override
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Sequence
+    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
     from collections.abc import Set as AbstractSet
+    from typing import TextIO
 
 
 try:
@@ -41,9 +48,114 @@ logger = logging.getLogger(__name__)
 TS = TypeVar("TS", bound="TextSplitter")
 
 
+@dataclass(frozen=True)
+class TextChunk:
+    """A chunk of a text stream."""
+
+    text: str
+    """Text of the chunk."""
+    start_index: int
+    """Offset of the chunk in the whole stream, or -1 if it could not be located."""
+
+
+class _TokenIndex:
+    """Token counts of the spans of a text, from a single encoding of the text."""
+
+    __slots__ = ("_starts",)
+
+    def __init__(self, starts: list[int]) -> None:
+        # Character offset at which each token starts, in order
+        self._starts = starts
+
+    def count(self, start: int, end: int) -> int:
+        """Number of tokens overlapping `text[start:end]`."""
+        if end <= start:
+            return 0
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        return bisect_left(self._starts, end) - first
+
+
+_UTF8_CONTINUATION_BYTES = range(0x80, 0xC0)
+
+
+class _TiktokenEncoder:
+    """A tiktoken encoding with the special token settings to encode with."""
+
+    def __init__(
+        self,
+        encoding: tiktoken.Encoding,
+        allowed_special: Literal["all"] | AbstractSet[str],
+        disallowed_special: Literal["all"] | Collection[str],
+    ) -> None:
+        self.encoding = encoding
+        self.allowed_special = allowed_special
+        self.disallowed_special = disallowed_special
+        # Per token id: number of characters the token ends, and whether it starts
+        # inside a character, as in `Encoding.decode_with_offsets`
+        self._char_counts: dict[int, int] = {}
+        self._starts_inside: dict[int, int] = {}
+
+    def encode(self, text: str) -> list[int]:
+        return self.encoding.encode(
+            text,
+            allowed_special=self.allowed_special,
+            disallowed_special=self.disallowed_special,
+        )
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode `texts`, in parallel in tiktoken's thread pool if there are CPUs."""
+        num_threads = min(8, os.cpu_count() or 1)
+        if num_threads == 1 or len(texts) == 1:
+            return [self.encode(text) for text in texts]
+        return self.encoding.encode_batch(
+            texts,
+            num_threads=num_threads,
+            allowed_special=self.allowed_special,
+            disallowed_special=self.disallowed_special,
+        )
+
+    def index(self, text: str, tokens: list[int] | None = None) -> _TokenIndex:
+        """Index the tokens of `text`, encoding it unless `tokens` are given."""
+        if tokens is None:
+            tokens = self.encode(text)
+        char_counts = self._char_counts
+        starts_inside = self._starts_inside
+        unique = set(tokens)
+        for token in unique.difference(char_counts):
+            token_bytes = self.encoding.decode_single_token_bytes(token)
+            starts_inside[token] = int(token_bytes[0] in _UTF8_CONTINUATION_BYTES)
+            char_counts[token] = sum(
+                1 for b in token_bytes if b not in _UTF8_CONTINUATION_BYTES
+            )
+        starts = list(
+            itertools.accumulate(map(char_counts.__getitem__, tokens), initial=0)
+        )
+        starts.pop()
+        if any(starts_inside[token] for token in unique):
+            # A token starting inside a character starts with that character
+            inside = map(starts_inside.__getitem__, tokens)
+            starts = list(
+                map(max, itertools.repeat(0), map(operator.sub, starts, inside))
+            )
+        return _TokenIndex(starts)
+
+
+def _iter_pieces(source: Iterable[str] | TextIO, read_size: int) -> Iterator[str]:
+    """Iterate over a text stream, reading file objects `read_size` at a time."""
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while piece := read(read_size):
+        yield piece
+
+
 class TextSplitter(BaseDocumentTransformer, ABC):
     """Interface for splitting text into chunks."""
 
+    _supports_encode_once: ClassVar[bool] = False
+    """Whether the splitter can count tokens from a single encoding per text."""
+
     def __init__(
         self,
         chunk_size: int = 4000,
@@ -83,6 +195,8 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         self._keep_separator = keep_separator
         self._add_start_index = add_start_index
         self._strip_whitespace = strip_whitespace
+        # Set by `from_tiktoken_encoder(encode_once=True)`
+        self._token_encoder: _TiktokenEncoder | None = None
 
     @abstractmethod
     def split_text(self, text: str) -> list[str]:
@@ -94,10 +208,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         """Create documents from a list of texts."""
         metadatas_ = metadatas or [{}] * len(texts)
         documents = []
-        for i, text in enumerate(texts):
+        for i, (text, chunks) in enumerate(
+            zip(texts, self._split_texts(texts), strict=True)
+        ):
             index = 0
             previous_chunk_len = 0
-            for chunk in self.split_text(text):
+            for chunk in chunks:
                 metadata = copy.deepcopy(metadatas_[i])
                 if self._add_start_index:
                     offset = index + previous_chunk_len - self._chunk_overlap
@@ -108,6 +224,100 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                 documents.append(new_doc)
         return documents
 
+    def _split_texts(self, texts: list[str]) -> Iterable[list[str]]:
+        """Split several texts, which subclasses may batch."""
+        return (self.split_text(text) for text in texts)
+
+    def split_text_stream(
+        self, source: Iterable[str] | TextIO, *, buffer_size: int = 1 << 20
+    ) -> Iterator[TextChunk]:
+        """Lazily split a text that arrives in pieces.
+
+        The text is split a window of roughly `buffer_size` characters at a time.
+        Every chunk of a window but the last is emitted; the last one may continue
+        past the window, so splitting resumes from its start once more text has
+        been read. Overlap between consecutive chunks is therefore preserved, and
+        only about one window of text (plus its chunks) is held in memory.
+
+        A window that cannot be cut, because it makes a single chunk or none, is
+        extended once. If it still cannot be cut, all of its chunks are emitted
+        and splitting starts afresh after them, without overlap, so text with no
+        separator yields chunks of about two windows rather than one chunk of the
+        whole text.
+
+        Chunks are not in general the same as those of `split_text`: the first
+        window is split as `split_text` would split it, but later windows start
+        at a chunk boundary and the splitter's merging does not resynchronize
+        with the whole-text split. What is guaranteed is that each chunk is
+        found in the text at its `start_index`, chunks come in order, and
+        anything between consecutive chunks that do not overlap is whitespace.
+        If the whole text fits in one window, the chunks are those of
+        `create_documents`.
+
+        Args:
+            source: An iterable of text pieces of any size, e.g. `Blob.iter_text()`,
+                or a text file object.
+            buffer_size: Number of characters to read before splitting. Should be
+                well above the number of characters in a chunk.
+
+        Raises:
+            ValueError: If `buffer_size` is less than 1.
+
+        Yields:
+            The chunks, with their offsets in the whole text.
+        """
+        if buffer_size < 1:
+            msg = f"buffer_size must be >= 1, got {buffer_size}"
+            raise ValueError(msg)
+        pieces = _iter_pieces(source, buffer_size)
+        buffer = ""
+        # Offset of buffer[0] in the whole text
+        buffer_start = 0
+        exhausted = False
+        while not exhausted:
+            parts = [buffer]
+            size = len(buffer)
+            target = size + buffer_size
+            for piece in pieces:
+                parts.append(piece)
+                size += len(piece)
+                if size >= target:
+                    break
+            else:
+                exhausted = True
+            buffer = "".join(parts)
+            chunks = self._split_text_with_offsets(buffer)
+            if exhausted:
+                for index, chunk in chunks:
+                    yield TextChunk(chunk, index + buffer_start if index >= 0 else -1)
+                return
+            # Keep the last chunk, which may continue past the window, unless it
+            # is the only one (or cannot be located): then read one more window
+            # before giving up on cutting the buffer and emitting all of it.
+            cut = chunks[-1][0] if len(chunks) > 1 else 0
+            if cut > 0:
+                chunks.pop()
+            elif len(buffer) < 2 * buffer_size:
+                continue
+            else:
+                cut = len(buffer)
+            for index, chunk in chunks:
+                yield TextChunk(chunk, index + buffer_start if index >= 0 else -1)
+            buffer = buffer[cut:]
+            buffer_start += cut
+
+    def _split_text_with_offsets(self, text: str) -> list[tuple[int, str]]:
+        """Split `text` and locate each chunk in it, as `create_documents` does."""
+        chunks = []
+        index = 0
+        previous_chunk_len = 0
+        for chunk in self.split_text(text):
+            offset = index + previous_chunk_len - self._chunk_overlap
+            index = text.find(chunk, max(0, offset))
+            chunks.append((index, chunk))
+            previous_chunk_len = len(chunk)
+        return chunks
+
     def split_documents(self, documents: Iterable[Document]) -> list[Document]:
         """Split documents."""
         texts, metadatas = [], []
@@ -122,16 +332,25 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             text = text.strip()
         return text or None
 
-    def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
+    def _merge_splits(
+        self,
+        splits: Iterable[str],
+        separator: str,
+        lengths: Iterable[int] | None = None,
+    ) -> list[str]:
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
         separator_len = self._length_function(separator)
+        if lengths is None:
+            splits = list(splits)
+            lengths = [self._length_function(d) for d in splits]
 
         docs = []
-        current_doc: list[str] = []
+        current_doc: deque[str] = deque()
+        # Lengths of the splits in current_doc, so each split is measured once
+        current_lens: deque[int] = deque()
         total = 0
-        for d in splits:
-            len_ = self._length_function(d)
+        for d, len_ in zip(splits, lengths, strict=False):
             if (
                 total + len_ + (separator_len if len(current_doc) > 0 else 0)
                 > self._chunk_size
@@ -144,7 +363,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         self._chunk_size,
                     )
                 if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
+                    doc = self._join_docs(list(current_doc), separator)
                     if doc is not None:
                         docs.append(doc)
                     # Keep on popping if:
@@ -155,13 +374,14 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
+                        total -= current_lens.popleft() + (
                             separator_len if len(current_doc) > 1 else 0
                         )
-                        current_doc = current_doc[1:]
+                        current_doc.popleft()
             current_doc.append(d)
+            current_lens.append(len_)
             total += len_ + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
+        doc = self._join_docs(list(current_doc), separator)
         if doc is not None:
             docs.append(doc)
         return docs
@@ -194,9 +414,29 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         model_name: str | None = None,
         allowed_special: Literal["all"] | AbstractSet[str] = set(),
         disallowed_special: Literal["all"] | Collection[str] = "all",
+        *,
+        encode_once: bool = False,
         **kwargs: Any,
     ) -> Self:
-        """Text splitter that uses tiktoken encoder to count length."""
+        """Text splitter that uses tiktoken encoder to count length.
+
+        By default every candidate split is encoded to measure it, so a text is
+        tokenized piece by piece many times over. With `encode_once=True` each
+        text is encoded once, and a split's length is the number of the text's
+        tokens it overlaps. This can differ slightly from encoding the split on
+        its own, as tokens may merge across split boundaries. `split_documents`
+        and `create_documents` then also encode all texts in one parallel batch.
+
+        `encode_once` is supported by `RecursiveCharacterTextSplitter` and its
+        subclasses; `TokenTextSplitter` always encodes each text once.
+
+        Raises:
+            ImportError: If tiktoken is not installed.
+            ValueError: If `encode_once` is not supported by this splitter.
+        """
+        if encode_once and not cls._supports_encode_once:
+            msg = f"{cls.__name__} does not support encode_once"
+            raise ValueError(msg)
         if not _HAS_TIKTOKEN:
             msg = (
                 "Could not import tiktoken python package. "
@@ -228,7 +468,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             }
             kwargs = {**kwargs, **extra_kwargs}
 
-        return cls(length_function=_tiktoken_encoder, **kwargs)
+        splitter = cls(length_function=_tiktoken_encoder, **kwargs)
+        if encode_once:
+            splitter._token_encoder = _TiktokenEncoder(
+                enc, allowed_special, disallowed_special
+            )
+        return splitter
 
     @override
     def transform_documents(
@@ -241,6 +486,8 @@ class TextSplitter(BaseDocumentTransformer, ABC):
 class TokenTextSplitter(TextSplitter):
     """Splitting text to tokens using model tokenizer."""
 
+    _supports_encode_once = True
+
     def __init__(
         self,
         encoding_name: str = "gpt2",
@@ -282,7 +529,19 @@ class TokenTextSplitter(TextSplitter):
             A list of text chunks, where each chunk is derived from a portion
             of the input text based on the tokenization and chunking rules.
         """
+        return split_text_on_tokens(text=text, tokenizer=self._make_tokenizer())
 
+    @override
+    def _split_texts(self, texts: list[str]) -> Iterable[list[str]]:
+        if type(self).split_text is not TokenTextSplitter.split_text:
+            return super()._split_texts(texts)
+        tokenizer = self._make_tokenizer()
+        encoder = _TiktokenEncoder(
+            self._tokenizer, self._allowed_special, self._disallowed_special
+        )
+        return (_split_token_ids(ids, tokenizer) for ids in encoder.encode_batch(texts))
+
+    def _make_tokenizer(self) -> Tokenizer:
         def _encode(_text: str) -> list[int]:
             return self._tokenizer.encode(
                 _text,
@@ -290,15 +549,13 @@ class TokenTextSplitter(TextSplitter):
                 disallowed_special=self._disallowed_special,
             )
 
-        tokenizer = Tokenizer(
+        return Tokenizer(
             chunk_overlap=self._chunk_overlap,
             tokens_per_chunk=self._chunk_size,
             decode=self._tokenizer.decode,
             encode=_encode,
         )
 
-        return split_text_on_tokens(text=text, tokenizer=tokenizer)
-
 
 class Language(str, Enum):
     """Enum of the programming languages."""
@@ -348,8 +605,11 @@ class Tokenizer:
 
 def split_text_on_tokens(*, text: str, tokenizer: Tokenizer) -> list[str]:
     """Split incoming text and return chunks using tokenizer."""
+    return _split_token_ids(tokenizer.encode(text), tokenizer)
+
+
+def _split_token_ids(input_ids: list[int], tokenizer: Tokenizer) -> list[str]:
     splits: list[str] = []
-    input_ids = tokenizer.encode(text)
     start_idx = 0
     if tokenizer.tokens_per_chunk <= tokenizer.chunk_overlap:
         msg = "tokens_per_chunk must be greater than chunk_overlap"
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+from typing_extensions import override
 
 from langchain_text_splitters.base import Language, TextSplitter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langchain_text_splitters.base import _TokenIndex
+
 
 class CharacterTextSplitter(TextSplitter):
     """Splitting text that looks at characters."""
@@ -78,6 +86,123 @@ def _split_text_with_regex(
     return [s for s in splits if s]
 
 
+_REGEX_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()")
+
+
+def _regex_literal(pattern: str) -> str | None:
+    """Return the string `pattern` matches if it is a plain literal, else `None`."""
+    chars = []
+    escaped = False
+    for c in pattern:
+        if escaped:
+            if c.isascii() and c.isalnum():
+                if c not in _REGEX_ESCAPES:
+                    return None
+                c = _REGEX_ESCAPES[c]  # noqa: PLW2901
+            chars.append(c)
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c in _REGEX_METACHARACTERS:
+            return None
+        else:
+            chars.append(c)
+    return None if escaped else "".join(chars)
+
+
+class _Separator:
+    """A separator of `RecursiveCharacterTextSplitter`, prepared for repeated use.
+
+    Literal separators, including regex separators that only match a literal
+    string, are searched for and split on with `str` methods, which find exactly
+    what the regex would; other regexes go through `re`.
+    """
+
+    __slots__ = ("literal", "pattern", "text")
+
+    def __init__(self, text: str, *, is_regex: bool) -> None:
+        self.text = text
+        self.pattern = text if is_regex else re.escape(text)
+        self.literal = _regex_literal(text) if is_regex else text
+
+    def search(self, text: str) -> bool:
+        """Whether the separator occurs in `text`."""
+        if self.literal is not None:
+            return self.literal in text
+        return re.search(self.pattern, text) is not None
+
+    def split(
+        self, text: str, *, keep_separator: bool | Literal["start", "end"]
+    ) -> list[str]:
+        """Split `text` exactly like `_split_text_with_regex`."""
+        literal = self.literal
+        if not literal:
+            return _split_text_with_regex(
+                text, self.pattern, keep_separator=keep_separator
+            )
+        splits = text.split(literal)
+        if keep_separator == "end":
+            last = splits.pop()
+            splits = [s + literal for s in splits]
+            splits.append(last)
+        elif keep_separator:
+            splits[1:] = [literal + s for s in splits[1:]]
+        return [s for s in splits if s]
+
+    def locate(
+        self, text: str, *, keep_separator: bool | Literal["start", "end"]
+    ) -> list[tuple[int, str]]:
+        """Like `split`, also returning the offset of each split in `text`.
+
+        The offset is -1 for a split that cannot be located, which only happens
+        with regexes containing groups.
+        """
+        splits = self.split(text, keep_separator=keep_separator)
+        literal = self.literal
+        located = []
+        offset = 0
+        if literal and not keep_separator:
+            # Splits are what is between consecutive separators
+            for part in text.split(literal):
+                if part:
+                    located.append((offset, part))
+                offset += len(part) + len(literal)
+        elif literal is not None:
+            # Splits cover the text
+            for split in splits:
+                located.append((offset, split))
+                offset += len(split)
+        else:
+            for split in splits:
+                index = text.find(split, offset)
+                located.append((index, split))
+                if index != -1:
+                    offset = index + len(split)
+        return located
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_separators(
+    separators: tuple[str, ...], *, is_regex: bool
+) -> tuple[_Separator, ...]:
+    return tuple(_Separator(s, is_regex=is_regex) for s in separators)
+
+
+def _drop_absent(
+    separators: tuple[_Separator, ...], text: str
+) -> tuple[_Separator, ...]:
+    """Drop the literal separators that do not occur in `text`.
+
+    The last separator is the fallback when none is found, so it is always kept.
+    """
+    *candidates, last = separators
+    return (
+        *(sep for sep in candidates if not sep.literal or sep.literal in text),
+        last,
+    )
+
+
 class RecursiveCharacterTextSplitter(TextSplitter):
     """Splitting text by recursively look at characters.
 
@@ -85,6 +210,8 @@ class RecursiveCharacterTextSplitter(TextSplitter):
     that works.
     """
 
+    _supports_encode_once = True
+
     def __init__(
         self,
         separators: list[str] | None = None,
@@ -97,45 +224,94 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         self._separators = separators or ["\n\n", "\n", " ", ""]
         self._is_separator_regex = is_separator_regex
 
-    def _split_text(self, text: str, separators: list[str]) -> list[str]:
+    def _split_text(
+        self,
+        text: str,
+        separators: list[str],
+        token_index: _TokenIndex | None = None,
+    ) -> list[str]:
         """Split incoming text and return chunks."""
+        return self._split_text_with_separators(
+            text,
+            _compile_separators(tuple(separators), is_regex=self._is_separator_regex),
+            drop_absent=True,
+            token_index=token_index,
+        )
+
+    def _split_text_with_separators(
+        self,
+        text: str,
+        separators: tuple[_Separator, ...],
+        *,
+        drop_absent: bool = False,
+        token_index: _TokenIndex | None = None,
+        offset: int = 0,
+    ) -> list[str]:
         final_chunks = []
         # Get appropriate separator to use
         separator = separators[-1]
-        new_separators = []
-        for i, _s in enumerate(separators):
-            separator_ = _s if self._is_separator_regex else re.escape(_s)
-            if not _s:
-                separator = _s
+        new_separators: tuple[_Separator, ...] = ()
+        for i, sep in enumerate(separators):
+            if not sep.text:
+                separator = sep
                 break
-            if re.search(separator_, text):
-                separator = _s
+            if sep.search(text):
+                separator = sep
                 new_separators = separators[i + 1 :]
                 break
 
-        separator_ = separator if self._is_separator_regex else re.escape(separator)
-        splits = _split_text_with_regex(
-            text, separator_, keep_separator=self._keep_separator
-        )
+        # Measure each split once; with a token index, from the tokens of the
+        # whole text
+        offsets: list[int] | None = None
+        if token_index is None:
+            splits = separator.split(text, keep_separator=self._keep_separator)
+            lengths = list(map(self._length_function, splits))
+        else:
+            located = separator.locate(text, keep_separator=self._keep_separator)
+            splits = [s for _, s in located]
+            offsets = [offset + i if i != -1 else -1 for i, _ in located]
+            lengths = [
+                token_index.count(i, i + len(s))
+                if i != -1
+                else self._length_function(s)
+                for i, s in zip(offsets, splits, strict=True)
+            ]
 
         # Now go merging things, recursively splitting longer texts.
-        good_splits = []
-        separator_ = "" if self._keep_separator else separator
-        for s in splits:
-            if self._length_function(s) < self._chunk_size:
+        good_splits: list[str] = []
+        good_lengths: list[int] = []
+        separator_ = "" if self._keep_separator else separator.text
+        for k, (s, length) in enumerate(zip(splits, lengths, strict=True)):
+            if length < self._chunk_size:
                 good_splits.append(s)
+                good_lengths.append(length)
             else:
                 if good_splits:
-                    merged_text = self._merge_splits(good_splits, separator_)
+                    merged_text = self._merge_splits(
+                        good_splits, separator_, good_lengths
+                    )
                     final_chunks.extend(merged_text)
                     good_splits = []
+                    good_lengths = []
                 if not new_separators:
                     final_chunks.append(s)
                 else:
-                    other_info = self._split_text(s, new_separators)
+                    if drop_absent:
+                        # Splits found while recursing are substrings of `text`,
+                        # so separators missing from it need not be searched for
+                        # again in each of them.
+                        new_separators = _drop_absent(new_separators, text)
+                        drop_absent = False
+                    s_offset = -1 if offsets is None else offsets[k]
+                    other_info = self._split_text_with_separators(
+                        s,
+                        new_separators,
+                        token_index=token_index if s_offset != -1 else None,
+                        offset=s_offset,
+                    )
                     final_chunks.extend(other_info)
         if good_splits:
-            merged_text = self._merge_splits(good_splits, separator_)
+            merged_text = self._merge_splits(good_splits, separator_, good_lengths)
             final_chunks.extend(merged_text)
         return final_chunks
 
@@ -148,7 +324,23 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         Returns:
             A list of text chunks obtained after splitting.
         """
-        return self._split_text(text, self._separators)
+        token_index = (
+            self._token_encoder.index(text) if self._token_encoder is not None else None
+        )
+        return self._split_text(text, self._separators, token_index)
+
+    @override
+    def _split_texts(self, texts: list[str]) -> Iterable[list[str]]:
+        encoder = self._token_encoder
+        if (
+            encoder is None
+            or type(self).split_text is not RecursiveCharacterTextSplitter.split_text
+        ):
+            return super()._split_texts(texts)
+        return (
+            self._split_text(text, self._separators, encoder.index(text, tokens))
+            for text, tokens in zip(texts, encoder.encode_batch(texts), strict=True)
+        )
 
     @classmethod
     def from_language(
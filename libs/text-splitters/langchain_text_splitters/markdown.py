@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import re
-from typing import Any, TypedDict
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from langchain_core.documents import Document
 
-from langchain_text_splitters.base import Language
+from langchain_text_splitters.base import Language, _iter_pieces
 from langchain_text_splitters.character import RecursiveCharacterTextSplitter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
 
 class MarkdownTextSplitter(RecursiveCharacterTextSplitter):
     """Attempts to split the text along Markdown-formatted headings."""
@@ -29,6 +34,10 @@ class MarkdownHeaderTextSplitter:
         return_each_line: bool = False,  # noqa: FBT001,FBT002
         strip_headers: bool = True,  # noqa: FBT001,FBT002
         custom_header_patterns: dict[str, int] | None = None,
+        *,
+        chunk_size: int | None = None,
+        chunk_overlap: int = 0,
+        add_start_index: bool = False,
     ) -> None:
         """Create a new MarkdownHeaderTextSplitter.
 
@@ -39,6 +48,13 @@ class MarkdownHeaderTextSplitter:
             custom_header_patterns: Optional dict mapping header patterns to their
                 levels. For example: {"**": 1, "***": 2} to treat **Header** as
                 level 1 and ***Header*** as level 2 headers.
+            chunk_size: If set, sections of this many characters or more are
+                further split with a `RecursiveCharacterTextSplitter`, as if the
+                documents were passed through its `split_documents`.
+            chunk_overlap: Overlap of the chunks sections are split into.
+            add_start_index: Add the offsets in the markdown text of the first
+                character of each chunk and just past its last character as
+                `start_index` and `end_index` metadata.
         """
         # Output line-by-line or aggregated into chunks w/ common headers
         self.return_each_line = return_each_line
@@ -51,6 +67,44 @@ class MarkdownHeaderTextSplitter:
         self.strip_headers = strip_headers
         # Custom header patterns with their levels
         self.custom_header_patterns = custom_header_patterns or {}
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._add_start_index = add_start_index
+        self._text_splitter = (
+            RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size, chunk_overlap=chunk_overlap
+            )
+            if chunk_size is not None
+            else None
+        )
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """Compile the regexes that classify lines, once for all texts."""
+        # Header separator, metadata name, level and whether it is a custom
+        # header, by regex group name
+        self._headers: dict[str, tuple[str, str, int, bool]] = {}
+        alternatives = []
+        # Alternatives are tried in order, as the separators are checked
+        for i, (sep, name) in enumerate(self.headers_to_split_on):
+            escaped = re.escape(sep)
+            level = self.custom_header_patterns.get(sep, sep.count("#"))
+            if sep in self.custom_header_patterns:
+                # Same as `_is_custom_header`: the separator on both ends of text
+                # that is not only spaces and separator characters
+                chars = re.escape("".join(sorted(set(sep))))
+                alternatives.append(
+                    f"(?P<c{i}>{escaped}(?!{escaped})(?=.*[^ {chars}])"
+                    f".+?(?<!{escaped}){escaped}$)"
+                )
+                self._headers[f"c{i}"] = (sep, name, level, True)
+            # Header with no text or followed by a space
+            alternatives.append(f"(?P<h{i}>{escaped}(?: |$))")
+            self._headers[f"h{i}"] = (sep, name, level, False)
+        headers = "|".join(alternatives) or "(?!)"
+        self._header_pattern = re.compile(headers)
+        # A code fence, excluding inline code spans, or a header
+        self._line_pattern = re.compile(f"(?P<fence>```(?!.*```)|~~~)|{headers}")
 
     def _is_custom_header(self, line: str, sep: str) -> bool:
         """Check if line matches a custom header pattern.
@@ -89,42 +143,49 @@ class MarkdownHeaderTextSplitter:
         Args:
             lines: Line of text / associated header metadata
         """
-        aggregated_chunks: list[LineType] = []
+        blocks = (
+            _Block(line["metadata"], line["content"].split("\n")) for line in lines
+        )
+        return [
+            Document(page_content=_join_blocks(group), metadata=metadata)
+            for metadata, group in self._group_blocks(blocks)
+        ]
 
-        for line in lines:
-            if (
-                aggregated_chunks
-                and aggregated_chunks[-1]["metadata"] == line["metadata"]
-            ):
-                # If the last line in the aggregated list
-                # has the same metadata as the current line,
-                # append the current content to the last lines's content
-                aggregated_chunks[-1]["content"] += "  \n" + line["content"]
+    def _group_blocks(
+        self, blocks: Iterable[_Block]
+    ) -> Iterator[tuple[dict[str, str], list[_Block]]]:
+        """Group blocks with common metadata, yielding each group once complete."""
+        group: list[_Block] = []
+        metadata: dict[str, str] = {}
+
+        for block in blocks:
+            if group and metadata == block.metadata:
+                # If the last block has the same metadata as the current one,
+                # add the current block to its chunk
+                group.append(block)
             elif (
-                aggregated_chunks
-                and aggregated_chunks[-1]["metadata"] != line["metadata"]
+                group
                 # may be issues if other metadata is present
-                and len(aggregated_chunks[-1]["metadata"]) < len(line["metadata"])
-                and aggregated_chunks[-1]["content"].split("\n")[-1][0] == "#"
+                and len(metadata) < len(block.metadata)
+                and group[-1].lines[-1].startswith("#")
                 and not self.strip_headers
             ):
-                # If the last line in the aggregated list
-                # has different metadata as the current line,
-                # and has shallower header level than the current line,
-                # and the last line is a header,
+                # If the chunk has shallower header level than the current block,
+                # and its last line is a header,
                 # and we are not stripping headers,
-                # append the current content to the last line's content
-                aggregated_chunks[-1]["content"] += "  \n" + line["content"]
-                # and update the last line's metadata
-                aggregated_chunks[-1]["metadata"] = line["metadata"]
+                # add the current block to the chunk
+                group.append(block)
+                # and update the chunk's metadata
+                metadata = block.metadata
             else:
-                # Otherwise, append the current line to the aggregated list
-                aggregated_chunks.append(line)
+                # Otherwise, the last chunk is complete
+                if group:
+                    yield metadata, group
+                group = [block]
+                metadata = block.metadata
 
-        return [
-            Document(page_content=chunk["content"], metadata=chunk["metadata"])
-            for chunk in aggregated_chunks
-        ]
+        if group:
+            yield metadata, group
 
     def split_text(self, text: str) -> list[Document]:
         """Split markdown file.
@@ -133,137 +194,217 @@ class MarkdownHeaderTextSplitter:
             text: Markdown file
         """
         # Split the input text by newline character ("\n").
-        lines = text.split("\n")
-        # Final output
-        lines_with_metadata: list[LineType] = []
-        # Content and metadata of the chunk currently being processed
-        current_content: list[str] = []
-        current_metadata: dict[str, str] = {}
+        return list(self._split_lines(text.split("\n")))
+
+    def split_text_stream(
+        self, source: Iterable[str] | TextIO, *, buffer_size: int = 1 << 20
+    ) -> Iterator[Document]:
+        """Lazily split a markdown file that arrives in pieces.
+
+        Yields the same documents as `split_text` on the whole text. Lines are
+        processed as they are read, and each document is yielded as soon as the
+        next one starts, so only the current section is held in memory.
+
+        Args:
+            source: An iterable of text pieces of any size, e.g. `Blob.iter_text()`,
+                or a text file object.
+            buffer_size: Number of characters to read at a time from a file object.
+
+        Yields:
+            The documents, in order.
+        """
+        yield from self._split_lines(_iter_lines(_iter_pieces(source, buffer_size)))
+
+    def _split_lines(self, lines: Iterable[str]) -> Iterator[Document]:
+        blocks = self._scan(lines)
+        if self.return_each_line:
+            groups: Iterable[tuple[dict[str, str], list[_Block]]] = (
+                (block.metadata, [block]) for block in blocks
+            )
+        else:
+            # aggregate blocks into chunks based on common metadata
+            groups = self._group_blocks(blocks)
+        for metadata, group in groups:
+            yield from self._documents(metadata, group)
+
+    def _documents(
+        self, metadata: dict[str, str], group: list[_Block]
+    ) -> Iterator[Document]:
+        """Make the documents of a chunk, splitting it if it is too large."""
+        content = _join_blocks(group)
+        splitter = self._text_splitter
+        if splitter is None or self._chunk_size is None:
+            texts = [content]
+        elif len(content) < self._chunk_size:
+            # What splitting it would give, without scanning it again
+            texts = [content.strip()] if content.strip() else []
+        else:
+            texts = splitter.split_text(content)
+        if not self._add_start_index:
+            if len(texts) == 1:
+                yield Document(page_content=texts[0], metadata=metadata)
+                return
+            for text in texts:
+                yield Document(page_content=text, metadata=metadata.copy())
+            return
+
+        to_source = _SourceMap(group)
+        index = 0
+        previous_chunk_len = 0
+        overlap = self._chunk_overlap if splitter is not None else 0
+        for text in texts:
+            # Locate the text in the chunk as `TextSplitter.create_documents` does
+            index = content.find(text, max(0, index + previous_chunk_len - overlap))
+            previous_chunk_len = len(text)
+            start = index + len(text) - len(text.lstrip())
+            end = index + len(text.rstrip())
+            yield Document(
+                page_content=text,
+                metadata={
+                    **metadata,
+                    "start_index": to_source(start),
+                    "end_index": to_source(end - 1) + 1,
+                },
+            )
+
+    def _scan(self, lines: Iterable[str]) -> Iterator[_Block]:
+        """Yield each block of lines with its associated header metadata.
+
+        Each line is matched once against a regex of the code fences and headers.
+        """
+        track_offsets = self._add_start_index
+        line_pattern = self._line_pattern
+        header_pattern = self._header_pattern
+        headers = self._headers
+        # Content lines of the block currently being processed, and where they
+        # start in the text
+        content: list[str] = []
+        starts: list[int] = []
+        # Metadata of the headers the current line is under
+        metadata: dict[str, str] = {}
         # Keep track of the nested header structure
         header_stack: list[HeaderType] = []
-        initial_metadata: dict[str, str] = {}
 
-        in_code_block = False
         opening_fence = ""
+        next_line_start = 0
 
         for line in lines:
+            line_start = next_line_start
+            next_line_start += len(line) + 1
             stripped_line = line.strip()
-            # Remove all non-printable characters from the string, keeping only visible
-            # text.
-            stripped_line = "".join(filter(str.isprintable, stripped_line))
-            if not in_code_block:
-                # Exclude inline code spans
-                if stripped_line.startswith("```") and stripped_line.count("```") == 1:
-                    in_code_block = True
-                    opening_fence = "```"
-                elif stripped_line.startswith("~~~"):
-                    in_code_block = True
-                    opening_fence = "~~~"
-            elif stripped_line.startswith(opening_fence):
-                in_code_block = False
+            if not stripped_line.isprintable():
+                # Remove all non-printable characters from the string, keeping
+                # only visible text.
+                stripped_line = "".join(filter(str.isprintable, stripped_line))
+
+            if opening_fence and not stripped_line.startswith(opening_fence):
+                match = None
+            elif opening_fence:
                 opening_fence = ""
+                match = header_pattern.match(stripped_line)
+            else:
+                match = line_pattern.match(stripped_line)
+                if match and match.lastgroup == "fence":
+                    opening_fence = match.group()
+            if opening_fence or (match is None and stripped_line):
+                content.append(stripped_line)
+                if track_offsets:
+                    starts.append(line_start + len(line) - len(line.lstrip()))
+                continue
 
-            if in_code_block:
-                current_content.append(stripped_line)
+            # The line is blank or a header, so the block is complete
+            if content:
+                yield _Block(metadata.copy(), content, starts)
+                content = []
+                starts = []
+            if match is None:
                 continue
 
-            # Check each line against each of the header types (e.g., #, ##)
-            for sep, name in self.headers_to_split_on:
-                is_standard_header = stripped_line.startswith(sep) and (
-                    # Header with no text OR header is followed by space
-                    # Both are valid conditions that sep is being used a header
-                    len(stripped_line) == len(sep) or stripped_line[len(sep)] == " "
-                )
-                is_custom_header = self._is_custom_header(stripped_line, sep)
-
-                # Check if line matches either standard or custom header pattern
-                if is_standard_header or is_custom_header:
-                    # Ensure we are tracking the header as metadata
-                    if name is not None:
-                        # Get the current header level
-                        if sep in self.custom_header_patterns:
-                            current_header_level = self.custom_header_patterns[sep]
-                        else:
-                            current_header_level = sep.count("#")
-
-                        # Pop out headers of lower or same level from the stack
-                        while (
-                            header_stack
-                            and header_stack[-1]["level"] >= current_header_level
-                        ):
-                            # We have encountered a new header
-                            # at the same or higher level
-                            popped_header = header_stack.pop()
-                            # Clear the metadata for the
-                            # popped header in initial_metadata
-                            if popped_header["name"] in initial_metadata:
-                                initial_metadata.pop(popped_header["name"])
-
-                        # Push the current header to the stack
-                        # Extract header text based on header type
-                        if is_custom_header:
-                            # For custom headers like **Header**, extract text
-                            # between patterns
-                            header_text = stripped_line[len(sep) : -len(sep)].strip()
-                        else:
-                            # For standard headers like # Header, extract text
-                            # after the separator
-                            header_text = stripped_line[len(sep) :].strip()
-
-                        header: HeaderType = {
-                            "level": current_header_level,
-                            "name": name,
-                            "data": header_text,
-                        }
-                        header_stack.append(header)
-                        # Update initial_metadata with the current header
-                        initial_metadata[name] = header["data"]
-
-                    # Add the previous line to the lines_with_metadata
-                    # only if current_content is not empty
-                    if current_content:
-                        lines_with_metadata.append(
-                            {
-                                "content": "\n".join(current_content),
-                                "metadata": current_metadata.copy(),
-                            }
-                        )
-                        current_content.clear()
-
-                    if not self.strip_headers:
-                        current_content.append(stripped_line)
-
-                    break
-            else:
-                if stripped_line:
-                    current_content.append(stripped_line)
-                elif current_content:
-                    lines_with_metadata.append(
-                        {
-                            "content": "\n".join(current_content),
-                            "metadata": current_metadata.copy(),
-                        }
-                    )
-                    current_content.clear()
-
-            current_metadata = initial_metadata.copy()
-
-        if current_content:
-            lines_with_metadata.append(
-                {
-                    "content": "\n".join(current_content),
-                    "metadata": current_metadata,
-                }
-            )
+            sep, name, level, is_custom_header = headers[match.lastgroup or ""]
+            # Ensure we are tracking the header as metadata
+            if name is not None:
+                # Pop out headers of lower or same level from the stack
+                while header_stack and header_stack[-1]["level"] >= level:
+                    # We have encountered a new header
+                    # at the same or higher level
+                    metadata.pop(header_stack.pop()["name"], None)
 
-        # lines_with_metadata has each line with associated header metadata
-        # aggregate these into chunks based on common metadata
-        if not self.return_each_line:
-            return self.aggregate_lines_to_chunks(lines_with_metadata)
-        return [
-            Document(page_content=chunk["content"], metadata=chunk["metadata"])
-            for chunk in lines_with_metadata
-        ]
+                # For custom headers like **Header**, extract text between
+                # patterns, and for standard headers like # Header, after the
+                # separator
+                header_text = (
+                    stripped_line[len(sep) : -len(sep)]
+                    if is_custom_header
+                    else stripped_line[len(sep) :]
+                ).strip()
+                header_stack.append({"level": level, "name": name, "data": header_text})
+                metadata[name] = header_text
+
+            if not self.strip_headers:
+                content.append(stripped_line)
+                if track_offsets:
+                    starts.append(line_start + len(line) - len(line.lstrip()))
+
+        if content:
+            yield _Block(metadata, content, starts)
+
+
+class _Block:
+    """Consecutive lines of markdown content under the same headers."""
+
+    __slots__ = ("lines", "metadata", "starts")
+
+    def __init__(
+        self,
+        metadata: dict[str, str],
+        lines: list[str],
+        starts: list[int] | None = None,
+    ) -> None:
+        self.metadata = metadata
+        self.lines = lines
+        # Offset in the text of the first character of each line, if tracked
+        self.starts = starts
+
+
+def _join_blocks(blocks: list[_Block]) -> str:
+    return "  \n".join(["\n".join(block.lines) for block in blocks])
+
+
+class _SourceMap:
+    """Map offsets in the content of joined blocks to offsets in the text."""
+
+    __slots__ = ("_content_starts", "_text_starts")
+
+    def __init__(self, blocks: list[_Block]) -> None:
+        self._content_starts: list[int] = []
+        self._text_starts: list[int] = []
+        position = 0
+        for block in blocks:
+            for line, start in zip(block.lines, block.starts or (), strict=True):
+                self._content_starts.append(position)
+                self._text_starts.append(start)
+                position += len(line) + 1
+            # Blocks are joined with "  \n" rather than "\n"
+            position += 2
+
+    def __call__(self, offset: int) -> int:
+        i = bisect_right(self._content_starts, offset) - 1
+        return self._text_starts[i] + offset - self._content_starts[i]
+
+
+def _iter_lines(pieces: Iterable[str]) -> Iterator[str]:
+    """Split a stream of text pieces into lines, as splitting the whole text would."""
+    partial: list[str] = []
+    for piece in pieces:
+        *complete, last = piece.split("\n")
+        if complete:
+            partial.append(complete[0])
+            yield "".join(partial)
+            yield from complete[1:]
+            partial = [last]
+        else:
+            partial.append(last)
+    yield "".join(partial)
 
 
 class LineType(TypedDict):
@@ -0,0 +1,63 @@
+"""Time `RecursiveCharacterTextSplitter` over a source tree.
+
+Usage:
+    python scripts/benchmark_recursive_splitter.py [ROOT] [--glob PATTERN]
+
+Splits every file under ROOT matching PATTERN (default: `**/*.py` under the
+current directory) with the default separators and with the separators of a few
+languages, and prints the best of several runs for each.
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
+
+SPLITTERS = {
+    "default": lambda: RecursiveCharacterTextSplitter(
+        chunk_size=1000, chunk_overlap=100
+    ),
+    "default, chunk_size=200": lambda: RecursiveCharacterTextSplitter(
+        chunk_size=200, chunk_overlap=20
+    ),
+    **{
+        f"Language.{language.name}": (
+            lambda language=language: RecursiveCharacterTextSplitter.from_language(
+                language, chunk_size=1000, chunk_overlap=100
+            )
+        )
+        for language in (Language.PYTHON, Language.CPP, Language.MARKDOWN)
+    },
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root", nargs="?", default=".", type=Path)
+    parser.add_argument("--glob", default="**/*.py")
+    parser.add_argument("--repeat", default=5, type=int)
+    args = parser.parse_args()
+
+    # Oversized chunks are expected in source files
+    logging.disable(logging.WARNING)
+    texts = [
+        path.read_text(errors="replace")
+        for path in sorted(args.root.glob(args.glob))
+        if path.is_file()
+    ]
+    size = sum(len(text) for text in texts) / 1e6
+    print(f"{len(texts)} files, {size:.1f}M characters")  # noqa: T201
+
+    for name, make_splitter in SPLITTERS.items():
+        splitter = make_splitter()
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            chunks = sum(len(splitter.split_text(text)) for text in texts)
+            best = min(best, time.perf_counter() - start)
+        print(  # noqa: T201
+            f"{name:<28} {best * 1e3:8.0f} ms {size / best:6.1f} Mchar/s "
+            f"{chunks} chunks"
+        )
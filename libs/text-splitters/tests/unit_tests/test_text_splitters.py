@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import io
 import random
 import re
 import string
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from bs4 import Tag
@@ -16,11 +17,17 @@ from langchain_core.documents import Document
 from langchain_text_splitters import (
     Language,
     RecursiveCharacterTextSplitter,
+    TextChunk,
     TextSplitter,
     Tokenizer,
+    TokenTextSplitter,
 )
-from langchain_text_splitters.base import split_text_on_tokens
-from langchain_text_splitters.character import CharacterTextSplitter
+from langchain_text_splitters.base import (
+    _TiktokenEncoder,
+    _TokenIndex,
+    split_text_on_tokens,
+)
+from langchain_text_splitters.character import CharacterTextSplitter, _regex_literal
 from langchain_text_splitters.html import (
     HTMLHeaderTextSplitter,
     HTMLSectionSplitter,
@@ -34,6 +41,9 @@ from langchain_text_splitters.markdown import (
 )
 from langchain_text_splitters.python import PythonCodeTextSplitter
 
+if TYPE_CHECKING:
+    import tiktoken
+
 FAKE_PYTHON_TEXT = """
 class Foo:
 
@@ -3847,3 +3857,368 @@ def test_character_text_splitter_chunk_size_effect(
         keep_separator=False,
     )
     assert splitter.split_text(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("pattern", "literal"),
+    [
+        ("\n\n", "\n\n"),
+        ("\\n\\n", "\n\n"),
+        ("\\*\\*\\*", "***"),
+        ("\nclass ", "\nclass "),
+        ("\n#{1,6} ", None),
+        ("\\nWith\\s+", None),
+        ("(?<=\\.)", None),
+        ("a\\", None),
+        ("$", None),
+    ],
+)
+def test_regex_literal(pattern: str, literal: str | None) -> None:
+    assert _regex_literal(pattern) == literal
+
+
+# Without keep_separator, splits are re-joined with the separator as written,
+# which differs between the two forms.
+@pytest.mark.parametrize("keep_separator", [True, "start", "end"])
+def test_recursive_character_regex_and_literal_separators_agree(
+    *, keep_separator: bool | str
+) -> None:
+    separators = ["\n\n", "\n", ".", " ", ""]
+    text = "Hello.  World.\n\nThis is\na test.\n\n\nOf separators. " * 5
+    literal = RecursiveCharacterTextSplitter(
+        separators=separators,
+        keep_separator=keep_separator,  # type: ignore[arg-type]
+        chunk_size=20,
+        chunk_overlap=5,
+    )
+    escaped = RecursiveCharacterTextSplitter(
+        separators=[re.escape(s) for s in separators],
+        is_separator_regex=True,
+        keep_separator=keep_separator,  # type: ignore[arg-type]
+        chunk_size=20,
+        chunk_overlap=5,
+    )
+    assert literal.split_text(text) == escaped.split_text(text)
+
+
+@pytest.mark.parametrize(
+    ("keep_separator", "expected"),
+    [
+        (False, ["ab", "b"]),
+        (True, ["aa", "aaab", "aab"]),
+        ("end", ["aa", "aa", "abaa", "b"]),
+    ],
+)
+def test_recursive_character_overlapping_separator(
+    *, keep_separator: bool | str, expected: list[str]
+) -> None:
+    # Matches of "aa" are non-overlapping, scanning from the left
+    splitter = RecursiveCharacterTextSplitter(
+        separators=["aa"],
+        keep_separator=keep_separator,  # type: ignore[arg-type]
+        chunk_size=3,
+        chunk_overlap=0,
+    )
+    assert splitter.split_text("aaaaabaab") == expected
+
+
+def test_recursive_character_separator_absent_from_text() -> None:
+    splitter = RecursiveCharacterTextSplitter(
+        separators=["\nclass ", "\n\n", "|"], chunk_size=5, chunk_overlap=0
+    )
+    # No separator occurs in the oversized split, so it is kept whole
+    assert splitter.split_text("abc\n\nabcdefgh\n\nab") == [
+        "abc",
+        "\n\nabcdefgh",
+        "ab",
+    ]
+
+
+def _stream_text() -> str:
+    rng = random.Random(0)
+    words = iter(f"w{i}" for i in range(100_000))
+    paragraphs = [
+        "\n".join(
+            " ".join(next(words) for _ in range(rng.randint(1, 30)))
+            for _ in range(rng.randint(1, 4))
+        )
+        for _ in range(100)
+    ]
+    return "\n\n".join(paragraphs)
+
+
+def _pieces(text: str, size: int) -> Iterator[str]:
+    return (text[i : i + size] for i in range(0, len(text), size))
+
+
+@pytest.mark.parametrize(
+    "make_splitter",
+    [
+        lambda: RecursiveCharacterTextSplitter(
+            chunk_size=100, chunk_overlap=20, add_start_index=True
+        ),
+        lambda: CharacterTextSplitter(
+            separator=" ", chunk_size=50, chunk_overlap=10, add_start_index=True
+        ),
+    ],
+)
+def test_split_text_stream_single_window(
+    make_splitter: Callable[[], TextSplitter],
+) -> None:
+    text = _stream_text()
+    splitter = make_splitter()
+    expected = [
+        TextChunk(doc.page_content, doc.metadata["start_index"])
+        for doc in splitter.create_documents([text])
+    ]
+    chunks = list(splitter.split_text_stream(_pieces(text, 7), buffer_size=10**6))
+    assert chunks == expected
+
+
+def _check_stream_chunks(text: str, chunks: list[TextChunk], max_len: int) -> None:
+    """Check what `split_text_stream` guarantees, whatever the window size."""
+    end = 0
+    for chunk in chunks:
+        assert 0 < len(chunk.text) <= max_len
+        assert text[chunk.start_index : chunk.start_index + len(chunk.text)] == (
+            chunk.text
+        )
+        # Consecutive chunks overlap or are separated by whitespace only
+        assert not text[end : chunk.start_index].strip()
+        end = chunk.start_index + len(chunk.text)
+    assert not text[end:].strip()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 64, 1000])
+@pytest.mark.parametrize("piece_size", [1, 13, 5000])
+def test_split_text_stream_windows(buffer_size: int, piece_size: int) -> None:
+    text = _stream_text()
+    splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=20)
+    chunks = list(
+        splitter.split_text_stream(_pieces(text, piece_size), buffer_size=buffer_size)
+    )
+    # Chunks after the first window can differ from those of `split_text`, so
+    # only the stream's own guarantees are checked
+    _check_stream_chunks(text, chunks, 100)
+
+
+def test_split_text_stream_without_separators_is_bounded() -> None:
+    # The window cannot be cut at a separator, so it is cut after two windows
+    # instead of buffering the whole text
+    text = "x" * 10_000 + "\n\n" + "y" * 50
+    splitter = CharacterTextSplitter(separator="\n\n", chunk_size=100, chunk_overlap=0)
+    chunks = list(splitter.split_text_stream(_pieces(text, 10), buffer_size=500))
+    _check_stream_chunks(text, chunks, 1000)
+    assert [len(chunk.text) for chunk in chunks] == [1000] * 10 + [50]
+
+
+def test_split_text_stream_is_lazy() -> None:
+    text = _stream_text()
+    f = io.StringIO(text)
+    splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=0)
+    chunks = splitter.split_text_stream(f, buffer_size=500)
+    first = next(chunks)
+    assert first.start_index == 0
+    assert f.tell() < len(text) // 10
+    last = list(chunks)[-1]
+    assert last.start_index + len(last.text) == len(text)
+
+
+def test_split_text_stream_invalid_buffer_size() -> None:
+    splitter = CharacterTextSplitter(chunk_size=10, chunk_overlap=0)
+    with pytest.raises(ValueError, match="buffer_size"):
+        next(splitter.split_text_stream(["a"], buffer_size=0))
+
+
+@pytest.mark.parametrize("piece_size", [1, 3, 100, 10_000])
+@pytest.mark.parametrize("return_each_line", [False, True])
+def test_md_header_text_splitter_stream(
+    piece_size: int, *, return_each_line: bool
+) -> None:
+    markdown_document = (
+        "# Foo\n\n"
+        "    ## Bar\n\n"
+        "Hi this is Jim\n\n"
+        "```\n# not a header\n```\n"
+        "## Baz\n\n"
+        "Hi this is Molly\n"
+        "# Qux\n"
+    ) * 20
+    splitter = MarkdownHeaderTextSplitter(
+        [("#", "Header 1"), ("##", "Header 2")],
+        return_each_line=return_each_line,
+        strip_headers=False,
+    )
+    expected = splitter.split_text(markdown_document)
+    assert (
+        list(splitter.split_text_stream(_pieces(markdown_document, piece_size)))
+        == expected
+    )
+    assert (
+        list(
+            splitter.split_text_stream(
+                io.StringIO(markdown_document), buffer_size=piece_size
+            )
+        )
+        == expected
+    )
+
+
+def _toy_encoding() -> tiktoken.Encoding:
+    tiktoken = pytest.importorskip("tiktoken")
+    ranks = {bytes([i]): i for i in range(256)}
+    # "\x98\x80" is the tail of the 4-byte "😀", so its token starts mid-character
+    for merge in [b"in", b"ing", b" t", b"he", b" the", b"\x98\x80", b"\n\n"]:
+        ranks[merge] = len(ranks)
+    return tiktoken.Encoding(
+        name="toy",
+        pat_str=r"\s?\w+|\s?[^\s\w]+|\s+",
+        mergeable_ranks=ranks,
+        special_tokens={"<|endoftext|>": len(ranks)},
+    )
+
+
+@pytest.fixture
+def toy_encoding(monkeypatch: pytest.MonkeyPatch) -> tiktoken.Encoding:
+    encoding = _toy_encoding()
+    monkeypatch.setattr("tiktoken.get_encoding", lambda _: encoding)
+    return encoding
+
+
+def _token_texts() -> list[str]:
+    text = _stream_text().replace("w1", "thing w1")
+    return [text, text[:3000].replace("w2", "wörld😀 ü"), "", "the end"]
+
+
+@pytest.mark.requires("tiktoken")
+def test_token_index_matches_decode_with_offsets(
+    toy_encoding: tiktoken.Encoding,
+) -> None:
+    encoder = _TiktokenEncoder(toy_encoding, set(), "all")
+    for text in ["héllo wörld ünïcödé ✓ 😀 x", "😀😀", "the thing", ""]:
+        tokens = encoder.encode(text)
+        assert (
+            encoder.index(text, tokens)._starts
+            == (toy_encoding.decode_with_offsets(tokens)[1])
+        )
+
+
+def test_token_index_count() -> None:
+    index = _TokenIndex([0, 2, 5, 5, 9])
+    assert index.count(0, 12) == 5
+    assert index.count(2, 5) == 1
+    # Tokens straddling either end of the range are counted
+    assert index.count(3, 6) == 3
+    assert index.count(4, 4) == 0
+
+
+@pytest.mark.requires("tiktoken")
+@pytest.mark.usefixtures("toy_encoding")
+def test_encode_once_matches_per_split_lengths() -> None:
+    texts = _token_texts()
+    splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=60, chunk_overlap=10
+    )
+    fast = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=60, chunk_overlap=10, encode_once=True
+    )
+    expected = [splitter.split_text(text) for text in texts]
+    assert [fast.split_text(text) for text in texts] == expected
+    docs = fast.create_documents(texts)
+    assert [doc.page_content for doc in docs] == [c for e in expected for c in e]
+
+
+@pytest.mark.requires("tiktoken")
+@pytest.mark.usefixtures("toy_encoding")
+def test_token_text_splitter_create_documents_batches() -> None:
+    texts = _token_texts()
+    splitter = TokenTextSplitter(chunk_size=50, chunk_overlap=5)
+    docs = splitter.create_documents(texts, [{"i": i} for i in range(len(texts))])
+    assert [(doc.page_content, doc.metadata["i"]) for doc in docs] == [
+        (chunk, i)
+        for i, text in enumerate(texts)
+        for chunk in splitter.split_text(text)
+    ]
+
+
+@pytest.mark.requires("tiktoken")
+@pytest.mark.usefixtures("toy_encoding")
+def test_encode_once_unsupported_splitter() -> None:
+    with pytest.raises(ValueError, match="encode_once"):
+        CharacterTextSplitter.from_tiktoken_encoder(encode_once=True)
+
+
+MARKDOWN_WITH_SECTIONS = (
+    "# Intro\n"
+    "\n"
+    "  Some intro text.\n"
+    "## Details\n"
+    "\n"
+    "First paragraph of details, long enough to be split in two.\n"
+    "\n"
+    "```\n"
+    "# not a header\n"
+    "```\n"
+    "# Outro\n"
+    "Bye.\n"
+)
+
+
+def test_md_header_text_splitter_start_index() -> None:
+    splitter = MarkdownHeaderTextSplitter(
+        [("#", "Header 1"), ("##", "Header 2")], add_start_index=True
+    )
+    docs = splitter.split_text(MARKDOWN_WITH_SECTIONS)
+    assert [doc.metadata for doc in docs] == [
+        {"Header 1": "Intro", "start_index": 11, "end_index": 27},
+        {
+            "Header 1": "Intro",
+            "Header 2": "Details",
+            "start_index": 40,
+            "end_index": 123,
+        },
+        {"Header 1": "Outro", "start_index": 132, "end_index": 136},
+    ]
+    # Offsets span the source of the content, which is not copied verbatim
+    assert MARKDOWN_WITH_SECTIONS[40:123] == (
+        "First paragraph of details, long enough to be split in two.\n\n"
+        "```\n# not a header\n```"
+    )
+    assert docs[1].page_content == (
+        "First paragraph of details, long enough to be split in two.  \n"
+        "```\n# not a header\n```"
+    )
+
+
+@pytest.mark.parametrize("return_each_line", [False, True])
+@pytest.mark.parametrize("strip_headers", [False, True])
+def test_md_header_text_splitter_chunk_size(
+    *, return_each_line: bool, strip_headers: bool
+) -> None:
+    headers = [("#", "Header 1"), ("##", "Header 2")]
+    expected = RecursiveCharacterTextSplitter(
+        chunk_size=30, chunk_overlap=10
+    ).split_documents(
+        MarkdownHeaderTextSplitter(
+            headers, return_each_line=return_each_line, strip_headers=strip_headers
+        ).split_text(MARKDOWN_WITH_SECTIONS)
+    )
+    splitter = MarkdownHeaderTextSplitter(
+        headers,
+        return_each_line=return_each_line,
+        strip_headers=strip_headers,
+        chunk_size=30,
+        chunk_overlap=10,
+        add_start_index=True,
+    )
+    # The splitter keeps no state between texts
+    for _ in range(2):
+        docs = splitter.split_text(MARKDOWN_WITH_SECTIONS)
+        for doc in docs:
+            start = doc.metadata.pop("start_index")
+            end = doc.metadata.pop("end_index")
+            source = MARKDOWN_WITH_SECTIONS[start:end]
+            lines = doc.page_content.split("\n")
+            assert source.startswith(lines[0].rstrip())
+            assert source.endswith(lines[-1])
+        assert docs == expected
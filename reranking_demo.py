@@ -1,46 +1,255 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
 from dotenv import load_dotenv
-from langchain_core.documents import Document
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor, Document
+from langchain_core.runnables import run_in_executor
+from pydantic import ConfigDict, PrivateAttr
+from requests.adapters import HTTPAdapter
 
-from retrieval_common import index_markdown
+from retrieval_common import index_markdown, stable_chunk_id
+
+
+class RerankScoreCache:
+    """Thread-safe LRU cache of (query-hash, chunk_id) -> score with a TTL."""
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Tuple[str, str], Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[float]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            score, stored_at = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return score
+
+    def put(self, key: Tuple[str, str], score: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (score, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _chunk_id(doc: Document) -> str:
+    cid = doc.metadata.get("chunk_id") or doc.id
+    if cid:
+        return str(cid)
+    return stable_chunk_id(doc.metadata.get("source", "unknown"), doc.page_content)
+
+
+class SiliconFlowRerank(BaseDocumentCompressor):
+    """Document compressor backed by the SiliconFlow `/v1/rerank` API.
+
+    Candidates are split into batches of `batch_size` that are sent concurrently
+    over one pooled HTTP session and merged by relevance score. Scores are cached
+    per (query-hash, chunk_id) so repeated pairs skip the network entirely.
+    """
+
+    api_key: str
+    base_url: str
+    model: str
+    instruction: str = "请根据查询对文档进行重排序"
+    top_n: int = 5
+    """Number of documents to return."""
+    batch_size: int = 16
+    """Max candidate texts per rerank request."""
+    max_concurrency: int = 4
+    """Max rerank requests in flight for one query (also the HTTP pool size)."""
+    timeout: float = 30.0
+    cache_size: int = 4096
+    """Max cached (query, chunk) scores; 0 disables the cache."""
+    cache_ttl: Optional[float] = 600.0
+    """Seconds a cached score stays valid; None keeps it until evicted."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+
+    _session: requests.Session = PrivateAttr()
+    _cache: RerankScoreCache = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        session = requests.Session()
+        pool = max(1, self.max_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        )
+        self._session = session
+        self._cache = RerankScoreCache(self.cache_size, self.cache_ttl)
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "SiliconFlowRerank":
+        """Build from SILICONFLOW_API_KEY/SILICONFLOW_BASE_URL/RERANKING_MODEL."""
+        load_dotenv()
+        api_key = os.getenv("SILICONFLOW_API_KEY")
+        base_url = os.getenv("SILICONFLOW_BASE_URL")
+        model = os.getenv("RERANKING_MODEL")
+        if not api_key or not base_url or not model:
+            raise RuntimeError("Missing SILICONFLOW_API_KEY/SILICONFLOW_BASE_URL/RERANKING_MODEL in environment")
+        return cls(api_key=api_key, base_url=base_url, model=model, **kwargs)
+
+    @property
+    def cache(self) -> RerankScoreCache:
+        return self._cache
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _post_batch(self, query: str, texts: List[str]) -> List[float]:
+        """Score one batch of texts; returns scores aligned with `texts`."""
+        payload = {
+            "model": self.model,
+            "instruction": self.instruction,
+            "query": query,
+            "documents": texts,
+            "top_n": len(texts),
+            "return_documents": False,
+        }
+        resp = self._session.post(
+            f"{self.base_url}/v1/rerank",
+            data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        scores = [float("-inf")] * len(texts)
+        for r in resp.json().get("results", []):
+            i = r.get("index")
+            if isinstance(i, int) and 0 <= i < len(texts):
+                scores[i] = float(r.get("relevance_score", 0.0))
+        return scores
+
+    def _plan(
+        self, documents: Sequence[Document], query: str
+    ) -> Tuple[str, List[str], List[Optional[float]], List[List[int]]]:
+        """Resolve cached scores and batch the misses (deduplicated by chunk_id)."""
+        qh = _query_hash(query)
+        keys = [_chunk_id(d) for d in documents]
+        scores: List[Optional[float]] = [self._cache.get((qh, k)) for k in keys]
+        first: Dict[str, int] = {}
+        for i, k in enumerate(keys):
+            if scores[i] is None:
+                first.setdefault(k, i)
+        missing = list(first.values())
+        size = max(1, self.batch_size)
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+        return qh, keys, scores, batches
+
+    def _merge(
+        self,
+        documents: Sequence[Document],
+        qh: str,
+        keys: List[str],
+        scores: List[Optional[float]],
+        batches: List[List[int]],
+        batch_scores: List[List[float]],
+    ) -> List[Document]:
+        fresh: Dict[str, float] = {}
+        for idxs, got in zip(batches, batch_scores):
+            for i, s in zip(idxs, got):
+                fresh[keys[i]] = s
+                if s != float("-inf"):
+                    self._cache.put((qh, keys[i]), s)
+        resolved = [s if s is not None else fresh[keys[i]] for i, s in enumerate(scores)]
+        order = sorted(range(len(documents)), key=lambda i: resolved[i], reverse=True)
+        out: List[Document] = []
+        for i in order[: self.top_n]:
+            doc = documents[i]
+            doc_copy = Document(doc.page_content, metadata=deepcopy(doc.metadata), id=doc.id)
+            doc_copy.metadata["relevance_score"] = resolved[i]
+            out.append(doc_copy)
+        return out
+
+    def compress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Rerank documents, returning the top_n with `relevance_score` metadata."""
+        if not documents:
+            return []
+        qh, keys, scores, batches = self._plan(documents, query)
+        if len(batches) <= 1 or self.max_concurrency <= 1:
+            batch_scores = [self._post_batch(query, [documents[i].page_content for i in b]) for b in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as ex:
+                batch_scores = list(
+                    ex.map(lambda b: self._post_batch(query, [documents[i].page_content for i in b]), batches)
+                )
+        return self._merge(documents, qh, keys, scores, batches, batch_scores)
+
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Async rerank; batches run concurrently on the shared pooled session."""
+        if not documents:
+            return []
+        qh, keys, scores, batches = self._plan(documents, query)
+        sem = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _run(b: List[int]) -> List[float]:
+            async with sem:
+                return await run_in_executor(
+                    None, self._post_batch, query, [documents[i].page_content for i in b]
+                )
+
+        batch_scores = list(await asyncio.gather(*(_run(b) for b in batches)))
+        return self._merge(documents, qh, keys, scores, batches, batch_scores)
+
+
+@lru_cache(maxsize=1)
+def _default_reranker() -> SiliconFlowRerank:
+    return SiliconFlowRerank.from_env()
 
 
 def siliconflow_rerank(query: str, documents: List[Document], top_n: int = 5) -> List[Document]:
-    load_dotenv()
-    api_key = os.getenv("SILICONFLOW_API_KEY")
-    base_url = os.getenv("SILICONFLOW_BASE_URL")
-    model = os.getenv("RERANKING_MODEL")
-    if not api_key or not base_url or not model:
-        raise RuntimeError("Missing SILICONFLOW_API_KEY/SILICONFLOW_BASE_URL/RERANKING_MODEL in environment")
-
-    payload = {
-        "model": model,
-        "instruction": "请根据查询对文档进行重排序",
-        "query": query,
-        "documents": [d.page_content for d in documents],
-        "top_n": top_n,
-        "return_documents": True,
-    }
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    resp = requests.post(
-        f"{base_url}/v1/rerank",
-        headers=headers,
-        data=json.dumps(payload).encode("utf-8"),
-        timeout=30,
-    )
-    resp.raise_for_status()
-    body = resp.json()
-    idx = [r.get("index") for r in body.get("results", []) if isinstance(r.get("index"), int)][:top_n]
-    return [documents[i] for i in idx if 0 <= i < len(documents)]
+    """Rerank with a process-wide pooled, cached SiliconFlowRerank."""
+    reranker = _default_reranker()
+    if top_n == reranker.top_n:
+        return list(reranker.compress_documents(documents, query))
+    return list(reranker.model_copy(update={"top_n": top_n}).compress_documents(documents, query))
 
 
 def main() -> None:
@@ -4,13 +4,18 @@ SiliconFlow 嵌入 API 包装器
 直接调用 SiliconFlow API 进行嵌入，避免下载本地模型
 """
 
+import base64
 import os
 import requests
 import json
-from typing import List
+from typing import TYPE_CHECKING, List
+
 from dotenv import load_dotenv
 from langchain_core.embeddings import Embeddings
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class SiliconFlowEmbeddings(Embeddings):
     """SiliconFlow 嵌入 API 包装器"""
@@ -27,8 +32,13 @@ class SiliconFlowEmbeddings(Embeddings):
         if not self.base_url:
             raise ValueError("请设置 SILICONFLOW_BASE_URL 环境变量")
 
-    def _call_embedding_api(self, texts: List[str]) -> List[List[float]]:
-        """调用 SiliconFlow 嵌入 API"""
+    def _call_embedding_api(
+        self, texts: List[str], encoding_format: str = "float"
+    ) -> list:
+        """调用 SiliconFlow 嵌入 API
+
+        encoding_format 为 "base64" 时返回 base64 字符串列表（float32 小端序）。
+        """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -37,7 +47,7 @@ class SiliconFlowEmbeddings(Embeddings):
         payload = {
             "model": self.model,
             "input": texts,
-            "encoding_format": "float"
+            "encoding_format": encoding_format,
         }
 
         try:
@@ -70,6 +80,30 @@ class SiliconFlowEmbeddings(Embeddings):
             output.extend(self._call_embedding_api(texts[i : i + batch_size]))
         return output
 
+    def embed_documents_array(self, texts: List[str]) -> "np.ndarray":
+        """嵌入文档列表，直接返回 float32 二维数组（分批）
+
+        以 base64 格式请求，解码后写入预分配的数组，不创建 Python float 对象。
+        """
+        import numpy as np
+
+        batch_size = int(os.getenv("EMBED_BATCH", "64"))
+        output = None
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i : i + batch_size]
+            encoded = self._call_embedding_api(batch, "base64")
+            # 返回条数不符时直接报错，避免未填充的行被当作嵌入返回
+            if len(encoded) != len(batch):
+                raise ValueError(
+                    f"嵌入 API 返回了 {len(encoded)} 个向量，期望 {len(batch)} 个"
+                )
+            for j, item in enumerate(encoded):
+                vector = np.frombuffer(base64.b64decode(item), dtype="<f4")
+                if output is None:
+                    output = np.empty((len(texts), vector.size), dtype=np.float32)
+                output[i + j] = vector
+        return output if output is not None else np.empty((0, 0), dtype=np.float32)
+
     def embed_query(self, text: str) -> List[float]:
         """嵌入单个查询"""
         embeddings = self._call_embedding_api([text])
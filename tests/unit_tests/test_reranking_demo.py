@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import json
+
+from langchain_core.documents import Document
+
+from reranking_demo import RerankScoreCache, SiliconFlowRerank
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._body
+
+
+class _FakeSession:
+    """Scores each document by its length; records request sizes."""
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, data, timeout):  # noqa: ARG002
+        payload = json.loads(data)
+        docs = payload["documents"]
+        self.calls.append(len(docs))
+        results = [{"index": i, "relevance_score": float(len(t))} for i, t in enumerate(docs)]
+        return _FakeResponse({"results": results[::-1]})
+
+
+def _reranker(**kwargs) -> tuple[SiliconFlowRerank, _FakeSession]:
+    rr = SiliconFlowRerank(api_key="k", base_url="http://x", model="m", **kwargs)
+    session = _FakeSession()
+    rr._session = session  # type: ignore[assignment]
+    return rr, session
+
+
+def _docs(n: int) -> list[Document]:
+    return [Document("x" * (i + 1), metadata={"chunk_id": f"c{i}"}) for i in range(n)]
+
+
+def test_rerank_splits_batches_and_merges_by_score():
+    rr, session = _reranker(top_n=3, batch_size=4, max_concurrency=3)
+    out = rr.compress_documents(_docs(10), "q")
+    assert sorted(session.calls) == [2, 4, 4]
+    assert [d.metadata["chunk_id"] for d in out] == ["c9", "c8", "c7"]
+    assert out[0].metadata["relevance_score"] == 10.0
+
+
+def test_rerank_cache_skips_known_pairs():
+    rr, session = _reranker(top_n=2, batch_size=8)
+    docs = _docs(5)
+    rr.compress_documents(docs, "q")
+    assert session.calls == [5]
+    rr.compress_documents(docs, "q")
+    assert session.calls == [5]
+    rr.compress_documents(docs, "other")
+    assert session.calls == [5, 5]
+
+
+def test_rerank_async_matches_sync():
+    rr, _ = _reranker(top_n=4, batch_size=2, cache_size=0)
+    docs = _docs(7)
+    sync = rr.compress_documents(docs, "q")
+    got = asyncio.run(rr.acompress_documents(docs, "q"))
+    assert [d.page_content for d in got] == [d.page_content for d in sync]
+
+
+def test_score_cache_lru_and_ttl():
+    cache = RerankScoreCache(maxsize=2, ttl=None)
+    cache.put(("q", "a"), 1.0)
+    cache.put(("q", "b"), 2.0)
+    assert cache.get(("q", "a")) == 1.0
+    cache.put(("q", "c"), 3.0)
+    assert cache.get(("q", "b")) is None
+    assert len(cache) == 2
+
+    expired = RerankScoreCache(maxsize=2, ttl=-1.0)
+    expired.put(("q", "a"), 1.0)
+    assert expired.get(("q", "a")) is None
@@ -5,7 +5,9 @@ import tempfile
 from pathlib import Path
 
 from langchain_community.vectorstores import Chroma
-from langchain_core.embeddings import Embeddings
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+from langchain_core.indexing import InMemoryRecordManager
+from langchain_core.vectorstores import InMemoryVectorStore
 
 import retrieval_common as rc
 
@@ -45,3 +47,31 @@ def test_add_texts_skip_existing():
     added2, skipped2 = rc.add_texts_skip_existing(vs, texts=texts, metadatas=metas, ids=ids)
     assert added2 == 0 and skipped2 == 2
 
+
+
+def test_sync_markdown_skips_unchanged_files(tmp_path, monkeypatch):
+    (tmp_path / "a.md").write_text("# A\n\nalpha", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n\nbeta", encoding="utf-8")
+    split_calls = []
+    split = rc.split_markdown
+
+    def counting_split(path):
+        split_calls.append(path.name)
+        return split(path)
+
+    monkeypatch.setattr(rc, "split_markdown", counting_split)
+    vs = InMemoryVectorStore(DeterministicFakeEmbedding(size=4))
+    rm = InMemoryRecordManager("md")
+
+    first = rc.sync_markdown(tmp_path, vs, rm)
+    assert first["num_added"] == 2 and sorted(split_calls) == ["a.md", "b.md"]
+
+    split_calls.clear()
+    second = rc.sync_markdown(tmp_path, vs, rm)
+    assert second["num_added"] == 0 and second["num_deleted"] == 0
+    assert second["num_skipped"] == 2 and split_calls == []
+
+    (tmp_path / "b.md").write_text("# B\n\nbeta, edited", encoding="utf-8")
+    third = rc.sync_markdown(tmp_path, vs, rm)
+    assert split_calls == ["b.md"]
+    assert third["num_added"] == 1 and third["num_deleted"] == 1
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import base64
+import json
+
+import numpy as np
+import pytest
+
+import siliconflow_embeddings as sf
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._body
+
+
+def _fake_post(calls):
+    def post(url, headers, data, timeout):  # noqa: ARG001
+        payload = json.loads(data)
+        calls.append(payload)
+        rows = [np.full(3, len(t), dtype="<f4") for t in payload["input"]]
+        if payload["encoding_format"] == "base64":
+            data = [{"embedding": base64.b64encode(r.tobytes()).decode()} for r in rows]
+        else:
+            data = [{"embedding": r.tolist()} for r in rows]
+        return _FakeResponse({"data": data})
+
+    return post
+
+
+def test_embed_documents_array_decodes_base64(monkeypatch):
+    monkeypatch.setenv("SILICONFLOW_API_KEY", "k")
+    monkeypatch.setenv("SILICONFLOW_BASE_URL", "http://x")
+    monkeypatch.setenv("EMBED_BATCH", "2")
+    calls = []
+    monkeypatch.setattr(sf.requests, "post", _fake_post(calls))
+
+    emb = sf.SiliconFlowEmbeddings()
+    texts = ["a", "bb", "ccc"]
+    out = emb.embed_documents_array(texts)
+
+    assert out.dtype == np.float32
+    assert out.shape == (3, 3)
+    assert out[:, 0].tolist() == [1.0, 2.0, 3.0]
+    assert [c["encoding_format"] for c in calls] == ["base64", "base64"]
+    assert out.tolist() == emb.embed_documents(texts)
+    assert emb.embed_documents_array([]).shape == (0, 0)
+
+
+def test_embed_documents_array_rejects_short_response(monkeypatch):
+    monkeypatch.setenv("SILICONFLOW_API_KEY", "k")
+    monkeypatch.setenv("SILICONFLOW_BASE_URL", "http://x")
+    monkeypatch.setenv("EMBED_BATCH", "2")
+    post = _fake_post([])
+
+    def short_post(url, headers, data, timeout):
+        response = post(url, headers, data, timeout)
+        response._body["data"] = response._body["data"][:1]
+        return response
+
+    monkeypatch.setattr(sf.requests, "post", short_post)
+
+    with pytest.raises(ValueError, match="期望 2"):
+        sf.SiliconFlowEmbeddings().embed_documents_array(["a", "bb", "ccc"])